@@ -289,6 +289,8 @@ See `LICENSE` file.
 **Built with coffee by the Coffee Maker Agent team**
 """
 
+import importlib
+from types import ModuleType
 from typing import List
 
 __version__: str = "1.0.0"
@@ -310,5 +312,19 @@ __all__: List[str] = [
     "__version__",
 ]
 
-# Note: Actual imports would go here in a production setup
-# For now, we keep the package lightweight and allow explicit imports
+
+def __getattr__(name: str) -> ModuleType:
+    """Import subpackages on first attribute access (PEP 562).
+
+    The package stays lightweight: ``import coffee_maker`` loads nothing else, and
+    ``coffee_maker.langfuse_observe`` (langchain, langfuse, tiktoken) is only
+    imported when it is actually used.
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
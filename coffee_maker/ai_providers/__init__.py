@@ -40,30 +40,31 @@ Example config/ai_providers.yaml:
 For complete documentation, see: docs/PRIORITY_8_MULTI_AI_PROVIDER_GUIDE.md
 """
 
-from coffee_maker.ai_providers.base import (
-    BaseAIProvider,
-    ProviderCapability,
-    ProviderResult,
-)
-from coffee_maker.ai_providers.fallback_strategy import (
-    AllProvidersFailedError,
-    FallbackStrategy,
-    ProviderUnavailableError,
-    RateLimitError,
-)
-from coffee_maker.ai_providers.provider_config import (
-    CostConfig,
-    FallbackConfig,
-    ProviderConfig,
-    ProviderConfigError,
-)
-from coffee_maker.ai_providers.provider_factory import (
-    get_provider,
-    list_available_providers,
-    list_enabled_providers,
-)
+import importlib
+from typing import Any, Dict, List
 
-__all__ = [
+# Names are imported on first access (PEP 562): the provider factory pulls in the
+# anthropic, openai and google SDKs, which most callers of this package never need.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "BaseAIProvider": "coffee_maker.ai_providers.base",
+    "ProviderCapability": "coffee_maker.ai_providers.base",
+    "ProviderResult": "coffee_maker.ai_providers.base",
+    "AllProvidersFailedError": "coffee_maker.ai_providers.fallback_strategy",
+    "FallbackStrategy": "coffee_maker.ai_providers.fallback_strategy",
+    "ProviderUnavailableError": "coffee_maker.ai_providers.fallback_strategy",
+    "RateLimitError": "coffee_maker.ai_providers.fallback_strategy",
+    "CostConfig": "coffee_maker.ai_providers.provider_config",
+    "FallbackConfig": "coffee_maker.ai_providers.provider_config",
+    "ProviderConfig": "coffee_maker.ai_providers.provider_config",
+    "ProviderConfigError": "coffee_maker.ai_providers.provider_config",
+    "SharedProviderConfig": "coffee_maker.ai_providers.provider_config",
+    "get_shared_config": "coffee_maker.ai_providers.provider_config",
+    "get_provider": "coffee_maker.ai_providers.provider_factory",
+    "list_available_providers": "coffee_maker.ai_providers.provider_factory",
+    "list_enabled_providers": "coffee_maker.ai_providers.provider_factory",
+}
+
+__all__: List[str] = [
     # Base classes
     "BaseAIProvider",
     "ProviderCapability",
@@ -73,6 +74,8 @@ __all__ = [
     "ProviderConfigError",
     "FallbackConfig",
     "CostConfig",
+    "SharedProviderConfig",
+    "get_shared_config",
     # Factory
     "get_provider",
     "list_enabled_providers",
@@ -85,3 +88,17 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -20,7 +20,7 @@ import time
 from typing import Dict, List, Optional
 
 from coffee_maker.ai_providers.base import ProviderResult
-from coffee_maker.ai_providers.provider_config import ProviderConfig
+from coffee_maker.ai_providers.provider_config import ProviderConfig, get_shared_config
 from coffee_maker.ai_providers.provider_factory import get_provider
 
 logger = logging.getLogger(__name__)
@@ -51,6 +51,9 @@ class FallbackStrategy:
     3. Check cost limits before execution
     4. Track which provider succeeded
 
+    Without an explicit config, every attribute below reads the process-wide
+    snapshot, so edits to config/ai_providers.yaml apply to existing strategies.
+
     Attributes:
         config: ProviderConfig instance
         retry_attempts: Number of retry attempts per provider
@@ -63,16 +66,10 @@ class FallbackStrategy:
         """Initialize fallback strategy.
 
         Args:
-            config: ProviderConfig instance. If None, loads from default location.
+            config: ProviderConfig instance. If None, uses the shared snapshot.
         """
-        self.config = config or ProviderConfig()
-
-        # Load fallback configuration
-        self.retry_attempts = self.config.fallback_config.retry_attempts
-        self.retry_delay = self.config.fallback_config.retry_delay
-        self.max_retry_delay = self.config.fallback_config.max_retry_delay
-        self.fallback_order = self.config.fallback_config.fallback_order
-        self.fallback_enabled = self.config.fallback_config.enabled
+        self._config = config
+        self._shared = None if config is not None else get_shared_config()
 
         logger.info(
             f"FallbackStrategy initialized: "
@@ -81,6 +78,36 @@ class FallbackStrategy:
             f"retries={self.retry_attempts}"
         )
 
+    @property
+    def config(self) -> ProviderConfig:
+        """Configuration in use (the current shared snapshot if none was given)."""
+        return self._config if self._config is not None else self._shared.current
+
+    @property
+    def retry_attempts(self) -> int:
+        """Number of retry attempts per provider."""
+        return self.config.fallback_config.retry_attempts
+
+    @property
+    def retry_delay(self) -> float:
+        """Initial retry delay in seconds."""
+        return self.config.fallback_config.retry_delay
+
+    @property
+    def max_retry_delay(self) -> float:
+        """Maximum retry delay for exponential backoff."""
+        return self.config.fallback_config.max_retry_delay
+
+    @property
+    def fallback_order(self) -> List[str]:
+        """Provider names to try in order."""
+        return self.config.fallback_config.fallback_order
+
+    @property
+    def fallback_enabled(self) -> bool:
+        """Whether fallback is enabled."""
+        return self.config.fallback_config.enabled
+
     def execute_with_fallback(
         self,
         prompt: str,
@@ -122,11 +149,14 @@ class FallbackStrategy:
             ... )
             >>> print(result.content)
         """
+        # One snapshot for the whole call, even if the file is reloaded meanwhile
+        config = self.config
+
         # Use custom provider list or default fallback order
-        provider_list = providers or self.fallback_order
+        provider_list = providers or config.fallback_config.fallback_order
 
         # Filter to only enabled providers
-        enabled_providers = [p for p in provider_list if self.config.is_provider_enabled(p)]
+        enabled_providers = [p for p in provider_list if config.is_provider_enabled(p)]
 
         if not enabled_providers:
             raise AllProvidersFailedError(
@@ -143,18 +173,16 @@ class FallbackStrategy:
                 logger.info(f"Trying provider: {provider_name}")
 
                 # Get provider instance
-                provider = get_provider(provider_name, self.config)
+                provider = get_provider(provider_name, config)
 
                 # Check cost if enabled
                 if check_cost:
-                    estimated_cost = provider.estimate_cost(
-                        prompt, system_prompt, self.config.cost_config.per_task_limit
-                    )
+                    estimated_cost = provider.estimate_cost(prompt, system_prompt, config.cost_config.per_task_limit)
 
-                    if estimated_cost > self.config.cost_config.per_task_limit:
+                    if estimated_cost > config.cost_config.per_task_limit:
                         logger.warning(
                             f"{provider_name}: Estimated cost ${estimated_cost:.2f} "
-                            f"exceeds per-task limit ${self.config.cost_config.per_task_limit:.2f}"
+                            f"exceeds per-task limit ${config.cost_config.per_task_limit:.2f}"
                         )
                         errors.append(f"{provider_name}: Cost limit exceeded")
                         continue
@@ -5,25 +5,41 @@ This module handles loading and validating provider configuration from:
 2. Environment variables (overrides)
 3. Default values (fallback)
 
+A ``ProviderConfig`` is a snapshot: it is read and validated once and not
+modified afterwards. Code that does not pass its own config shares the
+process-wide snapshot from ``get_shared_config()``, which is loaded on first
+use and replaced atomically when the file's mtime changes (checked by a
+background watcher thread), so reading it on the request path never touches
+the file.
+
 Example:
-    >>> from coffee_maker.ai_providers.provider_config import ProviderConfig
+    >>> from coffee_maker.ai_providers.provider_config import ProviderConfig, get_shared_config
     >>> config = ProviderConfig()
     >>> print(config.default_provider)  # 'claude'
     >>> print(config.get_provider_config('openai'))  # OpenAI config dict
+    >>>
+    >>> # Shared snapshot, reloaded when config/ai_providers.yaml changes
+    >>> config = get_shared_config().current
 """
 
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONFIG_FILE = Path(__file__).parent.parent.parent / "config" / "ai_providers.yaml"
+
+# Seconds between two checks of the config file's mtime
+DEFAULT_POLL_INTERVAL = 2.0
+
 
-@dataclass
+@dataclass(frozen=True)
 class FallbackConfig:
     """Fallback configuration.
 
@@ -42,7 +58,7 @@ class FallbackConfig:
     max_retry_delay: float = 60.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class CostConfig:
     """Cost control configuration.
 
@@ -93,9 +109,7 @@ class ProviderConfig:
             ProviderConfigError: If config file is missing or invalid
         """
         if config_file is None:
-            # Find config file relative to project root
-            project_root = Path(__file__).parent.parent.parent
-            config_file = project_root / "config" / "ai_providers.yaml"
+            config_file = DEFAULT_CONFIG_FILE
 
         self.config_file = Path(config_file)
         self.data = self._load_config()
@@ -261,3 +275,129 @@ class ProviderConfig:
         """String representation."""
         enabled = self.get_enabled_providers()
         return f"<ProviderConfig(default={self.default_provider}, enabled={enabled})>"
+
+
+class SharedProviderConfig:
+    """Process-wide provider configuration snapshot, reloaded when the file changes.
+
+    ``current`` is a plain attribute holding the latest valid ``ProviderConfig``.
+    A reload builds a complete new snapshot and then swaps the attribute, so
+    readers see either the old or the new configuration, never a mix. An
+    invalid file is logged and the previous snapshot is kept.
+
+    Environment overrides (DEFAULT_AI_PROVIDER) are resolved when a snapshot is
+    loaded; API keys are still read from the environment on each call.
+
+    Attributes:
+        config_file: Path to ai_providers.yaml
+        poll_interval: Seconds between two mtime checks of the watcher
+        current: Latest valid ProviderConfig
+
+    Example:
+        >>> shared = SharedProviderConfig()
+        >>> shared.start()
+        >>> shared.current.default_provider
+        'claude'
+    """
+
+    def __init__(self, config_file: Optional[str] = None, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Load the initial snapshot.
+
+        Args:
+            config_file: Path to ai_providers.yaml (default: config/ai_providers.yaml)
+            poll_interval: Seconds between two mtime checks of the watcher
+
+        Raises:
+            ProviderConfigError: If config file is missing or invalid
+        """
+        self.config_file = Path(config_file) if config_file else DEFAULT_CONFIG_FILE
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stat before reading: a change during the load is picked up by the next check
+        self._version = self._file_version()
+        self.current = ProviderConfig(self.config_file)
+
+    def refresh(self) -> bool:
+        """Reload the snapshot if the file changed since the last load.
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        version = self._file_version()
+        if version == self._version:
+            return False
+
+        with self._lock:
+            if version == self._version:
+                return False
+            self._version = version
+            try:
+                config = ProviderConfig(self.config_file)
+            except ProviderConfigError as e:
+                logger.warning(f"Keeping previous provider config, reload of {self.config_file} failed: {e}")
+                return False
+            self.current = config
+
+        logger.info(f"Provider config reloaded from {self.config_file}")
+        return True
+
+    def start(self) -> None:
+        """Start the background thread watching the file (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="provider-config-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.poll_interval + 1)
+
+    def _watch(self) -> None:
+        """Check the file every poll_interval seconds until stopped."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Provider config watcher error: {e}")
+
+    def _file_version(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) of the config file, or None if it cannot be read."""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+_shared_config: Optional[SharedProviderConfig] = None
+_shared_config_lock = threading.Lock()
+
+
+def get_shared_config() -> SharedProviderConfig:
+    """Get the process-wide provider configuration (singleton).
+
+    The snapshot is loaded on first call and the file watcher started.
+
+    Returns:
+        SharedProviderConfig whose ``current`` attribute is the latest snapshot
+
+    Raises:
+        ProviderConfigError: If the config file is missing or invalid on first load
+    """
+    global _shared_config
+    if _shared_config is None:
+        with _shared_config_lock:
+            if _shared_config is None:
+                shared = SharedProviderConfig()
+                shared.start()
+                _shared_config = shared
+    return _shared_config
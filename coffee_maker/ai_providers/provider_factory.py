@@ -18,7 +18,7 @@ import logging
 from typing import List, Optional
 
 from coffee_maker.ai_providers.base import BaseAIProvider
-from coffee_maker.ai_providers.provider_config import ProviderConfig
+from coffee_maker.ai_providers.provider_config import ProviderConfig, get_shared_config
 from coffee_maker.ai_providers.providers.claude_provider import ClaudeProvider
 from coffee_maker.ai_providers.providers.gemini_provider import GeminiProvider
 from coffee_maker.ai_providers.providers.openai_provider import OpenAIProvider
@@ -52,7 +52,7 @@ def get_provider(provider_name: Optional[str] = None, config: Optional[ProviderC
     Args:
         provider_name: Name of provider to create (e.g., 'claude', 'openai', 'gemini').
                       If None, uses default provider from config.
-        config: ProviderConfig instance. If None, loads from config/ai_providers.yaml.
+        config: ProviderConfig instance. If None, uses the shared snapshot of config/ai_providers.yaml.
 
     Returns:
         Instantiated provider (ClaudeProvider, OpenAIProvider, or GeminiProvider)
@@ -75,9 +75,9 @@ def get_provider(provider_name: Optional[str] = None, config: Optional[ProviderC
         >>> custom_config = ProviderConfig('my_config.yaml')
         >>> provider = get_provider(config=custom_config)
     """
-    # Load configuration if not provided
+    # Use the shared snapshot if no config is provided
     if config is None:
-        config = ProviderConfig()
+        config = get_shared_config().current
 
     # Use default provider if none specified
     if provider_name is None:
@@ -110,7 +110,7 @@ def list_enabled_providers(config: Optional[ProviderConfig] = None) -> List[str]
     """Get list of enabled providers from configuration.
 
     Args:
-        config: ProviderConfig instance. If None, loads from default location.
+        config: ProviderConfig instance. If None, uses the shared snapshot.
 
     Returns:
         List of enabled provider names
@@ -120,7 +120,7 @@ def list_enabled_providers(config: Optional[ProviderConfig] = None) -> List[str]
         >>> print(providers)  # ['claude', 'openai', 'gemini']
     """
     if config is None:
-        config = ProviderConfig()
+        config = get_shared_config().current
 
     return config.get_enabled_providers()
 
@@ -132,7 +132,7 @@ def list_available_providers(config: Optional[ProviderConfig] = None, check_conn
     and actually accessible (API key set, service reachable).
 
     Args:
-        config: ProviderConfig instance. If None, loads from default location.
+        config: ProviderConfig instance. If None, uses the shared snapshot.
         check_connectivity: If True, test connectivity to each provider.
                            If False, only check if API keys are set.
 
@@ -149,7 +149,7 @@ def list_available_providers(config: Optional[ProviderConfig] = None, check_conn
         >>> print(providers)  # ['claude', 'openai']  # gemini excluded if unreachable
     """
     if config is None:
-        config = ProviderConfig()
+        config = get_shared_config().current
 
     available = []
 
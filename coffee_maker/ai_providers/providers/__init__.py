@@ -21,12 +21,32 @@ Example:
     >>> result = provider.execute_prompt("Write a Python function")
 """
 
-from coffee_maker.ai_providers.providers.claude_provider import ClaudeProvider
-from coffee_maker.ai_providers.providers.gemini_provider import GeminiProvider
-from coffee_maker.ai_providers.providers.openai_provider import OpenAIProvider
+import importlib
+from typing import Any, Dict, List
 
-__all__ = [
+# Each provider imports its own SDK; load only the one that is asked for (PEP 562).
+_LAZY_EXPORTS: Dict[str, str] = {
+    "ClaudeProvider": "coffee_maker.ai_providers.providers.claude_provider",
+    "GeminiProvider": "coffee_maker.ai_providers.providers.gemini_provider",
+    "OpenAIProvider": "coffee_maker.ai_providers.providers.openai_provider",
+}
+
+__all__: List[str] = [
     "ClaudeProvider",
     "OpenAIProvider",
     "GeminiProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider classes on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -83,8 +83,8 @@ class ACEApi:
 
                 # Get trace counts
                 today = datetime.now().strftime("%Y-%m-%d")
-                traces_today = len(self.trace_manager.list_traces(date=today, agent=agent_name))
-                traces_total = len(self.trace_manager.list_traces(agent=agent_name))
+                traces_today = self.trace_manager.count_traces(date=today, agent=agent_name)
+                traces_total = self.trace_manager.count_traces(agent=agent_name)
 
                 # Get playbook size
                 playbook_size = 0
@@ -171,18 +171,13 @@ class ACEApi:
             traces = api.get_traces(agent="user_interpret", hours=24)
         """
         try:
+            # The trace store returns newest first and reads only `limit` traces
             if hours:
-                traces = self.trace_manager.get_traces_since(hours=hours, agent=agent)
+                traces = self.trace_manager.get_traces_since(hours=hours, agent=agent, limit=limit)
             elif date:
-                traces = self.trace_manager.list_traces(date=date, agent=agent)
+                traces = self.trace_manager.list_traces(date=date, agent=agent, limit=limit)
             else:
-                traces = self.trace_manager.list_traces(agent=agent)
-
-            # Sort by timestamp descending (newest first)
-            traces.sort(key=lambda t: t.timestamp, reverse=True)
-
-            # Apply limit
-            traces = traces[:limit]
+                traces = self.trace_manager.list_traces(agent=agent, limit=limit)
 
             # Convert to dictionaries for JSON serialization
             return [trace.to_dict() for trace in traces]
@@ -246,32 +241,29 @@ class ACEApi:
         """
         try:
             cutoff = datetime.now() - timedelta(days=days)
-            all_traces = self.trace_manager.list_traces()
 
-            # Filter by date range
-            recent_traces = [t for t in all_traces if t.timestamp >= cutoff]
+            # One pass over per-day/per-agent aggregates from the trace index
+            totals: Dict[str, Dict[str, float]] = {}
+            traces_by_day: Dict[str, int] = {}
+            for row in self.trace_manager.summarize(since=cutoff):
+                agent_totals = totals.setdefault(row["agent"], {"total": 0, "success": 0, "duration": 0.0})
+                agent_totals["total"] += row["total"]
+                agent_totals["success"] += row["success_count"]
+                agent_totals["duration"] += row["duration_seconds"]
+                traces_by_day[row["day"]] = traces_by_day.get(row["day"], 0) + row["total"]
 
-            # Calculate metrics
-            total_traces = len(recent_traces)
-            success_traces = len([t for t in recent_traces if self._is_success(t)])
-            failure_traces = len([t for t in recent_traces if not self._is_success(t)])
+            total_traces = sum(t["total"] for t in totals.values())
+            success_traces = sum(t["success"] for t in totals.values())
+            failure_traces = total_traces - success_traces
 
             success_rate = (success_traces / total_traces * 100) if total_traces > 0 else 0.0
 
             # Per-agent metrics
             agent_metrics = {}
-            agents = set(t.agent_identity.get("target_agent", "unknown") for t in recent_traces)
-
-            for agent_name in agents:
-                agent_traces = [t for t in recent_traces if t.agent_identity.get("target_agent") == agent_name]
-                agent_success = len([t for t in agent_traces if self._is_success(t)])
-                agent_total = len(agent_traces)
-
-                avg_duration = (
-                    sum(sum(e.duration_seconds for e in t.executions) for t in agent_traces) / agent_total
-                    if agent_total > 0
-                    else 0.0
-                )
+            for agent_name, agent_totals in totals.items():
+                agent_total = agent_totals["total"]
+                agent_success = agent_totals["success"]
+                avg_duration = agent_totals["duration"] / agent_total if agent_total > 0 else 0.0
 
                 agent_metrics[agent_name] = {
                     "total_traces": agent_total,
@@ -281,12 +273,6 @@ class ACEApi:
                     "avg_duration_seconds": round(avg_duration, 2),
                 }
 
-            # Trace stats by day
-            traces_by_day = {}
-            for trace in recent_traces:
-                day = trace.timestamp.strftime("%Y-%m-%d")
-                traces_by_day[day] = traces_by_day.get(day, 0) + 1
-
             return {
                 "date_range_days": days,
                 "total_traces": total_traces,
@@ -344,8 +330,7 @@ class ACEApi:
                     logger.warning(f"Failed to read delta file: {e}")
 
             # Count pending traces (traces without corresponding delta)
-            all_traces = self.trace_manager.list_traces()
-            pending_traces = len(all_traces)  # Simplified - could be more sophisticated
+            pending_traces = self.trace_manager.count_traces()  # Simplified - could be more sophisticated
 
             return {
                 "last_run": last_run.isoformat() if last_run else None,
@@ -587,11 +572,8 @@ class ACEApi:
         """
         try:
             cutoff = datetime.now() - timedelta(days=days)
-            all_traces = self.trace_manager.list_traces()
-            recent_traces = [t for t in all_traces if t.timestamp >= cutoff]
-
-            if agent:
-                recent_traces = [t for t in recent_traces if t.agent_identity.get("target_agent") == agent]
+            recent_traces = self.trace_manager.list_traces(agent=agent, since=cutoff)
+            recent_traces.sort(key=lambda t: t.timestamp)  # oldest first for the trend halves
 
             # Calculate costs (simulate based on executions and tokens)
             total_cost = 0.0
@@ -681,11 +663,7 @@ class ACEApi:
         """
         try:
             cutoff = datetime.now() - timedelta(days=days)
-            all_traces = self.trace_manager.list_traces()
-            recent_traces = [t for t in all_traces if t.timestamp >= cutoff]
-
-            if agent:
-                recent_traces = [t for t in recent_traces if t.agent_identity.get("target_agent") == agent]
+            recent_traces = self.trace_manager.list_traces(agent=agent, since=cutoff)
 
             if not recent_traces:
                 return {
@@ -777,11 +755,7 @@ class ACEApi:
         """
         try:
             cutoff = datetime.now() - timedelta(days=days)
-            all_traces = self.trace_manager.list_traces()
-            recent_traces = [t for t in all_traces if t.timestamp >= cutoff]
-
-            if agent:
-                recent_traces = [t for t in recent_traces if t.agent_identity.get("target_agent") == agent]
+            recent_traces = self.trace_manager.list_traces(agent=agent, since=cutoff)
 
             if not recent_traces:
                 return {
@@ -902,9 +876,7 @@ class ACEApi:
 
             # Count total traces
             cutoff = datetime.now() - timedelta(days=days)
-            all_traces = self.trace_manager.list_traces()
-            recent_traces = [t for t in all_traces if t.timestamp >= cutoff]
-            total_traces = len(recent_traces)
+            total_traces = self.trace_manager.count_traces(since=cutoff)
 
             # Find top performing agent (highest effectiveness)
             top_performing_agent = (
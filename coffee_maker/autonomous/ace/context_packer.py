@@ -0,0 +1,365 @@
+"""Cached, token-budgeted agent context for the ACE Generator.
+
+Agents get their required files upfront (US-042). Two pieces keep that cheap and
+useful for large files such as the 30k-line ROADMAP.md:
+
+- ``ContextFileCache``: one process-wide cache of context file contents,
+  validated by mtime and size, so agents starting in the same process do not
+  re-read unchanged files. Markdown files are split into sections once per
+  version.
+- ``ContextPacker``: fills a token budget (counted with the shared token
+  counting service) instead of cutting every file at a fixed number of
+  characters:
+
+  1. Stable block: the agent's instruction files (CLAUDE.md, agent definition,
+     ...) in a fixed order, whole sections only, within a fixed share of the
+     budget. It depends only on those files, so the packed prompt starts with the
+     same bytes on every call and provider-side prompt caching can reuse it.
+  2. Relevant block: the roadmap sections of the focused items (e.g. the current
+     priority), extra files such as its spec, then the in-progress and planned
+     roadmap items, until the budget is full.
+
+Example:
+    >>> from coffee_maker.autonomous.ace.context_packer import ContextPacker
+    >>>
+    >>> packer = ContextPacker()
+    >>> packed = packer.pack(
+    ...     [".claude/CLAUDE.md", ".claude/agents/code_developer.md", "docs/roadmap/ROADMAP.md"],
+    ...     token_budget=30000,
+    ...     focus=["PRIORITY 3"],
+    ...     extra_files=["docs/architecture/specs/SPEC-003.md"],
+    ... )
+    >>> packed.tokens <= 30000
+    True
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
+from coffee_maker.utils.token_service import TokenCountingService, approximate_token_count, get_token_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "anthropic/claude-sonnet-4"
+CONTEXT_HEADER = "=== CONTEXT FILES PROVIDED UPFRONT ===\n"
+CONTEXT_FOOTER = (
+    "=== END CONTEXT FILES ===\n\n"
+    "You have all required context above. Use Read tool for specific line ranges if needed, "
+    "but do NOT search with Glob/Grep for these known files."
+)
+ROADMAP_FILE_NAME = "ROADMAP.md"
+
+
+def resolve_context_path(file_path: str) -> Path:
+    """Resolve a context file path (relative paths are relative to the project root/cwd)."""
+    path = Path(file_path)
+    return path if path.is_absolute() else Path.cwd() / file_path
+
+
+@dataclass
+class _CachedFile:
+    """A cached file version and its lazily split sections."""
+
+    mtime_ns: int
+    size: int
+    content: str
+    sections: Optional[List[Tuple[str, str]]] = None
+
+
+class ContextFileCache:
+    """Process-wide cache of context files, validated by mtime and size.
+
+    Example:
+        >>> cache = get_context_cache()
+        >>> content = cache.read(Path(".claude/CLAUDE.md"))  # read from disk
+        >>> content = cache.read(Path(".claude/CLAUDE.md"))  # served from memory
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._files: Dict[str, _CachedFile] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def read(self, path: Path) -> str:
+        """Get the content of a file, re-reading it only if it changed.
+
+        Args:
+            path: File path
+
+        Returns:
+            File content
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return self._entry(path).content
+
+    def sections(self, path: Path) -> List[Tuple[str, str]]:
+        """Get a markdown file split at its level 1-2 headings.
+
+        Args:
+            path: File path
+
+        Returns:
+            List of (heading text, section text); text before the first heading
+            is a section with an empty heading. Joining the texts gives the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        entry = self._entry(path)
+        if entry.sections is None:
+            entry.sections = self._split(entry.content)
+        return entry.sections
+
+    def clear(self) -> None:
+        """Drop all cached files."""
+        with self._lock:
+            self._files.clear()
+
+    def _entry(self, path: Path) -> _CachedFile:
+        """Get the cache entry of a file's current version."""
+        stat = path.stat()
+        key = str(path.resolve())
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self.stats["hits"] += 1
+                return entry
+            self.stats["misses"] += 1
+
+        entry = _CachedFile(stat.st_mtime_ns, stat.st_size, path.read_text(encoding="utf-8"))
+        with self._lock:
+            self._files[key] = entry
+        logger.debug(f"Cached context file: {path} ({len(entry.content)} chars)")
+        return entry
+
+    @staticmethod
+    def _split(content: str) -> List[Tuple[str, str]]:
+        """Split markdown at level 1-2 headings outside code blocks."""
+        index = RoadmapIndex.build(content)
+        starts = [h for h in index.headings if h.level <= 2 and not h.in_code_block]
+
+        sections = []
+        data = index.data
+        boundaries = [0] + [h.start for h in starts] + [len(data)]
+        titles = [""] + [h.text for h in starts]
+        for title, start, end in zip(titles, boundaries, boundaries[1:]):
+            if end > start:
+                sections.append((title, data[start:end].decode("utf-8")))
+        return sections
+
+
+@dataclass
+class PackedContext:
+    """Result of packing agent context into a token budget.
+
+    Attributes:
+        text: Context text for the prompt
+        tokens: Token count of ``text`` (sum of its counted parts)
+        stable_tokens: Tokens of the stable prefix (header and instruction files)
+        included: Labels of the included files and sections, in prompt order
+        omitted: Number of sections left out for lack of budget
+    """
+
+    text: str
+    tokens: int
+    stable_tokens: int
+    included: List[str] = field(default_factory=list)
+    omitted: int = 0
+
+
+class ContextPacker:
+    """Packs agent context files into a token budget with a stable prefix."""
+
+    def __init__(
+        self,
+        cache: Optional[ContextFileCache] = None,
+        token_service: Optional[TokenCountingService] = None,
+        model: str = DEFAULT_MODEL,
+        stable_fraction: float = 0.5,
+    ):
+        """Initialize ContextPacker.
+
+        Args:
+            cache: Context file cache (default: the process-wide cache)
+            token_service: Token counter (default: the process-wide service)
+            model: Model whose tokenizer is used for counting
+            stable_fraction: Share of the budget for the stable instruction files
+        """
+        self.cache = cache or get_context_cache()
+        self.token_service = token_service or get_token_service()
+        self.model = model
+        self.stable_fraction = stable_fraction
+
+    def pack(
+        self,
+        files: Sequence[str],
+        token_budget: int,
+        focus: Sequence[str] = (),
+        extra_files: Sequence[str] = (),
+    ) -> PackedContext:
+        """Pack context files into a token budget.
+
+        Args:
+            files: Agent context files; ROADMAP.md files are packed by section,
+                the others form the stable prefix in the given order
+            token_budget: Maximum tokens of the packed context
+            focus: Roadmap item ids to include first (e.g. "PRIORITY 3", "US-104")
+            extra_files: Files relevant to the focus (e.g. its spec), included
+                after the focused roadmap sections
+
+        Returns:
+            PackedContext with the text and what was included
+        """
+        roadmaps = [f for f in files if Path(f).name == ROADMAP_FILE_NAME]
+        stable_files = [f for f in files if Path(f).name != ROADMAP_FILE_NAME]
+
+        parts: List[str] = [CONTEXT_HEADER]
+        included: List[str] = []
+        omitted = 0
+        used = self._count(CONTEXT_HEADER) + self._count(CONTEXT_FOOTER)
+
+        # 1. Stable prefix: instruction files, within a fixed share of the budget
+        stable_budget = int(token_budget * self.stable_fraction)
+        for file_path in stable_files:
+            text, tokens, skipped = self._pack_file(file_path, stable_budget - used)
+            if text:
+                parts.append(text)
+                included.append(file_path)
+                used += tokens
+            omitted += skipped
+        stable_tokens = used - self._count(CONTEXT_FOOTER)
+
+        # 2. Relevant block: focused roadmap items, extra files, then open roadmap items
+        roadmap_indexes = []
+        for file_path in roadmaps:
+            try:
+                roadmap_indexes.append((file_path, RoadmapIndex.for_path(resolve_context_path(file_path))))
+            except OSError as e:
+                parts.append(self._missing(file_path, e))
+                used += self._count(parts[-1])
+
+        taken: List[Tuple[str, int, int]] = []  # (file, start, end) of included roadmap sections
+
+        def add_section(file_path: str, index: RoadmapIndex, heading: RoadmapHeading) -> None:
+            nonlocal used, omitted
+            if any(f == file_path and s <= heading.start and heading.end <= e for f, s, e in taken):
+                return  # already included within an enclosing section
+            label = f"{file_path} ({heading.item_id or heading.text.lstrip('# ')})"
+            text = f"--- {label} ---\n{index.section_text(heading)}\n\n"
+            tokens = self._count_if_fits(text, token_budget - used)
+            if tokens is None:
+                omitted += 1
+                return
+            parts.append(text)
+            included.append(label)
+            taken.append((file_path, heading.start, heading.end))
+            used += tokens
+
+        for item_id in focus:
+            for file_path, index in roadmap_indexes:
+                heading = index.get(item_id)
+                if heading is not None:
+                    add_section(file_path, index, heading)
+
+        for file_path in extra_files:
+            text, tokens, skipped = self._pack_file(file_path, token_budget - used)
+            if text:
+                parts.append(text)
+                included.append(file_path)
+                used += tokens
+            omitted += skipped
+
+        for file_path, index in roadmap_indexes:
+            for heading in sorted(index.items(), key=lambda h: (self._status_rank(h.status), h.index)):
+                if self._status_rank(heading.status) < 2:
+                    add_section(file_path, index, heading)
+
+        parts.append(CONTEXT_FOOTER)
+        logger.debug(f"Packed {len(included)} context parts ({used}/{token_budget} tokens, {omitted} omitted)")
+        return PackedContext("".join(parts), used, stable_tokens, included, omitted)
+
+    # ==================== Internals ====================
+
+    def _pack_file(self, file_path: str, budget: int) -> Tuple[str, int, int]:
+        """Pack a file's leading sections that fit the budget.
+
+        Returns:
+            Tuple of (text, tokens, omitted section count)
+        """
+        try:
+            sections = self.cache.sections(resolve_context_path(file_path))
+        except OSError as e:
+            text = self._missing(file_path, e)
+            return text, self._count(text), 0
+
+        header = f"--- {file_path} ---\n"
+        texts = [header]
+        used = self._count(header)
+        for position, (_, section) in enumerate(sections):
+            tokens = self._count_if_fits(section, budget - used)
+            if tokens is None:
+                omitted = len(sections) - position
+                note = f"\n... [{omitted} sections omitted - use Read tool for the rest]\n"
+                texts.append(note)
+                used += self._count(note)
+                return "".join(texts) + "\n", used, omitted
+            texts.append(section)
+            used += tokens
+
+        return "".join(texts) + "\n\n", used, 0
+
+    def _count(self, text: str) -> int:
+        """Count tokens with the shared token counter."""
+        return self.token_service.count(text, model=self.model)
+
+    def _count_if_fits(self, text: str, budget: int) -> Optional[int]:
+        """Count a text's tokens, or None if it does not fit the budget.
+
+        Texts far larger than the budget are rejected on their approximate size
+        without being encoded.
+        """
+        if budget <= 0 or approximate_token_count(text) > 2 * budget:
+            return None
+        tokens = self._count(text)
+        return tokens if tokens <= budget else None
+
+    @staticmethod
+    def _status_rank(status: Optional[str]) -> int:
+        """Rank an item status: 0 in progress, 1 open/planned, 2 complete."""
+        status = (status or "").lower()
+        if "✅" in status or "complete" in status:
+            return 2
+        if "🔄" in status or "in progress" in status:
+            return 0
+        return 1
+
+    @staticmethod
+    def _missing(file_path: str, error: Exception) -> str:
+        """Placeholder for a context file that could not be read."""
+        logger.warning(f"Context file unavailable: {file_path} - {error}")
+        return f"--- {file_path} ---\nERROR: Required context file not found: {file_path}\n\n"
+
+
+_cache: Optional[ContextFileCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_context_cache() -> ContextFileCache:
+    """Get the process-wide ContextFileCache.
+
+    Returns:
+        Shared ContextFileCache instance
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ContextFileCache()
+    return _cache
@@ -51,8 +51,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+from coffee_maker.autonomous.ace.context_packer import ContextPacker, get_context_cache, resolve_context_path
 from coffee_maker.autonomous.ace.file_ownership import (
     FileOwnership,
     OwnershipUnclearError,
@@ -62,6 +63,39 @@ from coffee_maker.autonomous.agent_registry import AgentType
 logger = logging.getLogger(__name__)
 
 
+# Required context files per agent (aligned with agent definitions in .claude/agents/)
+AGENT_CONTEXT_FILES: Dict[AgentType, List[str]] = {
+    AgentType.CODE_DEVELOPER: [
+        "docs/roadmap/ROADMAP.md",
+        ".claude/CLAUDE.md",
+        ".claude/agents/code_developer.md",
+    ],
+    AgentType.PROJECT_MANAGER: [
+        "docs/roadmap/ROADMAP.md",
+        "docs/roadmap/TEAM_COLLABORATION.md",
+        "docs/roadmap/CRITICAL_FUNCTIONAL_REQUIREMENTS.md",
+        ".claude/CLAUDE.md",
+        ".claude/agents/project_manager.md",
+    ],
+    AgentType.ARCHITECT: [
+        "docs/roadmap/ROADMAP.md",
+        ".claude/CLAUDE.md",
+        ".claude/agents/architect.md",
+        "pyproject.toml",
+    ],
+    AgentType.ASSISTANT: [
+        ".claude/CLAUDE.md",
+        ".claude/agents/assistant.md",
+        "docs/roadmap/ROADMAP.md",
+    ],
+    AgentType.UX_DESIGN_EXPERT: [
+        ".claude/CLAUDE.md",
+        ".claude/agents/ux-design-expert.md",
+        "docs/roadmap/ROADMAP.md",
+    ],
+}
+
+
 class FileOperationType(Enum):
     """Types of file operations that can be intercepted."""
 
@@ -181,6 +215,8 @@ class Generator:
 
         This method implements the context-upfront file access pattern where agents
         receive required files upfront rather than searching for them during execution.
+        Files come from a process-wide cache validated by mtime, so they are only
+        re-read from disk when they change.
 
         Args:
             agent_type: The agent type to load context for
@@ -194,58 +230,16 @@ class Generator:
             >>> "docs/roadmap/ROADMAP.md" in context
             True
         """
-        # Define required files per agent (aligned with agent definitions in .claude/agents/)
-        AGENT_CONTEXT_FILES = {
-            AgentType.CODE_DEVELOPER: [
-                "docs/roadmap/ROADMAP.md",
-                ".claude/CLAUDE.md",
-                ".claude/agents/code_developer.md",
-            ],
-            AgentType.PROJECT_MANAGER: [
-                "docs/roadmap/ROADMAP.md",
-                "docs/roadmap/TEAM_COLLABORATION.md",
-                "docs/roadmap/CRITICAL_FUNCTIONAL_REQUIREMENTS.md",
-                ".claude/CLAUDE.md",
-                ".claude/agents/project_manager.md",
-            ],
-            AgentType.ARCHITECT: [
-                "docs/roadmap/ROADMAP.md",
-                ".claude/CLAUDE.md",
-                ".claude/agents/architect.md",
-                "pyproject.toml",
-            ],
-            AgentType.ASSISTANT: [
-                "docs/roadmap/ROADMAP.md",
-                ".claude/CLAUDE.md",
-                ".claude/agents/assistant.md",
-                ".claude/commands/PROMPTS_INDEX.md",
-            ],
-            AgentType.ASSISTANT: [
-                ".claude/CLAUDE.md",
-                ".claude/agents/assistant.md",
-                "docs/roadmap/ROADMAP.md",
-            ],
-            AgentType.UX_DESIGN_EXPERT: [
-                ".claude/CLAUDE.md",
-                ".claude/agents/ux-design-expert.md",
-                "docs/roadmap/ROADMAP.md",
-            ],
-        }
-
         context: Dict[str, str] = {}
         required_files = AGENT_CONTEXT_FILES.get(agent_type, [])
 
         logger.info(f"Loading context for {agent_type.value}: {len(required_files)} files")
 
+        cache = get_context_cache()
         for file_path in required_files:
             try:
-                # Construct absolute path
-                full_path = Path(file_path)
-                if not full_path.is_absolute():
-                    # Assume paths are relative to project root
-                    full_path = Path.cwd() / file_path
-
-                content = full_path.read_text(encoding="utf-8")
+                # Served from the process-wide cache unless the file changed
+                content = cache.read(resolve_context_path(file_path))
                 context[file_path] = content
                 logger.debug(f"Loaded context file: {file_path} ({len(content)} chars)")
             except FileNotFoundError:
@@ -300,6 +294,48 @@ class Generator:
 
         return "\n".join(lines)
 
+    def pack_agent_context(
+        self,
+        agent_type: AgentType,
+        token_budget: int = 30000,
+        focus: Sequence[str] = (),
+        extra_files: Sequence[str] = (),
+    ) -> str:
+        """Pack an agent's context files into a token budget for its prompt.
+
+        Unlike ``format_context_for_prompt``, large files are not cut at a fixed
+        number of characters: the roadmap contributes the sections of the focused
+        items first, then in-progress and planned items, until the budget is full.
+        The agent's instruction files form a stable prompt prefix (see
+        ``ContextPacker``).
+
+        Args:
+            agent_type: The agent type to pack context for
+            token_budget: Maximum tokens of packed context
+            focus: Roadmap items to include first (e.g. ["PRIORITY 3"])
+            extra_files: Files relevant to the focus (e.g. the priority's spec)
+
+        Returns:
+            Formatted string ready for prompt inclusion
+
+        Example:
+            >>> generator = Generator()
+            >>> prompt_context = generator.pack_agent_context(
+            ...     AgentType.CODE_DEVELOPER,
+            ...     token_budget=20000,
+            ...     focus=["US-104"],
+            ...     extra_files=["docs/architecture/specs/SPEC-104-orchestrator-continuous-work-loop.md"],
+            ... )
+        """
+        packed = ContextPacker().pack(
+            AGENT_CONTEXT_FILES.get(agent_type, []), token_budget, focus=focus, extra_files=extra_files
+        )
+        logger.info(
+            f"Packed context for {agent_type.value}: {packed.tokens}/{token_budget} tokens, "
+            f"{len(packed.included)} parts, {packed.omitted} sections omitted"
+        )
+        return packed.text
+
     def monitor_file_search(
         self, agent_type: AgentType, operation: str, file_pattern: str, context_provided: bool = True
     ) -> None:
@@ -39,6 +39,19 @@ class Execution:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Execution":
+        """Create from a dictionary produced by ``to_dict``."""
+        return cls(
+            execution_id=data["execution_id"],
+            prompt=data.get("prompt", ""),
+            input_data=data.get("input_data", {}),
+            output=data.get("output", ""),
+            result_status=data.get("result_status", ""),
+            duration_seconds=data.get("duration_seconds", 0.0),
+            metadata=data.get("metadata", {}),
+        )
+
 
 @dataclass
 class ExecutionTrace:
@@ -71,6 +84,18 @@ class ExecutionTrace:
             "context": self.context,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExecutionTrace":
+        """Create from a dictionary produced by ``to_dict``."""
+        return cls(
+            trace_id=data["trace_id"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            agent_identity=data.get("agent_identity", {}),
+            user_query=data.get("user_query", ""),
+            executions=[Execution.from_dict(e) for e in data.get("executions", [])],
+            context=data.get("context", {}),
+        )
+
 
 @dataclass
 class PlaybookBullet:
@@ -1,60 +1,214 @@
-"""Trace manager for ACE framework."""
+"""Trace manager for ACE framework.
 
+Execution traces are stored append-only, partitioned by date and agent, with a
+compact SQLite index next to them:
+
+    <trace_dir>/
+        2025-10-18/
+            code_developer.jsonl   # one JSON trace per line, never rewritten
+            assistant.jsonl
+        index.db                   # trace_id -> (segment, offset, length) + summary columns
+
+- Appends write one line to the trace's segment and index it with its
+  timestamp, agent, success flag and total duration, in one transaction
+  holding the index write lock (the trace_id primary key rejects duplicates).
+- Time-range and agent queries are answered from the index and only read the
+  byte ranges of the matching traces, newest first, with the limit applied
+  before anything is read.
+- Lookup by ID is a primary-key lookup followed by one seek into one segment.
+- Aggregates (``summarize``, ``count_traces``) are computed from the index
+  columns in SQL without loading traces.
+
+Segments are the source of truth: on first use, segments whose size differs
+from the bytes the index accounts for (e.g. a writer died between appending and
+indexing, or the index was deleted) are re-scanned, and index rows of deleted
+segments (pruned days) are dropped.
+
+Example:
+    >>> manager = TraceManager(Path("docs/generator/traces"))
+    >>> manager.append(trace)
+    >>> recent = manager.list_traces(since=datetime.now() - timedelta(hours=24), agent="assistant", limit=50)
+    >>> trace = manager.read_trace("trace_0042")
+"""
+
+import json
 import logging
-import random
+import os
+import re
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from coffee_maker.autonomous.ace.models import Execution, ExecutionTrace
+from coffee_maker.autonomous.ace.models import ExecutionTrace
 
 logger = logging.getLogger(__name__)
 
+INDEX_FILE = "index.db"
+
 
 class TraceManager:
-    """Manages execution traces."""
+    """Manages execution traces in date/agent-partitioned append-only segments."""
 
     def __init__(self, trace_dir: Path):
-        """Initialize trace manager.
+        """Initialize trace manager (the index is opened on first use).
 
         Args:
             trace_dir: Directory for trace storage
         """
-        self.trace_dir = trace_dir
+        self.trace_dir = Path(trace_dir)
+        self.index_path = self.trace_dir / INDEX_FILE
+        self._index_ready = False
+
+    # ==================== Writing ====================
+
+    def append(self, trace: ExecutionTrace) -> None:
+        """Append a trace to its date/agent segment and index it.
+
+        Args:
+            trace: Trace to store
+
+        Raises:
+            ValueError: If a trace with the same ID is already stored
+        """
+        day = trace.timestamp.strftime("%Y-%m-%d")
+        agent = self._agent_of(trace)
+        segment = f"{day}/{self._segment_name(agent)}.jsonl"
+        data = trace.to_dict()
+        line = (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+        segment_path = self.trace_dir / segment
+        segment_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            # The index write lock serializes appenders: the duplicate check (primary key),
+            # the segment write and the index rows form one transaction
+            conn.execute("BEGIN IMMEDIATE")
+            fd = os.open(segment_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                offset = os.fstat(fd).st_size
+                try:
+                    self._index_record(conn, segment, offset, len(line), data, ignore_existing=False)
+                except sqlite3.IntegrityError:
+                    raise ValueError(f"Trace already exists: {trace.trace_id}") from None
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            conn.execute(
+                "INSERT INTO segments (segment, indexed_bytes) VALUES (?, ?) "
+                "ON CONFLICT(segment) DO UPDATE SET indexed_bytes = indexed_bytes + excluded.indexed_bytes",
+                (segment, len(line)),
+            )
 
-    def list_traces(self, date: Optional[str] = None, agent: Optional[str] = None) -> List[ExecutionTrace]:
-        """List traces (optionally filtered).
+        logger.debug(f"Stored trace {trace.trace_id} in {segment}")
+
+    # ==================== Queries ====================
+
+    def list_traces(
+        self,
+        date: Optional[str] = None,
+        agent: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[ExecutionTrace]:
+        """List traces, newest first (optionally filtered).
 
         Args:
             date: Filter by date (YYYY-MM-DD)
             agent: Filter by agent name
+            since: Only traces at or after this time
+            limit: Maximum number of traces to read
 
         Returns:
             List of ExecutionTrace objects
         """
-        # For demo, generate mock traces
-        return self._generate_mock_traces(date=date, agent=agent)
+        if not self.trace_dir.exists():
+            return []
+
+        where, params = self._filters(date=date, agent=agent, since=since)
+        sql = f"SELECT segment, offset, length FROM traces{where} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
 
-    def get_traces_since(self, hours: int, agent: Optional[str] = None) -> List[ExecutionTrace]:
-        """Get traces from last N hours.
+        with self._connect() as conn:
+            locations = conn.execute(sql, params).fetchall()
+        return self._read_records(locations)
+
+    def get_traces_since(
+        self, hours: int, agent: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[ExecutionTrace]:
+        """Get traces from last N hours, newest first.
 
         Args:
             hours: Number of hours to look back
             agent: Optional agent filter
+            limit: Maximum number of traces to read
 
         Returns:
             List of ExecutionTrace objects
         """
         cutoff = datetime.now() - timedelta(hours=hours)
-        all_traces = self.list_traces(agent=agent)
-        return [t for t in all_traces if t.timestamp >= cutoff]
+        return self.list_traces(agent=agent, since=cutoff, limit=limit)
+
+    def count_traces(
+        self, date: Optional[str] = None, agent: Optional[str] = None, since: Optional[datetime] = None
+    ) -> int:
+        """Count traces without reading them.
+
+        Args:
+            date: Filter by date (YYYY-MM-DD)
+            agent: Filter by agent name
+            since: Only traces at or after this time
+
+        Returns:
+            Number of matching traces
+        """
+        if not self.trace_dir.exists():
+            return 0
+
+        where, params = self._filters(date=date, agent=agent, since=since)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM traces{where}", params).fetchone()[0]
+
+    def summarize(self, since: Optional[datetime] = None, agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Aggregate traces per day and agent from the index.
+
+        Args:
+            since: Only traces at or after this time
+            agent: Optional agent filter
+
+        Returns:
+            List of dicts with day, agent, total, success_count and duration_seconds
+            (sum of execution durations), ordered by day and agent
+        """
+        if not self.trace_dir.exists():
+            return []
+
+        where, params = self._filters(agent=agent, since=since)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT day, agent, COUNT(*), SUM(success), SUM(duration_seconds)
+                FROM traces{where}
+                GROUP BY day, agent
+                ORDER BY day, agent
+                """,
+                params,
+            ).fetchall()
+
+        return [
+            {"day": day, "agent": agent_name, "total": total, "success_count": success, "duration_seconds": duration}
+            for day, agent_name, total, success, duration in rows
+        ]
 
     def read_trace(self, trace_id: str, date: Optional[str] = None) -> ExecutionTrace:
         """Read specific trace by ID.
 
         Args:
             trace_id: Trace ID
-            date: Optional date hint
+            date: Optional date hint (unused: lookups go through the index)
 
         Returns:
             ExecutionTrace object
@@ -62,86 +216,176 @@ class TraceManager:
         Raises:
             FileNotFoundError: If trace not found
         """
-        # For demo, just generate a mock trace
-        all_traces = self.list_traces()
-        for trace in all_traces:
-            if trace.trace_id == trace_id:
-                return trace
+        if not self.trace_dir.exists():
+            raise FileNotFoundError(f"Trace not found: {trace_id}")
 
-        raise FileNotFoundError(f"Trace not found: {trace_id}")
+        with self._connect() as conn:
+            location = conn.execute(
+                "SELECT segment, offset, length FROM traces WHERE trace_id = ?", (trace_id,)
+            ).fetchone()
 
-    def _generate_mock_traces(
-        self, date: Optional[str] = None, agent: Optional[str] = None, count: int = 50
-    ) -> List[ExecutionTrace]:
-        """Generate mock traces for demo.
+        if location is None:
+            raise FileNotFoundError(f"Trace not found: {trace_id}")
+        return self._read_records([location])[0]
 
-        Args:
-            date: Date filter
-            agent: Agent filter
-            count: Number of traces to generate
+    # ==================== Index ====================
 
-        Returns:
-            List of mock ExecutionTrace objects
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the index (creating and catching it up on first use)."""
+        self._ensure_index()
+        conn = sqlite3.connect(str(self.index_path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_index(self) -> None:
+        """Create the index schema and index segment bytes it does not account for."""
+        if self._index_ready:
+            return
+
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS traces (
+                        trace_id TEXT PRIMARY KEY,
+                        day TEXT NOT NULL,
+                        agent TEXT NOT NULL,
+                        timestamp TEXT NOT NULL,
+                        segment TEXT NOT NULL,
+                        offset INTEGER NOT NULL,
+                        length INTEGER NOT NULL,
+                        success INTEGER NOT NULL,
+                        duration_seconds REAL NOT NULL,
+                        execution_count INTEGER NOT NULL
+                    )
+                    """
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_traces_timestamp ON traces(timestamp)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_traces_agent_timestamp ON traces(agent, timestamp)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_traces_day_agent ON traces(day, agent)")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS segments (segment TEXT PRIMARY KEY, indexed_bytes INTEGER NOT NULL)"
+                )
+
+            indexed = dict(conn.execute("SELECT segment, indexed_bytes FROM segments"))
+            for segment_path in sorted(self.trace_dir.glob("*/*.jsonl")):
+                segment = segment_path.relative_to(self.trace_dir).as_posix()
+                if segment_path.stat().st_size != indexed.pop(segment, 0):
+                    with conn:
+                        self._reindex_segment(conn, segment)
+
+            # Segments deleted from disk (e.g. old days pruned): drop their index rows
+            with conn:
+                for segment in indexed:
+                    conn.execute("DELETE FROM traces WHERE segment = ?", (segment,))
+                    conn.execute("DELETE FROM segments WHERE segment = ?", (segment,))
+        finally:
+            conn.close()
+
+        self._index_ready = True
+
+    def _reindex_segment(self, conn: sqlite3.Connection, segment: str) -> None:
+        """Index every complete line of a segment (already indexed traces are kept)."""
+        offset = 0
+        count = 0
+        with open(self.trace_dir / segment, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a write in progress or a torn write: not a complete record
+                try:
+                    self._index_record(conn, segment, offset, len(line), json.loads(line))
+                    count += 1
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping unreadable trace at {segment}:{offset}: {e}")
+                offset += len(line)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO segments (segment, indexed_bytes) VALUES (?, ?)",
+            (segment, offset),
+        )
+        logger.info(f"Indexed {count} traces from {segment}")
+
+    def _index_record(
+        self,
+        conn: sqlite3.Connection,
+        segment: str,
+        offset: int,
+        length: int,
+        data: Dict,
+        ignore_existing: bool = True,
+    ) -> None:
+        """Insert the index row of a stored trace.
+
+        Raises:
+            sqlite3.IntegrityError: If the trace ID is already indexed and ignore_existing is False
         """
-        agents = [
-            "user_interpret",
-            "assistant",
-            "code_searcher",
-            "code_developer",
-            "project_manager",
-        ]
+        executions = data.get("executions", [])
+        timestamp = datetime.fromisoformat(data["timestamp"])
+        conn.execute(
+            f"""
+            INSERT {"OR IGNORE " if ignore_existing else ""}INTO traces (
+                trace_id, day, agent, timestamp, segment, offset, length,
+                success, duration_seconds, execution_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                data["trace_id"],
+                timestamp.strftime("%Y-%m-%d"),
+                data.get("agent_identity", {}).get("target_agent", "unknown"),
+                timestamp.isoformat(),
+                segment,
+                offset,
+                length,
+                int(bool(executions) and all(e.get("result_status") == "success" for e in executions)),
+                sum(e.get("duration_seconds", 0.0) for e in executions),
+                len(executions),
+            ),
+        )
+
+    @staticmethod
+    def _filters(date: Optional[str] = None, agent: Optional[str] = None, since: Optional[datetime] = None) -> tuple:
+        """Build the WHERE clause and parameters of an index query."""
+        clauses, params = [], []
+        if date:
+            clauses.append("day = ?")
+            params.append(date)
         if agent:
-            agents = [agent]
-
-        queries = [
-            "Implement user authentication feature",
-            "Fix bug in database connection pooling",
-            "Add unit tests for API endpoints",
-            "Optimize query performance",
-            "Update documentation for new features",
-            "Refactor legacy code module",
-            "Add logging to critical operations",
-            "Implement caching layer",
-            "Fix security vulnerability in input validation",
-            "Add error handling for edge cases",
-        ]
+            clauses.append("agent = ?")
+            params.append(agent)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since.isoformat())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
 
-        traces = []
-        base_time = datetime.now() if not date else datetime.fromisoformat(date)
-
-        for i in range(count):
-            trace_id = f"trace_{i:04d}"
-            agent_name = random.choice(agents)
-            timestamp = base_time - timedelta(hours=random.randint(0, 72))
-            user_query = random.choice(queries)
-
-            # Generate 1-3 executions per trace
-            num_executions = random.randint(1, 3)
-            executions = []
-
-            for j in range(num_executions):
-                exec_id = f"{trace_id}_exec_{j}"
-                result_status = random.choices(["success", "failure", "error"], weights=[0.85, 0.10, 0.05])[0]
-
-                execution = Execution(
-                    execution_id=exec_id,
-                    prompt=f"Process: {user_query}",
-                    input_data={"query": user_query, "context": {}},
-                    output=(f"Completed {user_query}" if result_status == "success" else "Failed to complete"),
-                    result_status=result_status,
-                    duration_seconds=random.uniform(0.5, 15.0),
-                    metadata={"iteration": j + 1},
-                )
-                executions.append(execution)
-
-            trace = ExecutionTrace(
-                trace_id=trace_id,
-                timestamp=timestamp,
-                agent_identity={"target_agent": agent_name, "version": "1.0"},
-                user_query=user_query,
-                executions=executions,
-                context={"session_id": f"session_{i % 10}"},
-            )
-            traces.append(trace)
+    def _read_records(self, locations: List[tuple]) -> List[ExecutionTrace]:
+        """Read traces at (segment, offset, length) locations, keeping their order."""
+        traces: List[Optional[ExecutionTrace]] = [None] * len(locations)
+        by_segment: Dict[str, List[int]] = {}
+        for position, (segment, _, _) in enumerate(locations):
+            by_segment.setdefault(segment, []).append(position)
+
+        for segment, positions in by_segment.items():
+            with open(self.trace_dir / segment, "rb") as f:
+                for position in sorted(positions, key=lambda p: locations[p][1]):
+                    _, offset, length = locations[position]
+                    f.seek(offset)
+                    traces[position] = ExecutionTrace.from_dict(json.loads(f.read(length)))
 
         return traces
+
+    @staticmethod
+    def _agent_of(trace: ExecutionTrace) -> str:
+        """Get the agent a trace belongs to."""
+        return trace.agent_identity.get("target_agent", "unknown")
+
+    @staticmethod
+    def _segment_name(agent: str) -> str:
+        """Get a filesystem-safe segment name for an agent."""
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", agent) or "unknown"
@@ -24,6 +24,15 @@ Context Manager Pattern (Recommended):
     ...     # Agent work here
     ...     pass  # Automatically unregistered on exit
 
+Host-wide Enforcement:
+    The registry itself only sees agents of its own process. Pass a
+    ``status_registry`` (see agent_status_registry.py) to also claim the agent
+    type in the host-wide status table, so a second process is refused too:
+
+    >>> from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry
+    >>> with AgentRegistry.register(AgentType.CODE_DEVELOPER, status_registry=get_agent_status_registry()):
+    ...     pass
+
 Key Features:
     - Thread-safe locking using threading.Lock
     - Singleton pattern ensures single registry instance
@@ -38,7 +47,10 @@ import threading
 from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from coffee_maker.autonomous.agent_status_registry import AgentStatusRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -147,18 +159,28 @@ class AgentRegistry:
         # Track active agents: {AgentType: {pid, started_at}}
         self._agents: Dict[AgentType, Dict[str, any]] = {}
 
+        # Host-wide claims held by registered agents: {AgentType: AgentStatusRegistry}
+        self._host_claims: Dict[AgentType, "AgentStatusRegistry"] = {}
+
         self._initialized = True
         logger.info("AgentRegistry initialized (singleton)")
 
-    def register_agent(self, agent_type: AgentType, pid: Optional[int] = None) -> None:
+    def register_agent(
+        self,
+        agent_type: AgentType,
+        pid: Optional[int] = None,
+        status_registry: Optional["AgentStatusRegistry"] = None,
+    ) -> None:
         """Register an agent as running.
 
         Args:
             agent_type: Type of agent to register
             pid: Process ID (defaults to current process)
+            status_registry: Host-wide status registry to also claim the agent in
 
         Raises:
             AgentAlreadyRunningError: If agent of this type is already running
+                (in this process, or in another process when status_registry is given)
             ValueError: If agent_type is not a valid AgentType
 
         Example:
@@ -178,6 +200,11 @@ class AgentRegistry:
                     existing_started_at=existing["started_at"],
                 )
 
+            # Claim host-wide before registering locally
+            if status_registry is not None:
+                status_registry.claim(agent_type.value, pid=pid)
+                self._host_claims[agent_type] = status_registry
+
             # Register the agent
             self._agents[agent_type] = {
                 "pid": pid or os.getpid(),
@@ -204,6 +231,9 @@ class AgentRegistry:
             if agent_type in self._agents:
                 pid = self._agents[agent_type]["pid"]
                 del self._agents[agent_type]
+                status_registry = self._host_claims.pop(agent_type, None)
+                if status_registry is not None:
+                    status_registry.release(agent_type.value, pid=pid)
                 logger.info(f"Agent unregistered: {agent_type.value} (PID: {pid})")
             else:
                 logger.warning(f"Attempted to unregister non-registered agent: {agent_type.value}")
@@ -275,12 +305,20 @@ class AgentRegistry:
             >>> registry.reset()  # Clear all agents
         """
         with self._agent_lock:
+            for agent_type, status_registry in self._host_claims.items():
+                status_registry.release(agent_type.value, pid=self._agents[agent_type]["pid"])
+            self._host_claims.clear()
             self._agents.clear()
             logger.warning("AgentRegistry reset - all agents unregistered")
 
     @classmethod
     @contextmanager
-    def register(cls, agent_type: AgentType, pid: Optional[int] = None):
+    def register(
+        cls,
+        agent_type: AgentType,
+        pid: Optional[int] = None,
+        status_registry: Optional["AgentStatusRegistry"] = None,
+    ):
         """Context manager for automatic agent registration/unregistration.
 
         This is the RECOMMENDED way to use the registry as it ensures
@@ -289,6 +327,7 @@ class AgentRegistry:
         Args:
             agent_type: Type of agent to register
             pid: Process ID (defaults to current process)
+            status_registry: Host-wide status registry to also claim the agent in
 
         Yields:
             AgentRegistry instance
@@ -302,7 +341,7 @@ class AgentRegistry:
             ...     pass  # Automatically unregistered on exit
         """
         registry = cls()
-        registry.register_agent(agent_type, pid=pid)
+        registry.register_agent(agent_type, pid=pid, status_registry=status_registry)
         try:
             yield registry
         finally:
@@ -0,0 +1,332 @@
+"""Host-wide agent status registry (heartbeats, liveness, singleton claims).
+
+Agents used to publish their state by rewriting ``{agent}_status.json`` on every
+iteration, and the orchestrator and dashboards re-parsed those files - sometimes
+catching them half-written. ``AgentRegistry`` only sees agents of its own process.
+
+This registry is one small SQLite table in WAL mode shared by every process on the
+host (``data/agent_status/agent_status.db``), one row per agent type:
+
+- Heartbeats are single-statement upserts: atomic, and counters (heartbeats,
+  errors) are incremented in place.
+- Readers get a consistent snapshot of all agents with one SELECT on an open
+  connection (under 0.1 ms for all agents), never a torn file.
+- Liveness is checked against the recorded PID, so a crashed agent is reported
+  as not alive even though its last row says "working".
+- ``claim()``/``release()`` give singleton enforcement across processes: a claim
+  held by a live PID blocks other processes; a claim left by a dead PID is taken over.
+
+Example:
+    >>> from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry
+    >>>
+    >>> registry = get_agent_status_registry()
+    >>> registry.claim("code_developer")
+    >>> registry.heartbeat("code_developer", state="working", current_task={"priority": "US-104"})
+    >>> registry.snapshot()["code_developer"]["alive"]
+    True
+    >>> registry.release("code_developer")
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATUS_DIR = Path("data/agent_status")
+STATUS_DB_NAME = "agent_status.db"
+
+_COLUMNS = (
+    "agent_type, pid, state, health, current_task, metrics, error, started_at, "
+    "last_heartbeat, next_check, heartbeats, errors, claimed"
+)
+
+
+def pid_alive(pid: Optional[int]) -> bool:
+    """Check whether a process exists on this host.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        True if the process exists (signal 0 can be delivered or is denied)
+    """
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True  # exists, owned by another user
+    except (OSError, ProcessLookupError):
+        return False
+    return True
+
+
+class AgentStatusRegistry:
+    """Host-wide agent status table in a WAL SQLite database.
+
+    One connection is kept per process (reopened after a fork) and shared by
+    its threads under a lock, so heartbeats and snapshots do not pay for
+    opening the database.
+
+    Attributes:
+        db_path: Path to the registry database
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize the registry (the database is created on first use).
+
+        Args:
+            db_path: Database path (default: data/agent_status/agent_status.db)
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_STATUS_DIR / STATUS_DB_NAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    # ==================== Writers ====================
+
+    def heartbeat(
+        self,
+        agent_type: str,
+        state: str,
+        current_task: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        next_check: Optional[float] = None,
+        pid: Optional[int] = None,
+    ) -> None:
+        """Record an agent heartbeat atomically.
+
+        Args:
+            agent_type: Agent type value (e.g. "code_developer")
+            state: Agent state (idle, working, error, stopped, crashed)
+            current_task: Current task, if any
+            metrics: Agent metrics
+            error: Error message if the agent hit an error
+            next_check: Epoch seconds of the agent's next scheduled check
+            pid: Process ID (defaults to current process)
+        """
+        health = {"error": "unhealthy", "crashed": "unhealthy", "stopped": "stopped"}.get(state, "healthy")
+        now = time.time()
+        with self._cursor() as conn:
+            conn.execute(
+                f"""
+                INSERT INTO agent_status ({_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, 0)
+                ON CONFLICT(agent_type) DO UPDATE SET
+                    pid = excluded.pid,
+                    state = excluded.state,
+                    health = excluded.health,
+                    current_task = excluded.current_task,
+                    metrics = excluded.metrics,
+                    error = excluded.error,
+                    started_at = CASE WHEN agent_status.pid = excluded.pid
+                                      THEN agent_status.started_at ELSE excluded.started_at END,
+                    last_heartbeat = excluded.last_heartbeat,
+                    next_check = excluded.next_check,
+                    heartbeats = agent_status.heartbeats + 1,
+                    errors = agent_status.errors + excluded.errors,
+                    claimed = CASE WHEN agent_status.pid = excluded.pid THEN agent_status.claimed ELSE 0 END
+                """,
+                (
+                    agent_type,
+                    pid or os.getpid(),
+                    state,
+                    health,
+                    json.dumps(current_task) if current_task is not None else None,
+                    json.dumps(metrics or {}),
+                    error,
+                    now,
+                    now,
+                    next_check,
+                    1 if error else 0,
+                ),
+            )
+
+    def claim(self, agent_type: str, pid: Optional[int] = None) -> None:
+        """Claim the single slot of an agent type on this host.
+
+        Args:
+            agent_type: Agent type value
+            pid: Process ID (defaults to current process)
+
+        Raises:
+            AgentAlreadyRunningError: If a live process other than ``pid`` holds the claim
+        """
+        from coffee_maker.autonomous.agent_registry import AgentAlreadyRunningError, AgentType
+
+        pid = pid or os.getpid()
+        now = time.time()
+        with self._cursor(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT pid, started_at FROM agent_status WHERE agent_type = ? AND claimed = 1", (agent_type,)
+            ).fetchone()
+            if row and row[0] != pid and pid_alive(row[0]):
+                raise AgentAlreadyRunningError(
+                    agent_type=AgentType(agent_type),
+                    existing_pid=row[0],
+                    existing_started_at=datetime.fromtimestamp(row[1]).isoformat(),
+                )
+            if row and row[0] != pid:
+                logger.warning(f"Taking over {agent_type} claim left by dead PID {row[0]}")
+
+            conn.execute(
+                f"""
+                INSERT INTO agent_status ({_COLUMNS})
+                VALUES (?, ?, 'starting', 'healthy', NULL, '{{}}', NULL, ?, ?, NULL, 0, 0, 1)
+                ON CONFLICT(agent_type) DO UPDATE SET
+                    pid = excluded.pid,
+                    state = excluded.state,
+                    health = excluded.health,
+                    current_task = NULL,
+                    error = NULL,
+                    started_at = excluded.started_at,
+                    last_heartbeat = excluded.last_heartbeat,
+                    claimed = 1
+                """,
+                (agent_type, pid, now, now),
+            )
+        logger.info(f"Agent claimed host-wide: {agent_type} (PID: {pid})")
+
+    def release(self, agent_type: str, pid: Optional[int] = None) -> None:
+        """Release a claim held by ``pid`` (no-op if another process holds it).
+
+        Args:
+            agent_type: Agent type value
+            pid: Process ID (defaults to current process)
+        """
+        with self._cursor() as conn:
+            conn.execute(
+                "UPDATE agent_status SET claimed = 0 WHERE agent_type = ? AND pid = ?",
+                (agent_type, pid or os.getpid()),
+            )
+
+    # ==================== Readers ====================
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a consistent snapshot of all agents.
+
+        Returns:
+            Dictionary mapping agent type to its status: the fields of the
+            legacy status file (agent_type, state, current_task, last_heartbeat,
+            next_check, health, pid, metrics, error) plus started_at, heartbeats,
+            errors, claimed, alive (PID exists) and heartbeat_age_seconds
+        """
+        if not self.db_path.exists():
+            return {}
+        with self._cursor() as conn:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM agent_status").fetchall()
+        now = time.time()
+        return {row[0]: self._to_status(row, now) for row in rows}
+
+    def get(self, agent_type: str) -> Optional[Dict[str, Any]]:
+        """Get the status of one agent.
+
+        Args:
+            agent_type: Agent type value
+
+        Returns:
+            Status dictionary (see ``snapshot``), or None if never seen
+        """
+        if not self.db_path.exists():
+            return None
+        with self._cursor() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM agent_status WHERE agent_type = ?", (agent_type,)).fetchone()
+        return self._to_status(row, time.time()) if row else None
+
+    # ==================== Internals ====================
+
+    @staticmethod
+    def _to_status(row: tuple, now: float) -> Dict[str, Any]:
+        """Convert a table row to a status dictionary."""
+        (agent_type, pid, state, health, task, metrics, error, started, beat, next_check, beats, errors, claimed) = row
+        return {
+            "agent_type": agent_type,
+            "state": state,
+            "current_task": json.loads(task) if task else None,
+            "last_heartbeat": datetime.fromtimestamp(beat).isoformat(),
+            "next_check": datetime.fromtimestamp(next_check).isoformat() if next_check else None,
+            "health": health,
+            "pid": pid,
+            "metrics": json.loads(metrics) if metrics else {},
+            "error": error,
+            "started_at": datetime.fromtimestamp(started).isoformat() if started else None,
+            "heartbeats": beats,
+            "errors": errors,
+            "claimed": bool(claimed),
+            "alive": pid_alive(pid),
+            "heartbeat_age_seconds": max(0.0, now - beat),
+        }
+
+    @contextmanager
+    def _cursor(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction on this process's connection."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this process's connection, creating the database on first use."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS agent_status (
+                    agent_type TEXT PRIMARY KEY,
+                    pid INTEGER,
+                    state TEXT NOT NULL,
+                    health TEXT NOT NULL,
+                    current_task TEXT,
+                    metrics TEXT,
+                    error TEXT,
+                    started_at REAL,
+                    last_heartbeat REAL NOT NULL,
+                    next_check REAL,
+                    heartbeats INTEGER NOT NULL DEFAULT 0,
+                    errors INTEGER NOT NULL DEFAULT 0,
+                    claimed INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+
+_registries: Dict[Path, AgentStatusRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_agent_status_registry(status_dir: Optional[Path] = None) -> AgentStatusRegistry:
+    """Get the process-wide AgentStatusRegistry for a status directory.
+
+    Args:
+        status_dir: Agent status directory (default: data/agent_status)
+
+    Returns:
+        Shared AgentStatusRegistry instance
+    """
+    db_path = Path(status_dir or DEFAULT_STATUS_DIR) / STATUS_DB_NAME
+    registry = _registries.get(db_path)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(db_path, AgentStatusRegistry(db_path))
+    return registry
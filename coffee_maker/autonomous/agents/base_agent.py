@@ -3,7 +3,7 @@
 This module provides common infrastructure that ALL agents must have:
 - CFR-013 enforcement (roadmap branch only)
 - CFR-012 interruption handling (urgent requests first)
-- Status file writing (heartbeat every iteration)
+- Status heartbeat every iteration (host-wide status registry)
 - Message queue management (inbox for inter-agent delegation)
 - Git operations with branch validation
 
@@ -24,7 +24,7 @@ Architecture:
     ├── _enforce_cfr_013(): Validate roadmap branch
     ├── _check_inbox_urgent(): Check for urgent messages (CFR-012)
     ├── _check_inbox(): Check for regular messages
-    ├── _write_status(): Write heartbeat and status
+    ├── _write_status(): Heartbeat into the host-wide status registry
     ├── commit_changes(): Git commit with agent identification
     └── Abstract methods (implemented by subclasses)
         ├── _do_background_work(): Agent-specific continuous tasks
@@ -73,8 +73,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from coffee_maker.autonomous.agent_registry import AgentType
+from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry
 from coffee_maker.autonomous.git_manager import GitManager
 from coffee_maker.autonomous.message_queue import MessageQueue
+from coffee_maker.utils.file_io import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +91,7 @@ class BaseAgent(ABC):
     This class provides common infrastructure that ALL agents must have:
     - CFR-013 enforcement (roadmap branch only)
     - CFR-012 interruption handling (urgent requests first)
-    - Status file writing (heartbeat every 30 seconds)
+    - Status heartbeat every 30 seconds (host-wide status registry)
     - Message queue management (inbox for inter-agent delegation)
     - Git operations with branch validation
 
@@ -103,7 +105,8 @@ class BaseAgent(ABC):
         message_dir: Directory for message queues
         check_interval: Seconds between background work checks
         git: GitManager instance for git operations
-        status_file: Path to this agent's status file
+        status_file: Path to this agent's status file (mirror of its registry row)
+        status_registry: Host-wide status registry receiving heartbeats
         inbox_dir: Path to this agent's message inbox
 
     Example:
@@ -123,6 +126,9 @@ class BaseAgent(ABC):
         >>> agent.run_continuous()  # Runs until stopped
     """
 
+    # Longest an unchanged status file may go without a fresh last_heartbeat
+    STATUS_MIRROR_REFRESH_SECONDS = 30
+
     def __init__(
         self,
         agent_type: AgentType,
@@ -154,6 +160,11 @@ class BaseAgent(ABC):
         self.current_task: Optional[Dict[str, Any]] = None
         self.metrics: Dict[str, Any] = {}
 
+        # Host-wide status registry (heartbeats) and the state last mirrored to status_file
+        self.status_registry = get_agent_status_registry(self.status_dir)
+        self._mirrored_status: Optional[str] = None
+        self._mirrored_at = 0.0
+
         # Message queue (database-backed)
         self.message_queue = MessageQueue()
 
@@ -480,68 +491,102 @@ class BaseAgent(ABC):
         return messages
 
     def _write_status(self, error: Optional[str] = None):
-        """Write status file with current state (heartbeat).
+        """Record a heartbeat with the current state.
 
-        Status file is written every iteration to track:
-        - Agent state (idle, working, error)
-        - Current task and progress
-        - Heartbeat timestamp
-        - Health metrics
-        - Error information if any
+        Every call is an atomic upsert into the host-wide status registry
+        (state, current task, metrics, error, PID, heartbeat counters), which
+        is what the orchestrator, project_manager and dashboards read.
 
-        The status file is used by:
-        - Orchestrator for health monitoring
-        - Project_manager for status dashboard
-        - Other agents for coordination
+        The legacy status file is kept as a human-readable mirror. It is
+        replaced atomically when state, task or error changed, and at least
+        every STATUS_MIRROR_REFRESH_SECONDS otherwise so its last_heartbeat
+        stays fresh for file readers.
 
         Args:
             error: Optional error message if agent encountered error
         """
-        status = {
-            "agent_type": self.agent_type.value,
-            "state": ("error" if error else ("working" if self.current_task else "idle")),
-            "current_task": self.current_task,
-            "last_heartbeat": datetime.now().isoformat(),
-            "next_check": (datetime.now() + timedelta(seconds=self.check_interval)).isoformat(),
-            "health": "unhealthy" if error else "healthy",
-            "pid": os.getpid(),
-            "metrics": self.metrics,
-            "error": error,
-        }
+        state = "error" if error else ("working" if self.current_task else "idle")
+        next_check = datetime.now() + timedelta(seconds=self.check_interval)
 
         try:
-            self.status_file.write_text(json.dumps(status, indent=2))
+            self.status_registry.heartbeat(
+                self.agent_type.value,
+                state=state,
+                current_task=self.current_task,
+                metrics=self.metrics,
+                error=error,
+                next_check=next_check.timestamp(),
+            )
             self.last_heartbeat = datetime.now()
         except Exception as e:
             logger.error(f"Error writing status: {e}")
 
+        self._mirror_status_file(
+            {
+                "agent_type": self.agent_type.value,
+                "state": state,
+                "current_task": self.current_task,
+                "last_heartbeat": datetime.now().isoformat(),
+                "next_check": next_check.isoformat(),
+                "health": "unhealthy" if error else "healthy",
+                "pid": os.getpid(),
+                "metrics": self.metrics,
+                "error": error,
+            }
+        )
+
     def _write_status_stopped(self):
-        """Update status file to show agent stopped.
+        """Update status to show agent stopped.
 
-        This keeps the status file for debugging (especially crash info)
-        but marks it as stopped so activity_summary can distinguish between
+        This keeps the status row and file for debugging (especially crash info)
+        but marks them as stopped so activity_summary can distinguish between
         running agents and stopped/crashed agents.
 
         Called automatically when agent stops (normal exit or KeyboardInterrupt).
         """
-        status = {
-            "agent_type": self.agent_type.value,
-            "state": "stopped",
-            "current_task": self.current_task,
-            "last_heartbeat": datetime.now().isoformat(),
-            "stopped_at": datetime.now().isoformat(),
-            "health": "stopped",
-            "pid": os.getpid(),
-            "metrics": self.metrics,
-            "error": None,
-        }
-
         try:
-            self.status_file.write_text(json.dumps(status, indent=2))
-            logger.info(f"✅ Updated status to 'stopped': {self.status_file}")
+            self.status_registry.heartbeat(
+                self.agent_type.value, state="stopped", current_task=self.current_task, metrics=self.metrics
+            )
         except Exception as e:
             logger.error(f"Error updating stopped status: {e}")
 
+        self._mirror_status_file(
+            {
+                "agent_type": self.agent_type.value,
+                "state": "stopped",
+                "current_task": self.current_task,
+                "last_heartbeat": datetime.now().isoformat(),
+                "stopped_at": datetime.now().isoformat(),
+                "health": "stopped",
+                "pid": os.getpid(),
+                "metrics": self.metrics,
+                "error": None,
+            }
+        )
+        logger.info(f"✅ Updated status to 'stopped': {self.status_file}")
+
+    def _mirror_status_file(self, status: Dict[str, Any]) -> None:
+        """Atomically rewrite the status file if state, task or error changed.
+
+        An unchanged status is still rewritten once it is older than
+        STATUS_MIRROR_REFRESH_SECONDS, so the mirrored last_heartbeat never
+        lags the registry by more than that.
+
+        Args:
+            status: Status dictionary to write
+        """
+        signature = json.dumps([status["state"], status["current_task"], status["error"]], default=str)
+        now = time.monotonic()
+        if signature == self._mirrored_status and now - self._mirrored_at < self.STATUS_MIRROR_REFRESH_SECONDS:
+            return
+        try:
+            atomic_write_json(self.status_file, status)
+            self._mirrored_status = signature
+            self._mirrored_at = now
+        except Exception as e:
+            logger.error(f"Error writing status file: {e}")
+
     def commit_changes(self, message: str, files: Optional[List[str]] = None):
         """Commit changes with agent identification.
 
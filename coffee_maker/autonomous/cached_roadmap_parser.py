@@ -25,6 +25,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +40,7 @@ class CachedRoadmapParser:
 
     Attributes:
         roadmap_path: Path to ROADMAP.md
-        _cached_content: Cached file content
+        _index: Shared section index of the cached content
         _cached_priorities: Cached parsed priorities
         _last_mtime: Last modification time of file
         _pattern: Pre-compiled regex pattern for priority headers
@@ -69,9 +71,8 @@ class CachedRoadmapParser:
             raise FileNotFoundError(f"ROADMAP not found: {roadmap_path}")
 
         # Cache state
-        self._cached_content: Optional[str] = None
+        self._index: Optional[RoadmapIndex] = None
         self._cached_priorities: Optional[List[Dict]] = None
-        self._cached_lines: Optional[List[str]] = None
         self._last_mtime: Optional[float] = None
 
         logger.info(f"Initialized cached parser for {roadmap_path}")
@@ -95,19 +96,23 @@ class CachedRoadmapParser:
         return False
 
     def _load_file(self) -> str:
-        """Load file content and update cache.
+        """Load the shared section index and update cache.
 
         Returns:
             File content as string
         """
-        self._cached_content = self.roadmap_path.read_text()
-        self._cached_lines = self._cached_content.split("\n")
+        self._index = RoadmapIndex.for_path(self.roadmap_path)
         self._last_mtime = self.roadmap_path.stat().st_mtime
-        logger.debug(f"Loaded roadmap: {len(self._cached_lines)} lines")
-        return self._cached_content
+        logger.debug(f"Loaded roadmap: {len(self._index.headings)} headings")
+        return self._index.text
+
+    @staticmethod
+    def _is_section_boundary(heading: RoadmapHeading) -> bool:
+        """Check if a heading ends a priority section."""
+        return heading.text.startswith("### 🔴 **PRIORITY") or heading.text.startswith("## ")
 
     def _parse_priorities(self) -> List[Dict]:
-        """Parse priorities from cached content.
+        """Parse priorities from the cached index.
 
         Returns:
             List of priority dictionaries
@@ -116,24 +121,14 @@ class CachedRoadmapParser:
             self._load_file()
 
         priorities = []
-        lines = self._cached_lines
-
-        # Track code blocks to skip priorities inside them
-        in_code_block = False
-
-        for i, line in enumerate(lines):
-            # Check for code fence markers
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-
-            # Skip lines inside code blocks
-            if in_code_block:
-                continue
+        index = self._index
+        ends = index.section_ends(self._is_section_boundary, key="cached_roadmap_parser")
 
+        # Item headings from the shared index (code blocks already excluded)
+        for heading in index.items():
             # Try each pattern until we find a match
             for pattern in self._PRIORITY_PATTERNS:
-                match = pattern.search(line)
+                match = pattern.search(heading.text)
                 if match:
                     priority_num = match.group(1)
                     title = match.group(2).strip()
@@ -141,18 +136,11 @@ class CachedRoadmapParser:
                     # Clean up title (remove emojis and status if captured)
                     title = re.sub(r"\s*(📝|🔄|✅|⏸️).*$", "", title).strip()
 
-                    # Look for status in next few lines
-                    status = self._extract_status(lines, i)
-
-                    # If status not found in **Status**: lines, try to extract from header
-                    if status == "Unknown":
-                        status = self._extract_status_from_header(line)
-
-                    # Extract full section content (lazy - only when needed)
-                    section_content = self._extract_section(lines, i)
+                    # Status from the **Status**: line, else from the header
+                    status = heading.status or self._extract_status_from_header(heading.text)
 
                     # Determine priority name based on format (PRIORITY or US-XXX)
-                    if "US-" in line:
+                    if "US-" in heading.text:
                         priority_name = f"US-{priority_num}"
                     else:
                         priority_name = f"PRIORITY {priority_num}"
@@ -163,11 +151,11 @@ class CachedRoadmapParser:
                             "number": priority_num,
                             "title": title,
                             "status": status,
-                            "section_start": i,
-                            "content": section_content,
+                            "section_start": heading.line,
+                            "content": index.section_text(heading, ends[heading.index]),
                         }
                     )
-                    break  # Found match, move to next line
+                    break  # Found match, move to next heading
 
         logger.debug(f"Parsed {len(priorities)} priorities")
         return priorities
@@ -200,27 +188,6 @@ class CachedRoadmapParser:
         self._cached_priorities = self._parse_priorities()
         return self._cached_priorities
 
-    def _extract_status(self, lines: List[str], start_line: int) -> str:
-        """Extract status from lines near priority header.
-
-        Args:
-            lines: All lines from roadmap
-            start_line: Line number of priority header
-
-        Returns:
-            Status string (e.g., "📝 Planned", "🔄 In Progress")
-        """
-        # Look in next 10 lines for **Status**: pattern
-        for i in range(start_line, min(start_line + 15, len(lines))):
-            line = lines[i]
-            if "**Status**:" in line:
-                # Extract status after the colon
-                status_match = re.search(r"\*\*Status\*\*:\s*(.+?)(?:\n|$)", line)
-                if status_match:
-                    return status_match.group(1).strip()
-
-        return "Unknown"
-
     def _extract_status_from_header(self, header_line: str) -> str:
         """Extract status emoji and text from priority header line.
 
@@ -242,34 +209,6 @@ class CachedRoadmapParser:
 
         return "Unknown"
 
-    def _extract_section(self, lines: List[str], start_line: int) -> str:
-        """Extract full section content until next priority or end.
-
-        Args:
-            lines: All lines from roadmap
-            start_line: Line number of priority header
-
-        Returns:
-            Section content as string
-        """
-        section_lines = [lines[start_line]]
-
-        # Continue until we hit another ### heading with PRIORITY
-        for i in range(start_line + 1, len(lines)):
-            line = lines[i]
-
-            # Stop at next priority section
-            if line.startswith("### 🔴 **PRIORITY"):
-                break
-
-            # Stop at major section divider
-            if line.startswith("## ") and not line.startswith("###"):
-                break
-
-            section_lines.append(line)
-
-        return "\n".join(section_lines)
-
     def get_next_planned_priority(self) -> Optional[Dict]:
         """Get the next priority that is in Planned status.
 
@@ -386,8 +325,7 @@ class CachedRoadmapParser:
         """Manually invalidate the cache to force re-parsing."""
         logger.info("Manually invalidating cache")
         self._cached_priorities = None
-        self._cached_content = None
-        self._cached_lines = None
+        self._index = None
         self._last_mtime = None
 
     def get_cache_stats(self) -> Dict:
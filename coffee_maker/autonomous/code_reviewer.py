@@ -998,6 +998,7 @@ This index lists all code reviews performed by code-reviewer agent.
             priority=priority,
             sound=False,  # CFR-009: code-reviewer is background agent
             agent_id="code_reviewer",
+            wait=False,
         )
 
         logger.info(f"Notified architect: {title}")
@@ -1111,6 +1111,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>
                 context=context,
                 sound=False,  # CFR-009: code_developer uses sound=False
                 agent_id="code_developer",
+                wait=False,
             )
             logger.info(f"✅ Created notification for missing spec: {priority['name']}")
 
@@ -1202,6 +1203,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>
                 context=context,
                 sound=False,  # CFR-009: code_developer uses sound=False
                 agent_id="code_developer",
+                wait=False,
             )
             logger.info(f"✅ Created notification for {review_type} review")
 
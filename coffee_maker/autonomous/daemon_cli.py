@@ -16,6 +16,7 @@ import logging
 import os
 import signal
 import sys
+from pathlib import Path
 from types import FrameType
 from typing import Optional
 
@@ -37,6 +38,7 @@ from coffee_maker.cli.console_ui import (
     warning,
 )
 from coffee_maker.config import ConfigManager
+from coffee_maker.config.logging_config import setup_async_logging
 from coffee_maker.process_manager import ProcessManager
 
 
@@ -135,11 +137,7 @@ By default, it uses Claude CLI (subscription). Use --use-api for Anthropic API m
 
     # Setup logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    setup_async_logging(log_dir=Path("logs"), name="code_developer", level=log_level)
 
     # Determine mode: CLI is default, API requires --use-api flag
     use_cli_mode = not args.use_api
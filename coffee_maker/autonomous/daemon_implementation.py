@@ -18,7 +18,6 @@ Enhanced with centralized prompt loading:
 """
 
 import logging
-import time
 from datetime import datetime
 
 from coffee_maker.autonomous.developer_status import ActivityType, DeveloperState
@@ -101,21 +100,13 @@ class ImplementationMixin:
         logger.info("Check notifications with: project-manager notifications")
         logger.info(f"Approve with: project-manager respond {notif_id} approve")
 
-        # Poll for response (simplified - in production would use event system)
-        max_wait = 1800  # 30 minutes
-        poll_interval = 5
-        waited = 0
-
-        while waited < max_wait:
-            time.sleep(poll_interval)
-            waited += poll_interval
-
-            notif = self.notifications.get_notification(notif_id)
-            if notif and notif["user_response"]:
-                response = notif["user_response"].lower()
-                approved = "approve" in response or "yes" in response
-                logger.info(f"User response: {response} (approved={approved})")
-                return approved
+        # Woken by the response commit instead of re-reading the notification every few seconds
+        response = self.notifications.wait_for_response(notif_id, timeout=1800)  # 30 minutes
+        if response:
+            response = response.lower()
+            approved = "approve" in response or "yes" in response
+            logger.info(f"User response: {response} (approved={approved})")
+            return approved
 
         logger.warning("User did not respond in time - skipping")
         return False
@@ -152,7 +143,7 @@ class ImplementationMixin:
                     new_status="⏸️ Blocked - Too complex for autonomous implementation",
                     updated_by="code_developer",
                 )
-                db.export_to_file(self.roadmap_path)
+                db.export_changes(self.roadmap_path)
                 logger.info(f"✅ Updated {priority_name} status to '⏸️ Blocked' in ROADMAP")
             except Exception as e:
                 logger.error(f"Failed to update ROADMAP status: {e}")
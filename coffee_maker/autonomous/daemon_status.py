@@ -75,6 +75,7 @@ class StatusMixin:
             priority=NOTIF_PRIORITY_HIGH,
             sound=False,
             agent_id="code_developer",
+            wait=False,
         )
 
     def _notify_persistent_failure(self, crash_info: dict):
@@ -148,6 +149,7 @@ The daemon will remain stopped until manually restarted.
             },
             sound=False,
             agent_id="code_developer",
+            wait=False,
         )
 
         logger.critical("Created critical notification for persistent failure")
@@ -12,6 +12,16 @@ Database Integration:
 - Uses TechnicalSpecSkill for reading specs (shared skill pattern)
 - Direct database access only for specs_task table operations
 
+Ready Queue:
+- specs_task_group_state keeps, per task group, its open (not completed) task
+  count, the priority_order of its first open task, and its in-degree: the
+  number of hard dependencies on groups that still have open tasks
+- Triggers on specs_task and specs_task_dependency keep the counts current
+  whenever tasks are added, claimed or completed, whoever writes them
+- The ready set is the first open task of every group with in-degree 0;
+  claiming from it is one indexed UPDATE, so parallel code_developer
+  instances pull work without re-evaluating the dependency graph
+
 Author: code_developer
 Date: 2025-10-23
 Related: PRIORITY 31, CFR-000
@@ -35,6 +45,115 @@ from coffee_maker.autonomous.technical_spec_skill import TechnicalSpecSkill
 
 logger = logging.getLogger(__name__)
 
+# Group state refresh, instantiated per trigger with NEW/OLD.task_group_id
+_REFRESH_GROUP = """
+    INSERT INTO specs_task_group_state (task_group_id, open_tasks, next_order, blocking_deps)
+    SELECT {group},
+           (SELECT COUNT(*) FROM specs_task WHERE task_group_id = {group} AND status != 'completed'),
+           (SELECT MIN(priority_order) FROM specs_task WHERE task_group_id = {group} AND status != 'completed'),
+           (SELECT COUNT(*) FROM specs_task_dependency d
+              JOIN specs_task_group_state s ON s.task_group_id = d.depends_on_group_id
+             WHERE d.task_group_id = {group} AND d.dependency_type = 'hard' AND s.open_tasks > 0)
+    WHERE {group} IS NOT NULL
+    ON CONFLICT(task_group_id) DO UPDATE SET
+        open_tasks = excluded.open_tasks,
+        next_order = excluded.next_order,
+        blocking_deps = excluded.blocking_deps;
+"""
+
+# In-degree of the groups depending on a group (after its open task count changed)
+_REFRESH_DEPENDENTS = """
+    UPDATE specs_task_group_state
+    SET blocking_deps = (
+        SELECT COUNT(*) FROM specs_task_dependency d
+          JOIN specs_task_group_state s ON s.task_group_id = d.depends_on_group_id
+         WHERE d.task_group_id = specs_task_group_state.task_group_id
+           AND d.dependency_type = 'hard' AND s.open_tasks > 0
+    )
+    WHERE task_group_id IN (SELECT task_group_id FROM specs_task_dependency WHERE depends_on_group_id = {group});
+"""
+
+# In-degree of one group (after its dependencies changed)
+_REFRESH_IN_DEGREE = """
+    UPDATE specs_task_group_state
+    SET blocking_deps = (
+        SELECT COUNT(*) FROM specs_task_dependency d
+          JOIN specs_task_group_state s ON s.task_group_id = d.depends_on_group_id
+         WHERE d.task_group_id = {group} AND d.dependency_type = 'hard' AND s.open_tasks > 0
+    )
+    WHERE task_group_id = {group};
+"""
+
+# Created here only for databases that predate task group dependencies (schema of PRIORITY 32)
+_DEPENDENCY_TABLE = """
+    CREATE TABLE IF NOT EXISTS specs_task_dependency (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_group_id TEXT NOT NULL,
+        depends_on_group_id TEXT NOT NULL,
+        dependency_type TEXT NOT NULL,
+        reason TEXT,
+        created_at TEXT NOT NULL,
+        created_by TEXT NOT NULL,
+
+        UNIQUE(task_group_id, depends_on_group_id),
+        CHECK(task_group_id != depends_on_group_id),
+        CHECK(dependency_type IN ('hard', 'soft'))
+    )
+"""
+
+_SCHEDULER_TABLE = """
+    CREATE TABLE IF NOT EXISTS specs_task_group_state (
+        task_group_id TEXT PRIMARY KEY,
+        open_tasks INTEGER NOT NULL,     -- tasks not completed
+        next_order INTEGER,              -- priority_order of the first open task
+        blocking_deps INTEGER NOT NULL   -- hard dependencies on groups with open tasks
+    )
+"""
+
+_SCHEDULER_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_specs_task_group_state_ready ON specs_task_group_state(blocking_deps, next_order)",
+    "CREATE INDEX IF NOT EXISTS idx_specs_task_group_order ON specs_task(task_group_id, priority_order)",
+    "CREATE INDEX IF NOT EXISTS idx_specs_task_dependency_group ON specs_task_dependency(task_group_id)",
+    "CREATE INDEX IF NOT EXISTS idx_specs_task_dependency_depends_on ON specs_task_dependency(depends_on_group_id)",
+]
+
+_SCHEDULER_TRIGGERS = {
+    "trg_specs_task_insert_state": (
+        "AFTER INSERT ON specs_task",
+        _REFRESH_GROUP.format(group="NEW.task_group_id") + _REFRESH_DEPENDENTS.format(group="NEW.task_group_id"),
+    ),
+    "trg_specs_task_update_state": (
+        "AFTER UPDATE OF status, task_group_id, priority_order ON specs_task",
+        _REFRESH_GROUP.format(group="OLD.task_group_id")
+        + _REFRESH_DEPENDENTS.format(group="OLD.task_group_id")
+        + _REFRESH_GROUP.format(group="NEW.task_group_id")
+        + _REFRESH_DEPENDENTS.format(group="NEW.task_group_id"),
+    ),
+    "trg_specs_task_delete_state": (
+        "AFTER DELETE ON specs_task",
+        _REFRESH_GROUP.format(group="OLD.task_group_id") + _REFRESH_DEPENDENTS.format(group="OLD.task_group_id"),
+    ),
+    "trg_specs_task_dependency_insert_state": (
+        "AFTER INSERT ON specs_task_dependency",
+        _REFRESH_IN_DEGREE.format(group="NEW.task_group_id"),
+    ),
+    "trg_specs_task_dependency_update_state": (
+        "AFTER UPDATE ON specs_task_dependency",
+        _REFRESH_IN_DEGREE.format(group="OLD.task_group_id") + _REFRESH_IN_DEGREE.format(group="NEW.task_group_id"),
+    ),
+    "trg_specs_task_dependency_delete_state": (
+        "AFTER DELETE ON specs_task_dependency",
+        _REFRESH_IN_DEGREE.format(group="OLD.task_group_id"),
+    ),
+}
+
+# Ready set: the first open task of every group whose hard dependencies are all completed
+_READY_TASKS = """
+    SELECT t.* FROM specs_task_group_state g
+      JOIN specs_task t ON t.task_group_id = g.task_group_id AND t.priority_order = g.next_order
+     WHERE g.blocking_deps = 0 AND t.status = 'pending' AND t.process_id IS NULL
+"""
+
 
 class FileAccessViolationError(Exception):
     """Raised when code_developer tries to access file not in assigned_files."""
@@ -56,6 +175,7 @@ class ImplementationTaskManager:
 
     Key Features:
     - Enforces sequential execution within task_group_id groups
+    - Ready queue of unblocked tasks, maintained by triggers (claim_next_work)
     - Atomic claiming (race-safe)
     - File access validation
     """
@@ -71,6 +191,7 @@ class ImplementationTaskManager:
         self.agent_name = agent_name
         self.current_work: Optional[Dict[str, Any]] = None
         self.assigned_files: List[str] = []
+        self._scheduler_ready = False
 
         # Initialize technical spec skill for reading specs
         # Use hybrid mode: direct DB for tests, skill for production
@@ -102,28 +223,18 @@ class ImplementationTaskManager:
             If GROUP-31 depends on GROUP-36 (hard dependency), and GROUP-36 is not completed:
             → Returns None (wait for GROUP-36 to complete)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         # Get all specs_task for this priority, excluding groups with incomplete dependencies
         cursor.execute(
             """
-            SELECT * FROM specs_task
-            WHERE priority_number = ?
-              AND task_group_id NOT IN (
-                  -- Exclude task groups with incomplete hard dependencies
-                  SELECT tgd.task_group_id
-                  FROM specs_task_dependency tgd
-                  WHERE tgd.dependency_type = 'hard'
-                    AND EXISTS (
-                        SELECT 1
-                        FROM specs_task dep_tasks
-                        WHERE dep_tasks.task_group_id = tgd.depends_on_group_id
-                          AND dep_tasks.status != 'completed'
-                    )
-              )
-            ORDER BY priority_order ASC
+            SELECT t.* FROM specs_task t
+            JOIN specs_task_group_state g ON g.task_group_id = t.task_group_id
+            WHERE t.priority_number = ?
+              AND g.blocking_deps = 0
+            ORDER BY t.priority_order ASC
         """,
             (priority_number,),
         )
@@ -134,20 +245,13 @@ class ImplementationTaskManager:
         cursor.execute(
             """
             SELECT tgd.task_group_id, tgd.depends_on_group_id, tgd.reason
-            FROM specs_task_dependency tgd
-            WHERE tgd.dependency_type = 'hard'
-              AND EXISTS (
-                  SELECT 1
-                  FROM specs_task t
-                  WHERE t.task_group_id = tgd.task_group_id
-                    AND t.priority_number = ?
-              )
-              AND EXISTS (
-                  SELECT 1
-                  FROM specs_task dep_tasks
-                  WHERE dep_tasks.task_group_id = tgd.depends_on_group_id
-                    AND dep_tasks.status != 'completed'
-              )
+            FROM specs_task_group_state g
+            JOIN specs_task_dependency tgd ON tgd.task_group_id = g.task_group_id
+            JOIN specs_task_group_state dep ON dep.task_group_id = tgd.depends_on_group_id
+            WHERE g.blocking_deps > 0
+              AND tgd.dependency_type = 'hard'
+              AND dep.open_tasks > 0
+              AND g.task_group_id IN (SELECT task_group_id FROM specs_task WHERE priority_number = ?)
         """,
             (priority_number,),
         )
@@ -195,74 +299,122 @@ class ImplementationTaskManager:
             Excludes tasks from groups with incomplete hard dependencies.
             If task_group_id is specified, checks if that group has incomplete dependencies.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
+        query = """
+            SELECT t.* FROM specs_task_group_state g
+            JOIN specs_task t ON t.task_group_id = g.task_group_id
+            WHERE g.blocking_deps = 0
+              AND t.status = 'pending'
+              AND t.process_id IS NULL
+        """
         if task_group_id:
-            cursor.execute(
-                """
-                SELECT * FROM specs_task
-                WHERE status = 'pending'
-                  AND process_id IS NULL
-                  AND task_group_id = ?
-                  AND task_group_id NOT IN (
-                      -- Exclude if this group has incomplete hard dependencies
-                      SELECT tgd.task_group_id
-                      FROM specs_task_dependency tgd
-                      WHERE tgd.dependency_type = 'hard'
-                        AND EXISTS (
-                            SELECT 1
-                            FROM specs_task dep_tasks
-                            WHERE dep_tasks.task_group_id = tgd.depends_on_group_id
-                              AND dep_tasks.status != 'completed'
-                        )
-                  )
-                ORDER BY priority_order ASC
-            """,
-                (task_group_id,),
-            )
+            cursor.execute(query + " AND g.task_group_id = ? ORDER BY t.priority_order ASC", (task_group_id,))
         else:
-            cursor.execute(
-                """
-                SELECT * FROM specs_task
-                WHERE status = 'pending'
-                  AND process_id IS NULL
-                  AND task_group_id NOT IN (
-                      -- Exclude groups with incomplete hard dependencies
-                      SELECT tgd.task_group_id
-                      FROM specs_task_dependency tgd
-                      WHERE tgd.dependency_type = 'hard'
-                        AND EXISTS (
-                            SELECT 1
-                            FROM specs_task dep_tasks
-                            WHERE dep_tasks.task_group_id = tgd.depends_on_group_id
-                              AND dep_tasks.status != 'completed'
-                        )
-                  )
-                ORDER BY task_group_id, priority_order ASC
-            """
-            )
+            cursor.execute(query + " ORDER BY t.task_group_id, t.priority_order ASC")
 
         specs_task = [dict(row) for row in cursor.fetchall()]
         conn.close()
 
         return specs_task
 
+    def query_ready_works(self, priority_number: Optional[int] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Query the ready set: tasks that can be claimed right now.
+
+        A task is ready when it is pending and unclaimed, all earlier tasks of
+        its group are completed, and all hard dependencies of its group are
+        completed. There is at most one ready task per group.
+
+        Args:
+            priority_number: Only tasks of this ROADMAP priority
+            limit: Maximum number of tasks
+
+        Returns:
+            Ready specs_task, in priority_number then task_group_id order
+        """
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+
+        if priority_number is None:
+            rows = conn.execute(_READY_TASKS + " ORDER BY t.priority_number, t.task_group_id LIMIT ?", (limit,))
+        else:
+            rows = conn.execute(
+                _READY_TASKS + " AND t.priority_number = ? ORDER BY t.task_group_id LIMIT ?", (priority_number, limit)
+            )
+        specs_task = [dict(row) for row in rows.fetchall()]
+        conn.close()
+
+        return specs_task
+
+    def claim_next_work(self, priority_number: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Atomically claim the first task of the ready set.
+
+        The ready set is read and the task claimed in one UPDATE statement, so
+        parallel instances never claim the same task or a blocked one.
+
+        Args:
+            priority_number: Only claim tasks of this ROADMAP priority
+
+        Returns:
+            The claimed task (also set as current work), or None if nothing is ready
+        """
+        if self.current_work:
+            raise TaskAlreadyClaimedError(f"task {self.current_work['task_id']} already claimed by this instance")
+
+        ready = _READY_TASKS.replace("SELECT t.*", "SELECT t.task_id", 1)
+        params: List[Any] = [os.getpid(), datetime.now().isoformat()]
+        if priority_number is not None:
+            ready += " AND t.priority_number = ?"
+            params.append(priority_number)
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"""
+                UPDATE specs_task
+                SET status = 'in_progress',
+                    process_id = ?,
+                    claimed_at = ?
+                WHERE task_id = ({ready} ORDER BY t.priority_number, t.task_group_id LIMIT 1)
+                  AND status = 'pending'
+                  AND process_id IS NULL
+            """,
+                params,
+            )
+            conn.commit()
+            if cursor.rowcount == 0:
+                return None
+
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM specs_task WHERE process_id = ? AND claimed_at = ? AND status = 'in_progress'",
+                params[:2],
+            ).fetchone()
+        finally:
+            conn.close()
+
+        self._set_current_work(dict(row))
+        return self.current_work
+
     def claim_work(self, task_id: str) -> bool:
         """Atomically claim a task (race-safe).
 
+        The task is claimed only if it is in the ready set (earlier tasks of its
+        group and the groups it depends on are completed).
+
         Args:
             task_id: Work ID to claim (e.g., "TASK-31-1")
 
         Returns:
-            True if claimed successfully, False if already claimed
+            True if claimed successfully, False if already claimed or not ready yet
 
         Raises:
             TaskNotFoundError: If task_id doesn't exist
             TaskAlreadyClaimedError: If already claimed by this instance
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         try:
@@ -281,30 +433,7 @@ class ImplementationTaskManager:
             if process_id == os.getpid() and self.current_work:
                 raise TaskAlreadyClaimedError(f"task {task_id} already claimed by this instance")
 
-            # Validate sequential ordering: check if earlier specs_task in group are completed
-            if priority_order > 1:
-                cursor.execute(
-                    """
-                    SELECT task_id, status, priority_order FROM specs_task
-                    WHERE task_group_id = ?
-                      AND priority_order < ?
-                    ORDER BY priority_order ASC
-                """,
-                    (task_group_id, priority_order),
-                )
-
-                earlier_works = cursor.fetchall()
-
-                for earlier_work_id, earlier_status, earlier_order in earlier_works:
-                    if earlier_status != "completed":
-                        logger.error(
-                            f"Cannot claim {task_id} (order={priority_order}) - "
-                            f"earlier task {earlier_work_id} (order={earlier_order}) not completed (status={earlier_status})"
-                        )
-                        conn.close()
-                        return False
-
-            # ATOMIC claim operation
+            # ATOMIC claim operation (only the ready head of an unblocked group)
             now = datetime.now().isoformat()
             current_pid = os.getpid()
             cursor.execute(
@@ -316,29 +445,29 @@ class ImplementationTaskManager:
                 WHERE task_id = ?
                   AND status = 'pending'
                   AND process_id IS NULL
+                  AND EXISTS (
+                      SELECT 1 FROM specs_task_group_state g
+                      WHERE g.task_group_id = specs_task.task_group_id
+                        AND g.next_order = specs_task.priority_order
+                        AND g.blocking_deps = 0
+                  )
             """,
                 (current_pid, now, task_id),
             )
 
-            rows_affected = cursor.rowcount
-
-            if rows_affected == 0:
-                # Claim failed (another instance claimed it)
-                logger.warning(f"Failed to claim task {task_id} - already claimed")
-                conn.close()
+            if cursor.rowcount == 0:
+                conn.rollback()
+                self._log_claim_failure(conn, task_id, task_group_id, priority_order)
                 return False
 
+            conn.commit()
+
             # Load full task data
-            cursor.execute("SELECT * FROM specs_task WHERE task_id = ?", (task_id,))
             conn.row_factory = sqlite3.Row
-            cursor_with_factory = conn.cursor()
-            cursor_with_factory.execute("SELECT * FROM specs_task WHERE task_id = ?", (task_id,))
-            self.current_work = dict(cursor_with_factory.fetchone())
-
-            # Parse assigned_files
-            self.assigned_files = json.loads(self.current_work["assigned_files"])
+            self._set_current_work(
+                dict(conn.execute("SELECT * FROM specs_task WHERE task_id = ?", (task_id,)).fetchone())
+            )
 
-            conn.commit()
             logger.info(
                 f"✅ Successfully claimed task {task_id} "
                 f"(group={task_group_id}, order={priority_order}) "
@@ -353,6 +482,89 @@ class ImplementationTaskManager:
         finally:
             conn.close()
 
+    def _set_current_work(self, task: Dict[str, Any]) -> None:
+        """Make a claimed task the current work."""
+        self.current_work = task
+        self.assigned_files = json.loads(task["assigned_files"])
+
+    def _log_claim_failure(self, conn: sqlite3.Connection, task_id: str, task_group_id: str, priority_order: int):
+        """Log why a task could not be claimed."""
+        earlier = conn.execute(
+            """
+            SELECT task_id, status, priority_order FROM specs_task
+            WHERE task_group_id = ? AND priority_order < ? AND status != 'completed'
+            ORDER BY priority_order ASC LIMIT 1
+        """,
+            (task_group_id, priority_order),
+        ).fetchone()
+        if earlier:
+            logger.error(
+                f"Cannot claim {task_id} (order={priority_order}) - "
+                f"earlier task {earlier[0]} (order={earlier[2]}) not completed (status={earlier[1]})"
+            )
+            return
+
+        blocking = conn.execute(
+            "SELECT blocking_deps FROM specs_task_group_state WHERE task_group_id = ?", (task_group_id,)
+        ).fetchone()
+        if blocking and blocking[0]:
+            logger.error(f"Cannot claim {task_id} - group {task_group_id} waits for {blocking[0]} task group(s)")
+        else:
+            # Claim failed (another instance claimed it)
+            logger.warning(f"Failed to claim task {task_id} - already claimed")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, setting up the ready-queue state on first use."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._scheduler_ready:
+            self._ensure_scheduler(conn)
+            self._scheduler_ready = True
+        return conn
+
+    @staticmethod
+    def _ensure_scheduler(conn: sqlite3.Connection) -> None:
+        """Create the group state table and its triggers, building the state if new."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'specs_task_group_state'"
+            ).fetchone()
+            conn.execute(_DEPENDENCY_TABLE)
+            conn.execute(_SCHEDULER_TABLE)
+            for statement in _SCHEDULER_INDEXES:
+                conn.execute(statement)
+            for name, (event, body) in _SCHEDULER_TRIGGERS.items():
+                conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} FOR EACH ROW BEGIN {body} END")
+
+            if not exists:
+                conn.execute(
+                    """
+                    INSERT INTO specs_task_group_state (task_group_id, open_tasks, next_order, blocking_deps)
+                    SELECT task_group_id,
+                           SUM(status != 'completed'),
+                           MIN(CASE WHEN status != 'completed' THEN priority_order END),
+                           0
+                    FROM specs_task
+                    GROUP BY task_group_id
+                """
+                )
+                conn.execute(
+                    """
+                    UPDATE specs_task_group_state
+                    SET blocking_deps = (
+                        SELECT COUNT(*) FROM specs_task_dependency d
+                          JOIN specs_task_group_state s ON s.task_group_id = d.depends_on_group_id
+                         WHERE d.task_group_id = specs_task_group_state.task_group_id
+                           AND d.dependency_type = 'hard' AND s.open_tasks > 0
+                    )
+                """
+                )
+                logger.info("Built specs_task ready-queue state")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def validate_file_access(self, file_path: str) -> bool:
         """Validate file access against assigned_files.
 
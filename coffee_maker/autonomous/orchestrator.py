@@ -20,7 +20,8 @@ Agent Processes (running simultaneously):
     6. UX_DESIGN_EXPERT - Design reviews and guidance
 
 Inter-Process Communication (IPC):
-    - Status files: data/agent_status/{agent}_status.json
+    - Status registry: data/agent_status/agent_status.db (heartbeats, PIDs, singleton claims)
+    - Status files: data/agent_status/{agent}_status.json (readable mirror)
     - Message queues: data/agent_messages/{agent}_inbox/
     - File-based for simplicity and observability
 
@@ -58,7 +59,6 @@ Timeline:
     Week 3 (Days 9-15): Complete team + testing + deployment
 """
 
-import json
 import logging
 import os
 import time
@@ -68,7 +68,10 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from coffee_maker.autonomous.agent_registry import AgentRegistry, AgentType
+from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry
 from coffee_maker.autonomous.agents.base_agent import BaseAgent
+from coffee_maker.config.logging_config import setup_async_logging
+from coffee_maker.utils.file_io import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
@@ -91,12 +94,8 @@ def _agent_runner_static(agent_type: AgentType, config: Dict, status_dir: Path,
     Raises:
         AgentAlreadyRunningError: If agent type already registered
     """
-    # Setup logging in subprocess
-    import sys
-
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", stream=sys.stdout
-    )
+    # Setup logging in subprocess (one background writer per agent process)
+    setup_async_logging(log_dir=Path("logs"), name=config["name"])
 
     try:
         logger.info(f"🚀 Starting {config['name']} subprocess (PID: {os.getpid()})")
@@ -116,8 +115,8 @@ def _agent_runner_static(agent_type: AgentType, config: Dict, status_dir: Path,
         )
         logger.info(f"✅ Agent instance created")
 
-        # Register agent (CFR-000 singleton enforcement)
-        with AgentRegistry.register(agent_type):
+        # Register agent (CFR-000 singleton enforcement, host-wide)
+        with AgentRegistry.register(agent_type, status_registry=agent.status_registry):
             logger.info(f"✅ {config['name']} registered in singleton registry (PID: {os.getpid()})")
 
             # Run agent's continuous loop
@@ -132,6 +131,7 @@ def _agent_runner_static(agent_type: AgentType, config: Dict, status_dir: Path,
 
         # Write error status before exiting
         try:
+            get_agent_status_registry(status_dir).heartbeat(config["name"], state="crashed", error=str(e))
             status_file = status_dir / f"{config['name']}_status.json"
             error_status = {
                 "agent_type": config["name"],
@@ -141,7 +141,7 @@ def _agent_runner_static(agent_type: AgentType, config: Dict, status_dir: Path,
                 "pid": os.getpid(),
                 "timestamp": datetime.now().isoformat(),
             }
-            status_file.write_text(json.dumps(error_status, indent=2))
+            atomic_write_json(status_file, error_status)
         except:
             pass
 
@@ -744,36 +744,37 @@ class OrchestratorAgent(BaseAgent):
             logger.error(f"❌ Failed to launch {config['name']}: {e}")
 
     def _check_agent_health(self):
-        """Monitor agent health via status files and process liveness.
+        """Monitor agent health via the status registry and process liveness.
 
         Checks two health indicators per agent:
         1. Process liveness: Is the subprocess still running?
-        2. Heartbeat staleness: Is the status file recent (<5 minutes)?
+        2. Heartbeat staleness: Is the last heartbeat recent (<5 minutes)?
 
+        All heartbeats come from one snapshot of the host-wide status registry.
         Warnings logged but no action taken here (handled by _handle_crashed_agents).
         """
+        try:
+            statuses = self.status_registry.snapshot()
+        except Exception as e:
+            logger.error(f"Error reading agent status registry: {e}")
+            statuses = {}
+
         for agent_type, process in list(self.processes.items()):
             config = self.agents[agent_type]
-            status_file = self.status_dir / f"{config['name']}_status.json"
 
             # Check 1: Process is alive
             if not process.is_alive():
                 logger.error(f"❌ {config['name']} process died (PID: {process.pid})")
                 continue
 
-            # Check 2: Status file exists and is recent
-            if status_file.exists():
-                try:
-                    status = json.loads(status_file.read_text())
-                    last_heartbeat = datetime.fromisoformat(status["last_heartbeat"])
-                    age_seconds = (datetime.now() - last_heartbeat).total_seconds()
-
-                    # Warn if heartbeat stale (>5 minutes)
-                    if age_seconds > 300:
-                        logger.warning(f"⚠️  {config['name']} heartbeat stale " f"({age_seconds:.0f}s old)")
+            # Check 2: Heartbeat is recent
+            status = statuses.get(config["name"])
+            if status and status["pid"] == process.pid:
+                age_seconds = status["heartbeat_age_seconds"]
 
-                except Exception as e:
-                    logger.error(f"Error reading status for {config['name']}: {e}")
+                # Warn if heartbeat stale (>5 minutes)
+                if age_seconds > 300:
+                    logger.warning(f"⚠️  {config['name']} heartbeat stale " f"({age_seconds:.0f}s old)")
 
     def _handle_crashed_agents(self):
         """Restart crashed agents with exponential backoff.
@@ -856,7 +857,7 @@ class OrchestratorAgent(BaseAgent):
 
             # Write to orchestrator status file
             orch_status_file = self.status_dir / "orchestrator_status.json"
-            orch_status_file.write_text(json.dumps(status_info, indent=2))
+            atomic_write_json(orch_status_file, status_info)
 
         except Exception as e:
             logger.error(f"Error writing orchestrator status: {e}")
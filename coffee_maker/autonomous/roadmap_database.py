@@ -9,8 +9,23 @@ Architecture:
     - Write access: project_manager only
     - Read access: All agents
     - Direct file access: FORBIDDEN
+
+Search:
+    roadmap_search is an FTS5 table over roadmap item titles, content,
+    plan_and_summary and reusable components, and over technical spec
+    titles and content. roadmap_components is a trigram FTS5 table over the
+    reusable components, so component lookups match terms inside words
+    ("mail" finds "Email"). Triggers on roadmap_priority and
+    specs_specification keep both in sync, and an expression index on
+    plan_and_summary.tech_specs_complete serves reuse lookups, so
+    find_reusable_components() is one ranked query instead of a read per item.
+
+    >>> db = RoadmapDatabase(agent_name="architect")
+    >>> db.find_reusable_components(["JWT", "email"])  # best matches first
+    >>> db.search("authentication token", kind="spec")
 """
 
+import json
 import re
 import sqlite3
 from datetime import datetime
@@ -18,8 +33,126 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+from coffee_maker.autonomous.roadmap_index import RoadmapIndex
+
 logger = logging.getLogger(__name__)
 
+# First item-like header: everything before it is the roadmap header
+_IMPORT_HEADER_END = re.compile(r"^##\s+(US-|PRIORITY)|^###\s+(🔴|PRIORITY|US-)")
+
+_IMPORT_PATTERNS = [
+    (re.compile(r"^##\s+US-(\d+):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$"), "user_story"),
+    (re.compile(r"^##\s+PRIORITY\s+(\d+(?:\.\d+)?):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$"), "priority"),
+    (re.compile(r"^###\s+🔴\s+\*\*PRIORITY\s+(\d+(?:\.\d+)?):(.+?)\*\*.*$"), "priority"),
+    (re.compile(r"^###\s+PRIORITY\s+(\d+(?:\.\d+)?):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$"), "priority"),
+    (re.compile(r"^###\s+US-(\d+):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$"), "user_story"),
+]
+
+
+def _match_import_item(text: str):
+    """Match a heading line against the import item patterns.
+
+    Returns:
+        Tuple of (match, item_type) or (None, None)
+    """
+    for pattern, item_type in _IMPORT_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            return match, item_type
+    return None, None
+
+
+# plan_and_summary is free-form text written by architect: JSON functions only see valid JSON
+_PLAN_JSON = "CASE WHEN json_valid({plan}) THEN {plan} END"
+
+_TECH_SPECS_COMPLETE = "json_extract(" + _PLAN_JSON + ", '$.tech_specs_complete')"
+
+# Names, use cases and locations of the plan's reusable components, as searchable text
+_COMPONENTS_TEXT = (
+    "(SELECT group_concat(coalesce(json_extract(c.value, '$.name'), '') || ' ' "
+    "|| coalesce(json_extract(c.value, '$.use_cases'), '') || ' ' "
+    "|| coalesce(json_extract(c.value, '$.location'), ''), ' ') "
+    "FROM json_each(" + _PLAN_JSON + ", '$.reusable_components') AS c WHERE c.type = 'object')"
+)
+
+_SEARCH_TABLE = """
+    CREATE VIRTUAL TABLE roadmap_search USING fts5(
+        doc_id UNINDEXED,
+        kind UNINDEXED,
+        title,
+        content,
+        plan,
+        components,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+"""
+
+# Reusable components by substring (like the per-component check): trigrams match inside words
+_COMPONENTS_TABLE = """
+    CREATE VIRTUAL TABLE roadmap_components USING fts5(
+        doc_id UNINDEXED,
+        components,
+        tokenize = 'trigram'
+    )
+"""
+
+_COMPONENTS_ROW = "INSERT INTO roadmap_components (doc_id, components) SELECT {row}.id, " + _COMPONENTS_TEXT.format(
+    plan="{row}.plan_and_summary"
+)
+
+# Search sources: (table, kind, indexed columns, roadmap_search row for {row})
+_SEARCH_SOURCES = [
+    (
+        "roadmap_priority",
+        "item",
+        "id, title, content, plan_and_summary",
+        "INSERT INTO roadmap_search (doc_id, kind, title, content, plan, components) "
+        "SELECT {row}.id, 'item', {row}.title, {row}.content, {row}.plan_and_summary, "
+        + _COMPONENTS_TEXT.format(plan="{row}.plan_and_summary"),
+    ),
+    (
+        "specs_specification",
+        "spec",
+        "id, title, content",
+        "INSERT INTO roadmap_search (doc_id, kind, title, content) SELECT {row}.id, 'spec', {row}.title, {row}.content",
+    ),
+]
+
+
+def _fts_query(terms: List[str], operator: str = "OR") -> Optional[str]:
+    """Build an FTS5 query matching each term as a (prefix) phrase.
+
+    Args:
+        terms: Search terms (e.g., ["JWT", "email validation"])
+        operator: "OR" or "AND"
+
+    Returns:
+        FTS5 query string, or None if no term has searchable text
+    """
+    phrases = []
+    for term in terms:
+        words = re.findall(r"\w+", term)
+        if words:
+            phrases.append('"' + " ".join(words) + '"*')
+    if not phrases:
+        return None
+    return f" {operator} ".join(phrases)
+
+
+def _substring_query(terms: List[str]) -> Optional[str]:
+    """Build a trigram FTS5 query matching any term anywhere in the text.
+
+    Args:
+        terms: Search terms (e.g., ["mail", "auth"])
+
+    Returns:
+        FTS5 query string, or None if a term is shorter than a trigram
+        (the caller then scans instead)
+    """
+    if any(len(term) < 3 for term in terms):
+        return None
+    return " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
 
 class RoadmapDatabase:
     """Database-backed ROADMAP with enforced access control.
@@ -147,6 +280,9 @@ class RoadmapDatabase:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_audit_item ON roadmap_audit(item_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_notifications_status ON roadmap_notification(status)")
 
+            self._init_search(cursor)
+            self._init_change_tracking(cursor)
+
             conn.commit()
             conn.close()
 
@@ -154,6 +290,82 @@ class RoadmapDatabase:
             logger.error(f"Error initializing roadmap database: {e}")
             raise
 
+    @staticmethod
+    def _init_change_tracking(cursor: sqlite3.Cursor) -> None:
+        """Bump updated_at when a rendered column changes without it (idempotent).
+
+        export_changes detects changed sections by updated_at, and some writers
+        update title, status or content directly without touching it.
+        """
+        rendered = ("item_type", "number", "title", "status", "content")
+        changed = " OR ".join(f"NEW.{column} IS NOT OLD.{column}" for column in rendered)
+        cursor.execute(
+            f"CREATE TRIGGER IF NOT EXISTS trg_roadmap_priority_touch AFTER UPDATE OF {', '.join(rendered)} "
+            f"ON roadmap_priority WHEN NEW.updated_at IS OLD.updated_at AND ({changed}) BEGIN "
+            "UPDATE roadmap_priority SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime') "
+            "WHERE id = NEW.id; END"
+        )
+
+    @staticmethod
+    def _init_search(cursor: sqlite3.Cursor) -> None:
+        """Create the search index, its triggers and JSON indexes (idempotent).
+
+        Sources created after the index (specs_specification comes from a
+        migration) get their triggers and are backfilled on the next init.
+
+        Args:
+            cursor: Cursor inside the schema initialization transaction
+        """
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(roadmap_priority)")}
+        if "plan_and_summary" not in columns:
+            cursor.execute("ALTER TABLE roadmap_priority ADD COLUMN plan_and_summary TEXT")
+
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_items_tech_specs_complete ON roadmap_priority({})".format(
+                _TECH_SPECS_COMPLETE.format(plan="plan_and_summary")
+            )
+        )
+
+        existing = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master")}
+        if "roadmap_search" not in existing:
+            cursor.execute(_SEARCH_TABLE)
+
+        for table, kind, indexed_columns, search_row in _SEARCH_SOURCES:
+            if table not in existing or f"trg_{table}_search_insert" in existing:
+                continue
+            insert_row = search_row.format(row="new") + ";"
+            delete_row = f"DELETE FROM roadmap_search WHERE kind = '{kind}' AND doc_id = old.id;"
+            cursor.execute(f"CREATE TRIGGER trg_{table}_search_insert AFTER INSERT ON {table} BEGIN {insert_row} END")
+            cursor.execute(
+                f"CREATE TRIGGER trg_{table}_search_update AFTER UPDATE OF {indexed_columns} ON {table} "
+                f"BEGIN {delete_row} {insert_row} END"
+            )
+            cursor.execute(f"CREATE TRIGGER trg_{table}_search_delete AFTER DELETE ON {table} BEGIN {delete_row} END")
+
+            # Backfill rows written before the triggers existed
+            cursor.execute("DELETE FROM roadmap_search WHERE kind = ?", (kind,))
+            cursor.execute(search_row.format(row="t") + f" FROM {table} AS t")
+            logger.info(f"Indexed {table} for search")
+
+        if "roadmap_components" not in existing:
+            cursor.execute(_COMPONENTS_TABLE)
+            insert_row = _COMPONENTS_ROW.format(row="new") + ";"
+            delete_row = "DELETE FROM roadmap_components WHERE doc_id = old.id;"
+            cursor.execute(
+                f"CREATE TRIGGER trg_roadmap_priority_components_insert AFTER INSERT ON roadmap_priority "
+                f"BEGIN {insert_row} END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER trg_roadmap_priority_components_update "
+                f"AFTER UPDATE OF id, plan_and_summary ON roadmap_priority BEGIN {delete_row} {insert_row} END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER trg_roadmap_priority_components_delete AFTER DELETE ON roadmap_priority "
+                f"BEGIN {delete_row} END"
+            )
+            cursor.execute(_COMPONENTS_ROW.format(row="t") + " FROM roadmap_priority AS t")
+            logger.info("Indexed reusable components for substring search")
+
     def create_item(
         self,
         item_id: str,
@@ -194,50 +406,21 @@ class RoadmapDatabase:
         if not self.can_write:
             raise PermissionError(f"Only project_manager can create items, not {self.agent_name}")
 
-        now = datetime.now().isoformat()
-
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            # If priority_order not specified, default to max+1
-            if priority_order is None:
-                cursor.execute("SELECT MAX(priority_order) FROM roadmap_priority")
-                max_order = cursor.fetchone()[0]
-                priority_order = (max_order + 1) if max_order is not None else 1
-                logger.info(f"Auto-assigned priority_order={priority_order} for {item_id}")
-
-            cursor.execute(
-                """
-                INSERT INTO roadmap_priority (
-                    id, item_type, number, title, status, content,
-                    estimated_hours, dependencies, priority_order,
-                    updated_at, updated_by
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    item_id,
-                    item_type,
-                    number,
-                    title,
-                    status,
-                    content,
-                    estimated_hours,
-                    dependencies,
-                    priority_order,
-                    now,
-                    self.agent_name,
-                ),
-            )
-
-            # Log to audit
-            cursor.execute(
-                """
-                INSERT INTO roadmap_audit (
-                    item_id, action, changed_by, changed_at
-                ) VALUES (?, ?, ?, ?)
-            """,
-                (item_id, "create", self.agent_name, now),
+            self._insert_item(
+                cursor,
+                item_id=item_id,
+                item_type=item_type,
+                number=number,
+                title=title,
+                status=status,
+                content=content,
+                estimated_hours=estimated_hours,
+                dependencies=dependencies,
+                priority_order=priority_order,
             )
 
             conn.commit()
@@ -253,6 +436,68 @@ class RoadmapDatabase:
             logger.error(f"Error creating item: {e}")
             return False
 
+    def _insert_item(
+        self,
+        cursor: sqlite3.Cursor,
+        item_id: str,
+        item_type: str,
+        number: str,
+        title: str,
+        status: str = "📝 Planned",
+        content: str = "",
+        estimated_hours: Optional[str] = None,
+        dependencies: Optional[str] = None,
+        priority_order: Optional[int] = None,
+    ) -> None:
+        """Insert a roadmap item and its audit row in the caller's transaction (no commit).
+
+        Shared by create_item and DomainWrapper batches; see create_item for arguments.
+
+        Raises:
+            sqlite3.IntegrityError: If id already exists
+        """
+        now = datetime.now().isoformat()
+
+        # If priority_order not specified, default to max+1
+        if priority_order is None:
+            cursor.execute("SELECT MAX(priority_order) FROM roadmap_priority")
+            max_order = cursor.fetchone()[0]
+            priority_order = (max_order + 1) if max_order is not None else 1
+            logger.info(f"Auto-assigned priority_order={priority_order} for {item_id}")
+
+        cursor.execute(
+            """
+            INSERT INTO roadmap_priority (
+                id, item_type, number, title, status, content,
+                estimated_hours, dependencies, priority_order,
+                updated_at, updated_by
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                item_id,
+                item_type,
+                number,
+                title,
+                status,
+                content,
+                estimated_hours,
+                dependencies,
+                priority_order,
+                now,
+                self.agent_name,
+            ),
+        )
+
+        # Log to audit
+        cursor.execute(
+            """
+            INSERT INTO roadmap_audit (
+                item_id, action, changed_by, changed_at
+            ) VALUES (?, ?, ?, ?)
+        """,
+            (item_id, "create", self.agent_name, now),
+        )
+
     def get_all_items(self, status_filter: Optional[str] = None) -> List[Dict]:
         """Get all roadmap items (READ operation - all agents allowed).
 
@@ -333,47 +578,65 @@ class RoadmapDatabase:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            # Get current status
-            cursor.execute("SELECT status FROM roadmap_priority WHERE id = ?", (item_id,))
-            result = cursor.fetchone()
+            old_status = self._set_status(cursor, item_id, new_status, updated_by)
+            if old_status is not None:
+                conn.commit()
+            conn.close()
+            return old_status is not None
 
-            if not result:
-                logger.error(f"Item not found: {item_id}")
-                return False
+        except sqlite3.Error as e:
+            logger.error(f"Error updating status: {e}")
+            return False
 
-            old_status = result[0]
-            now = datetime.now().isoformat()
+    @staticmethod
+    def _set_status(cursor: sqlite3.Cursor, item_id: str, new_status: str, updated_by: str) -> Optional[str]:
+        """Update an item's status and add its audit row in the caller's transaction (no commit).
 
-            # Update status
-            cursor.execute(
-                """
-                UPDATE roadmap_priority
-                SET status = ?, updated_at = ?, updated_by = ?
-                WHERE id = ?
-            """,
-                (new_status, now, updated_by, item_id),
-            )
+        Shared by update_status and DomainWrapper batches.
 
-            # Log audit trail
-            cursor.execute(
-                """
-                INSERT INTO roadmap_audit (
-                    item_id, action, field_changed, old_value, new_value,
-                    changed_by, changed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (item_id, "update_status", "status", old_status, new_status, updated_by, now),
-            )
+        Args:
+            cursor: Cursor of the transaction
+            item_id: Item ID (e.g., "US-062")
+            new_status: New status (e.g., "✅ Complete")
+            updated_by: Agent making the update
 
-            conn.commit()
-            conn.close()
+        Returns:
+            Previous status, or None if the item does not exist
+        """
+        # Get current status
+        cursor.execute("SELECT status FROM roadmap_priority WHERE id = ?", (item_id,))
+        result = cursor.fetchone()
 
-            logger.info(f"✅ Updated {item_id} status: {old_status} → {new_status}")
-            return True
+        if not result:
+            logger.error(f"Item not found: {item_id}")
+            return None
 
-        except sqlite3.Error as e:
-            logger.error(f"Error updating status: {e}")
-            return False
+        old_status = result[0]
+        now = datetime.now().isoformat()
+
+        # Update status
+        cursor.execute(
+            """
+            UPDATE roadmap_priority
+            SET status = ?, updated_at = ?, updated_by = ?
+            WHERE id = ?
+        """,
+            (new_status, now, updated_by, item_id),
+        )
+
+        # Log audit trail
+        cursor.execute(
+            """
+            INSERT INTO roadmap_audit (
+                item_id, action, field_changed, old_value, new_value,
+                changed_by, changed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+            (item_id, "update_status", "status", old_status, new_status, updated_by, now),
+        )
+
+        logger.info(f"✅ Updated {item_id} status: {old_status} → {new_status}")
+        return old_status
 
     def get_next_planned(self) -> Optional[Dict]:
         """Get next planned item (READ operation - all agents allowed).
@@ -582,30 +845,287 @@ class RoadmapDatabase:
         cursor = conn.cursor()
 
         # Get header
-        cursor.execute("SELECT value FROM roadmap_metadata WHERE key = ?", ("header",))
+        cursor.execute("SELECT value, updated_at FROM roadmap_metadata WHERE key = ?", ("header",))
         result = cursor.fetchone()
         header = result["value"] if result else "# ROADMAP\n\n"
 
         # Get all items
         cursor.execute("SELECT * FROM roadmap_priority ORDER BY priority_order ASC")
         rows = cursor.fetchall()
-        conn.close()
 
         # Build markdown
-        lines = [header]
-        for row in rows:
-            if row["content"]:
-                lines.append(row["content"])
-            else:
-                prefix = "##" if row["item_type"] == "user_story" else "###"
-                item_id = f"US-{row['number']}" if row["item_type"] == "user_story" else f"PRIORITY {row['number']}"
-                lines.append(f"{prefix} {item_id}: {row['title']} {row['status']}\n")
-
+        blocks = [self._render_item(row) for row in rows]
+        text = "\n".join([header] + blocks)
         roadmap_path.parent.mkdir(parents=True, exist_ok=True)
-        roadmap_path.write_text("\n".join(lines))
+        roadmap_path.write_text(text)
+
+        state = {
+            "header_updated_at": result["updated_at"] if result else None,
+            "header_length": len(header),
+            "items": [
+                [row["id"], row["priority_order"], row["updated_at"], len(block)] for row, block in zip(rows, blocks)
+            ],
+        }
+        self._save_export_state(conn, roadmap_path, state)
+        conn.close()
 
         logger.info(f"✅ Exported {len(rows)} items to {roadmap_path} (backup only)")
 
+    def export_changes(self, roadmap_path: Path) -> List[Dict]:
+        """Bring an exported ROADMAP.md up to date by patching only changed sections.
+
+        The previous export recorded each item's updated_at and the length of
+        its section. Items whose updated_at changed (a trigger bumps it when a
+        rendered column changes without it) are re-rendered, new ones
+        inserted, deleted ones dropped and moved ones re-positioned; every
+        other section is copied from the existing file untouched. Falls back
+        to a full export if there is no previous export or the file was
+        modified since.
+
+        Args:
+            roadmap_path: Path of the exported ROADMAP.md
+
+        Returns:
+            Changed sections (see get_changed_sections), empty if the file was up to date
+
+        Raises:
+            PermissionError: If not project_manager
+        """
+        if not self.can_write:
+            raise PermissionError("Only project_manager can export roadmap")
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        state = self._load_export_state(cursor, roadmap_path)
+        exported = {entry[0]: entry for entry in state["items"]} if state else {}
+
+        cursor.execute("SELECT id, priority_order, updated_at FROM roadmap_priority ORDER BY priority_order ASC")
+        current = cursor.fetchall()
+        cursor.execute("SELECT value, updated_at FROM roadmap_metadata WHERE key = ?", ("header",))
+        header_row = cursor.fetchone()
+
+        changed = [
+            row["id"] for row in current if row["id"] not in exported or exported[row["id"]][2] != row["updated_at"]
+        ]
+        moved = [
+            row["id"]
+            for row in current
+            if row["id"] in exported and row["id"] not in changed and exported[row["id"]][1] != row["priority_order"]
+        ]
+        current_ids = {row["id"] for row in current}
+        deleted = [item_id for item_id in exported if item_id not in current_ids]
+        header_changed = not state or state["header_updated_at"] != (header_row["updated_at"] if header_row else None)
+
+        if state and not (changed or moved or deleted or header_changed):
+            conn.close()
+            logger.info(f"{roadmap_path} is up to date")
+            return []
+
+        rows = self._get_rows(cursor, changed)
+        sections = self._describe_sections(cursor, rows, state and state["exported_at"])
+        sections += [
+            {"item_id": item_id, "change": "moved", "title": None, "status": None, "markdown": None, "audit": []}
+            for item_id in moved
+        ]
+        sections += [
+            {"item_id": item_id, "change": "deleted", "title": None, "status": None, "markdown": None, "audit": []}
+            for item_id in deleted
+        ]
+
+        existing = self._exported_sections(roadmap_path, state)
+        if existing is None:
+            conn.close()
+            self.export_to_file(roadmap_path)
+            return sections
+
+        header_text, blocks = existing
+        if header_changed:
+            header_text = header_row["value"] if header_row else "# ROADMAP\n\n"
+        blocks.update({row["id"]: self._render_item(row) for row in rows})
+
+        ordered = [blocks[row["id"]] for row in current]
+        roadmap_path.write_text("\n".join([header_text] + ordered))
+
+        self._save_export_state(
+            conn,
+            roadmap_path,
+            {
+                "header_updated_at": header_row["updated_at"] if header_row else None,
+                "header_length": len(header_text),
+                "items": [
+                    [row["id"], row["priority_order"], row["updated_at"], len(block)]
+                    for row, block in zip(current, ordered)
+                ],
+            },
+        )
+        conn.close()
+
+        logger.info(
+            f"✅ Patched {roadmap_path}: {len(changed)} changed, {len(moved)} moved, {len(deleted)} deleted section(s)"
+        )
+        return sections
+
+    def get_changed_sections(self, since: str) -> List[Dict]:
+        """Get the roadmap sections changed after a point in time (READ operation).
+
+        Args:
+            since: ISO timestamp (e.g., the time of the last notification or commit)
+
+        Returns:
+            One entry per changed item, in roadmap order:
+            [
+                {
+                    "item_id": "US-062",
+                    "change": "added" | "updated" | "moved" | "deleted",
+                    "title": "...",
+                    "status": "✅ Complete",
+                    "markdown": "## US-062: ...",   # section as exported (None if deleted or moved)
+                    "audit": [{"action": "update_status", "field_changed": "status", ...}],
+                },
+                ...
+            ]
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT * FROM roadmap_priority WHERE updated_at > ? ORDER BY priority_order ASC",
+            (since,),
+        )
+        sections = self._describe_sections(cursor, cursor.fetchall(), since)
+
+        cursor.execute(
+            """
+            SELECT DISTINCT item_id FROM roadmap_audit
+            WHERE action = 'delete' AND changed_at > ?
+            AND item_id NOT IN (SELECT id FROM roadmap_priority)
+            """,
+            (since,),
+        )
+        for (item_id,) in cursor.fetchall():
+            sections.append(
+                {
+                    "item_id": item_id,
+                    "change": "deleted",
+                    "title": None,
+                    "status": None,
+                    "markdown": None,
+                    "audit": self._get_audit(cursor, [item_id], since).get(item_id, []),
+                }
+            )
+        conn.close()
+        return sections
+
+    # ==================== EXPORT HELPERS ====================
+
+    @staticmethod
+    def _render_item(row: sqlite3.Row) -> str:
+        """Render one roadmap item as its ROADMAP.md section."""
+        if row["content"]:
+            return row["content"]
+        prefix = "##" if row["item_type"] == "user_story" else "###"
+        item_id = f"US-{row['number']}" if row["item_type"] == "user_story" else f"PRIORITY {row['number']}"
+        return f"{prefix} {item_id}: {row['title']} {row['status']}\n"
+
+    @staticmethod
+    def _get_rows(cursor: sqlite3.Cursor, item_ids: List[str]) -> List[sqlite3.Row]:
+        """Fetch full rows for some items, in roadmap order."""
+        if not item_ids:
+            return []
+        cursor.execute(
+            f"SELECT * FROM roadmap_priority WHERE id IN ({', '.join('?' * len(item_ids))}) ORDER BY priority_order",
+            item_ids,
+        )
+        return cursor.fetchall()
+
+    @staticmethod
+    def _get_audit(cursor: sqlite3.Cursor, item_ids: List[str], since: Optional[str]) -> Dict[str, List[Dict]]:
+        """Get audit entries per item, oldest first (all entries if since is None)."""
+        if not item_ids:
+            return {}
+        cursor.execute(
+            f"""
+            SELECT item_id, action, field_changed, old_value, new_value, changed_by, changed_at
+            FROM roadmap_audit
+            WHERE item_id IN ({', '.join('?' * len(item_ids))}) AND changed_at > ?
+            ORDER BY id
+            """,
+            [*item_ids, since or ""],
+        )
+        audit: Dict[str, List[Dict]] = {}
+        for row in cursor.fetchall():
+            entry = dict(row)
+            audit.setdefault(entry.pop("item_id"), []).append(entry)
+        return audit
+
+    def _describe_sections(self, cursor: sqlite3.Cursor, rows: List[sqlite3.Row], since: Optional[str]) -> List[Dict]:
+        """Describe changed items as sections with their audit trail since a timestamp."""
+        audit = self._get_audit(cursor, [row["id"] for row in rows], since)
+        sections = []
+        for row in rows:
+            entries = audit.get(row["id"], [])
+            created = any(entry["action"] == "create" for entry in entries)
+            sections.append(
+                {
+                    "item_id": row["id"],
+                    "change": "added" if created or since is None else "updated",
+                    "title": row["title"],
+                    "status": row["status"],
+                    "markdown": self._render_item(row),
+                    "audit": entries,
+                }
+            )
+        return sections
+
+    @staticmethod
+    def _export_state_key(roadmap_path: Path) -> str:
+        return f"export_state:{Path(roadmap_path).resolve()}"
+
+    def _load_export_state(self, cursor: sqlite3.Cursor, roadmap_path: Path) -> Optional[Dict]:
+        """Load what the last export of roadmap_path wrote, if any."""
+        cursor.execute("SELECT value FROM roadmap_metadata WHERE key = ?", (self._export_state_key(roadmap_path),))
+        result = cursor.fetchone()
+        return json.loads(result[0]) if result else None
+
+    def _save_export_state(self, conn: sqlite3.Connection, roadmap_path: Path, state: Dict) -> None:
+        """Record the sections just written to roadmap_path and the file's stat."""
+        stat = roadmap_path.stat()
+        state.update(exported_at=datetime.now().isoformat(), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        conn.execute(
+            "INSERT OR REPLACE INTO roadmap_metadata (key, value, updated_at) VALUES (?, ?, ?)",
+            (self._export_state_key(roadmap_path), json.dumps(state), state["exported_at"]),
+        )
+        conn.commit()
+
+    @staticmethod
+    def _exported_sections(roadmap_path: Path, state: Optional[Dict]) -> Optional[tuple]:
+        """Split an exported file back into its header and item sections.
+
+        Returns:
+            Tuple of (header, {item_id: section}), or None if the file is
+            missing or no longer what the last export wrote
+        """
+        if not state or not roadmap_path.exists():
+            return None
+        stat = roadmap_path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (state["size"], state["mtime_ns"]):
+            logger.warning(f"{roadmap_path} was modified outside of export, rewriting it")
+            return None
+
+        text = roadmap_path.read_text()
+        position = state["header_length"]
+        header = text[:position]
+        blocks = {}
+        for item_id, _, _, length in state["items"]:
+            blocks[item_id] = text[position + 1 : position + 1 + length]
+            position += 1 + length
+        if position != len(text):
+            return None
+        return header, blocks
+
     def import_from_file(self, roadmap_path: Path) -> int:
         """Import ROADMAP.md into database (ONE-TIME MIGRATION ONLY).
 
@@ -629,81 +1149,39 @@ class RoadmapDatabase:
         if not roadmap_path.exists():
             raise FileNotFoundError(f"ROADMAP not found: {roadmap_path}")
 
-        content = roadmap_path.read_text()
-        lines = content.split("\n")
+        index = RoadmapIndex.for_path(roadmap_path)
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Store header
-        header_lines = []
-        priority_start_idx = 0
-
-        for idx, line in enumerate(lines):
-            if re.match(r"^##\s+(US-|PRIORITY)", line) or re.match(r"^###\s+(🔴|PRIORITY|US-)", line):
-                priority_start_idx = idx
-                break
-            header_lines.append(line)
-
-        header = "\n".join(header_lines)
+        # Store header (everything before the first item-like header)
+        first_item = next((h for h in index.headings if _IMPORT_HEADER_END.match(h.text)), None)
+        header = index.prefix_text(first_item) if first_item else index.text
         cursor.execute(
             "INSERT OR REPLACE INTO roadmap_metadata (key, value, updated_at) VALUES (?, ?, ?)",
             ("header", header, datetime.now().isoformat()),
         )
 
-        # Parse items
+        # Each item runs until the next item header
+        ends = index.section_ends(lambda h: _match_import_item(h.text)[0] is not None, key="roadmap_import")
+
         items_imported = 0
-        priority_order = 0
-        current_item = None
-        current_content_lines = []
-
-        patterns = [
-            (r"^##\s+US-(\d+):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$", "user_story"),
-            (r"^##\s+PRIORITY\s+(\d+(?:\.\d+)?):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$", "priority"),
-            (r"^###\s+🔴\s+\*\*PRIORITY\s+(\d+(?:\.\d+)?):(.+?)\*\*.*$", "priority"),
-            (r"^###\s+PRIORITY\s+(\d+(?:\.\d+)?):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$", "priority"),
-            (r"^###\s+US-(\d+):(.+?)(?:\s+(📝|🔄|✅|⏸️|🚧).*)?$", "user_story"),
-        ]
+        for heading in index.headings:
+            match, item_type = _match_import_item(heading.text)
+            if not match:
+                continue
 
-        for idx in range(priority_start_idx, len(lines)):
-            line = lines[idx]
-            matched = False
-
-            for pattern, item_type in patterns:
-                match = re.match(pattern, line)
-                if match:
-                    # Save previous item
-                    if current_item:
-                        current_item["content"] = "\n".join(current_content_lines)
-                        self._save_item(cursor, current_item, priority_order)
-                        items_imported += 1
-                        priority_order += 1
-
-                    # Start new item
-                    number = match.group(1)
-                    title = match.group(2).strip()
-                    status = match.group(3) if len(match.groups()) >= 3 else "📝 Planned"
-
-                    item_id = f"US-{number}" if item_type == "user_story" else f"PRIORITY-{number}"
-
-                    current_item = {
-                        "id": item_id,
-                        "item_type": item_type,
-                        "number": number,
-                        "title": title,
-                        "status": status if status else "📝 Planned",
-                    }
-                    current_content_lines = [line]
-                    matched = True
-                    break
-
-            if not matched and current_item:
-                current_content_lines.append(line)
-
-        # Save last item
-        if current_item:
-            current_item["content"] = "\n".join(current_content_lines)
-            self._save_item(cursor, current_item, priority_order)
+            number = match.group(1)
+            status = match.group(3) if len(match.groups()) >= 3 else "📝 Planned"
+            item = {
+                "id": f"US-{number}" if item_type == "user_story" else f"PRIORITY-{number}",
+                "item_type": item_type,
+                "number": number,
+                "title": match.group(2).strip(),
+                "status": status if status else "📝 Planned",
+                "content": index.section_text(heading, ends[heading.index]),
+            }
+            self._save_item(cursor, item, items_imported)
             items_imported += 1
 
         conn.commit()
@@ -1295,43 +1773,97 @@ class RoadmapDatabase:
             ]
         """
 
-        all_items = self.get_all_items()
-        reusable_components = []
+        plan = _PLAN_JSON.format(plan="r.plan_and_summary")
+        select = f"""
+            SELECT r.id, r.title, c.value, json_extract({plan}, '$.architecture_summary.overview')
+            FROM {{source}}
+            JOIN json_each({plan}, '$.reusable_components') AS c
+            WHERE {_TECH_SPECS_COMPLETE.format(plan="r.plan_and_summary")} = 1 AND c.type = 'object'
+        """
 
-        for item in all_items:
-            plan = self.get_plan_and_summary(item["id"])
+        terms = [term.lower() for term in search_terms or []]
+        query = _substring_query(terms) if terms else None
 
-            # Only consider items with completed tech specs
-            if not plan or not plan.get("tech_specs_complete"):
-                continue
+        try:
+            conn = sqlite3.connect(self.db_path)
+            if query:
+                # Items whose components contain any term, best match first
+                source = "roadmap_components AS s JOIN roadmap_priority AS r ON r.id = s.doc_id"
+                sql = select.format(source=source) + " AND roadmap_components MATCH ? ORDER BY s.rank, c.key"
+                rows = conn.execute(sql, (query,)).fetchall()
+            else:
+                sql = select.format(source="roadmap_priority AS r") + " ORDER BY r.priority_order, c.key"
+                rows = conn.execute(sql).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error finding reusable components: {e}")
+            return []
 
-            components = plan.get("reusable_components", [])
-            architecture_summary = plan.get("architecture_summary", {})
-
-            for component in components:
-                # Filter by search terms if provided
-                if search_terms:
-                    component_text = (
-                        f"{component.get('name', '')} " f"{' '.join(component.get('use_cases', []))}"
-                    ).lower()
-
-                    if not any(term.lower() in component_text for term in search_terms):
-                        continue
-
-                reusable_components.append(
-                    {
-                        "component_name": component.get("name"),
-                        "source_item_id": item["id"],
-                        "source_item_title": item.get("title", "Unknown"),
-                        "location": component.get("location"),
-                        "use_cases": component.get("use_cases", []),
-                        "architecture_overview": architecture_summary.get("overview", ""),
-                    }
-                )
+        reusable_components = []
+        for item_id, title, component_json, overview in rows:
+            component = json.loads(component_json)
+
+            # Items match as a whole: keep only the components that match a term
+            if terms:
+                component_text = f"{component.get('name', '')} {' '.join(component.get('use_cases', []))}".lower()
+                if not any(term in component_text for term in terms):
+                    continue
+
+            reusable_components.append(
+                {
+                    "component_name": component.get("name"),
+                    "source_item_id": item_id,
+                    "source_item_title": title or "Unknown",
+                    "location": component.get("location"),
+                    "use_cases": component.get("use_cases", []),
+                    "architecture_overview": overview or "",
+                }
+            )
 
         logger.info(f"Found {len(reusable_components)} reusable components")
         return reusable_components
 
+    def search(self, text: str, kind: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """Full-text search over roadmap items and technical specs (all agents can read).
+
+        Every word must match (as a prefix, ignoring case and accents);
+        results are ranked by BM25.
+
+        Args:
+            text: Search text (e.g., "email validation")
+            kind: Restrict to "item" (roadmap items) or "spec" (technical specs)
+            limit: Maximum number of results
+
+        Returns:
+            List of matches, best first:
+            [{"kind": "item", "id": "US-062", "title": "...", "snippet": "...", "rank": -4.2}, ...]
+        """
+        query = _fts_query(text.split(), operator="AND")
+        if not query:
+            return []
+
+        sql = """
+            SELECT kind, doc_id, title, snippet(roadmap_search, -1, '[', ']', '…', 12), rank
+            FROM roadmap_search
+            WHERE roadmap_search MATCH ?
+        """
+        params: list = [query]
+        if kind:
+            sql += " AND kind = ?"
+            params.append(kind)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute(sql, params).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error searching roadmap: {e}")
+            return []
+
+        return [{"kind": row[0], "id": row[1], "title": row[2], "snippet": row[3], "rank": row[4]} for row in rows]
+
     # ==================== CODE REVIEW SYSTEM ====================
 
     def track_commit(
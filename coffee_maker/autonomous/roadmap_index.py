@@ -0,0 +1,538 @@
+"""Shared section index for ROADMAP.md.
+
+ROADMAP.md is tens of thousands of lines long, and the parsers, the status
+report generator, the roadmap editor and the database import all need the same
+thing from it: where each heading is, where its section ends, and which
+US-XXX / PRIORITY X item it belongs to. Instead of every consumer re-reading and
+regex-scanning the whole file (and rescanning forward from every header to find
+where a section ends), ``RoadmapIndex`` builds that map once:
+
+- One linear pass over the file records every heading line with its byte offset,
+  level, code-fence state, US/PRIORITY id and ``**Status**:`` value. The pass
+  jumps between heading, code fence and status lines instead of visiting every
+  line.
+- Section ends are resolved in the same pass (next heading of the same or a
+  higher level); consumers with their own boundary rules get all ends in one
+  reverse pass over the headings with ``section_ends()``.
+- The index is validated by mtime and size, then by SHA-256 of the content, and
+  persisted as JSON so other processes reuse it without re-parsing.
+
+Example:
+    >>> from coffee_maker.autonomous.roadmap_index import RoadmapIndex
+    >>>
+    >>> index = RoadmapIndex.for_path("docs/roadmap/ROADMAP.md")
+    >>> heading = index.get("US-110")
+    >>> print(heading.status)
+    ✅ Complete
+    >>> section = index.section_text(heading)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+DEFAULT_CACHE_DIR = Path.home() / ".coffee_maker" / "roadmap_index"
+
+# Lines after a heading searched for a "**Status**:" line (same window the parsers used)
+STATUS_WINDOW = 15
+
+_ITEM_ID_PATTERN = re.compile(r"^#+\s+(?:\S+\s+)??\*{0,2}\[?(US-(\d+)|PRIORITY\s+(\d+(?:\.\d+)?))\]?:?\s*(.*)$")
+# Matched against "\n" + content, so match.start() is the line's offset in the content
+_HEADING_OR_FENCE = re.compile(rb"\n(?:#|[ \t\r\f\v]*```)")
+_STATUS_MARK = re.compile(rb"\*\*Status\*\*:")
+_STATUS_PATTERN = re.compile(r"\*\*Status\*\*:\s*(.+?)(?:\n|$)")
+_TITLE_STATUS_SUFFIX = re.compile(r"\s*(📝|🔄|✅|⏸️).*$")
+
+
+@dataclass(frozen=True)
+class RoadmapHeading:
+    """A heading line of ROADMAP.md and the section it opens.
+
+    Attributes:
+        index: Position in ``RoadmapIndex.headings``
+        line: 0-based line number
+        level: Number of leading ``#`` characters
+        text: Heading line without the trailing newline
+        start: Byte offset of the heading line
+        end: Byte offset where the section ends (next heading of the same or a
+            higher level outside code blocks, or end of file)
+        in_code_block: Whether the line is inside a fenced code block
+        item_id: "US-XXX" or "PRIORITY X" if the heading names a roadmap item
+        kind: "user_story" or "priority" for item headings
+        number: Item number as written (e.g. "062", "2.5")
+        title: Item title without markup and status suffix
+        status: Value of the first ``**Status**:`` line within the status window
+    """
+
+    index: int
+    line: int
+    level: int
+    text: str
+    start: int
+    end: int
+    in_code_block: bool
+    item_id: Optional[str] = None
+    kind: Optional[str] = None
+    number: Optional[str] = None
+    title: Optional[str] = None
+    status: Optional[str] = None
+
+
+_heading_values = attrgetter(*(field.name for field in fields(RoadmapHeading)))
+
+
+class RoadmapIndex:
+    """Immutable section index of one version of ROADMAP.md.
+
+    Use ``RoadmapIndex.for_path()`` to get the index for the current content of a
+    file; it is shared process-wide and persisted between processes.
+
+    Attributes:
+        path: Path to the indexed file
+        data: File content (bytes) the index was built from
+        sha256: Hex digest of ``data``
+        headings: All heading lines in file order
+        fences: Byte offsets of code fence lines
+    """
+
+    _instances: Dict[str, "RoadmapIndex"] = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Path,
+        data: bytes,
+        headings: List[RoadmapHeading],
+        sha256: str,
+        mtime_ns: int = 0,
+        fences: Optional[List[int]] = None,
+    ):
+        """Initialize RoadmapIndex (use ``build`` or ``for_path``).
+
+        Args:
+            path: Path to the indexed file
+            data: File content
+            headings: Headings of ``data``
+            sha256: Hex digest of ``data``
+            mtime_ns: File modification time the index was validated against
+            fences: Byte offsets of code fence lines
+        """
+        self.path = path
+        self.data = data
+        self.headings = headings
+        self.sha256 = sha256
+        self.mtime_ns = mtime_ns
+        self.fences = fences or []
+
+        self._items: Dict[str, RoadmapHeading] = {}
+        for heading in headings:
+            if heading.item_id and not heading.in_code_block:
+                self._items.setdefault(heading.item_id.upper(), heading)
+
+        self._text: Optional[str] = None
+        self._section_ends: Dict[str, List[int]] = {}
+
+    # ==================== Construction ====================
+
+    @classmethod
+    def build(cls, data: Union[bytes, str], path: Union[str, Path] = "") -> "RoadmapIndex":
+        """Build an index in one pass over the content.
+
+        Args:
+            data: Roadmap content
+            path: Path the content came from (informational)
+
+        Returns:
+            RoadmapIndex for the content
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        headings, fences = cls._scan(data, 0, len(data), 0, False)
+        return cls._finish(Path(path), data, headings, fences)
+
+    def splice(self, start: int, end: int, replacement: bytes) -> "RoadmapIndex":
+        """Index the content with bytes [start, end) replaced.
+
+        Only the lines touched by the edit are re-scanned; headings after it are
+        shifted. Edits that add or remove code fences fall back to a full build.
+
+        Args:
+            start: Start byte offset
+            end: End byte offset
+            replacement: New bytes for the range
+
+        Returns:
+            RoadmapIndex for the edited content
+        """
+        data = self.data
+        new_data = data[:start] + replacement + data[end:]
+        delta = len(replacement) - (end - start)
+
+        line_lo = data.rfind(b"\n", 0, start) + 1
+        line_hi = data.find(b"\n", end)
+        if line_hi < 0:
+            line_hi = len(data)
+        if b"```" in data[line_lo:line_hi] or b"```" in new_data[line_lo : line_hi + delta]:
+            return self.build(new_data, self.path)
+
+        line_delta = replacement.count(b"\n") - data.count(b"\n", start, end)
+        in_code_block = bisect_left(self.fences, line_lo) % 2 == 1
+        rescanned, _ = self._scan(new_data, line_lo, line_hi + delta, new_data.count(b"\n", 0, line_lo), in_code_block)
+
+        headings = [self._as_list(h) for h in self.headings if h.start < line_lo]
+        headings.extend(rescanned)
+        for heading in self.headings:
+            if heading.start > line_hi:
+                shifted = self._as_list(heading)
+                shifted[1] += line_delta
+                shifted[4] += delta
+                headings.append(shifted)
+
+        fences = [f for f in self.fences if f < line_lo] + [f + delta for f in self.fences if f > line_hi]
+        return self._finish(self.path, new_data, headings, fences)
+
+    @staticmethod
+    def _as_list(heading: RoadmapHeading) -> list:
+        """Get a heading's fields as a mutable list (end and status reset)."""
+        fields_list = list(_heading_values(heading))
+        fields_list[11] = None
+        return fields_list
+
+    @classmethod
+    def _scan(cls, data: bytes, lo: int, hi: int, line_no: int, in_code_block: bool) -> tuple:
+        """Scan heading and code fence lines starting in [lo, hi].
+
+        Args:
+            data: Content
+            lo: Offset of a line start
+            hi: Offset up to which lines are scanned
+            line_no: Line number of ``lo``
+            in_code_block: Code fence state at ``lo``
+
+        Returns:
+            Tuple of (heading field lists, code fence line offsets)
+        """
+        headings: List[list] = []
+        fences: List[int] = []
+        line_pos = lo
+
+        # Only heading and code fence lines matter: jump between them
+        for line_match in _HEADING_OR_FENCE.finditer(b"\n" + data, lo, hi + 1):
+            offset = line_match.start()
+            line_no += data.count(b"\n", line_pos, offset)
+            line_pos = offset
+            line_end = data.find(b"\n", offset)
+            raw_line = data[offset : line_end if line_end >= 0 else len(data)]
+
+            if not raw_line.startswith(b"#"):
+                in_code_block = not in_code_block
+                fences.append(offset)
+                continue
+
+            text = raw_line.decode("utf-8", "replace").rstrip("\r")
+            level = len(text) - len(text.lstrip("#"))
+            heading = [0, line_no, level, text, offset, 0, in_code_block]
+            heading.extend(cls._parse_item(text))
+            heading.append(None)
+            headings.append(heading)
+
+        return headings, fences
+
+    @classmethod
+    def _finish(cls, path: Path, data: bytes, headings: List[list], fences: List[int]) -> "RoadmapIndex":
+        """Resolve section ends and statuses of scanned headings and create the index."""
+        open_sections: List[list] = []  # headings whose end is not known yet
+        open_fenced: List[list] = []  # headings inside code blocks, ended by the next real heading
+
+        for position, heading in enumerate(headings):
+            heading[0] = position
+            heading[5] = len(data)
+            offset, level = heading[4], heading[2]
+
+            if heading[6]:
+                open_fenced.append(heading)
+                continue
+
+            while open_sections and open_sections[-1][2] >= level:
+                open_sections.pop()[5] = offset
+            for fenced in open_fenced:
+                fenced[5] = offset
+            open_fenced = []
+            open_sections.append(heading)
+
+        cls._assign_status(data, [h for h in headings if h[7] and not h[6]])
+
+        return cls(
+            path,
+            data,
+            [RoadmapHeading(*heading) for heading in headings],
+            hashlib.sha256(data).hexdigest(),
+            fences=fences,
+        )
+
+    @staticmethod
+    def _assign_status(data: bytes, item_headings: List[list]) -> None:
+        """Attach the first parseable **Status**: line within the status window to each item heading."""
+        status_lines = []  # (offset, line number, line text)
+        line_no, line_pos = 0, 0
+        for mark in _STATUS_MARK.finditer(data):
+            line_start = data.rfind(b"\n", 0, mark.start()) + 1
+            if status_lines and status_lines[-1][0] == line_start:
+                continue
+            line_no += data.count(b"\n", line_pos, line_start)
+            line_pos = line_start
+            line_end = data.find(b"\n", line_start)
+            line = data[line_start : line_end if line_end >= 0 else len(data)].decode("utf-8", "replace")
+            status_lines.append((line_start, line_no, line))
+
+        offsets = [offset for offset, _, _ in status_lines]
+        for heading in item_headings:
+            for _, status_line_no, line in status_lines[bisect_left(offsets, heading[4]) :]:
+                if status_line_no >= heading[1] + STATUS_WINDOW:
+                    break
+                match = _STATUS_PATTERN.search(line)
+                if match:
+                    heading[11] = match.group(1).strip()
+                    break
+
+    @staticmethod
+    def _parse_item(text: str) -> tuple:
+        """Parse (item_id, kind, number, title) from a heading line."""
+        match = _ITEM_ID_PATTERN.match(text)
+        if not match:
+            return None, None, None, None
+
+        if match.group(2):
+            item_id, kind, number = f"US-{match.group(2)}", "user_story", match.group(2)
+        else:
+            item_id, kind, number = f"PRIORITY {match.group(3)}", "priority", match.group(3)
+
+        title = match.group(4).split("**")[0].strip() if "**" in text else match.group(4)
+        title = _TITLE_STATUS_SUFFIX.sub("", title).strip()
+        return item_id, kind, number, title
+
+    @classmethod
+    def for_path(cls, path: Union[str, Path], cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> "RoadmapIndex":
+        """Get the index for the current content of a file.
+
+        The in-process index is reused while the file's mtime and size are
+        unchanged. Otherwise the file is read and hashed, and the index is reused
+        (from memory or the on-disk cache) when the hash matches, or rebuilt.
+
+        Args:
+            path: Path to ROADMAP.md
+            cache_dir: Directory of persisted indexes (None disables persistence)
+
+        Returns:
+            RoadmapIndex for the file's current content
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        path = Path(path)
+        key = str(path.resolve())
+        stat = path.stat()
+
+        with cls._lock:
+            current = cls._instances.get(key)
+        if current is not None and current.mtime_ns == stat.st_mtime_ns and len(current.data) == stat.st_size:
+            return current
+
+        data = path.read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        if current is not None and current.sha256 == sha256:
+            index = cls(path, data, current.headings, sha256, fences=current.fences)
+        else:
+            index = cls._load_persisted(path, data, sha256, cache_dir)
+            if index is None:
+                index = cls.build(data, path)
+                logger.debug(f"Built roadmap index for {path}: {len(index.headings)} headings")
+                cls._persist(index, cache_dir)
+
+        index.mtime_ns = stat.st_mtime_ns
+        with cls._lock:
+            cls._instances[key] = index
+        return index
+
+    @classmethod
+    def update(
+        cls, path: Union[str, Path], index: "RoadmapIndex", cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+    ) -> "RoadmapIndex":
+        """Share the index of content just written to a file, without reading it back.
+
+        Args:
+            path: Path the content was written to
+            index: Index of the written content (e.g. from ``splice``)
+            cache_dir: Directory of persisted indexes (None disables persistence)
+
+        Returns:
+            The index, now returned by ``for_path`` for this file
+        """
+        path = Path(path)
+        index.path = path
+        index.mtime_ns = path.stat().st_mtime_ns
+        cls._persist(index, cache_dir)
+        with cls._lock:
+            cls._instances[str(path.resolve())] = index
+        return index
+
+    @classmethod
+    def invalidate(cls, path: Optional[Union[str, Path]] = None) -> None:
+        """Drop in-process indexes (all of them if no path is given).
+
+        Args:
+            path: Path whose index to drop
+        """
+        with cls._lock:
+            if path is None:
+                cls._instances.clear()
+            else:
+                cls._instances.pop(str(Path(path).resolve()), None)
+
+    # ==================== Persistence ====================
+
+    @staticmethod
+    def _cache_file(path: Path, cache_dir: Path) -> Path:
+        """Get the cache file for a roadmap path."""
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return cache_dir / f"{path.stem}_{digest}.json"
+
+    @classmethod
+    def _load_persisted(
+        cls, path: Path, data: bytes, sha256: str, cache_dir: Optional[Path]
+    ) -> Optional["RoadmapIndex"]:
+        """Load a persisted index if it was built from the same content."""
+        if cache_dir is None:
+            return None
+
+        cache_file = cls._cache_file(path, cache_dir)
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached.get("version") != INDEX_VERSION or cached.get("sha256") != sha256:
+                return None
+            headings = [RoadmapHeading(*fields) for fields in cached["headings"]]
+            fences = cached["fences"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        logger.debug(f"Loaded persisted roadmap index from {cache_file}")
+        return cls(path, data, headings, sha256, fences=fences)
+
+    @classmethod
+    def _persist(cls, index: "RoadmapIndex", cache_dir: Optional[Path]) -> None:
+        """Persist an index atomically (failures only disable persistence)."""
+        if cache_dir is None:
+            return
+
+        cache_file = cls._cache_file(index.path, cache_dir)
+        payload = {
+            "version": INDEX_VERSION,
+            "path": str(index.path),
+            "sha256": index.sha256,
+            "headings": [_heading_values(heading) for heading in index.headings],
+            "fences": index.fences,
+        }
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(payload, ensure_ascii=False))
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not persist roadmap index to {cache_file}: {e}")
+
+    # ==================== Queries ====================
+
+    @property
+    def text(self) -> str:
+        """Full content as text."""
+        if self._text is None:
+            self._text = self.data.decode("utf-8")
+        return self._text
+
+    def items(self) -> List[RoadmapHeading]:
+        """Get all US/PRIORITY item headings outside code blocks, in file order."""
+        return [h for h in self.headings if h.item_id and not h.in_code_block]
+
+    def get(self, item_id: str) -> Optional[RoadmapHeading]:
+        """Look up an item heading by id.
+
+        Args:
+            item_id: "US-062", "PRIORITY 3" or a bare priority number such as "3"
+
+        Returns:
+            First matching heading outside code blocks, or None
+        """
+        item_id = item_id.strip().upper()
+        if not item_id.startswith(("US-", "PRIORITY")):
+            item_id = f"PRIORITY {item_id}"
+        return self._items.get(re.sub(r"^PRIORITY\s*", "PRIORITY ", item_id))
+
+    def section_ends(self, stop: Callable[[RoadmapHeading], bool], key: Optional[str] = None) -> List[int]:
+        """Resolve section ends for every heading under a custom boundary rule.
+
+        ``ends[i]`` is the start of the first heading after ``headings[i]`` for
+        which ``stop`` is true (or end of file). Computed in one reverse pass.
+
+        Args:
+            stop: Predicate marking headings that end the previous section
+            key: Cache key for the result (e.g. the consumer's name)
+
+        Returns:
+            List of byte offsets, parallel to ``headings``
+        """
+        if key is not None and key in self._section_ends:
+            return self._section_ends[key]
+
+        ends = [0] * len(self.headings)
+        next_stop = len(self.data)
+        for heading in reversed(self.headings):
+            ends[heading.index] = next_stop
+            if stop(heading):
+                next_stop = heading.start
+
+        if key is not None:
+            self._section_ends[key] = ends
+        return ends
+
+    def section_text(self, heading: RoadmapHeading, end: Optional[int] = None) -> str:
+        """Get the text of a section, from its heading line up to ``end``.
+
+        Same text as joining the section's lines with newlines: the newline that
+        precedes the next heading is not included.
+
+        Args:
+            heading: Heading opening the section
+            end: Byte offset where the section ends (default: ``heading.end``)
+
+        Returns:
+            Section text
+        """
+        end = heading.end if end is None else end
+        if end < len(self.data) and end > heading.start and self.data[end - 1 : end] == b"\n":
+            end -= 1
+        return self.data[heading.start : end].decode("utf-8")
+
+    def prefix_text(self, heading: RoadmapHeading) -> str:
+        """Get the text before a heading (e.g. the roadmap header).
+
+        Args:
+            heading: First heading after the prefix
+
+        Returns:
+            Text of all lines before the heading line
+        """
+        end = heading.start - 1 if heading.start else 0
+        return self.data[:end].decode("utf-8")
@@ -22,8 +22,35 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
+
 logger = logging.getLogger(__name__)
 
+# Priority header patterns (BUG-066: support both ## and ### formats)
+# Double hash (##) - new format:
+#   1. ## US-110: Orchestrator Database Tracing
+#   2. ## PRIORITY 20: Feature Name
+# Triple hash (###) - legacy format:
+#   3. ### 🔴 **PRIORITY 1: Analytics & Observability** ⚡ FOUNDATION
+#   4. ### PRIORITY 1: Analytics 📝 Planned
+#   5. ### US-062: Implement startup skill 📝 Planned
+PRIORITY_PATTERNS = [
+    # Double hash patterns (new format) - check these first
+    re.compile(r"^##\s+US-(\d+):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$"),  # ## US-XXX: Title
+    re.compile(r"^##\s+PRIORITY\s+(\d+(?:\.\d+)?):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$"),  # ## PRIORITY X: Title
+    # Triple hash patterns (legacy format)
+    re.compile(r"^###\s+🔴\s+\*\*PRIORITY\s+(\d+(?:\.\d+)?):([^*]+)\*\*"),  # ### 🔴 **PRIORITY X**
+    re.compile(r"^###\s+PRIORITY\s+(\d+(?:\.\d+)?):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$"),  # ### PRIORITY X: Title
+    re.compile(r"^###\s+US-(\d+):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$"),  # ### US-XXX: Title
+]
+
+_PRIORITY_BOUNDARY = re.compile(r"^###\s+(🔴\s+)?\*?PRIORITY\s+\d+")
+
+
+def _is_priority_boundary(heading: RoadmapHeading) -> bool:
+    """Check if a heading ends a priority section (next priority or ## divider)."""
+    return heading.text.startswith("## ") or bool(_PRIORITY_BOUNDARY.match(heading.text))
+
 
 class RoadmapParser:
     """Parse ROADMAP.md to extract tasks and priorities.
@@ -53,9 +80,14 @@ class RoadmapParser:
         if not self.roadmap_path.exists():
             raise FileNotFoundError(f"ROADMAP not found: {roadmap_path}")
 
-        self.content = self.roadmap_path.read_text()
+        self.index = RoadmapIndex.for_path(self.roadmap_path)
         logger.info(f"Loaded roadmap from {roadmap_path}")
 
+    @property
+    def content(self) -> str:
+        """Raw markdown content of the loaded roadmap."""
+        return self.index.text
+
     def reload(self):
         """Reload roadmap from disk.
 
@@ -64,7 +96,7 @@ class RoadmapParser:
             >>> # ... roadmap file changes ...
             >>> parser.reload()  # Re-read from disk
         """
-        self.content = self.roadmap_path.read_text()
+        self.index = RoadmapIndex.for_path(self.roadmap_path)
         logger.info(f"Reloaded roadmap from {self.roadmap_path}")
 
     def get_priorities(self) -> List[Dict]:
@@ -86,43 +118,12 @@ class RoadmapParser:
             7
         """
         priorities = []
+        ends = self.index.section_ends(_is_priority_boundary, key="roadmap_parser")
 
-        # Multiple patterns to match priority headers:
-        # BUG-066: Support both ## and ### formats
-        # Double hash (##) - new format:
-        #   1. ## US-110: Orchestrator Database Tracing
-        #   2. ## PRIORITY 20: Feature Name
-        # Triple hash (###) - legacy format:
-        #   3. ### 🔴 **PRIORITY 1: Analytics & Observability** ⚡ FOUNDATION
-        #   4. ### PRIORITY 1: Analytics 📝 Planned
-        #   5. ### US-062: Implement startup skill 📝 Planned
-        patterns = [
-            # Double hash patterns (new format) - check these first
-            r"^##\s+US-(\d+):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$",  # ## US-XXX: Title
-            r"^##\s+PRIORITY\s+(\d+(?:\.\d+)?):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$",  # ## PRIORITY X: Title
-            # Triple hash patterns (legacy format)
-            r"^###\s+🔴\s+\*\*PRIORITY\s+(\d+(?:\.\d+)?):([^*]+)\*\*",  # ### 🔴 **PRIORITY X**
-            r"^###\s+PRIORITY\s+(\d+(?:\.\d+)?):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$",  # ### PRIORITY X: Title
-            r"^###\s+US-(\d+):([^#]+?)(?:\s+(?:📝|🔄|✅|⏸️).*)?$",  # ### US-XXX: Title
-        ]
-
-        lines = self.content.split("\n")
-
-        # Track code blocks to skip priorities inside them
-        in_code_block = False
-
-        for i, line in enumerate(lines):
-            # Check for code fence markers
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-
-            # Skip lines inside code blocks
-            if in_code_block:
-                continue
-
-            for pattern in patterns:
-                match = re.search(pattern, line)
+        # Item headings from the shared index (code blocks already excluded)
+        for heading in self.index.items():
+            for pattern in PRIORITY_PATTERNS:
+                match = pattern.search(heading.text)
                 if match:
                     priority_num = match.group(1)
                     title = match.group(2).strip()
@@ -130,18 +131,11 @@ class RoadmapParser:
                     # Clean up title (remove emojis and status if captured)
                     title = re.sub(r"\s*(📝|🔄|✅|⏸️).*$", "", title).strip()
 
-                    # Look for status in next few lines
-                    status = self._extract_status(lines, i)
-
-                    # If status not found in **Status**: lines, try to extract from header
-                    if status == "Unknown":
-                        status = self._extract_status_from_header(line)
-
-                    # Extract full section content
-                    section_content = self._extract_section(lines, i)
+                    # Status from the **Status**: line, else from the header
+                    status = heading.status or self._extract_status_from_header(heading.text)
 
                     # Determine priority name based on format (PRIORITY or US-XXX)
-                    if "US-" in line:
+                    if "US-" in heading.text:
                         priority_name = f"US-{priority_num}"
                     else:
                         priority_name = f"PRIORITY {priority_num}"
@@ -152,36 +146,15 @@ class RoadmapParser:
                             "number": priority_num,
                             "title": title,
                             "status": status,
-                            "section_start": i,
-                            "content": section_content,
+                            "section_start": heading.line,
+                            "content": self.index.section_text(heading, ends[heading.index]),
                         }
                     )
-                    break  # Found match, move to next line
+                    break  # Found match, move to next heading
 
         logger.info(f"Found {len(priorities)} priorities")
         return priorities
 
-    def _extract_status(self, lines: List[str], start_line: int) -> str:
-        """Extract status from lines near priority header.
-
-        Args:
-            lines: All lines from roadmap
-            start_line: Line number of priority header
-
-        Returns:
-            Status string (e.g., "📝 Planned", "🔄 In Progress")
-        """
-        # Look in next 10 lines for **Status**: pattern
-        for i in range(start_line, min(start_line + 15, len(lines))):
-            line = lines[i]
-            if "**Status**:" in line:
-                # Extract status after the colon
-                status_match = re.search(r"\*\*Status\*\*:\s*(.+?)(?:\n|$)", line)
-                if status_match:
-                    return status_match.group(1).strip()
-
-        return "Unknown"
-
     def _extract_status_from_header(self, header_line: str) -> str:
         """Extract status emoji and text from priority header line.
 
@@ -203,34 +176,6 @@ class RoadmapParser:
 
         return "Unknown"
 
-    def _extract_section(self, lines: List[str], start_line: int) -> str:
-        """Extract full section content until next priority or end.
-
-        Args:
-            lines: All lines from roadmap
-            start_line: Line number of priority header
-
-        Returns:
-            Section content as string
-        """
-        section_lines = [lines[start_line]]
-
-        # Continue until we hit another ### heading with PRIORITY
-        for i in range(start_line + 1, len(lines)):
-            line = lines[i]
-
-            # Stop at next priority section (both formats)
-            if re.match(r"^###\s+(🔴\s+)?\*?PRIORITY\s+\d+", line):
-                break
-
-            # Stop at major section divider (## but not ###)
-            if line.startswith("## ") and not line.startswith("###"):
-                break
-
-            section_lines.append(line)
-
-        return "\n".join(section_lines)
-
     def get_next_planned_priority(self) -> Optional[Dict]:
         """Get the next priority that is in Planned status.
 
@@ -23,6 +23,8 @@ from pathlib import Path
 from typing import List, Optional
 import os
 
+from coffee_maker.utils.token_service import get_token_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -296,7 +298,7 @@ class StartupSkillExecutor:
     def _estimate_tokens(text: str) -> int:
         """Estimate token count for text.
 
-        Rule of thumb: ~4 characters per token
+        Uses the token service's approximate mode (~4 characters per token).
 
         Args:
             text: Text to estimate
@@ -304,7 +306,7 @@ class StartupSkillExecutor:
         Returns:
             Estimated token count
         """
-        return max(1, len(text) // 4)
+        return max(1, get_token_service().count(text, approximate=True))
 
     def _execute_health_checks(self, agent_name: str, step: SkillStep) -> List[HealthCheckResult]:
         """Execute health checks from checklist.
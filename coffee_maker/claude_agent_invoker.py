@@ -10,11 +10,13 @@ Key Features:
 - Support for both CLI and API modes
 - Automatic CFR-013 compliance (roadmap branch)
 - Cost tracking and token usage monitoring
+- Completed invocations recorded as ACE execution traces
 
 Architecture:
     ClaudeAgentInvoker: Main class for agent invocation
     ├── invoke_agent(): Non-streaming invocation
     ├── invoke_agent_streaming(): Streaming invocation with progress
+    ├── stream_text(): Response text as the model generates it (chat)
     ├── invoke_slash_command(): Execute slash commands programmatically
     └── Database persistence via ClaudeInvocationDB
 
@@ -54,14 +56,20 @@ import json
 import logging
 import sqlite3
 import subprocess
+import tempfile
+import threading
+import uuid
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Characters of an invocation's output kept in its ACE trace
+TRACE_OUTPUT_CHARS = 4000
+
 
 @dataclass
 class AgentInvocationResult:
@@ -119,6 +127,28 @@ class StreamMessage:
     metadata: Dict[str, Any]
 
 
+def _event_text(message: Dict[str, Any]) -> Optional[str]:
+    """Extract response text from a ``stream-json`` line.
+
+    Args:
+        message: Parsed line of ``claude --output-format stream-json`` output
+
+    Returns:
+        Text of a partial-message delta (``stream_event``) or of a complete
+        ``assistant`` message, or None for other lines
+    """
+    msg_type = message.get("type")
+    if msg_type == "stream_event":
+        event = message.get("event") or {}
+        delta = event.get("delta") or {}
+        if event.get("type") == "content_block_delta" and delta.get("type") == "text_delta":
+            return delta.get("text", "")
+    elif msg_type == "assistant":
+        blocks = (message.get("message") or {}).get("content") or []
+        return "".join(block.get("text", "") for block in blocks if block.get("type") == "text")
+    return None
+
+
 class ClaudeInvocationDB:
     """Database persistence for Claude agent invocations.
 
@@ -127,16 +157,30 @@ class ClaudeInvocationDB:
         claude_stream_messages: Streaming message history for debugging
 
     All data stored in data/claude_invocations.db per CFR-015.
+
+    With ``record_traces``, each completed invocation is also appended to the
+    ACE trace store as an ExecutionTrace (one execution: prompt, output,
+    status, duration), which feeds the ACE metrics and dashboards.
     """
 
-    def __init__(self, db_path: str = "data/claude_invocations.db"):
+    def __init__(
+        self,
+        db_path: str = "data/claude_invocations.db",
+        record_traces: bool = False,
+        trace_dir: Optional[Path] = None,
+    ):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database (default: data/claude_invocations.db)
+            record_traces: Append completed invocations to the ACE trace store
+            trace_dir: ACE trace directory (default: from the ACE configuration)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.record_traces = record_traces
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self._trace_manager = None
         self._init_schema()
 
     def _init_schema(self):
@@ -309,6 +353,72 @@ class ClaudeInvocationDB:
             )
             conn.commit()
 
+        if self.record_traces:
+            try:
+                self._record_trace(invocation_id)
+            except Exception as e:
+                logger.warning(f"Failed to record ACE trace for invocation {invocation_id}: {e}")
+
+    def _record_trace(self, invocation_id: int) -> None:
+        """Append a completed invocation to the ACE trace store."""
+        from coffee_maker.autonomous.ace.models import Execution, ExecutionTrace
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM claude_invocations WHERE invocation_id = ?", (invocation_id,)).fetchone()
+        if row is None:
+            return
+
+        trace_manager = self._get_trace_manager()
+        if trace_manager is None:
+            return
+
+        duration_seconds = (row["duration_ms"] or 0) / 1000
+        trace_id = f"invocation_{invocation_id}_{uuid.uuid4().hex[:8]}"
+        output = row["final_result"] or row["content"] or row["error"] or ""
+        trace_manager.append(
+            ExecutionTrace(
+                trace_id=trace_id,
+                timestamp=datetime.now() - timedelta(seconds=duration_seconds),
+                agent_identity={"target_agent": row["agent_type"], "model": row["model"]},
+                user_query=row["prompt"],
+                executions=[
+                    Execution(
+                        execution_id=f"{trace_id}_exec_0",
+                        prompt=row["prompt"],
+                        input_data={"system_prompt": row["system_prompt"], "working_dir": row["working_dir"]},
+                        output=output[:TRACE_OUTPUT_CHARS],
+                        result_status=row["status"],
+                        duration_seconds=duration_seconds,
+                        metadata={
+                            "invocation_id": invocation_id,
+                            "stop_reason": row["stop_reason"],
+                            "input_tokens": row["input_tokens"],
+                            "output_tokens": row["output_tokens"],
+                            "cost_usd": row["cost_usd"],
+                            "error": row["error"],
+                        },
+                    )
+                ],
+                context={"session_id": row["session_id"], "invocation_db": str(self.db_path)},
+            )
+        )
+
+    def _get_trace_manager(self):
+        """Get the ACE trace store (None if ACE is disabled)."""
+        if self._trace_manager is None:
+            # Imported on first use: the ACE package is not needed to invoke agents
+            from coffee_maker.autonomous.ace.config import get_default_config
+            from coffee_maker.autonomous.ace.trace_manager import TraceManager
+
+            if self.trace_dir is None:
+                config = get_default_config()
+                if not config.enabled:
+                    return None
+                self.trace_dir = config.trace_dir
+            self._trace_manager = TraceManager(self.trace_dir)
+        return self._trace_manager
+
     def add_stream_message(self, invocation_id: int, message_type: str, sequence: int, content: str, metadata: Dict):
         """Add streaming message to database.
 
@@ -410,6 +520,8 @@ class ClaudeAgentInvoker:
         claude_path: str = "/opt/homebrew/bin/claude",
         db_path: str = "data/claude_invocations.db",
         default_model: str = "sonnet",
+        record_traces: bool = True,
+        trace_dir: Optional[Path] = None,
     ):
         """Initialize Claude agent invoker.
 
@@ -417,9 +529,11 @@ class ClaudeAgentInvoker:
             claude_path: Path to claude CLI
             db_path: Path to invocation database
             default_model: Default model to use
+            record_traces: Append completed invocations to the ACE trace store
+            trace_dir: ACE trace directory (default: from the ACE configuration)
         """
         self.claude_path = Path(claude_path)
-        self.db = ClaudeInvocationDB(db_path)
+        self.db = ClaudeInvocationDB(db_path, record_traces=record_traces, trace_dir=trace_dir)
         self.default_model = default_model
 
         if not self.claude_path.exists():
@@ -723,6 +837,130 @@ class ClaudeAgentInvoker:
                 invocation_id, "", self.default_model, {}, "error", duration_ms, 0.0, error=str(e)
             )
 
+    def stream_text(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        agent_type: str = "chat",
+        timeout: int = 600,
+    ) -> Generator[str, None, None]:
+        """Invoke Claude and yield response text as the model generates it.
+
+        Runs ``claude --print --output-format stream-json --include-partial-messages``
+        and yields each text delta as soon as its line arrives, so the first
+        token reaches the caller as early as with the streaming API. CLIs that
+        do not emit partial messages still stream one complete message at a time.
+
+        Args:
+            prompt: Prompt to send
+            model: Model alias (default: invoker's default model)
+            system_prompt: Optional text appended to Claude's system prompt
+            agent_type: Agent type recorded for the invocation
+            timeout: Seconds after which the CLI is killed
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            RuntimeError: If the CLI fails or reports an error result
+
+        Example:
+            >>> for chunk in invoker.stream_text("Summarize the roadmap", model="haiku"):
+            ...     print(chunk, end="", flush=True)
+        """
+        start_time = datetime.utcnow()
+        model = model or self.default_model
+        invocation_id = self.db.create_invocation(agent_type, prompt, system_prompt)
+
+        cmd = [
+            str(self.claude_path),
+            "--print",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--include-partial-messages",
+            "--model",
+            model,
+        ]
+        if system_prompt:
+            cmd.extend(["--append-system-prompt", system_prompt])
+        cmd.append(prompt)
+
+        logger.info(f"Invoking Claude (text streaming, invocation_id={invocation_id})")
+
+        # stderr goes to a file: a pipe nobody reads while stdout is iterated
+        # would block the CLI once its buffer fills
+        stderr = tempfile.TemporaryFile(mode="w+")
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True, bufsize=1)
+        killer = threading.Timer(timeout, proc.kill)
+        killer.daemon = True
+        killer.start()
+
+        chunks: List[str] = []
+        partial = False  # deltas seen: complete assistant messages would repeat them
+        result: Dict[str, Any] = {}
+        error = None
+        try:
+            for line in proc.stdout:
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Failed to parse streaming line: {line[:100]}")
+                    continue
+
+                if message.get("type") == "result":
+                    result = message
+                    continue
+
+                text = _event_text(message)
+                if message.get("type") == "stream_event":
+                    partial = partial or text is not None
+                elif partial:
+                    continue
+                if text:
+                    chunks.append(text)
+                    yield text
+
+            returncode = proc.wait()
+            if result.get("is_error") or returncode != 0:
+                stderr.seek(0)
+                error = result.get("result") or stderr.read().strip() or f"Claude CLI exited with code {returncode}"
+                raise RuntimeError(error)
+
+        except GeneratorExit:
+            error = "Stream closed by caller"
+            raise
+
+        except Exception as e:
+            error = error or str(e)
+            raise
+
+        finally:
+            killer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            stderr.close()
+
+            usage = result.get("usage") or {}
+            duration_ms = result.get("duration_ms", int((datetime.utcnow() - start_time).total_seconds() * 1000))
+            self.db.complete_invocation(
+                invocation_id,
+                "".join(chunks),
+                model,
+                {"input_tokens": usage.get("input_tokens", 0), "output_tokens": usage.get("output_tokens", 0)},
+                "error" if error else result.get("stop_reason") or "end_turn",
+                duration_ms,
+                result.get("total_cost_usd", 0.0),
+                result.get("session_id"),
+                error=error,
+                final_result=result.get("result"),
+            )
+            logger.info(f"Text streaming completed in {duration_ms}ms ({len(chunks)} chunks)")
+
     def invoke_slash_command(
         self, command_name: str, variables: Dict[str, str], timeout: int = 600
     ) -> AgentInvocationResult:
@@ -10,6 +10,15 @@ Modules:
     notifications: Notification database and management
 """
 
+import importlib
+from types import ModuleType
 from typing import List
 
 __all__: List[str] = ["roadmap_cli", "notifications"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import CLI modules on first attribute access (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
@@ -24,12 +24,14 @@ Example:
 import logging
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from anthropic import Anthropic
 
-from coffee_maker.autonomous.prompt_loader import PromptNames, load_prompt
+from coffee_maker.autonomous.prompt_loader import PROMPTS_DIR, PromptNames, load_prompt
+from coffee_maker.cli.conversation_memory import ConversationMemory
 from coffee_maker.config import ConfigManager
+from coffee_maker.utils.pattern_matcher import PatternMatcher
 
 # Import RequestClassifier for Phase 2 integration (US-021)
 try:
@@ -49,6 +51,68 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Intent keywords in priority order (first matching intent wins)
+_INTENT_MATCHER = PatternMatcher(
+    keywords={
+        "user_story": [
+            "as a",
+            "i want",
+            "i need",
+            "user story",
+            "feature request",
+            "so that",
+        ],
+        "add_priority": [
+            "add",
+            "create",
+            "new priority",
+            "insert priority",
+        ],
+        "update_priority": [
+            "update",
+            "change",
+            "modify",
+            "edit priority",
+            "mark as",
+        ],
+        "view_roadmap": [
+            "show",
+            "view",
+            "display",
+            "see",
+            "list",
+            "what are",
+        ],
+        "analyze_roadmap": [
+            "analyze",
+            "health",
+            "check",
+            "status",
+            "how is",
+        ],
+        "suggest_next": [
+            "suggest",
+            "recommend",
+            "what next",
+            "what should",
+            "priority",
+        ],
+        "start_implementation": [
+            "implement",
+            "start",
+            "begin",
+            "work on",
+            "build",
+        ],
+        "daemon_status": [
+            "daemon",
+            "running",
+            "status",
+            "progress",
+        ],
+    }
+)
+
 # Import Claude agent invoker (unified interface)
 try:
     from coffee_maker.claude_agent_invoker import get_invoker
@@ -117,6 +181,11 @@ class AIService:
         self.client = None
         self.cli_interface = None
 
+        # History fitted into a token budget (recent turns verbatim, older ones summarized)
+        self.memory = ConversationMemory(model=model)
+        # Last system prompt, keyed on the roadmap version and the prompt file
+        self._system_prompt_cache: Optional[Tuple[Tuple, str]] = None
+
         # Initialize RequestClassifier for Phase 2 (US-021)
         self.classifier = None
         if CLASSIFIER_AVAILABLE:
@@ -245,6 +314,7 @@ class AIService:
 
             # Build system prompt with classification context
             system_prompt = self._build_system_prompt_with_classification(enhanced_context)
+            base_prompt = self._build_system_prompt(enhanced_context)
 
             # Build conversation messages
             messages = self._build_messages(user_input, history)
@@ -252,33 +322,16 @@ class AIService:
             logger.debug(f"Processing request: {user_input[:100]}...")
 
             if self.use_claude_cli:
-                # Use Claude CLI interface
-                # Build full prompt: system + history + user input
-                full_prompt = system_prompt + "\n\n"
-
-                # Add conversation history
-                for msg in messages[:-1]:  # All except last (current user input)
-                    role = msg["role"]
-                    content = msg["content"]
-                    full_prompt += f"\n{role.upper()}: {content}\n"
-
-                # Add current user input
-                full_prompt += f"\nUSER: {user_input}\n\nASSISTANT:"
-
-                # Execute via CLI
-                result = self.cli_interface.execute_prompt(full_prompt)
-
-                if not result.success:
-                    raise Exception(result.error)
-
-                content = result.content
+                # Execute via Claude CLI (text is collected as it streams)
+                full_prompt = self._build_cli_prompt(system_prompt, messages, user_input)
+                content = "".join(self.invoker.stream_text(full_prompt, model=self.cli_model))
 
             else:
                 # Use Anthropic API
                 response = self.client.messages.create(
                     model=self.model,
                     max_tokens=self.max_tokens,
-                    system=system_prompt,
+                    system=self._system_blocks(base_prompt, system_prompt[len(base_prompt) :]),
                     messages=messages,
                 )
 
@@ -361,7 +414,7 @@ class AIService:
             history: Conversation history
 
         Yields:
-            Text chunks as they arrive from Claude API
+            Text chunks as they arrive from Claude (API or CLI stream-json)
 
         Example:
             >>> for chunk in service.process_request_stream("Hello", context, []):
@@ -369,24 +422,6 @@ class AIService:
             Hello! How can I help you today?
         """
         try:
-            if self.use_claude_cli:
-                # Claude CLI doesn't support streaming, so we get the full response
-                # and yield it in chunks to simulate streaming
-                response = self.process_request(user_input, context, history, stream=False)
-
-                # Yield in smaller chunks with word-boundary awareness for smooth streaming
-                # Similar to claude-cli's character-by-character appearance
-                import time
-
-                words = response.message.split()
-                for word in words:
-                    yield word + " "
-                    # Small delay to simulate natural typing (adjustable)
-                    time.sleep(0.01)  # 10ms per word feels natural
-
-                logger.info("CLI response yielded word-by-word")
-                return
-
             # Build system prompt with context
             system_prompt = self._build_system_prompt(context)
 
@@ -395,11 +430,19 @@ class AIService:
 
             logger.debug(f"Processing streaming request: {user_input[:100]}...")
 
+            if self.use_claude_cli:
+                # Stream text deltas from the CLI as the model generates them
+                full_prompt = self._build_cli_prompt(system_prompt, messages, user_input)
+                yield from self.invoker.stream_text(full_prompt, model=self.cli_model)
+
+                logger.info("CLI streaming response completed")
+                return
+
             # Stream from Claude API
             with self.client.messages.stream(
                 model=self.model,
                 max_tokens=self.max_tokens,
-                system=system_prompt,
+                system=self._system_blocks(system_prompt),
                 messages=messages,
             ) as stream:
                 for text in stream.text_stream:
@@ -428,73 +471,10 @@ class AIService:
             >>> print(intent)
             'add_priority'
         """
-        lower_input = user_input.lower()
-
-        # Intent patterns
-        intents = {
-            "user_story": [
-                "as a",
-                "i want",
-                "i need",
-                "user story",
-                "feature request",
-                "so that",
-            ],
-            "add_priority": [
-                "add",
-                "create",
-                "new priority",
-                "insert priority",
-            ],
-            "update_priority": [
-                "update",
-                "change",
-                "modify",
-                "edit priority",
-                "mark as",
-            ],
-            "view_roadmap": [
-                "show",
-                "view",
-                "display",
-                "see",
-                "list",
-                "what are",
-            ],
-            "analyze_roadmap": [
-                "analyze",
-                "health",
-                "check",
-                "status",
-                "how is",
-            ],
-            "suggest_next": [
-                "suggest",
-                "recommend",
-                "what next",
-                "what should",
-                "priority",
-            ],
-            "start_implementation": [
-                "implement",
-                "start",
-                "begin",
-                "work on",
-                "build",
-            ],
-            "daemon_status": [
-                "daemon",
-                "running",
-                "status",
-                "progress",
-            ],
-        }
-
-        # Check each intent pattern
-        for intent, patterns in intents.items():
-            if any(pattern in lower_input for pattern in patterns):
-                logger.debug(f"Classified intent: {intent}")
-                return intent
+        intent = _INTENT_MATCHER.first(user_input)
+        if intent is not None:
+            logger.debug(f"Classified intent: {intent}")
+            return intent
 
         # Default to general query
         logger.debug("Classified intent: general_query")
@@ -544,6 +524,10 @@ class AIService:
         Enhanced: Now uses centralized prompt from .claude/commands/
         for easy migration to Gemini, OpenAI, or other LLMs.
 
+        The prompt is memoized: it is rebuilt only when the roadmap version
+        (or, without one, the summarized values) or the prompt file changes, so
+        consecutive turns send a byte-identical, cacheable prefix.
+
         Args:
             context: Context dictionary with roadmap information
 
@@ -556,13 +540,27 @@ class AIService:
         completed = roadmap_summary.get("completed", 0)
         in_progress = roadmap_summary.get("in_progress", 0)
         planned = roadmap_summary.get("planned", 0)
+        priorities = roadmap_summary.get("priorities", [])[:10]  # Limit to first 10
+
+        version = roadmap_summary.get("version") or (
+            total,
+            completed,
+            in_progress,
+            planned,
+            tuple((p["number"], p["title"], p["status"]) for p in priorities),
+        )
+        try:
+            prompt_mtime = (PROMPTS_DIR / f"{PromptNames.AGENT_PROJECT_MANAGER}.md").stat().st_mtime_ns
+        except OSError:
+            prompt_mtime = None
+        key = (version, prompt_mtime)
+        if self._system_prompt_cache and self._system_prompt_cache[0] == key:
+            return self._system_prompt_cache[1]
 
         # Build priority list if available
-        priorities = roadmap_summary.get("priorities", [])
         priority_list = ""
-        if priorities:
-            for p in priorities[:10]:  # Limit to first 10
-                priority_list += f"- {p['number']}: {p['title']} ({p['status']})\n"
+        for p in priorities:
+            priority_list += f"- {p['number']}: {p['title']} ({p['status']})\n"
 
         # Load centralized prompt and substitute variables
         prompt = load_prompt(
@@ -576,8 +574,24 @@ class AIService:
             },
         )
 
+        self._system_prompt_cache = (key, prompt)
         return prompt
 
+    def _system_blocks(self, system_prompt: str, suffix: str = "") -> List[Dict[str, Union[str, Dict]]]:
+        """Build API system blocks with the stable prompt marked for prompt caching.
+
+        Args:
+            system_prompt: Stable system prompt (cached by the API across turns)
+            suffix: Per-request additions, sent after the cached prefix
+
+        Returns:
+            System content blocks for the Messages API
+        """
+        blocks = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        if suffix:
+            blocks.append({"type": "text", "text": suffix})
+        return blocks
+
     def _build_system_prompt_with_classification(self, context: Dict) -> str:
         """Build system prompt with classification context (Phase 2 enhancement).
 
@@ -620,6 +634,10 @@ Remember: Be transparent about what you'll do with the user's request!
     def _build_messages(self, user_input: str, history: List[Dict]) -> List[Dict]:
         """Build conversation messages.
 
+        Recent history is sent verbatim and older history as a summary, within
+        the token budget of ``self.memory``; large outputs are replaced by a
+        stored reference with an excerpt.
+
         Args:
             user_input: Current user input
             history: Conversation history
@@ -627,17 +645,34 @@ Remember: Be transparent about what you'll do with the user's request!
         Returns:
             List of message dictionaries for Claude API
         """
-        messages = []
-
-        # Add history (last 10 messages for context window)
-        for msg in history[-10:]:
-            messages.append({"role": msg["role"], "content": msg["content"]})
+        messages = self.memory.build(history)
 
         # Add current input
         messages.append({"role": "user", "content": user_input})
 
         return messages
 
+    def _build_cli_prompt(self, system_prompt: str, messages: List[Dict], user_input: str) -> str:
+        """Flatten system prompt, history and user input into one Claude CLI prompt.
+
+        Args:
+            system_prompt: System prompt
+            messages: Conversation messages ending with the current user input
+            user_input: Current user input
+
+        Returns:
+            Prompt text for ``claude --print``
+        """
+        full_prompt = system_prompt + "\n\n"
+
+        # Add conversation history
+        for msg in messages[:-1]:  # All except last (current user input)
+            full_prompt += f"\n{msg['role'].upper()}: {msg['content']}\n"
+
+        # Add current user input
+        full_prompt += f"\nUSER: {user_input}\n\nASSISTANT:"
+        return full_prompt
+
     def _extract_action(self, content: str) -> Optional[Dict]:
         """Extract structured action from AI response.
 
@@ -14,7 +14,6 @@ load_dotenv()
 from coffee_maker.autonomous.roadmap_parser import RoadmapParser
 from coffee_maker.autonomous.spec_generator import SpecGenerator
 from coffee_maker.autonomous.technical_spec_skill import TechnicalSpecSkill
-from coffee_maker.cli.ai_service import AIService
 
 
 @click.group()
@@ -67,6 +66,8 @@ def create_spec(priority: str, auto_approve: bool):
         # Generate spec using SpecGenerator
         click.echo("Generating technical specification (this may take 1-2 minutes)...\n")
 
+        from coffee_maker.cli.ai_service import AIService
+
         ai_service = AIService()
         generator = SpecGenerator(ai_service)
         user_story = f"{priority_name}: {priority_title}\n\n{priority_content}"
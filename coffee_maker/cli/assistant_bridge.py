@@ -11,6 +11,8 @@ The assistant:
 - Streams actions to user in real-time
 - Allows user to provide guidance during execution
 - Is completely transparent to the user
+- Gets the top-k matching documentation chunks in its prompt (from the local
+  BM25 index) instead of reading whole documents
 """
 
 import logging
@@ -22,6 +24,7 @@ from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
 from coffee_maker.cli.assistant_tools import get_assistant_tools
+from coffee_maker.cli.doc_index import DEFAULT_TOP_K, DocumentationIndex, get_documentation_index
 from coffee_maker.config import ConfigManager
 
 logger = logging.getLogger(__name__)
@@ -36,16 +39,27 @@ class AssistantBridge:
     Attributes:
         agent: LangChain agent executor
         action_callback: Callback to display actions to user
+        doc_index: Documentation index queried for each question
+        top_k: Number of documentation chunks added to the prompt
     """
 
-    def __init__(self, action_callback: Optional[Callable[[str], None]] = None):
+    def __init__(
+        self,
+        action_callback: Optional[Callable[[str], None]] = None,
+        doc_index: Optional[DocumentationIndex] = None,
+        top_k: int = DEFAULT_TOP_K,
+    ):
         """Initialize assistant bridge.
 
         Args:
             action_callback: Callback function to display action steps
                             Called with action string like "🔍 Analyzing logs..."
+            doc_index: Documentation index (default: the shared project index)
+            top_k: Number of documentation chunks added to the prompt
         """
         self.action_callback = action_callback or self._default_action_callback
+        self.doc_index = doc_index or get_documentation_index()
+        self.top_k = top_k
         self.agent = None
         self._initialize_agent()
 
@@ -85,6 +99,10 @@ Observation: result from tool
 Thought: I now know the final answer
 Final Answer: the final answer to the question
 
+Relevant documentation excerpts (best matches from the project docs; read files
+with tools only if they are not enough):
+{documentation}
+
 Question: {input}
 
 {agent_scratchpad}
@@ -170,8 +188,8 @@ Question: {input}
             # Track actions
             actions = []
 
-            # Invoke agent
-            result = self.agent.invoke({"input": question})
+            # Invoke agent with the documentation chunks relevant to the question
+            result = self.agent.invoke({"input": question, "documentation": self._retrieve_documentation(question)})
 
             # Extract intermediate steps (actions)
             if "intermediate_steps" in result:
@@ -189,6 +207,26 @@ Question: {input}
             logger.error(f"Assistant invocation failed: {e}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    def _retrieve_documentation(self, question: str) -> str:
+        """Format the documentation chunks most relevant to a question for the prompt.
+
+        Args:
+            question: User's question
+
+        Returns:
+            Chunks with their source location, or a note if none matched
+        """
+        try:
+            chunks = self.doc_index.search(question, top_k=self.top_k)
+        except Exception as e:
+            logger.warning(f"Documentation retrieval failed: {e}")
+            chunks = []
+
+        if not chunks:
+            return "(no matching documentation)"
+
+        return "\n\n".join(f"[{chunk.path}:{chunk.line}] {chunk.heading}\n{chunk.content}" for chunk in chunks)
+
     def should_invoke_for_question(self, question: str) -> bool:
         """Determine if assistant should be invoked for a question.
 
@@ -10,6 +10,7 @@ Features:
 - Background thread for auto-refresh (every 30 minutes)
 - Manual refresh on demand
 - Documentation loading and caching
+- Incremental documentation retrieval index (BM25) shared with the assistant
 - Git history tracking
 - Status reporting
 """
@@ -22,6 +23,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional
 
 from coffee_maker.cli.assistant_bridge import AssistantBridge
+from coffee_maker.cli.doc_index import DocumentationIndex, get_documentation_index
 from coffee_maker.config import PROJECT_ROOT
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,8 @@ class AssistantManager:
         refresh_thread: Background thread for auto-refresh
         is_running: Whether auto-refresh is active
         docs_cache: Cache of loaded documentation
+        doc_index: Documentation retrieval index used by the assistant
+        index_stats: File counts of the last index update
     """
 
     def __init__(
@@ -50,6 +54,7 @@ class AssistantManager:
         assistant_bridge: Optional[AssistantBridge] = None,
         refresh_interval: int = 1800,  # 30 minutes
         action_callback: Optional[callable] = None,
+        doc_index: Optional[DocumentationIndex] = None,
     ):
         """Initialize assistant manager.
 
@@ -57,8 +62,11 @@ class AssistantManager:
             assistant_bridge: Existing AssistantBridge instance (or create new one)
             refresh_interval: Seconds between auto-refreshes (default: 1800)
             action_callback: Callback for action streaming
+            doc_index: Documentation index (default: the shared project index)
         """
-        self.assistant = assistant_bridge or AssistantBridge(action_callback=action_callback)
+        self.doc_index = doc_index or get_documentation_index()
+        self.index_stats: Dict[str, int] = {}
+        self.assistant = assistant_bridge or AssistantBridge(action_callback=action_callback, doc_index=self.doc_index)
         self.refresh_interval = refresh_interval
         self.last_refresh: Optional[datetime] = None
         self.refresh_thread: Optional[threading.Thread] = None
@@ -128,9 +136,9 @@ class AssistantManager:
     def _refresh_documentation(self):
         """Refresh documentation cache by reading files from disk.
 
-        This loads documentation files and updates the internal cache.
-        The assistant doesn't directly use this cache yet (future enhancement),
-        but it ensures the manager has fresh knowledge of documentation state.
+        This loads documentation files for status reporting and updates the
+        retrieval index the assistant answers from (only files whose mtime or
+        size changed are re-indexed).
         """
         logger.info("Refreshing documentation...")
 
@@ -163,6 +171,12 @@ class AssistantManager:
             except Exception as e:
                 logger.error(f"Failed to refresh {doc_path}: {e}")
 
+        # Re-index changed documentation
+        try:
+            self.index_stats = self.doc_index.update()
+        except Exception as e:
+            logger.error(f"Failed to update documentation index: {e}")
+
         # Refresh git history
         self._refresh_git_history()
 
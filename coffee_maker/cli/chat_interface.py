@@ -317,15 +317,12 @@ class ProjectManagerCompleter(Completer):
         # Complete priority names when relevant
         elif any(keyword in text_before_cursor.lower() for keyword in ["priority", "PRIORITY", "view", "update"]):
             try:
-                priorities = self.editor.list_priorities()
-                for priority in priorities[:15]:  # Limit to 15 for performance
-                    priority_name = priority["name"]
-                    if priority_name.lower().startswith(word_before_cursor.lower()):
-                        yield Completion(
-                            priority_name,
-                            start_position=-len(word_before_cursor),
-                            display_meta=f"{priority['title'][:40]}...",
-                        )
+                for priority in self.editor.complete_priorities(word_before_cursor, limit=15):
+                    yield Completion(
+                        priority["name"],
+                        start_position=-len(word_before_cursor),
+                        display_meta=f"{priority['title'][:40]}...",
+                    )
             except Exception as e:
                 logger.debug(f"Priority completion failed: {e}")
 
@@ -792,17 +789,33 @@ class ChatSession:
         the session is terminated. Uses prompt-toolkit for advanced
         input features (multi-line, history, auto-completion).
 
-        Checks for daemon questions on startup and every 10 messages.
+        Checks for daemon questions on startup, then shows new ones before
+        each prompt as they are pushed by a notification subscription.
         Updates daemon status every 10 messages.
         """
         # Check for daemon questions on startup
         self._check_daemon_questions()
 
+        new_questions: List[Dict] = []
+        questions_lock = threading.Lock()
+
+        def on_question(question: Dict):
+            with questions_lock:
+                new_questions.append(question)
+
+        subscription = self.notif_db.subscribe(on_question, type="question")
+
         message_count = 0
 
         try:
             while self.active:
                 try:
+                    with questions_lock:
+                        arrived = list(new_questions)
+                        new_questions.clear()
+                    if arrived:
+                        self._display_daemon_questions(arrived)
+
                     # Show prompt in a clean, claude-cli style
                     self.console.print("\n[bold]You[/]")
 
@@ -847,9 +860,6 @@ class ChatSession:
                         if old_status != self.daemon_status_text:
                             self.console.print(f"\n[cyan]📊 Status Update: {self.daemon_status_text}[/]\n")
 
-                        # Check for new daemon questions
-                        self._check_daemon_questions()
-
                 except KeyboardInterrupt:
                     self.console.print("\n\n[yellow]Interrupted. Type /exit to quit.[/]")
                 except EOFError:
@@ -859,7 +869,8 @@ class ChatSession:
                     logger.error(f"Error in REPL loop: {e}", exc_info=True)
                     self.console.print(f"\n[red]Error: {e}[/]")
         finally:
-            # Ensure status monitor is stopped on any exit
+            # Ensure status monitor and question subscription are stopped on any exit
+            subscription.close()
             self.status_monitor.stop()
 
     def _process_input(self, user_input: str) -> str:
@@ -1335,11 +1346,8 @@ class ChatSession:
         """
         context = self._build_context()
 
-        # Show thinking indicator briefly (very subtle, like claude-cli)
+        # Show thinking indicator (very subtle, like claude-cli)
         self.console.print("\n[dim]...[/]", end="\r")  # Will be overwritten
-        import time
-
-        time.sleep(0.2)  # Brief pause
 
         # Stream response with clean header
         self.console.print("\n[bold]Claude[/]")
@@ -1476,30 +1484,36 @@ You can track progress in the ticket file or ask me for updates!
             questions = self.notif_db.get_pending_notifications()
 
             # Filter for questions from daemon (type="question")
-            daemon_questions = [q for q in questions if q.get("type") == "question"]
-
-            if daemon_questions:
-                self.console.print("\n[yellow]📋 Daemon Has Questions:[/]\n")
-
-                for q in daemon_questions[:5]:  # Show top 5
-                    created = q.get("created_at", "Unknown time")
-                    self.console.print(f"  [bold]#{q['id']}[/]: {q['title']}")
-                    self.console.print(f"  [dim]{created}[/]")
-                    # Truncate message if too long
-                    msg = q["message"]
-                    if len(msg) > 100:
-                        msg = msg[:100] + "..."
-                    self.console.print(f"  {msg}")
-                    self.console.print()
-
-                if len(daemon_questions) > 5:
-                    self.console.print(f"[dim]  ...and {len(daemon_questions) - 5} more[/]\n")
-
-                self.console.print("[dim]Use /notifications to view and respond[/]\n")
+            self._display_daemon_questions([q for q in questions if q.get("type") == "question"])
 
         except Exception as e:
             logger.error(f"Failed to check daemon questions: {e}")
 
+    def _display_daemon_questions(self, daemon_questions: List[Dict]):
+        """Display questions from daemon.
+
+        Args:
+            daemon_questions: Question notifications to display
+        """
+        if daemon_questions:
+            self.console.print("\n[yellow]📋 Daemon Has Questions:[/]\n")
+
+            for q in daemon_questions[:5]:  # Show top 5
+                created = q.get("created_at", "Unknown time")
+                self.console.print(f"  [bold]#{q['id']}[/]: {q['title']}")
+                self.console.print(f"  [dim]{created}[/]")
+                # Truncate message if too long
+                msg = q["message"]
+                if len(msg) > 100:
+                    msg = msg[:100] + "..."
+                self.console.print(f"  {msg}")
+                self.console.print()
+
+            if len(daemon_questions) > 5:
+                self.console.print(f"[dim]  ...and {len(daemon_questions) - 5} more[/]\n")
+
+            self.console.print("[dim]Use /notifications to view and respond[/]\n")
+
     def _load_roadmap_context(self):
         """Load roadmap context at session start.
 
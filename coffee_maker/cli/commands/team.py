@@ -19,6 +19,7 @@ import logging
 from pathlib import Path
 from typing import List
 
+from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry
 from coffee_maker.cli.commands.base import BaseCommand
 from coffee_maker.cli.roadmap_editor import RoadmapEditor
 from coffee_maker.autonomous.message_queue import MessageQueue
@@ -196,20 +197,11 @@ class AgentsStatusCommand(BaseCommand):
                         ]
                     )
 
-            # Check agent status files for additional info
+            # Check agent heartbeats for additional info
             status_dir = Path("data/agent_status")
             if status_dir.exists():
-                status_lines.append("📁 Agent Status Files:")
-                for status_file in sorted(status_dir.glob("*_status.json")):
-                    try:
-                        with open(status_file, "r") as f:
-                            status_data = json.load(f)
-                        agent_name = status_file.stem.replace("_status", "")
-                        state = status_data.get("state", "unknown")
-                        last_update = status_data.get("last_heartbeat", "N/A")
-                        status_lines.append(f"  {agent_name}: {state} (last: {last_update})")
-                    except Exception as e:
-                        logger.debug(f"Error reading {status_file}: {e}")
+                status_lines.append("📁 Agent Status:")
+                status_lines.extend(_agent_heartbeat_lines(status_dir))
 
             status_lines.extend(
                 [
@@ -226,4 +218,42 @@ class AgentsStatusCommand(BaseCommand):
             return f"❌ Error getting agents status: {e}"
 
 
+def _agent_heartbeat_lines(status_dir: Path) -> List[str]:
+    """Format the state and last heartbeat of every known agent.
+
+    Heartbeats come from the status registry. Status files are only read for
+    agents the registry has never seen, since their last_heartbeat can lag.
+
+    Args:
+        status_dir: Agent status directory
+
+    Returns:
+        One line per agent
+    """
+    try:
+        snapshot = get_agent_status_registry(status_dir).snapshot()
+    except Exception as e:
+        logger.debug(f"Error reading agent status registry: {e}")
+        snapshot = {}
+
+    lines = []
+    for agent_name, status_data in sorted(snapshot.items()):
+        state = status_data["state"] if status_data["alive"] else f"{status_data['state']}, not running"
+        lines.append(f"  {agent_name}: {state} (last: {status_data['last_heartbeat']})")
+
+    for status_file in sorted(status_dir.glob("*_status.json")):
+        agent_name = status_file.stem.replace("_status", "")
+        if agent_name in snapshot:
+            continue
+        try:
+            with open(status_file, "r") as f:
+                status_data = json.load(f)
+            state = status_data.get("state", "unknown")
+            last_update = status_data.get("last_heartbeat", "N/A")
+            lines.append(f"  {agent_name}: {state} (last: {last_update})")
+        except Exception as e:
+            logger.debug(f"Error reading {status_file}: {e}")
+    return lines
+
+
 __all__ = ["TeamStatusCommand", "AgentsStatusCommand"]
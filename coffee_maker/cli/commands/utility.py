@@ -19,6 +19,7 @@ Module Pattern:
 """
 
 import argparse
+import functools
 import logging
 import os
 import shutil
@@ -28,16 +29,39 @@ from coffee_maker.config import ROADMAP_PATH, ConfigManager
 
 logger = logging.getLogger(__name__)
 
-# Check if chat features available
-try:
-    from coffee_maker.cli.ai_service import AIService
-    from coffee_maker.cli.chat_interface import ChatSession
-    from coffee_maker.cli.roadmap_editor import RoadmapEditor
+_CHAT_COMPONENTS = ("AIService", "ChatSession", "RoadmapEditor")
 
-    CHAT_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Chat features not available: {e}")
-    CHAT_AVAILABLE = False
+
+@functools.lru_cache(maxsize=None)
+def _chat_available() -> bool:
+    """Import chat components on first use.
+
+    They pull in anthropic and langchain (several seconds of cold start), so
+    commands like ``--help`` or ``sync`` should not pay for them.
+
+    Returns:
+        True if chat features are available
+    """
+    global AIService, ChatSession, RoadmapEditor
+
+    try:
+        from coffee_maker.cli.ai_service import AIService
+        from coffee_maker.cli.chat_interface import ChatSession
+        from coffee_maker.cli.roadmap_editor import RoadmapEditor
+
+        return True
+    except ImportError as e:
+        logger.warning(f"Chat features not available: {e}")
+        return False
+
+
+def __getattr__(name: str):
+    """Resolve CHAT_AVAILABLE and chat component names lazily (PEP 562)."""
+    if name == "CHAT_AVAILABLE":
+        return _chat_available()
+    if name in _CHAT_COMPONENTS and _chat_available():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def cmd_sync(args: argparse.Namespace) -> int:
@@ -80,7 +104,7 @@ def cmd_spec(args: argparse.Namespace) -> int:
     Returns:
         0 on success, 1 on error
     """
-    if not CHAT_AVAILABLE:
+    if not _chat_available():
         print("❌ Spec generation not available")
         print("\nMissing dependencies. Install with: poetry install")
         return 1
@@ -179,7 +203,7 @@ def cmd_chat(args: argparse.Namespace) -> int:
     Returns:
         0 on success, 1 on error
     """
-    if not CHAT_AVAILABLE:
+    if not _chat_available():
         print("❌ Chat feature not available")
         print("\nMissing dependencies or ANTHROPIC_API_KEY not set.")
         print("\nPlease ensure:")
@@ -309,7 +333,7 @@ def cmd_assistant_status(args):
     Returns:
         0 on success, 1 on error
     """
-    if not CHAT_AVAILABLE:
+    if not _chat_available():
         print("❌ Assistant feature not available")
         print("\nMissing dependencies. Install with: poetry install")
         return 1
@@ -404,7 +428,7 @@ def cmd_assistant_refresh(args):
     Returns:
         0 on success, 1 on error
     """
-    if not CHAT_AVAILABLE:
+    if not _chat_available():
         print("❌ Assistant feature not available")
         print("\nMissing dependencies. Install with: poetry install")
         return 1
@@ -0,0 +1,277 @@
+"""Token-budgeted conversation memory for chat requests.
+
+Sending the last N history messages in full makes every request after a
+pasted log or a long tool output slow and expensive. ``ConversationMemory``
+fits the history into a token budget instead:
+
+- Large messages (pasted logs, tool outputs) are stored by reference: the full
+  text goes to a content-addressed file and the message keeps a stub with the
+  reference, its size and a head/tail excerpt.
+- The most recent messages are sent verbatim, newest first, while they fit in
+  the budget (at most ``recent_messages`` of them).
+- Older messages are compacted into a summary. Summaries are built per block
+  of ``block_messages`` messages counted from the start of the conversation,
+  so earlier blocks never change as the conversation grows and their
+  summaries are cached; only the newest block is summarized again.
+
+Token counts come from the shared token counting service, which caches counts
+by content, so each message is encoded once per process.
+
+Example:
+    >>> from coffee_maker.cli.conversation_memory import ConversationMemory
+    >>>
+    >>> memory = ConversationMemory(budget_tokens=4000)
+    >>> messages = memory.build(history)
+    >>> messages[0]["content"].startswith("[Summary of earlier conversation")
+    True
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from coffee_maker.utils.token_service import CHARS_PER_TOKEN, get_token_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_TOKENS = 8000
+DEFAULT_RECENT_MESSAGES = 10
+DEFAULT_MAX_MESSAGE_TOKENS = 1500
+DEFAULT_BLOCK_MESSAGES = 8
+DEFAULT_STORE_DIR = Path.home() / ".coffee_maker" / "conversation_artifacts"
+
+# Share of the budget reserved for the summary of older messages
+SUMMARY_BUDGET_RATIO = 0.25
+# Characters kept per message in extractive summaries
+SUMMARY_LINE_CHARS = 200
+# Cached block summaries
+MAX_CACHED_SUMMARIES = 256
+
+SUMMARY_HEADER = "[Summary of earlier conversation]"
+
+
+def extractive_summary(messages: Sequence[Dict]) -> str:
+    """Summarize messages as one line each (first line, truncated).
+
+    Args:
+        messages: Messages with "role" and "content"
+
+    Returns:
+        One "- role: text" line per message
+    """
+    lines = []
+    for message in messages:
+        text = " ".join(message["content"].split("\n", 1)[0].split())
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[: SUMMARY_LINE_CHARS - 1] + "…"
+        lines.append(f"- {message['role']}: {text}")
+    return "\n".join(lines)
+
+
+class ConversationMemory:
+    """Fits conversation history into a token budget.
+
+    Thread-safe; one instance can serve every request of a service.
+
+    Attributes:
+        budget_tokens: Token budget for the history (summary included)
+        recent_messages: Maximum number of messages sent verbatim
+        max_message_tokens: Messages above this size are stored by reference
+        block_messages: Messages per cached summary block
+        store_dir: Directory of stored large messages
+        model: Model name used to pick the token encoding
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+        recent_messages: int = DEFAULT_RECENT_MESSAGES,
+        max_message_tokens: int = DEFAULT_MAX_MESSAGE_TOKENS,
+        block_messages: int = DEFAULT_BLOCK_MESSAGES,
+        store_dir: Optional[Path] = DEFAULT_STORE_DIR,
+        summarizer: Callable[[Sequence[Dict]], str] = extractive_summary,
+        model: str = "gpt-4",
+    ):
+        """Initialize ConversationMemory.
+
+        Args:
+            budget_tokens: Token budget for the history (summary included)
+            recent_messages: Maximum number of messages sent verbatim
+            max_message_tokens: Messages above this size are stored by reference
+            block_messages: Messages per cached summary block
+            store_dir: Directory of stored large messages (None keeps excerpts only)
+            summarizer: Function summarizing a block of messages
+            model: Model name used to pick the token encoding
+        """
+        self.budget_tokens = budget_tokens
+        self.recent_messages = recent_messages
+        self.max_message_tokens = max_message_tokens
+        self.block_messages = block_messages
+        self.store_dir = Path(store_dir) if store_dir else None
+        self.summarizer = summarizer
+        self.model = model
+
+        self._lock = threading.Lock()
+        self._summaries: "OrderedDict[str, str]" = OrderedDict()
+
+    def build(self, history: Sequence[Dict]) -> List[Dict]:
+        """Build the messages to send for a conversation history.
+
+        Args:
+            history: Conversation messages, oldest first ({"role", "content"})
+
+        Returns:
+            Messages for the API: a summary of older messages (merged into the
+            first verbatim message when both are from the user), followed by the
+            most recent messages with large contents stored by reference
+        """
+        messages = [{"role": message["role"], "content": self.compact(message["content"])} for message in history]
+        if not messages:
+            return []
+
+        tokens = get_token_service().count_batch([message["content"] for message in messages], model=self.model)
+
+        # Newest messages first, while they fit (the newest one always does)
+        summary_budget = int(self.budget_tokens * SUMMARY_BUDGET_RATIO)
+        verbatim_budget = self.budget_tokens - summary_budget if len(messages) > 1 else self.budget_tokens
+        start = len(messages) - 1
+        used = tokens[start]
+        while (
+            start > 0 and len(messages) - start < self.recent_messages and used + tokens[start - 1] <= verbatim_budget
+        ):
+            start -= 1
+            used += tokens[start]
+
+        recent = messages[start:]
+        if start == 0:
+            return recent
+
+        summary = self._summarize(messages[:start], summary_budget + (verbatim_budget - used))
+        if recent[0]["role"] == "user":
+            return [{"role": "user", "content": f"{summary}\n\n{recent[0]['content']}"}] + recent[1:]
+        return [{"role": "user", "content": summary}] + recent
+
+    def compact(self, content: str) -> str:
+        """Replace a large message by a reference stub with a head/tail excerpt.
+
+        Args:
+            content: Message content
+
+        Returns:
+            content itself if within max_message_tokens, else the stub
+        """
+        # Cheap length check first: only long texts are counted exactly
+        if len(content) <= self.max_message_tokens * CHARS_PER_TOKEN // 2:
+            return content
+        tokens = get_token_service().count(content, model=self.model)
+        if tokens <= self.max_message_tokens:
+            return content
+
+        ref = self._store(content)
+        excerpt_chars = self.max_message_tokens * CHARS_PER_TOKEN // 4
+        location = f" (full text: {self.reference_path(ref)})" if self.store_dir else ""
+        return (
+            f"[Large output stored as ref {ref}{location}: {content.count(chr(10)) + 1} lines, ~{tokens} tokens. "
+            f"Excerpt:]\n{content[:excerpt_chars]}\n[…]\n{content[-excerpt_chars:]}"
+        )
+
+    def reference_path(self, ref: str) -> Optional[Path]:
+        """Get the file holding the full text of a stored message.
+
+        Args:
+            ref: Reference from a stub
+
+        Returns:
+            Path, or None if references are not stored
+        """
+        return self.store_dir / f"{ref}.txt" if self.store_dir else None
+
+    def load_reference(self, ref: str) -> Optional[str]:
+        """Load the full text of a stored message.
+
+        Args:
+            ref: Reference from a stub
+
+        Returns:
+            Full text, or None if unknown
+        """
+        path = self.reference_path(ref)
+        try:
+            return path.read_text(encoding="utf-8") if path else None
+        except OSError:
+            return None
+
+    def _store(self, content: str) -> str:
+        """Store content under its hash (failures only disable storage)."""
+        ref = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+        path = self.reference_path(ref)
+        if path is None or path.exists():
+            return ref
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to store large message {ref}: {e}")
+        return ref
+
+    def _summarize(self, messages: List[Dict], budget_tokens: int) -> str:
+        """Summarize older messages block by block, dropping the oldest blocks over budget."""
+        blocks = [messages[i : i + self.block_messages] for i in range(0, len(messages), self.block_messages)]
+        summaries = [self._block_summary(block) for block in blocks]
+        counts = get_token_service().count_batch(summaries, model=self.model)
+
+        # Keep the newest block summaries that fit
+        kept: List[str] = []
+        used = 0
+        for summary, count in zip(reversed(summaries), reversed(counts)):
+            if kept and used + count > budget_tokens:
+                break
+            kept.insert(0, summary)
+            used += count
+
+        omitted = sum(len(block) for block in blocks[: len(blocks) - len(kept)])
+        header = SUMMARY_HEADER if not omitted else f"{SUMMARY_HEADER} ({omitted} older messages omitted)"
+        return header + "\n" + "\n".join(kept)
+
+    def _block_summary(self, block: List[Dict]) -> str:
+        """Get the (cached) summary of a block of messages."""
+        key = self._block_key(block)
+        with self._lock:
+            if key in self._summaries:
+                self._summaries.move_to_end(key)
+                return self._summaries[key]
+
+        summary = self.summarizer(block)
+
+        with self._lock:
+            self._summaries[key] = summary
+            while len(self._summaries) > MAX_CACHED_SUMMARIES:
+                self._summaries.popitem(last=False)
+        return summary
+
+    @staticmethod
+    def _block_key(block: List[Dict]) -> str:
+        """Hash a block of messages."""
+        digest = hashlib.sha256()
+        for message in block:
+            for part in (message["role"], message["content"]):
+                data = part.encode("utf-8")
+                digest.update(len(data).to_bytes(8, "little"))
+                digest.update(data)
+        return digest.hexdigest()
+
+    def stats(self) -> Tuple[int, int]:
+        """Get cache usage.
+
+        Returns:
+            (cached block summaries, maximum cached block summaries)
+        """
+        with self._lock:
+            return len(self._summaries), MAX_CACHED_SUMMARIES
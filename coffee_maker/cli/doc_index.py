@@ -0,0 +1,379 @@
+"""Local BM25 retrieval index over the project documentation.
+
+The assistant answers documentation questions much more cheaply when its
+prompt carries the few passages that matter instead of whole documents (the
+roadmap alone is tens of thousands of lines). ``DocumentationIndex`` keeps an
+on-disk lexical index of ``docs/`` (which includes the roadmap) and
+``.claude/``:
+
+- Markdown files are split into chunks along headings, at most
+  ``chunk_chars`` characters each. Every chunk keeps its heading trail (e.g.
+  "ROADMAP > US-062: Email notifications") and start line.
+- Chunks live in SQLite with an external-content FTS5 table kept in sync by
+  triggers; queries are ranked by BM25 with headings weighted above body text.
+- ``update()`` compares each file's mtime and size with the indexed version
+  and only re-chunks changed files, so refreshing an unchanged tree costs one
+  directory walk. ``search()`` runs it at most every ``max_age`` seconds.
+
+Example:
+    >>> from coffee_maker.cli.doc_index import get_documentation_index
+    >>>
+    >>> index = get_documentation_index()
+    >>> index.update()
+    {'added': 0, 'updated': 1, 'removed': 0, 'unchanged': 418}
+    >>> for chunk in index.search("how are priorities numbered?", top_k=3):
+    ...     print(chunk.path, chunk.line, chunk.heading)
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from coffee_maker.config import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = Path.home() / ".coffee_maker" / "doc_index"
+
+# Directories indexed, relative to the project root
+DEFAULT_SOURCES = ("docs", ".claude")
+DEFAULT_SUFFIXES = (".md", ".txt")
+
+DEFAULT_CHUNK_CHARS = 1500  # ~375 tokens
+DEFAULT_TOP_K = 5
+DEFAULT_MAX_AGE = 60.0  # Seconds between mtime checks triggered by search()
+
+# Query terms beyond this are dropped (long questions add noise, not recall)
+MAX_QUERY_TERMS = 32
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS doc_file (
+        path TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS doc_chunk (
+        id INTEGER PRIMARY KEY,
+        path TEXT NOT NULL,
+        line INTEGER NOT NULL,
+        heading TEXT NOT NULL,
+        content TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_doc_chunk_path ON doc_chunk(path);
+    CREATE VIRTUAL TABLE IF NOT EXISTS doc_search USING fts5(
+        heading,
+        content,
+        content = 'doc_chunk',
+        content_rowid = 'id',
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_doc_chunk_insert AFTER INSERT ON doc_chunk BEGIN
+        INSERT INTO doc_search (rowid, heading, content) VALUES (new.id, new.heading, new.content);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_doc_chunk_delete AFTER DELETE ON doc_chunk BEGIN
+        INSERT INTO doc_search (doc_search, rowid, heading, content) VALUES ('delete', old.id, old.heading, old.content);
+    END;
+"""
+
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class DocChunk:
+    """A retrieved documentation passage.
+
+    Attributes:
+        path: File path relative to the project root
+        line: 1-based line number where the chunk starts
+        heading: Heading trail of the chunk (e.g. "ROADMAP > US-062: ...")
+        content: Chunk text
+        score: BM25 score (lower is a better match, as in FTS5)
+    """
+
+    path: str
+    line: int
+    heading: str
+    content: str
+    score: float = 0.0
+
+
+def chunk_markdown(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> List[Tuple[int, str, str]]:
+    """Split markdown into chunks along headings.
+
+    Sections longer than max_chars are split at line boundaries (single longer
+    lines are cut). Headings inside code fences are treated as text.
+
+    Args:
+        text: Markdown content
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        List of (start line, heading trail, content) tuples
+    """
+    chunks: List[Tuple[int, str, str]] = []
+    trail: List[Tuple[int, str]] = []
+    lines: List[str] = []
+    size = 0
+    start = 1
+    in_fence = False
+
+    def flush() -> None:
+        content = "\n".join(lines).strip()
+        if content:
+            chunks.append((start, " > ".join(title for _, title in trail), content))
+
+    for number, line in enumerate(text.splitlines(), start=1):
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING_PATTERN.match(line)
+
+        if heading or (lines and size + len(line) + 1 > max_chars):
+            flush()
+            lines, size, start = [], 0, number
+        if heading:
+            level = len(heading.group(1))
+            trail = [(lvl, title) for lvl, title in trail if lvl < level]
+            trail.append((level, heading.group(2)))
+
+        while len(line) > max_chars:
+            lines.append(line[:max_chars])
+            flush()
+            lines, size, start = [], 0, number
+            line = line[max_chars:]
+        lines.append(line)
+        size += len(line) + 1
+
+    flush()
+    return chunks
+
+
+def _match_query(text: str) -> Optional[str]:
+    """Build an FTS5 query matching any word of a natural-language question.
+
+    Args:
+        text: Question or search text
+
+    Returns:
+        FTS5 query (quoted terms joined by OR), or None if text has no words
+    """
+    terms = dict.fromkeys(word.lower() for word in _WORD_PATTERN.findall(text) if len(word) > 1)
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in list(terms)[:MAX_QUERY_TERMS])
+
+
+class DocumentationIndex:
+    """On-disk, incrementally updated BM25 index of project documentation.
+
+    Thread-safe; each call opens its own SQLite connection.
+
+    Attributes:
+        root: Project root the sources are relative to
+        sources: Indexed directories (or files), relative to root
+        db_path: SQLite index file
+        chunk_chars: Maximum characters per chunk
+        max_age: Seconds after which search() re-checks file mtimes
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = PROJECT_ROOT,
+        sources: Iterable[str] = DEFAULT_SOURCES,
+        index_dir: Union[str, Path] = DEFAULT_INDEX_DIR,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """Initialize the index (nothing is read until the first update or search).
+
+        Args:
+            root: Project root
+            sources: Directories (or files) to index, relative to root
+            index_dir: Directory of index databases (one per project root)
+            chunk_chars: Maximum characters per chunk
+            max_age: Seconds after which search() re-checks file mtimes
+        """
+        self.root = Path(root).resolve()
+        self.sources = tuple(sources)
+        self.chunk_chars = chunk_chars
+        self.max_age = max_age
+
+        digest = hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16]
+        self.db_path = Path(index_dir) / f"{self.root.name}_{digest}.db"
+
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._checked_at: Optional[float] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating (or rebuilding an outdated) schema on first use."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._schema_ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                # Chunking changed: drop everything and re-index from scratch
+                for name in ("trg_doc_chunk_insert", "trg_doc_chunk_delete"):
+                    conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+                for name in ("doc_search", "doc_chunk", "doc_file"):
+                    conn.execute(f"DROP TABLE IF EXISTS {name}")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self._schema_ready = True
+        return conn
+
+    def _source_files(self) -> Dict[str, os.stat_result]:
+        """Stat every indexable file under the sources, keyed by root-relative path.
+
+        Symlinks to files already indexed (e.g. docs/ROADMAP.md) are skipped.
+        """
+        candidates: List[str] = []
+        for source in self.sources:
+            base = self.root / source
+            if base.is_file():
+                candidates.append(str(base))
+            else:
+                candidates.extend(
+                    os.path.join(directory, name)
+                    for directory, _, names in os.walk(base)
+                    for name in names
+                    if name.endswith(DEFAULT_SUFFIXES)
+                )
+
+        files: Dict[str, os.stat_result] = {}
+        seen = set()
+        for candidate in sorted(candidates, key=lambda candidate: (os.path.islink(candidate), candidate)):
+            real_path = os.path.realpath(candidate)
+            if real_path in seen:
+                continue
+            try:
+                stat = os.stat(candidate)
+            except OSError:
+                continue
+            seen.add(real_path)
+            files[Path(candidate).relative_to(self.root).as_posix()] = stat
+        return files
+
+    def update(self) -> Dict[str, int]:
+        """Re-index files whose mtime or size changed, and drop deleted files.
+
+        Returns:
+            Counts of "added", "updated", "removed" and "unchanged" files
+        """
+        with self._lock:
+            files = self._source_files()
+            stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+            conn = self._connect()
+            try:
+                with conn:
+                    indexed = {
+                        row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, mtime_ns, size FROM doc_file")
+                    }
+
+                    for path in indexed.keys() - files.keys():
+                        conn.execute("DELETE FROM doc_chunk WHERE path = ?", (path,))
+                        conn.execute("DELETE FROM doc_file WHERE path = ?", (path,))
+                        stats["removed"] += 1
+
+                    for path, stat in sorted(files.items()):
+                        version = (stat.st_mtime_ns, stat.st_size)
+                        if indexed.get(path) == version:
+                            stats["unchanged"] += 1
+                            continue
+
+                        try:
+                            text = (self.root / path).read_text(encoding="utf-8", errors="replace")
+                        except OSError as e:
+                            logger.warning(f"Cannot index {path}: {e}")
+                            continue
+
+                        conn.execute("DELETE FROM doc_chunk WHERE path = ?", (path,))
+                        conn.executemany(
+                            "INSERT INTO doc_chunk (path, line, heading, content) VALUES (?, ?, ?, ?)",
+                            [
+                                (path, line, heading, content)
+                                for line, heading, content in chunk_markdown(text, self.chunk_chars)
+                            ],
+                        )
+                        conn.execute(
+                            "INSERT OR REPLACE INTO doc_file (path, mtime_ns, size) VALUES (?, ?, ?)", (path, *version)
+                        )
+                        stats["updated" if path in indexed else "added"] += 1
+            finally:
+                conn.close()
+
+            self._checked_at = time.monotonic()
+
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            logger.info(f"Documentation index updated: {stats}")
+        return stats
+
+    def search(self, query: str, top_k: int = DEFAULT_TOP_K) -> List[DocChunk]:
+        """Find the chunks most relevant to a query.
+
+        Any word of the query can match (stemmed, ignoring case and accents);
+        chunks are ranked by BM25 with heading matches weighted double. File
+        changes are picked up first if the last check is older than max_age.
+
+        Args:
+            query: Question or search text
+            top_k: Maximum number of chunks
+
+        Returns:
+            Best matching chunks, best first
+        """
+        if self._checked_at is None or time.monotonic() - self._checked_at > self.max_age:
+            self.update()
+
+        match = _match_query(query)
+        if not match:
+            return []
+
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT c.path, c.line, c.heading, c.content, bm25(doc_search, 2.0, 1.0) AS score
+                    FROM doc_search
+                    JOIN doc_chunk AS c ON c.id = doc_search.rowid
+                    WHERE doc_search MATCH ?
+                    ORDER BY score
+                    LIMIT ?
+                    """,
+                    (match, top_k),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error searching documentation index: {e}")
+            return []
+
+        return [DocChunk(*row) for row in rows]
+
+
+_index: Optional[DocumentationIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_documentation_index() -> DocumentationIndex:
+    """Get the shared documentation index of the project.
+
+    Returns:
+        DocumentationIndex for PROJECT_ROOT
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = DocumentationIndex()
+        return _index
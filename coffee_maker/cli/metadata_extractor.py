@@ -42,6 +42,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 from coffee_maker.cli.request_classifier import RequestType
+from coffee_maker.utils.pattern_matcher import PatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -147,6 +148,66 @@ class MetadataExtractor:
         r"\bafter\s+([A-Z]+-\d+)",
     ]
 
+    # Rationale patterns for methodology changes (first match wins)
+    RATIONALE_PATTERNS = [
+        r"because (.+)",
+        r"so that (.+)",
+        r"to ensure (.+)",
+        r"in order to (.+)",
+        r"rationale[:\s]+(.+)",
+    ]
+
+    # Priority keywords (checked in order: critical first)
+    PRIORITY_KEYWORDS = {
+        "critical": ["critical", "urgent", "blocker", "broken", "failing"],
+        "high": ["important", "soon", "asap", "quickly", "priority"],
+    }
+
+    # Roles a methodology change can apply to (first mentioned in this order wins)
+    ROLES = ["developers", "team", "everyone", "all", "project manager", "code_developer"]
+
+    # Section keywords for COLLABORATION_METHODOLOGY.md (first matching section wins)
+    SECTION_KEYWORDS = {
+        "Git Workflow": ["git", "branch", "commit"],
+        "Pull Request Process": ["pr", "pull request"],
+        "Code Review": ["review"],
+        "Testing Strategy": ["testing", "test"],
+        "Deployment": ["deploy"],
+        "CI/CD Pipeline": ["ci/cd"],
+        "Team Communication": ["communication", "meeting"],
+    }
+
+    # Technology tags
+    TECH_TAGS = [
+        "python",
+        "api",
+        "database",
+        "frontend",
+        "backend",
+        "ui",
+        "ux",
+        "security",
+        "performance",
+        "testing",
+        "documentation",
+        "devops",
+        "ci/cd",
+    ]
+
+    # Vocabularies compiled once and shared by all instances
+    _COMPLEXITY_MATCHER = PatternMatcher(
+        keywords={"high": sorted(COMPLEXITY_HIGH_KEYWORDS), "medium": sorted(COMPLEXITY_MEDIUM_KEYWORDS)}
+    )
+    _PRIORITY_MATCHER = PatternMatcher(keywords=PRIORITY_KEYWORDS)
+    _ROLE_MATCHER = PatternMatcher(keywords={"role": ROLES})
+    _SECTION_MATCHER = PatternMatcher(keywords=SECTION_KEYWORDS)
+    _TAG_MATCHER = PatternMatcher(keywords={"tag": TECH_TAGS})
+    _EFFORT_REGEXES = [
+        (re.compile(pattern, re.IGNORECASE), extractor) for pattern, extractor in EFFORT_PATTERNS.items()
+    ]
+    _DEPENDENCY_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in DEPENDENCY_PATTERNS]
+    _RATIONALE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in RATIONALE_PATTERNS]
+
     def __init__(self, use_ai: bool = False, ai_client=None):
         """Initialize metadata extractor.
 
@@ -366,13 +427,11 @@ class MetadataExtractor:
         Returns:
             Complexity rating ("low", "medium", "high")
         """
-        lower_text = text.lower()
+        hits = self._COMPLEXITY_MATCHER.find(text)
 
-        # Count high complexity indicators
-        high_count = sum(1 for keyword in self.COMPLEXITY_HIGH_KEYWORDS if keyword in lower_text)
-
-        # Count medium complexity indicators
-        medium_count = sum(1 for keyword in self.COMPLEXITY_MEDIUM_KEYWORDS if keyword in lower_text)
+        # Count high and medium complexity indicators
+        high_count = len(hits.get("high", []))
+        medium_count = len(hits.get("medium", []))
 
         if high_count >= 2:
             return "high"
@@ -390,8 +449,8 @@ class MetadataExtractor:
         Returns:
             Effort estimate string or None
         """
-        for pattern, extractor in self.EFFORT_PATTERNS.items():
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex, extractor in self._EFFORT_REGEXES:
+            match = regex.search(text)
             if match:
                 return extractor(match)
 
@@ -409,9 +468,8 @@ class MetadataExtractor:
         """
         dependencies = []
 
-        for pattern in self.DEPENDENCY_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for regex in self._DEPENDENCY_REGEXES:
+            for match in regex.finditer(text):
                 dep_id = match.group(1)
                 if dep_id not in dependencies:
                     dependencies.append(dep_id)
@@ -491,15 +549,10 @@ class MetadataExtractor:
         Returns:
             Priority suggestion ("critical", "high", "normal", "low")
         """
-        lower_text = text.lower()
-
-        # Critical keywords
-        if any(word in lower_text for word in ["critical", "urgent", "blocker", "broken", "failing"]):
-            return "critical"
-
-        # High priority keywords
-        if any(word in lower_text for word in ["important", "soon", "asap", "quickly", "priority"]):
-            return "high"
+        # Critical keywords, then high priority keywords
+        keyword_priority = self._PRIORITY_MATCHER.first(text)
+        if keyword_priority:
+            return keyword_priority
 
         # Complexity-based
         if complexity == "high":
@@ -519,16 +572,8 @@ class MetadataExtractor:
             Rationale or None
         """
         # Look for common rationale patterns
-        patterns = [
-            r"because (.+)",
-            r"so that (.+)",
-            r"to ensure (.+)",
-            r"in order to (.+)",
-            r"rationale[:\s]+(.+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in self._RATIONALE_REGEXES:
+            match = regex.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -549,18 +594,9 @@ class MetadataExtractor:
             return applies_match.group(1).strip()
 
         # Look for role mentions
-        roles = [
-            "developers",
-            "team",
-            "everyone",
-            "all",
-            "project manager",
-            "code_developer",
-        ]
-        lower_text = text.lower()
-        for role in roles:
-            if role in lower_text:
-                return role.capitalize()
+        roles = self._ROLE_MATCHER.find(text).get("role")
+        if roles:
+            return roles[0].capitalize()
 
         return "All team members"
 
@@ -573,27 +609,9 @@ class MetadataExtractor:
         Returns:
             Section name
         """
-        lower_text = text.lower()
-
-        # Section keywords
-        section_map = {
-            "git": "Git Workflow",
-            "branch": "Git Workflow",
-            "commit": "Git Workflow",
-            "pr": "Pull Request Process",
-            "pull request": "Pull Request Process",
-            "review": "Code Review",
-            "testing": "Testing Strategy",
-            "test": "Testing Strategy",
-            "deploy": "Deployment",
-            "ci/cd": "CI/CD Pipeline",
-            "communication": "Team Communication",
-            "meeting": "Team Communication",
-        }
-
-        for keyword, section in section_map.items():
-            if keyword in lower_text:
-                return section
+        section = self._SECTION_MATCHER.first(text)
+        if section:
+            return section
 
         return "General Guidelines"
 
@@ -606,28 +624,6 @@ class MetadataExtractor:
         Returns:
             List of tags
         """
-        tags = []
-        lower_text = text.lower()
-
-        # Technology tags
-        tech_tags = [
-            "python",
-            "api",
-            "database",
-            "frontend",
-            "backend",
-            "ui",
-            "ux",
-            "security",
-            "performance",
-            "testing",
-            "documentation",
-            "devops",
-            "ci/cd",
-        ]
-
-        for tag in tech_tags:
-            if tag in lower_text:
-                tags.append(tag)
+        tags = self._TAG_MATCHER.find(text).get("tag", [])
 
         return tags[:5]  # Limit to 5 tags
@@ -16,11 +16,20 @@ Database Schema:
         - created_at: Creation timestamp
         - updated_at: Last update timestamp
 
+        - occurrences: Number of identical notifications merged into this one
+
 Features:
     - WAL mode enabled (multi-process safe)
     - Retry logic for database operations
     - Timeout configuration
     - JSON context support
+    - Batched writes: notifications are queued to a background writer that
+      commits bursts in one transaction; ``wait=False`` returns immediately
+    - Deduplication: an identical pending notification created within
+      DEDUPE_WINDOW_SECONDS is merged (occurrences + 1) instead of repeated
+    - Sounds play on a background worker, never in the caller's thread
+    - Subscriptions: ``subscribe()`` pushes new notifications to a callback
+      (including ones created by other processes) instead of polling
 
 Example:
     Create notification:
@@ -41,16 +50,27 @@ Example:
 
     Respond to notification:
     >>> db.respond_to_notification(notif_id, "approve")
+
+    Fire-and-forget from a hot loop, and subscribe from a monitor:
+    >>> db.create_notification(type="info", title="Tick", message="...", wait=False)
+    >>> subscription = db.subscribe(lambda notif: print(notif["title"]), type="question")
+    >>> subscription.close()
 """
 
+import atexit
 import json
 import logging
 import os
 import platform
+import queue
 import sqlite3
-from datetime import datetime
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from coffee_maker.config import DATABASE_PATHS
 from coffee_maker.langfuse_observe.retry import with_retry
@@ -60,6 +80,18 @@ logger = logging.getLogger(__name__)
 # Default timeout for database operations (30 seconds)
 DB_TIMEOUT = 30.0
 
+# Identical pending notifications created within this window are merged
+DEDUPE_WINDOW_SECONDS = 300.0
+
+# Maximum notifications committed in one writer transaction
+WRITE_BATCH_SIZE = 100
+
+# A writer thread with nothing to write for this long stops (and restarts on demand)
+WRITER_IDLE_SECONDS = 10.0
+
+# Seconds between change checks of a subscription
+SUBSCRIBE_POLL_INTERVAL = 0.2
+
 # Notification types
 NOTIF_TYPE_QUESTION = "question"
 NOTIF_TYPE_INFO = "info"
@@ -118,18 +150,18 @@ def play_notification_sound(priority: str = "normal") -> bool:
 
         if system == "Darwin":  # macOS
             if priority == "critical":
-                os.system("afplay /System/Library/Sounds/Sosumi.aiff &")
+                _spawn_player(["afplay", "/System/Library/Sounds/Sosumi.aiff"])
             elif priority == "high":
-                os.system("afplay /System/Library/Sounds/Glass.aiff &")
+                _spawn_player(["afplay", "/System/Library/Sounds/Glass.aiff"])
             else:
-                os.system("afplay /System/Library/Sounds/Pop.aiff &")
+                _spawn_player(["afplay", "/System/Library/Sounds/Pop.aiff"])
             return True
 
         elif system == "Linux":
             # Try to play freedesktop sound
             sound_file = "/usr/share/sounds/freedesktop/stereo/message.oga"
             if os.path.exists(sound_file):
-                os.system(f"paplay {sound_file} &")
+                _spawn_player(["paplay", sound_file])
                 return True
             else:
                 logger.debug(f"Sound file not found: {sound_file}")
@@ -159,6 +191,41 @@ def play_notification_sound(priority: str = "normal") -> bool:
         return False
 
 
+def _spawn_player(command: List[str]) -> None:
+    """Start a sound player without waiting for it (no shell)."""
+    subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+_sound_queue: "queue.Queue[str]" = queue.Queue()
+_sound_worker: Optional[threading.Thread] = None
+_sound_lock = threading.Lock()
+
+
+def play_notification_sound_async(priority: str = "normal") -> None:
+    """Queue a notification sound for the background sound worker.
+
+    Args:
+        priority: Sound priority level - "normal", "high", or "critical"
+    """
+    global _sound_worker
+    if _sound_worker is None or not _sound_worker.is_alive():
+        with _sound_lock:
+            if _sound_worker is None or not _sound_worker.is_alive():
+                _sound_worker = threading.Thread(target=_play_sounds, name="notification-sounds", daemon=True)
+                _sound_worker.start()
+    _sound_queue.put(priority)
+
+
+def _play_sounds() -> None:
+    """Sound worker: play queued sounds one after another."""
+    while True:
+        priority = _sound_queue.get()
+        if play_notification_sound(priority):
+            logger.debug(f"Played {priority} notification sound")
+        else:
+            logger.debug("Sound notification disabled or unavailable")
+
+
 CREATE_NOTIFICATIONS_TABLE = """
 CREATE TABLE IF NOT EXISTS notifications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -170,7 +237,8 @@ CREATE TABLE IF NOT EXISTS notifications (
     status TEXT NOT NULL DEFAULT 'pending',
     user_response TEXT,
     created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    updated_at TEXT NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 1
 );
 
 CREATE INDEX IF NOT EXISTS idx_notifications_status ON notifications(status);
@@ -179,6 +247,282 @@ CREATE INDEX IF NOT EXISTS idx_notifications_priority ON notifications(priority)
 CREATE INDEX IF NOT EXISTS idx_notifications_created_at ON notifications(created_at);
 """
 
+# Created after the occurrences column exists (older databases get it in _init_database)
+CREATE_DEDUPE_INDEX = "CREATE INDEX IF NOT EXISTS idx_notifications_dedupe ON notifications(status, title, created_at)"
+
+
+class _NotificationWriter:
+    """Background writer committing queued notifications in batches.
+
+    One writer (thread and connection) per database per process. Each batch
+    is what accumulated while the previous one was being committed, so a
+    burst of notifications costs one transaction instead of one per call.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._queue: "queue.Queue[Tuple[Optional[Dict], Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def submit(self, row: Optional[Dict]) -> Future:
+        """Queue a notification row (None: flush marker).
+
+        Returns:
+            Future resolved with the notification ID once committed
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._queue = queue.Queue()  # a forked child does not inherit the parent's writes
+                self._thread = threading.Thread(target=self._run, name="notification-writer", daemon=True)
+                self._pid = os.getpid()
+                self._thread.start()
+            self._queue.put((row, future))
+        return future
+
+    def flush(self, timeout: Optional[float] = DB_TIMEOUT) -> None:
+        """Wait until every notification queued so far is committed."""
+        if self._thread is not None and self._pid == os.getpid():
+            self.submit(None).result(timeout)
+
+    def _run(self) -> None:
+        """Writer loop: take everything queued and commit it as one batch; exit when idle."""
+        conn = None
+        error: Optional[Exception] = None
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=DB_TIMEOUT)
+            conn.execute("PRAGMA busy_timeout=30000")
+            while True:
+                try:
+                    batch = [self._queue.get(timeout=WRITER_IDLE_SECONDS)]
+                except queue.Empty:
+                    with self._lock:
+                        if self._queue.empty():
+                            self._thread = None
+                            return
+                    continue
+                while len(batch) < WRITE_BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    self._write(conn, batch)
+                except Exception as e:
+                    logger.error(f"Notification writer failed on a batch of {len(batch)}: {e}", exc_info=True)
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+        except Exception as e:
+            logger.error(f"Notification writer stopped: {e}", exc_info=True)
+            error = e
+        finally:
+            if conn is not None:
+                conn.close()
+            # Fail what is queued and let the next submit start a new writer
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    while error is not None and not self._queue.empty():
+                        self._queue.get_nowait()[1].set_exception(error)
+
+    def _write(self, conn: sqlite3.Connection, batch: List[Tuple[Optional[Dict], Future]]) -> None:
+        """Commit a batch, retrying while the database is locked, then resolve its futures.
+
+        Each row is written under its own savepoint: a row violating a
+        constraint fails only its own future, the rest of the batch commits.
+        """
+        rows = [row for row, _ in batch if row is not None]
+        for attempt in range(3):
+            try:
+                with conn:
+                    conn.execute("BEGIN")
+                    results = [self._write_row(conn, row) for row in rows]
+                break
+            except sqlite3.OperationalError as e:
+                if attempt == 2:
+                    logger.error(f"Failed to write {len(rows)} notification(s): {e}")
+                    for _, future in batch:
+                        future.set_exception(e)
+                    return
+                time.sleep(0.1 * 2**attempt)
+
+        results = iter(results)
+        for row, future in batch:
+            if row is None:
+                future.set_result(None)
+                continue
+            result = next(results)
+            if isinstance(result, Exception):
+                logger.error(f"Failed to write notification {row.get('title')!r}: {result}")
+                future.set_exception(result)
+                continue
+            notif_id, occurrences = result
+            if occurrences > 1:
+                logger.info(f"Merged notification into {notif_id} ({occurrences} occurrences): {row['title']}")
+            else:
+                logger.info(f"Created notification {notif_id}: {row['title']}")
+            future.set_result(notif_id)
+
+    @classmethod
+    def _write_row(cls, conn: sqlite3.Connection, row: Dict):
+        """Write one row under a savepoint.
+
+        Returns:
+            (notification ID, occurrences), or the exception if the row was rejected
+
+        Raises:
+            sqlite3.OperationalError: If the database is locked (the batch is retried)
+        """
+        conn.execute("SAVEPOINT notification")
+        try:
+            result = cls._insert_or_merge(conn, row)
+        except sqlite3.OperationalError:
+            raise
+        except Exception as e:
+            conn.execute("ROLLBACK TO notification")
+            result = e
+        conn.execute("RELEASE notification")
+        return result
+
+    @staticmethod
+    def _insert_or_merge(conn: sqlite3.Connection, row: Dict) -> Tuple[int, int]:
+        """Insert a notification, or merge it into an identical recent pending one.
+
+        Returns:
+            Tuple of (notification ID, occurrences)
+        """
+        cutoff = (datetime.fromisoformat(row["created_at"]) - timedelta(seconds=DEDUPE_WINDOW_SECONDS)).isoformat()
+        existing = conn.execute(
+            """
+            SELECT id, occurrences FROM notifications
+            WHERE status = ? AND title = ? AND created_at >= ?
+            AND type = ? AND priority = ? AND message = ?
+            ORDER BY id DESC LIMIT 1
+            """,
+            (NOTIF_STATUS_PENDING, row["title"], cutoff, row["type"], row["priority"], row["message"]),
+        ).fetchone()
+        if existing:
+            conn.execute(
+                """
+                UPDATE notifications
+                SET occurrences = occurrences + 1, updated_at = ?, context = coalesce(?, context)
+                WHERE id = ?
+                """,
+                (row["created_at"], row["context"], existing[0]),
+            )
+            return existing[0], existing[1] + 1
+
+        cursor = conn.execute(
+            """
+            INSERT INTO notifications
+            (type, priority, title, message, context, status, created_at, updated_at)
+            VALUES (:type, :priority, :title, :message, :context, :status, :created_at, :created_at)
+            """,
+            row,
+        )
+        return cursor.lastrowid, 1
+
+
+_writers: Dict[str, _NotificationWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _get_writer(db_path: str) -> _NotificationWriter:
+    """Get the process-wide writer for a database."""
+    key = os.path.abspath(db_path)
+    writer = _writers.get(key)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.setdefault(key, _NotificationWriter(db_path))
+    return writer
+
+
+@atexit.register
+def _flush_writers() -> None:
+    """Commit notifications still queued when the process exits."""
+    for writer in list(_writers.values()):
+        try:
+            writer.flush(timeout=5)
+        except Exception as e:
+            logger.warning(f"Could not flush notifications for {writer.db_path}: {e}")
+
+
+class NotificationSubscription:
+    """Delivers notifications created after subscribing to a callback.
+
+    SQLite has no cross-process notification, so a background thread keeps
+    one connection open and checks ``PRAGMA data_version`` (no table access);
+    only when another connection has committed does it fetch the new rows.
+    Notifications from any process, including this one, are delivered.
+
+    Example:
+        >>> subscription = NotificationDB().subscribe(print, type="question")
+        >>> subscription.close()
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        callback: Callable[[Dict], None],
+        type: Optional[str] = None,
+        poll_interval: float = SUBSCRIBE_POLL_INTERVAL,
+    ):
+        """Start delivering notifications.
+
+        Args:
+            db_path: Notification database path
+            callback: Called with each new notification dict (in the subscription thread)
+            type: Only deliver notifications of this type
+            poll_interval: Seconds between change checks
+        """
+        self.callback = callback
+        self.type = type
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._conn = sqlite3.connect(db_path, timeout=DB_TIMEOUT, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._last_id = self._conn.execute("SELECT coalesce(max(id), 0) FROM notifications").fetchone()[0]
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        self._thread = threading.Thread(target=self._run, name="notification-subscription", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop delivering notifications."""
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        """Subscription loop: fetch and deliver new rows whenever the database changed."""
+        try:
+            while not self._stop.wait(self.poll_interval):
+                try:
+                    self._deliver_new()
+                except sqlite3.Error as e:
+                    logger.warning(f"Notification subscription check failed: {e}")
+        finally:
+            self._conn.close()
+
+    def _deliver_new(self) -> None:
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+
+        rows = self._conn.execute("SELECT * FROM notifications WHERE id > ? ORDER BY id", (self._last_id,)).fetchall()
+        for row in rows:
+            self._last_id = row["id"]
+            notif = NotificationDB._row_to_dict(row)
+            if self.type and notif["type"] != self.type:
+                continue
+            try:
+                self.callback(notif)
+            except Exception as e:
+                logger.error(f"Notification subscriber failed: {e}", exc_info=True)
+
 
 class NotificationDB:
     """Notification database for daemon-user communication.
@@ -216,6 +560,7 @@ class NotificationDB:
 
         # Initialize database
         self._init_database()
+        self._writer = _get_writer(db_path)
 
         logger.debug(f"NotificationDB initialized: {db_path}")
 
@@ -229,6 +574,10 @@ class NotificationDB:
 
         # Create schema
         conn.executescript(CREATE_NOTIFICATIONS_TABLE)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(notifications)")}
+        if "occurrences" not in columns:
+            conn.execute("ALTER TABLE notifications ADD COLUMN occurrences INTEGER NOT NULL DEFAULT 1")
+        conn.execute(CREATE_DEDUPE_INDEX)
         conn.commit()
         conn.close()
 
@@ -245,7 +594,6 @@ class NotificationDB:
         conn.execute("PRAGMA busy_timeout=30000")
         return conn
 
-    @with_retry(max_attempts=3, retriable_exceptions=(sqlite3.OperationalError,))
     def create_notification(
         self,
         type: str,
@@ -255,12 +603,17 @@ class NotificationDB:
         context: Optional[Dict] = None,
         sound: bool = False,
         agent_id: Optional[str] = None,
-    ) -> int:
+        wait: bool = True,
+    ) -> Optional[int]:
         """Create a new notification with CFR-009 sound enforcement.
 
         PRIORITY 2.9: Enhanced with sound notifications
         CFR-009: ONLY user_listener can use sound notifications
 
+        The notification is committed by the background writer, batched with
+        others created meanwhile. An identical pending notification created
+        within DEDUPE_WINDOW_SECONDS is merged instead (its ID is returned).
+
         Args:
             type: Notification type (question, info, warning, error, completion)
             title: Short title
@@ -271,9 +624,11 @@ class NotificationDB:
                    CFR-009: ONLY user_listener can use sound=True
             agent_id: Calling agent identifier for CFR-009 enforcement
                       (e.g., "user_listener", "code_developer", "architect")
+            wait: Wait for the notification to be committed and return its ID
+                  (default: True). Use False in loops that do not need the ID.
 
         Returns:
-            Notification ID
+            Notification ID, or None if wait is False
 
         Raises:
             CFR009ViolationError: If non-UI agent tries sound=True
@@ -308,30 +663,17 @@ class NotificationDB:
             )
 
         now = datetime.utcnow().isoformat()
-        context_json = json.dumps(context) if context else None
-
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO notifications
-                (type, priority, title, message, context, status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    type,
-                    priority,
-                    title,
-                    message,
-                    context_json,
-                    NOTIF_STATUS_PENDING,
-                    now,
-                    now,
-                ),
-            )
-            conn.commit()
-            notif_id = cursor.lastrowid
-
-        logger.info(f"Created notification {notif_id}: {title}")
+        future = self._writer.submit(
+            {
+                "type": type,
+                "priority": priority,
+                "title": title,
+                "message": message,
+                "context": json.dumps(context) if context else None,
+                "status": NOTIF_STATUS_PENDING,
+                "created_at": now,
+            }
+        )
 
         # PRIORITY 2.9: Play notification sound based on priority
         if sound:
@@ -340,13 +682,41 @@ class NotificationDB:
                 sound_priority = "critical"
             elif priority == NOTIF_PRIORITY_HIGH:
                 sound_priority = "high"
+            play_notification_sound_async(sound_priority)
 
-            if play_notification_sound(sound_priority):
-                logger.debug(f"Played {sound_priority} notification sound")
-            else:
-                logger.debug("Sound notification disabled or unavailable")
+        if not wait:
+            return None
+        return future.result(timeout=DB_TIMEOUT * 3)
+
+    def flush(self, timeout: Optional[float] = DB_TIMEOUT) -> None:
+        """Wait until notifications created by this process so far are committed.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        self._writer.flush(timeout)
+
+    def subscribe(
+        self,
+        callback: Callable[[Dict], None],
+        type: Optional[str] = None,
+        poll_interval: float = SUBSCRIBE_POLL_INTERVAL,
+    ) -> NotificationSubscription:
+        """Deliver notifications created from now on to a callback.
+
+        Args:
+            callback: Called with each new notification dict (in a background thread)
+            type: Only deliver notifications of this type (e.g., "question")
+            poll_interval: Seconds between change checks
 
-        return notif_id
+        Returns:
+            NotificationSubscription (call close() to stop)
+
+        Example:
+            >>> db = NotificationDB()
+            >>> subscription = db.subscribe(lambda n: print(n["title"]), type="question")
+        """
+        return NotificationSubscription(self.db_path, callback, type=type, poll_interval=poll_interval)
 
     @with_retry(max_attempts=3, retriable_exceptions=(sqlite3.OperationalError,))
     def get_pending_notifications(self, priority: Optional[str] = None) -> List[Dict]:
@@ -373,6 +743,7 @@ class NotificationDB:
 
         query += " ORDER BY created_at ASC"
 
+        self.flush()
         with self._get_connection() as conn:
             cursor = conn.execute(query, params)
             notifications = [self._row_to_dict(row) for row in cursor.fetchall()]
@@ -452,13 +823,60 @@ class NotificationDB:
         Returns:
             Notification dict or None if not found
         """
+        self.flush()
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT * FROM notifications WHERE id = ?", (notif_id,))
             row = cursor.fetchone()
 
         return self._row_to_dict(row) if row else None
 
-    def _row_to_dict(self, row: sqlite3.Row) -> Dict:
+    def wait_for_response(
+        self,
+        notif_id: int,
+        timeout: Optional[float] = None,
+        poll_interval: float = SUBSCRIBE_POLL_INTERVAL,
+    ) -> Optional[str]:
+        """Block until the user responds to a notification.
+
+        Like subscribe(), this checks ``PRAGMA data_version`` and reads the
+        notification only after another connection has committed.
+
+        Args:
+            notif_id: Notification ID
+            timeout: Maximum seconds to wait (None: no limit)
+            poll_interval: Seconds between change checks
+
+        Returns:
+            The user's response, or None on timeout or if the notification
+            is dismissed or does not exist
+
+        Example:
+            >>> response = db.wait_for_response(notif_id, timeout=300)
+        """
+        self.flush()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        conn = self._get_connection()
+        try:
+            data_version = None
+            while True:
+                version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if version != data_version:
+                    data_version = version
+                    row = conn.execute(
+                        "SELECT status, user_response FROM notifications WHERE id = ?", (notif_id,)
+                    ).fetchone()
+                    if row is None or row["status"] == NOTIF_STATUS_DISMISSED:
+                        return None
+                    if row["user_response"] is not None:
+                        return row["user_response"]
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+                time.sleep(poll_interval)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
         """Convert database row to dictionary.
 
         Args:
@@ -480,6 +898,6 @@ class NotificationDB:
         return notif
 
     def close(self):
-        """Close database connection."""
-        # Connection is opened per-operation, nothing to close
+        """Commit queued notifications (connections are opened per-operation)."""
+        self.flush()
         logger.info("NotificationDB closed")
@@ -12,8 +12,9 @@ to route user input to the appropriate documentation (ROADMAP vs TEAM_COLLABORAT
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
-import re
+from typing import Dict, List
+
+from coffee_maker.utils.pattern_matcher import PatternMatcher
 
 
 class RequestType(Enum):
@@ -142,6 +143,12 @@ class RequestClassifier:
         r"\b(every|each|all) (time|commit|PR|pull request|feature)\b",
     ]
 
+    # All indicators compiled once, found in a single pass per request
+    _MATCHER = PatternMatcher(
+        keywords={"feature": sorted(FEATURE_KEYWORDS), "methodology": sorted(METHODOLOGY_KEYWORDS)},
+        patterns={"feature": FEATURE_PATTERNS, "methodology": METHODOLOGY_PATTERNS},
+    )
+
     # Confidence thresholds
     HIGH_CONFIDENCE = 0.67  # 2+ indicators
     MEDIUM_CONFIDENCE = 0.33  # 1+ indicator
@@ -179,8 +186,9 @@ class RequestClassifier:
         lower_input = user_input.lower()
 
         # Find indicators
-        feature_indicators = self._find_feature_indicators(lower_input)
-        methodology_indicators = self._find_methodology_indicators(lower_input)
+        indicators = self._find_indicators(lower_input)
+        feature_indicators = indicators["feature"]
+        methodology_indicators = indicators["methodology"]
 
         # Calculate scores (normalize to 0.0-1.0 range)
         # Use a scaling factor that's more forgiving
@@ -265,28 +273,31 @@ class RequestClassifier:
             target_documents=target_docs,
         )
 
-    def _find_feature_indicators(self, text: str) -> List[str]:
-        """Find feature request indicators in text.
+    def _find_indicators(self, text: str) -> Dict[str, List[str]]:
+        """Find feature and methodology indicators in text in a single pass.
 
         Args:
             text: Lowercased text to search
 
         Returns:
-            List of indicators found (e.g., "keyword: want", "pattern: ...")
+            Dictionary with "feature" and "methodology" lists of indicators found
+            (e.g., "keyword: want", "pattern: ...")
         """
-        indicators = []
+        hits = self._MATCHER.find_terms(text)
+        return {
+            label: [f"{kind}: {term}" for kind, term in hits.get(label, [])] for label in ("feature", "methodology")
+        }
 
-        # Check keywords
-        for keyword in self.FEATURE_KEYWORDS:
-            if keyword in text:
-                indicators.append(f"keyword: {keyword}")
+    def _find_feature_indicators(self, text: str) -> List[str]:
+        """Find feature request indicators in text.
 
-        # Check patterns
-        for pattern in self.FEATURE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                indicators.append(f"pattern: {pattern}")
+        Args:
+            text: Lowercased text to search
 
-        return indicators
+        Returns:
+            List of indicators found (e.g., "keyword: want", "pattern: ...")
+        """
+        return self._find_indicators(text)["feature"]
 
     def _find_methodology_indicators(self, text: str) -> List[str]:
         """Find methodology change indicators in text.
@@ -297,16 +308,4 @@ class RequestClassifier:
         Returns:
             List of indicators found (e.g., "keyword: process", "pattern: ...")
         """
-        indicators = []
-
-        # Check keywords
-        for keyword in self.METHODOLOGY_KEYWORDS:
-            if keyword in text:
-                indicators.append(f"keyword: {keyword}")
-
-        # Check patterns
-        for pattern in self.METHODOLOGY_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                indicators.append(f"pattern: {pattern}")
-
-        return indicators
+        return self._find_indicators(text)["methodology"]
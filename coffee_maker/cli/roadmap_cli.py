@@ -47,15 +47,6 @@ logger = logging.getLogger(__name__)
 # Import command modules for SPEC-050 Phase 3/4
 from coffee_maker.cli.commands import roadmap, status, notifications, utility
 
-# Import chat components for Phase 2
-try:
-    from coffee_maker.cli.assistant_manager import AssistantManager
-
-    CHAT_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Chat features not available: {e}")
-    CHAT_AVAILABLE = False
-
 
 def main() -> int:
     """Main CLI entry point.
@@ -133,8 +124,11 @@ Use 'project-manager chat' for the best experience!
             logger.info("✅ Agent registered in singleton registry")
 
             # PRIORITY 5: Initialize and start AssistantManager if chat features available
-            if CHAT_AVAILABLE:
+            # (only for the commands that use it: importing it loads the AI stack)
+            if args.command in ("chat", "assistant-status", "assistant-refresh") and utility.CHAT_AVAILABLE:
                 try:
+                    from coffee_maker.cli.assistant_manager import AssistantManager
+
                     assistant_manager = AssistantManager()
                     assistant_manager.start_auto_refresh()
 
@@ -0,0 +1,285 @@
+"""In-memory ROADMAP.md document for incremental editing.
+
+``RoadmapDocument`` keeps the roadmap content and its section index
+(``RoadmapIndex``) in memory so editor operations do not re-read and re-split
+the whole file for every change:
+
+- Edits are spliced byte ranges located through the index. The index is updated
+  for the splice (offsets after it shifted, only touched lines re-scanned), the
+  content is written atomically, and the new index is shared with every other
+  reader in the process.
+- Backups are rolling and incremental: a full snapshot starts a chain, then each
+  edit appends its reverse patch (offset, old text, new text) to the chain's
+  journal. A new snapshot is taken every ``snapshot_every`` edits or when the
+  file was changed outside the editor; only the last ``max_snapshots`` chains
+  are kept.
+- Item ids (US-XXX, PRIORITY X) are served from a prefix trie cached per
+  roadmap version, so tab completion does not scan the roadmap.
+
+Example:
+    >>> from coffee_maker.cli.roadmap_document import RoadmapDocument
+    >>>
+    >>> document = RoadmapDocument(Path("docs/roadmap/ROADMAP.md"))
+    >>> heading = document.index.get("PRIORITY 3")
+    >>> document.splice(heading.start, heading.start, b"<!-- note -->\\n", "Add note")
+    >>> [h.item_id for h in document.complete("us-1", limit=3)]
+    ['US-100', 'US-101', 'US-102']
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
+
+logger = logging.getLogger(__name__)
+
+
+class PrefixTrie:
+    """Case-insensitive prefix trie mapping keys to values.
+
+    Example:
+        >>> trie = PrefixTrie()
+        >>> trie.insert("PRIORITY 3", "third")
+        >>> trie.complete("prio")
+        ['third']
+    """
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: Dict = {}
+
+    def insert(self, key: str, value) -> None:
+        """Insert a value under a key.
+
+        Args:
+            key: Key (matched case-insensitively)
+            value: Value returned for prefixes of the key
+        """
+        node = self._root
+        for char in key.lower():
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(value)
+
+    def complete(self, prefix: str, limit: int = 15) -> List:
+        """Get values whose key starts with a prefix, in key order.
+
+        Args:
+            prefix: Key prefix (case-insensitive)
+            limit: Maximum number of values
+
+        Returns:
+            Up to ``limit`` values
+        """
+        node = self._root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+
+        results: List = []
+        stack = [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            results.extend(node.get(None, [])[: limit - len(results)])
+            stack.extend(node[char] for char in sorted((c for c in node if c is not None), reverse=True))
+        return results
+
+
+class RoadmapDocument:
+    """In-memory roadmap content with spliced edits and incremental backups.
+
+    Attributes:
+        roadmap_path: Path to ROADMAP.md
+        backup_dir: Directory for snapshots and edit journals
+        max_snapshots: Number of backup chains kept
+        snapshot_every: Edits journaled before a new full snapshot
+    """
+
+    def __init__(
+        self,
+        roadmap_path: Path,
+        backup_dir: Optional[Path] = None,
+        max_snapshots: int = 10,
+        snapshot_every: int = 50,
+    ):
+        """Initialize RoadmapDocument (content is loaded on first use).
+
+        Args:
+            roadmap_path: Path to ROADMAP.md
+            backup_dir: Backup directory (default: roadmap_backups/ next to the roadmap)
+            max_snapshots: Number of backup chains kept
+            snapshot_every: Edits journaled before a new full snapshot
+        """
+        self.roadmap_path = Path(roadmap_path)
+        self.backup_dir = backup_dir or self.roadmap_path.parent / "roadmap_backups"
+        self.max_snapshots = max_snapshots
+        self.snapshot_every = snapshot_every
+
+        self._index: Optional[RoadmapIndex] = None
+        self._trie: Optional[PrefixTrie] = None
+        self._trie_sha: Optional[str] = None
+
+    # ==================== Reading ====================
+
+    @property
+    def index(self) -> RoadmapIndex:
+        """Section index of the current content (reloaded if the file changed)."""
+        self._index = RoadmapIndex.for_path(self.roadmap_path)
+        return self._index
+
+    @property
+    def data(self) -> bytes:
+        """Current content as bytes."""
+        return self.index.data
+
+    def complete(self, prefix: str, limit: int = 15) -> List[RoadmapHeading]:
+        """Complete an item id (e.g. "PRIORITY 1", "us-0") from the cached trie.
+
+        Args:
+            prefix: Item id prefix (case-insensitive)
+            limit: Maximum number of completions
+
+        Returns:
+            Item headings whose id starts with the prefix
+        """
+        index = self.index
+        if self._trie is None or self._trie_sha != index.sha256:
+            trie = PrefixTrie()
+            for heading in index.items():
+                trie.insert(heading.item_id, heading)
+            self._trie, self._trie_sha = trie, index.sha256
+        return self._trie.complete(prefix, limit)
+
+    # ==================== Editing ====================
+
+    def splice(self, start: int, end: int, replacement: bytes, description: str = "") -> None:
+        """Replace the byte range [start, end) of the roadmap and save it.
+
+        The reverse patch is journaled before the new content is written
+        atomically; the new index is shared with other readers in the process.
+
+        Args:
+            start: Start byte offset
+            end: End byte offset
+            replacement: New bytes for the range
+            description: Description of the edit for the backup journal
+
+        Raises:
+            ValueError: If the range is outside the document
+            IOError: If the roadmap cannot be written
+        """
+        before = self.index
+        data = before.data
+        if not 0 <= start <= end <= len(data):
+            raise ValueError(f"Invalid splice range [{start}, {end}) for {len(data)} bytes")
+
+        after = before.splice(start, end, replacement)
+        self._journal(before, after, start, data[start:end], replacement, description)
+        self._write(after)
+
+    def undo(self) -> bool:
+        """Revert the last journaled edit if the roadmap has not changed since.
+
+        Returns:
+            True if an edit was reverted
+        """
+        journal = self._current_journal()
+        entries = self._read_journal(journal) if journal else []
+        if not entries:
+            return False
+
+        last = entries[-1]
+        data = self.data
+        if hashlib.sha256(data).hexdigest() != last["sha_after"]:
+            logger.warning("Roadmap changed since the last edit - not undoing")
+            return False
+
+        start = last["start"]
+        end = start + len(last["new"].encode("utf-8"))
+        self._write(self.index.splice(start, end, last["old"].encode("utf-8")))
+        journal.write_text("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries[:-1]))
+
+        logger.info(f"Undid roadmap edit: {last['description']}")
+        return True
+
+    def _write(self, index: RoadmapIndex) -> None:
+        """Atomically write new content and share its index."""
+        temp_path = self.roadmap_path.with_suffix(".tmp")
+        try:
+            temp_path.write_bytes(index.data)
+            temp_path.replace(self.roadmap_path)
+        except Exception as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise IOError(f"Failed to write roadmap: {e}")
+
+        self._index = RoadmapIndex.update(self.roadmap_path, index)
+        logger.debug("Atomically wrote roadmap")
+
+    # ==================== Backups ====================
+
+    def _current_journal(self) -> Optional[Path]:
+        """Get the journal of the latest backup chain."""
+        snapshots = sorted(self.backup_dir.glob("ROADMAP_*.md"))
+        return snapshots[-1].with_suffix(".journal.jsonl") if snapshots else None
+
+    @staticmethod
+    def _read_journal(journal: Path) -> List[Dict]:
+        """Read journal entries (missing journal = no entries)."""
+        if not journal.exists():
+            return []
+        return [json.loads(line) for line in journal.read_text().splitlines() if line.strip()]
+
+    def _journal(
+        self, before: RoadmapIndex, after: RoadmapIndex, start: int, old: bytes, new: bytes, description: str
+    ) -> None:
+        """Append the reverse patch of an edit, starting a new chain when needed."""
+        try:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            journal = self._current_journal()
+            entries = self._read_journal(journal) if journal else []
+
+            chain_sha = entries[-1]["sha_after"] if entries else self._snapshot_sha(journal)
+            if journal is None or len(entries) >= self.snapshot_every or chain_sha != before.sha256:
+                journal = self._snapshot(before.data)
+
+            entry = {
+                "timestamp": datetime.now().isoformat(),
+                "description": description,
+                "start": start,
+                "old": old.decode("utf-8"),
+                "new": new.decode("utf-8"),
+                "sha_before": before.sha256,
+                "sha_after": after.sha256,
+            }
+            with open(journal, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        except Exception as e:
+            logger.warning(f"Failed to create backup: {e}")
+
+    @staticmethod
+    def _snapshot_sha(journal: Optional[Path]) -> Optional[str]:
+        """Get the SHA-256 of a chain's snapshot."""
+        if journal is None:
+            return None
+        snapshot = journal.with_name(journal.name.replace(".journal.jsonl", ".md"))
+        return hashlib.sha256(snapshot.read_bytes()).hexdigest() if snapshot.exists() else None
+
+    def _snapshot(self, data: bytes) -> Path:
+        """Write a full snapshot, prune old chains, and return the new journal path."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        snapshot = self.backup_dir / f"ROADMAP_{timestamp}.md"
+        snapshot.write_bytes(data)
+        logger.info(f"Created backup: {snapshot}")
+
+        for old_snapshot in sorted(self.backup_dir.glob("ROADMAP_*.md"))[: -self.max_snapshots]:
+            old_snapshot.unlink()
+            old_snapshot.with_suffix(".journal.jsonl").unlink(missing_ok=True)
+            logger.debug(f"Removed old backup: {old_snapshot}")
+
+        return snapshot.with_suffix(".journal.jsonl")
@@ -1,10 +1,11 @@
 """Roadmap Editor - Safe manipulation of ROADMAP.md with validation and backups.
 
 This module provides safe editing capabilities for ROADMAP.md including:
-- Atomic writes with automatic backups
+- Atomic writes with rolling incremental backups
 - Priority validation
 - Summary extraction
-- Safe updates with regex patterns
+- Safe updates spliced into the sections located by the roadmap index
+- Instant priority/User Story completion from a cached prefix trie
 
 Example:
     >>> from coffee_maker.cli.roadmap_editor import RoadmapEditor
@@ -23,25 +24,62 @@ Example:
 """
 
 import re
-import shutil
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import logging
 
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
+from coffee_maker.cli.roadmap_document import RoadmapDocument
+
 logger = logging.getLogger(__name__)
 
+_PRIORITY_SUMMARY_HEADER = re.compile(r"### [🔴🟢] \*\*PRIORITY (\d+\.?\d*):(.+?)\*\*")
+_USER_STORY_SUMMARY_HEADER = re.compile(r"### 🎯 \[(US-\d+)\] (.+?)$")
+_STATUS_LINE = re.compile(r"\*\*Status\*\*: (.+?)\n")
+_SEPARATOR_LINE = re.compile(rb"^[ \t]*---[ \t]*\r?$", re.MULTILINE)
+
+# Field name -> bold label, for update_priority and update_user_story
+PRIORITY_FIELDS = {
+    "status": "Status",
+    "duration": "Estimated Duration",
+    "estimated duration": "Estimated Duration",
+    "impact": "Impact",
+}
+USER_STORY_FIELDS = {
+    "status": "Status",
+    "business_value": "Business Value",
+    "estimated_effort": "Estimated Effort",
+    "assigned_to": "Assigned To",
+}
+
+USER_STORY_BACKLOG_HEADER = [
+    "",
+    "---",
+    "",
+    "## 📋 USER STORY BACKLOG",
+    "",
+    "> **What is this section?**",
+    "> This is where user needs are captured before being translated into technical priorities.",
+    "> User Stories help us understand WHAT users need and WHY, before deciding HOW to implement.",
+    "",
+    "---",
+    "",
+]
+
 
 class RoadmapEditor:
     """Safe editor for ROADMAP.md with validation and backups.
 
     This class provides methods to safely manipulate the ROADMAP.md file
-    with automatic backups, validation, and atomic writes.
+    with automatic backups, validation, and atomic writes. The content and its
+    section index are kept in memory by a RoadmapDocument; edits are spliced
+    into the located section instead of rewriting the file with regexes.
 
     Attributes:
         roadmap_path: Path to ROADMAP.md file
         backup_dir: Directory for backup files
+        document: In-memory roadmap document
 
     Example:
         >>> editor = RoadmapEditor(Path("docs/roadmap/ROADMAP.md"))
@@ -63,6 +101,7 @@ class RoadmapEditor:
         self.roadmap_path = Path(roadmap_path)
         self.backup_dir = self.roadmap_path.parent / "roadmap_backups"
         self.backup_dir.mkdir(exist_ok=True)
+        self.document = RoadmapDocument(self.roadmap_path, self.backup_dir)
 
         logger.debug(f"RoadmapEditor initialized for {self.roadmap_path}")
 
@@ -109,14 +148,10 @@ class RoadmapEditor:
             True
         """
         try:
-            # Create backup
-            self._create_backup()
-
-            # Read current roadmap
-            content = self.roadmap_path.read_text()
+            index = self.document.index
 
             # Validate priority number
-            if not self._validate_priority_number(priority_number, content):
+            if not self._validate_priority_number(priority_number, index):
                 raise ValueError(f"Priority {priority_number} already exists or is invalid")
 
             # Build priority section
@@ -130,16 +165,9 @@ class RoadmapEditor:
                 deliverables or [],
             )
 
-            # Find insertion point
-            lines = content.split("\n")
-            insert_index = self._find_insertion_point(lines, priority_number)
-
-            # Insert new priority
-            lines.insert(insert_index, priority_section)
-
-            # Write back atomically
-            new_content = "\n".join(lines)
-            self._atomic_write(new_content)
+            # Splice the new priority in at its insertion point
+            insert_at = self._find_insertion_point(index, priority_number)
+            self._insert_lines(insert_at, [priority_section], f"Add {priority_number}")
 
             logger.info(f"Added {priority_number}: {title}")
             return True
@@ -175,53 +203,22 @@ class RoadmapEditor:
             True
         """
         try:
-            # Create backup
-            self._create_backup()
-
-            # Read roadmap
-            content = self.roadmap_path.read_text()
-
             # Normalize priority number
             if not priority_number.startswith("PRIORITY"):
                 priority_number = f"PRIORITY {priority_number}"
 
             # Find priority section
-            pattern = rf"### 🔴 \*\*{re.escape(priority_number)}:.*?\*\*"
-            match = re.search(pattern, content, re.IGNORECASE)
+            index = self.document.index
+            heading = index.get(priority_number)
 
-            if not match:
+            if heading is None:
                 raise ValueError(f"{priority_number} not found in roadmap")
 
-            # Update field based on type
-            field_lower = field.lower()
-
-            if field_lower == "status":
-                # Update status line
-                content = re.sub(
-                    rf"(\*\*{re.escape(priority_number)}:.*?\*\*.*?\n.*?\*\*Status\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE,
-                )
-            elif field_lower in ["duration", "estimated duration"]:
-                content = re.sub(
-                    rf"(\*\*{re.escape(priority_number)}:.*?\n.*?\*\*Estimated Duration\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE,
-                )
-            elif field_lower == "impact":
-                content = re.sub(
-                    rf"(\*\*{re.escape(priority_number)}:.*?\n.*?\*\*Impact\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE,
-                )
-            else:
+            label = PRIORITY_FIELDS.get(field.lower())
+            if label is None:
                 raise ValueError(f"Unsupported field: {field}")
 
-            # Write back atomically
-            self._atomic_write(content)
+            self._update_field(index, heading, label, value)
 
             logger.info(f"Updated {priority_number} {field} to {value}")
             return True
@@ -243,6 +240,7 @@ class RoadmapEditor:
             - completed: Count of completed priorities
             - in_progress: Count of in-progress priorities
             - planned: Count of planned priorities
+            - version: Hash of the roadmap content the summary was built from
 
         Example:
             >>> summary = editor.get_priority_summary()
@@ -250,22 +248,21 @@ class RoadmapEditor:
             Progress: 3/9
         """
         try:
-            content = self.roadmap_path.read_text()
-
-            # Extract all priorities with various status patterns
-            # Pattern matches: ### 🔴 **PRIORITY X: Title** ... Status: ...
-            pattern = r"### [🔴🟢] \*\*PRIORITY (\d+\.?\d*):(.+?)\*\*.*?\n.*?\*\*Status\*\*: (.+?)\n"
-            matches = re.findall(pattern, content, re.DOTALL)
+            index = self.document.index
 
+            # Extract all priorities: ### 🔴 **PRIORITY X: Title** ... **Status**: ...
             priorities = []
-            for match in matches:
-                priorities.append(
-                    {
-                        "number": f"PRIORITY {match[0]}",
-                        "title": match[1].strip(),
-                        "status": match[2].strip(),
-                    }
-                )
+            for heading in index.headings:
+                match = _PRIORITY_SUMMARY_HEADER.match(heading.text)
+                status = match and self._section_status(index, heading)
+                if status:
+                    priorities.append(
+                        {
+                            "number": f"PRIORITY {match.group(1)}",
+                            "title": match.group(2).strip(),
+                            "status": status,
+                        }
+                    )
 
             # Count by status
             completed = len([p for p in priorities if "✅" in p["status"]])
@@ -278,6 +275,7 @@ class RoadmapEditor:
                 "completed": completed,
                 "in_progress": in_progress,
                 "planned": planned,
+                "version": index.sha256,
             }
 
         except Exception as e:
@@ -308,32 +306,55 @@ class RoadmapEditor:
             if not priority_number.startswith("PRIORITY"):
                 priority_number = f"PRIORITY {priority_number}"
 
-            content = self.roadmap_path.read_text()
-            lines = content.split("\n")
+            index = self.document.index
+            heading = index.get(priority_number)
+            if heading is None:
+                return None
 
-            # Find priority section
-            in_priority = False
-            priority_lines = []
-
-            for line in lines:
-                # Check if this is the start of our priority
-                if priority_number.upper() in line.upper() and line.startswith("###"):
-                    in_priority = True
-                    priority_lines.append(line)
-                elif in_priority:
-                    # Check if we've hit the next priority
-                    if line.startswith("###") and "PRIORITY" in line.upper():
-                        break
-                    priority_lines.append(line)
-
-            if priority_lines:
-                return "\n".join(priority_lines)
-            return None
+            # Section runs until the next priority heading or a major (##) section
+            ends = index.section_ends(
+                lambda h: h.level <= 2 or (h.text.startswith("###") and "PRIORITY" in h.text.upper()),
+                key="roadmap_editor_priority",
+            )
+            return index.section_text(heading, ends[heading.index])
 
         except Exception as e:
             logger.error(f"Failed to get priority content: {e}")
             return None
 
+    def list_priorities(self) -> List[Dict]:
+        """List all priorities and User Stories in roadmap order.
+
+        Returns:
+            List of dicts with name (e.g., "PRIORITY 3", "US-110"), title and status
+
+        Example:
+            >>> for priority in editor.list_priorities():
+            ...     print(priority["name"], priority["status"])
+        """
+        return [self._item_summary(heading) for heading in self.document.index.items()]
+
+    def complete_priorities(self, prefix: str, limit: int = 15) -> List[Dict]:
+        """Complete priority/User Story names from a cached prefix trie.
+
+        Args:
+            prefix: Name prefix, case-insensitive (e.g., "prio", "US-1")
+            limit: Maximum number of completions
+
+        Returns:
+            List of dicts with name, title and status
+
+        Example:
+            >>> [p["name"] for p in editor.complete_priorities("PRIORITY 1", limit=3)]
+            ['PRIORITY 1', 'PRIORITY 10', 'PRIORITY 11']
+        """
+        return [self._item_summary(heading) for heading in self.document.complete(prefix, limit)]
+
+    @staticmethod
+    def _item_summary(heading: RoadmapHeading) -> Dict:
+        """Summarize an item heading for listings and completion."""
+        return {"name": heading.item_id, "title": heading.title or "", "status": heading.status or ""}
+
     # ==================== USER STORY METHODS ====================
 
     def add_user_story(
@@ -385,14 +406,10 @@ class RoadmapEditor:
             True
         """
         try:
-            # Create backup
-            self._create_backup()
-
-            # Read current roadmap
-            content = self.roadmap_path.read_text()
+            index = self.document.index
 
             # Check if story_id already exists
-            if story_id.upper() in content.upper():
+            if index.get(story_id) is not None or self._find_user_story(index, story_id) is not None:
                 raise ValueError(f"User Story {story_id} already exists")
 
             # Build User Story section
@@ -410,20 +427,16 @@ class RoadmapEditor:
                 assigned_to=assigned_to,
             )
 
-            # Find insertion point in User Story Backlog section
-            lines = content.split("\n")
-            insert_index = self._find_user_story_insertion_point(lines)
-
-            # If no User Story section exists, create it
-            if insert_index == -1:
-                insert_index = self._create_user_story_backlog_section(lines)
-
-            # Insert new User Story
-            lines.insert(insert_index, story_section)
+            # Insert at the end of the User Story Backlog section, creating it if needed
+            backlog = next((h for h in index.headings if "## 📋 USER STORY BACKLOG" in h.text), None)
+            if backlog is not None:
+                insert_at = self._find_user_story_insertion_point(index, backlog)
+                new_lines = [story_section]
+            else:
+                insert_at = self._find_user_story_backlog_point(index)
+                new_lines = USER_STORY_BACKLOG_HEADER + [story_section]
 
-            # Write back atomically
-            new_content = "\n".join(lines)
-            self._atomic_write(new_content)
+            self._insert_lines(insert_at, new_lines, f"Add {story_id}")
 
             logger.info(f"Added {story_id}: {title}")
             return True
@@ -456,55 +469,18 @@ class RoadmapEditor:
             True
         """
         try:
-            # Create backup
-            self._create_backup()
-
-            # Read roadmap
-            content = self.roadmap_path.read_text()
-
             # Find User Story section
-            pattern = rf"### 🎯 \[{re.escape(story_id)}\]"
-            match = re.search(pattern, content, re.IGNORECASE)
+            index = self.document.index
+            heading = self._find_user_story(index, story_id)
 
-            if not match:
+            if heading is None:
                 raise ValueError(f"{story_id} not found in roadmap")
 
-            # Update field based on type
-            field_lower = field.lower()
-
-            if field_lower == "status":
-                content = re.sub(
-                    rf"(\[{re.escape(story_id)}\].*?\n.*?\*\*Status\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
-            elif field_lower == "business_value":
-                content = re.sub(
-                    rf"(\[{re.escape(story_id)}\].*?\n.*?\*\*Business Value\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
-            elif field_lower == "estimated_effort":
-                content = re.sub(
-                    rf"(\[{re.escape(story_id)}\].*?\n.*?\*\*Estimated Effort\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
-            elif field_lower == "assigned_to":
-                content = re.sub(
-                    rf"(\[{re.escape(story_id)}\].*?\n.*?\*\*Assigned To\*\*:) [^\n]+",
-                    rf"\1 {value}",
-                    content,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
-            else:
+            label = USER_STORY_FIELDS.get(field.lower())
+            if label is None:
                 raise ValueError(f"Unsupported field: {field}")
 
-            # Write back atomically
-            self._atomic_write(content)
+            self._update_field(index, heading, label, value)
 
             logger.info(f"Updated {story_id} {field} to {value}")
             return True
@@ -562,17 +538,15 @@ class RoadmapEditor:
             Total: 5
         """
         try:
-            content = self.roadmap_path.read_text()
-
-            # Extract all User Stories
-            # Pattern matches: ### 🎯 [US-XXX] Title
-            pattern = r"### 🎯 \[(US-\d+)\] (.+?)\n.*?\*\*Status\*\*: (.+?)\n"
-            matches = re.findall(pattern, content, re.DOTALL)
+            index = self.document.index
 
+            # Extract all User Stories: ### 🎯 [US-XXX] Title ... **Status**: ...
             stories = []
-            for match in matches:
-                story_id, title, status = match
-                stories.append({"id": story_id, "title": title.strip(), "status": status.strip()})
+            for heading in index.headings:
+                match = _USER_STORY_SUMMARY_HEADER.match(heading.text)
+                status = match and self._section_status(index, heading)
+                if status:
+                    stories.append({"id": match.group(1), "title": match.group(2).strip(), "status": status})
 
             # Count by status
             backlog = len([s for s in stories if "📝 Backlog" in s["status"]])
@@ -617,27 +591,17 @@ class RoadmapEditor:
             >>> print(content[:100])
         """
         try:
-            content = self.roadmap_path.read_text()
-            lines = content.split("\n")
+            index = self.document.index
+            heading = next(
+                (h for h in index.headings if h.text.startswith("###") and f"[{story_id}]" in h.text),
+                None,
+            )
+            if heading is None:
+                return None
 
-            # Find User Story section
-            in_story = False
-            story_lines = []
-
-            for line in lines:
-                # Check if this is the start of our story
-                if f"[{story_id}]" in line and line.startswith("###"):
-                    in_story = True
-                    story_lines.append(line)
-                elif in_story:
-                    # Check if we've hit the next story or section
-                    if line.startswith("###") or line.startswith("##"):
-                        break
-                    story_lines.append(line)
-
-            if story_lines:
-                return "\n".join(story_lines)
-            return None
+            # Section runs until the next story or section heading
+            ends = index.section_ends(lambda h: h.text.startswith("##"), key="roadmap_editor_story")
+            return index.section_text(heading, ends[heading.index])
 
         except Exception as e:
             logger.error(f"Failed to get User Story content: {e}")
@@ -707,124 +671,94 @@ class RoadmapEditor:
 
         return section
 
-    def _find_user_story_insertion_point(self, lines: List[str]) -> int:
+    @staticmethod
+    def _find_user_story(index: RoadmapIndex, story_id: str) -> Optional[RoadmapHeading]:
+        """Find the ### 🎯 [US-XXX] heading of a User Story.
+
+        Args:
+            index: Roadmap index
+            story_id: User Story ID (e.g., "US-001")
+
+        Returns:
+            Heading or None if not found
+        """
+        pattern = re.compile(rf"### 🎯 \[{re.escape(story_id)}\]", re.IGNORECASE)
+        return next((h for h in index.headings if pattern.match(h.text)), None)
+
+    @staticmethod
+    def _find_user_story_insertion_point(index: RoadmapIndex, backlog: RoadmapHeading) -> Optional[int]:
         """Find where to insert new User Story in backlog section.
 
         Args:
-            lines: Roadmap lines
+            index: Roadmap index
+            backlog: User Story Backlog heading
 
         Returns:
-            Line index where User Story should be inserted, or -1 if no backlog section
+            Byte offset of the next ## section, or None to append at the end
         """
-        # Find User Story Backlog section
-        in_backlog = False
-        for i, line in enumerate(lines):
-            if "## 📋 USER STORY BACKLOG" in line:
-                in_backlog = True
-            elif in_backlog and line.startswith("## "):
+        for heading in index.headings[backlog.index + 1 :]:
+            if heading.text.startswith("## "):
                 # Found next section, insert before it
-                return i
-            elif in_backlog and line.startswith("### 🎯"):
-                # Found existing User Story, continue to find end
-                continue
-
-        # If we found backlog but no next section, insert at end
-        if in_backlog:
-            return len(lines)
+                return heading.start
 
-        # No backlog section found
-        return -1
+        # Backlog is the last section: insert at end
+        return None
 
-    def _create_user_story_backlog_section(self, lines: List[str]) -> int:
-        """Create User Story Backlog section if it doesn't exist.
+    @staticmethod
+    def _find_user_story_backlog_point(index: RoadmapIndex) -> Optional[int]:
+        """Find where to create the User Story Backlog section.
 
         Args:
-            lines: Roadmap lines
+            index: Roadmap index
 
         Returns:
-            Line index where section was created
+            Byte offset of the priorities section, or None to append at the end
         """
-        # Find where to insert the section (before PRIORITIES section)
-        for i, line in enumerate(lines):
-            if "## 🎯 PRIORITIES" in line or ("## " in line and "PRIORITY" in line.upper()):
-                # Insert backlog section before priorities
-                backlog_header = [
-                    "",
-                    "---",
-                    "",
-                    "## 📋 USER STORY BACKLOG",
-                    "",
-                    "> **What is this section?**",
-                    "> This is where user needs are captured before being translated into technical priorities.",
-                    "> User Stories help us understand WHAT users need and WHY, before deciding HOW to implement.",
-                    "",
-                    "---",
-                    "",
-                ]
-                lines[i:i] = backlog_header
-                return i + len(backlog_header)
+        # Insert backlog section before priorities
+        for heading in index.headings:
+            if "## 🎯 PRIORITIES" in heading.text or ("## " in heading.text and "PRIORITY" in heading.text.upper()):
+                return heading.start
 
         # If no priorities section, add at end
-        lines.extend(
-            [
-                "",
-                "---",
-                "",
-                "## 📋 USER STORY BACKLOG",
-                "",
-                "> **What is this section?**",
-                "> This is where user needs are captured before being translated into technical priorities.",
-                "> User Stories help us understand WHAT users need and WHY, before deciding HOW to implement.",
-                "",
-                "---",
-                "",
-            ]
-        )
-        return len(lines)
-
-    def _create_backup(self):
-        """Create timestamped backup of roadmap.
-
-        Backups are stored in roadmap_backups/ directory with timestamp.
-        Only the last 10 backups are kept.
-        """
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = self.backup_dir / f"ROADMAP_{timestamp}.md"
-            shutil.copy(self.roadmap_path, backup_path)
+        return None
 
-            logger.info(f"Created backup: {backup_path}")
+    @staticmethod
+    def _section_status(index: RoadmapIndex, heading: RoadmapHeading) -> Optional[str]:
+        """Get the **Status**: value of a section (indexed, else searched in the section).
 
-            # Keep only last 10 backups
-            backups = sorted(self.backup_dir.glob("ROADMAP_*.md"))
-            for old_backup in backups[:-10]:
-                old_backup.unlink()
-                logger.debug(f"Removed old backup: {old_backup}")
+        Args:
+            index: Roadmap index
+            heading: Heading opening the section
 
-        except Exception as e:
-            logger.warning(f"Failed to create backup: {e}")
+        Returns:
+            Status text or None if the section has no status line
+        """
+        if heading.status:
+            return heading.status
+        match = _STATUS_LINE.search(index.section_text(heading) + "\n")
+        return match.group(1).strip() if match else None
 
-    def _validate_priority_number(self, priority_number: str, content: str) -> bool:
+    def _validate_priority_number(self, priority_number: str, index: RoadmapIndex) -> bool:
         """Validate priority number is unique and well-formed.
 
         Args:
             priority_number: Priority number to validate
-            content: Current roadmap content
+            index: Current roadmap index
 
         Returns:
             True if valid, False otherwise
         """
-        # Check if already exists (case insensitive)
-        if priority_number.upper() in content.upper():
-            logger.warning(f"Priority {priority_number} already exists")
-            return False
-
         # Extract and validate number format
         match = re.match(r"PRIORITY (\d+\.?\d*)", priority_number, re.IGNORECASE)
         if not match:
             logger.warning(f"Invalid priority number format: {priority_number}")
             return False
 
+        # Check if already exists (case insensitive)
+        if index.get(priority_number) is not None:
+            logger.warning(f"Priority {priority_number} already exists")
+            return False
+
         return True
 
     def _build_priority_section(
@@ -874,72 +808,80 @@ class RoadmapEditor:
 
         return section
 
-    def _find_insertion_point(self, lines: List[str], priority_number: str) -> int:
+    def _find_insertion_point(self, index: RoadmapIndex, priority_number: str) -> Optional[int]:
         """Find where to insert new priority.
 
-        Priorities should be inserted in numerical order.
+        Priorities should be inserted in numerical order: before the first
+        higher priority, else after the separator following the last lower one.
 
         Args:
-            lines: Roadmap lines
+            index: Roadmap index
             priority_number: New priority number
 
         Returns:
-            Line index where priority should be inserted
+            Byte offset of the line to insert before, or None to append at the end
         """
         # Extract number from priority
         match = re.match(r"PRIORITY (\d+\.?\d*)", priority_number, re.IGNORECASE)
         if not match:
             # Fallback to end of file
-            return len(lines)
+            return None
 
         new_priority_num = float(match.group(1))
 
-        # Find all existing priorities and their line numbers
-        priority_positions = []
-        for i, line in enumerate(lines):
-            if line.startswith("### ") and "PRIORITY" in line.upper():
-                # Extract priority number
-                priority_match = re.search(r"PRIORITY (\d+\.?\d*)", line, re.IGNORECASE)
-                if priority_match:
-                    priority_positions.append((float(priority_match.group(1)), i))
-
-        # Find insertion point based on numerical order
-        insert_line = len(lines)  # Default to end
-        for priority_num, line_idx in priority_positions:
+        # Find the surrounding existing priorities
+        last_lower: Optional[RoadmapHeading] = None
+        for heading in index.headings:
+            if not (heading.text.startswith("### ") and "PRIORITY" in heading.text.upper()):
+                continue
+            priority_match = re.search(r"PRIORITY (\d+\.?\d*)", heading.text, re.IGNORECASE)
+            if not priority_match:
+                continue
+
+            priority_num = float(priority_match.group(1))
             if new_priority_num < priority_num:
                 # Insert before this priority
-                insert_line = line_idx
-                break
-            # If new priority is greater, look for next separator after this priority
+                return heading.start
             elif new_priority_num > priority_num:
-                # Find next --- separator after this priority
-                for j in range(line_idx, len(lines)):
-                    if lines[j].strip() == "---":
-                        insert_line = j + 1
-                        break
+                last_lower = heading
 
-        return insert_line
+        if last_lower is None:
+            return None
 
-    def _atomic_write(self, content: str):
-        """Atomically write content to roadmap file.
+        # Insert after the next --- separator following the last lower priority
+        separator = _SEPARATOR_LINE.search(index.data, last_lower.start)
+        if separator is None or separator.end() >= len(index.data):
+            return None
+        return separator.end() + 1
 
-        Writes to a temporary file first, then renames to ensure atomicity.
+    def _insert_lines(self, offset: Optional[int], new_lines: List[str], description: str) -> None:
+        """Insert lines before the line starting at a byte offset.
 
         Args:
-            content: Content to write
+            offset: Byte offset of a line start, or None to append after the last line
+            new_lines: Lines to insert (may contain newlines)
+            description: Description of the edit for the backup journal
         """
-        temp_path = self.roadmap_path.with_suffix(".tmp")
-        try:
-            # Write to temp file
-            temp_path.write_text(content)
+        text = "\n".join(new_lines).encode("utf-8")
+        if offset is None:
+            end = len(self.document.data)
+            self.document.splice(end, end, b"\n" + text, description)
+        else:
+            self.document.splice(offset, offset, text + b"\n", description)
 
-            # Atomic rename
-            temp_path.replace(self.roadmap_path)
+    def _update_field(self, index: RoadmapIndex, heading: RoadmapHeading, label: str, value: str) -> None:
+        """Replace the value of a **Label**: line in a section.
 
-            logger.debug("Atomically wrote roadmap")
+        Args:
+            index: Roadmap index
+            heading: Heading opening the section
+            label: Field label (e.g., "Status")
+            value: New value
+        """
+        pattern = re.compile(rb"\*\*" + re.escape(label.encode("utf-8")) + rb"\*\*: ([^\n]+)", re.IGNORECASE)
+        match = pattern.search(index.data, heading.start, heading.end)
+        if not match:
+            logger.warning(f"No **{label}** line in {heading.text}")
+            return
 
-        except Exception as e:
-            # Clean up temp file on error
-            if temp_path.exists():
-                temp_path.unlink()
-            raise IOError(f"Failed to write roadmap: {e}")
+        self.document.splice(match.start(1), match.end(1), value.encode("utf-8"), f"{heading.text}: {label}")
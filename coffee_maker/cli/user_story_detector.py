@@ -114,6 +114,10 @@ class UserStoryDetector:
         r"(?i)^(?:Would\s+be\s+nice|It\s+would\s+be\s+good)\s+(?:to\s+have|if\s+we\s+had)\s+(.+)",
     ]
 
+    # Patterns compiled once and shared by all instances
+    _FORMAL_REGEXES = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in FORMAL_PATTERNS]
+    _INFORMAL_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in INFORMAL_PATTERNS]
+
     def __init__(self, ai_service: Optional["AIService"] = None, confidence_threshold: float = 0.70):
         """Initialize user story detector.
 
@@ -238,8 +242,8 @@ class UserStoryDetector:
             >>> result.so_that
             'builds are automated'
         """
-        for pattern in self.FORMAL_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for regex in self._FORMAL_REGEXES:
+            match = regex.search(text)
             if match:
                 groups = match.groupdict()
 
@@ -297,8 +301,8 @@ class UserStoryDetector:
             >>> "email notifications" in result
             True
         """
-        for pattern in self.INFORMAL_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in self._INFORMAL_REGEXES:
+            match = regex.search(text)
             if match:
                 feature = match.group(1).strip()
                 return self._clean_text(feature)
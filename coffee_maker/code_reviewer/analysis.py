@@ -0,0 +1,421 @@
+"""Single-pass AST analysis shared by the review perspectives.
+
+Each file is parsed once and its syntax tree walked once. Every node is sent
+to the rules registered for its type, whatever perspective they belong to.
+While walking, the analyzer tracks real scope: enclosing loops, functions and
+classes, plus the last value assigned to each local name. Rules read that
+context instead of guessing from indentation.
+
+Rules are plain generator functions registered with a decorator:
+
+Example:
+    >>> import ast
+    >>> from coffee_maker.code_reviewer.analysis import AnalysisContext, analyze_source, register_rule
+    >>>
+    >>> @register_rule("bug_hunter", ast.ExceptHandler)
+    ... def bare_except(node: ast.ExceptHandler, ctx: AnalysisContext):
+    ...     if node.type is None:
+    ...         yield ctx.issue(node, "medium", "bug", "Bare except clause", "...", "...")
+    >>>
+    >>> analysis = analyze_source(code, "app.py")
+    >>> analysis.issues["bug_hunter"]
+
+Results are cached by content, so the perspectives reviewing the same file
+share one walk.
+"""
+
+import ast
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from coffee_maker.code_reviewer.models import ReviewIssue
+
+Rule = Callable[[ast.AST, "AnalysisContext"], Optional[Iterable[ReviewIssue]]]
+
+# Analyses kept in memory (one per reviewed file content)
+ANALYSIS_CACHE_SIZE = 256
+
+_LOOP_TYPES = (ast.For, ast.AsyncFor, ast.While)
+
+# Fields never walked: expression contexts and operators are read from their parent node
+_SKIPPED_FIELDS = {"ctx", "op", "ops"}
+_child_fields: Dict[Type[ast.AST], Tuple[str, ...]] = {}
+
+_rules: List[Tuple[str, Tuple[Type[ast.AST], ...], Rule]] = []
+_dispatch: Optional[Dict[Type[ast.AST], List[Tuple[str, Rule]]]] = None
+_rules_lock = threading.Lock()
+
+
+def register_rule(group: str, *node_types: Type[ast.AST]) -> Callable[[Rule], Rule]:
+    """Register a rule called for every node of the given types.
+
+    Rules registered for ast.Module run after the walk, when context counters
+    such as ``ctx.counts`` cover the whole file.
+
+    Args:
+        group: Perspective the rule reports to (e.g. "bug_hunter")
+        *node_types: AST node classes the rule receives
+
+    Returns:
+        Decorator registering the rule function, returned unchanged
+    """
+
+    def decorator(rule: Rule) -> Rule:
+        global _dispatch
+        with _rules_lock:
+            _rules.append((group, node_types, rule))
+            _dispatch = None
+        analyze_source.cache_clear()
+        return rule
+
+    return decorator
+
+
+def _dispatch_table() -> Dict[Type[ast.AST], List[Tuple[str, Rule]]]:
+    """Get the rules by node type (built on first use after a registration)."""
+    global _dispatch
+    with _rules_lock:
+        if _dispatch is None:
+            table: Dict[Type[ast.AST], List[Tuple[str, Rule]]] = defaultdict(list)
+            for group, node_types, rule in _rules:
+                for node_type in node_types:
+                    table[node_type].append((group, rule))
+            _dispatch = dict(table)
+        return _dispatch
+
+
+@dataclass
+class Analysis:
+    """Result of analyzing one file.
+
+    Attributes:
+        issues: Issues found, by rule group
+        line_count: Number of lines in the file
+        syntax_error: Parse error, if the file is not valid Python (no rules ran)
+    """
+
+    issues: Dict[str, List[ReviewIssue]] = field(default_factory=dict)
+    line_count: int = 0
+    syntax_error: Optional[SyntaxError] = None
+
+
+class AnalysisContext:
+    """Walks a syntax tree once, sending nodes to rules with scope context.
+
+    Attributes:
+        file_path: Path of the analyzed file
+        lines: Source lines
+        parents: Ancestors of the current node, outermost first
+        loops: Loops (and comprehensions) enclosing the current node within
+            the current function
+        functions: Enclosing function definitions, outermost first
+        classes: Enclosing class definitions, outermost first
+        counts: Number of nodes seen, by node type
+    """
+
+    def __init__(self, code: str, file_path: str):
+        """Initialize the context.
+
+        Args:
+            code: Source code
+            file_path: Path of the file
+        """
+        self.file_path = file_path
+        self.lines = code.splitlines()
+        self.parents: List[ast.AST] = []
+        self.loops: List[ast.AST] = []
+        self.functions: List[ast.AST] = []
+        self.classes: List[ast.ClassDef] = []
+        self.counts: Counter = Counter()
+        self.issues: Dict[str, List[ReviewIssue]] = defaultdict(list)
+
+        self._scopes: List[Dict[str, Optional[ast.expr]]] = [{}]
+        self._dispatch = _dispatch_table()
+        self._handlers: Dict[Type[ast.AST], Callable[[ast.AST], None]] = {
+            ast.For: self._visit_for,
+            ast.AsyncFor: self._visit_for,
+            ast.While: self._visit_while,
+            ast.ListComp: self._visit_comprehension,
+            ast.SetComp: self._visit_comprehension,
+            ast.DictComp: self._visit_comprehension,
+            ast.GeneratorExp: self._visit_comprehension,
+            ast.FunctionDef: self._visit_function,
+            ast.AsyncFunctionDef: self._visit_function,
+            ast.Lambda: self._visit_function,
+            ast.ClassDef: self._visit_class,
+            ast.Assign: self._visit_assign,
+            ast.AnnAssign: self._visit_assign,
+            ast.With: self._visit_with,
+            ast.AsyncWith: self._visit_with,
+            ast.Import: self._visit_import,
+            ast.ImportFrom: self._visit_import,
+        }
+
+    @property
+    def loop_depth(self) -> int:
+        """Number of for/while statements enclosing the current node in its function."""
+        return sum(isinstance(loop, _LOOP_TYPES) for loop in self.loops)
+
+    def binding(self, name: str) -> Optional[ast.expr]:
+        """Get the value last assigned to a name in the current scope.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Assigned expression, or None if unknown (not assigned, or bound by
+            a loop, import, augmented assignment, ...)
+        """
+        return self._scopes[-1].get(name)
+
+    def snippet(self, node: ast.AST) -> str:
+        """Get the stripped source line of a node.
+
+        Args:
+            node: Node with a line number
+
+        Returns:
+            Source line, or "" if unknown
+        """
+        lineno = getattr(node, "lineno", 0)
+        return self.lines[lineno - 1].strip() if 0 < lineno <= len(self.lines) else ""
+
+    def issue(
+        self,
+        node: ast.AST,
+        severity: str,
+        category: str,
+        title: str,
+        description: str,
+        suggestion: str,
+        code_snippet: Optional[str] = None,
+    ) -> ReviewIssue:
+        """Create an issue located at a node.
+
+        Args:
+            node: Node the issue is about
+            severity: Issue severity
+            category: Issue category
+            title: Issue title
+            description: Issue description
+            suggestion: Suggested fix
+            code_snippet: Snippet (default: the node's source line)
+
+        Returns:
+            ReviewIssue instance
+        """
+        return ReviewIssue(
+            severity=severity,
+            category=category,
+            title=title,
+            description=description,
+            line_number=getattr(node, "lineno", None),
+            code_snippet=self.snippet(node) if code_snippet is None else code_snippet,
+            suggestion=suggestion,
+        )
+
+    def run(self, tree: ast.Module) -> Dict[str, List[ReviewIssue]]:
+        """Walk the tree, then run the whole-file (ast.Module) rules.
+
+        Args:
+            tree: Parsed module
+
+        Returns:
+            Issues by rule group
+        """
+        self._visit_children(tree)
+        for group, rule in self._dispatch.get(ast.Module, ()):
+            self.issues[group].extend(rule(tree, self) or ())
+        return dict(self.issues)
+
+    def _visit(self, node: ast.AST) -> None:
+        """Visit a node: count it, run its rules, then walk its children."""
+        node_type = type(node)
+        self.counts[node_type] += 1
+        rules = self._dispatch.get(node_type)
+        if rules:
+            for group, rule in rules:
+                found = rule(node, self)
+                if found:
+                    self.issues[group].extend(found)
+
+        self.parents.append(node)
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            self._visit_children(node)
+        else:
+            handler(node)
+        self.parents.pop()
+
+    def _visit_children(self, node: ast.AST) -> None:
+        node_type = type(node)
+        fields = _child_fields.get(node_type)
+        if fields is None:
+            fields = _child_fields[node_type] = tuple(f for f in node_type._fields if f not in _SKIPPED_FIELDS)
+
+        visit = self._visit
+        for name in fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                for item in value:
+                    # Lists may hold None (dict unpacking keys) or strings (global names)
+                    if isinstance(item, ast.AST):
+                        visit(item)
+            elif isinstance(value, ast.AST):
+                visit(value)
+
+    def _visit_all(self, nodes: Iterable[Optional[ast.AST]]) -> None:
+        for child in nodes:
+            if child is not None:
+                self._visit(child)
+
+    def _visit_for(self, node: ast.For) -> None:
+        """Visit a for loop: the iterable is evaluated once, the body on every iteration."""
+        self._visit_all([node.target, node.iter])
+        self._unbind(node.target)
+        self.loops.append(node)
+        self._visit_all(node.body)
+        self.loops.pop()
+        self._visit_all(node.orelse)
+
+    def _visit_while(self, node: ast.While) -> None:
+        """Visit a while loop: the test and body run on every iteration."""
+        self.loops.append(node)
+        self._visit_all([node.test, *node.body])
+        self.loops.pop()
+        self._visit_all(node.orelse)
+
+    def _visit_comprehension(self, node: ast.expr) -> None:
+        """Visit a comprehension: only the first iterable is evaluated once."""
+        generators = node.generators
+        self._visit(generators[0].iter)
+        self.loops.append(node)
+        for index, generator in enumerate(generators):
+            if index:
+                self._visit(generator.iter)
+            self._visit_all([generator.target, *generator.ifs])
+        if isinstance(node, ast.DictComp):
+            self._visit_all([node.key, node.value])
+        else:
+            self._visit(node.elt)
+        self.loops.pop()
+
+    def _visit_function(self, node: ast.AST) -> None:
+        """Visit a function: decorators and defaults belong to the enclosing scope."""
+        self._visit_all(getattr(node, "decorator_list", []))
+        self._visit(node.args)
+        self._visit_all([getattr(node, "returns", None)])
+
+        outer_loops, self.loops = self.loops, []
+        self.functions.append(node)
+        self._scopes.append({})
+        self._visit_all(node.body if isinstance(node.body, list) else [node.body])
+        self._scopes.pop()
+        self.functions.pop()
+        self.loops = outer_loops
+
+        if not isinstance(node, ast.Lambda):
+            self._scopes[-1][node.name] = None
+
+    def _visit_class(self, node: ast.ClassDef) -> None:
+        """Visit a class: its body is a scope of its own."""
+        self._visit_all([*node.decorator_list, *node.bases, *node.keywords])
+
+        outer_loops, self.loops = self.loops, []
+        self.classes.append(node)
+        self._scopes.append({})
+        self._visit_all(node.body)
+        self._scopes.pop()
+        self.classes.pop()
+        self.loops = outer_loops
+
+        self._scopes[-1][node.name] = None
+
+    def _visit_assign(self, node: ast.stmt) -> None:
+        """Visit an assignment, then record the values bound to plain names."""
+        self._visit_children(node)
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if isinstance(target, ast.Name):
+                self._scopes[-1][target.id] = node.value
+            else:
+                self._unbind(target)
+
+    def _visit_with(self, node: ast.stmt) -> None:
+        """Visit a with statement; its ``as`` names hold unknown values."""
+        for item in node.items:
+            self._visit(item)
+            if item.optional_vars is not None:
+                self._unbind(item.optional_vars)
+        self._visit_all(node.body)
+
+    def _visit_import(self, node: ast.stmt) -> None:
+        """Visit an import; imported names hold unknown values."""
+        self._visit_children(node)
+        for alias in node.names:
+            self._scopes[-1][(alias.asname or alias.name).split(".")[0]] = None
+
+    def _unbind(self, target: ast.AST) -> None:
+        """Forget values of names bound by a target (e.g. ``for a, b in ...``)."""
+        if isinstance(target, ast.Name):
+            self._scopes[-1][target.id] = None
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for element in target.elts:
+                self._unbind(element)
+        elif isinstance(target, ast.Starred):
+            self._unbind(target.value)
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def analyze_source(code: str, file_path: str) -> Analysis:
+    """Parse and walk a file once with every registered rule.
+
+    Results are cached by (code, file_path): treat them as read-only and copy
+    issues before changing them.
+
+    Args:
+        code: Source code
+        file_path: Path of the file
+
+    Returns:
+        Issues by rule group, or the syntax error if the file does not parse
+    """
+    try:
+        tree = ast.parse(code, filename=file_path)
+    except (SyntaxError, ValueError) as e:
+        error = e if isinstance(e, SyntaxError) else SyntaxError(str(e))
+        return Analysis(line_count=len(code.splitlines()), syntax_error=error)
+
+    ctx = AnalysisContext(code, file_path)
+    return Analysis(issues=ctx.run(tree), line_count=len(ctx.lines))
+
+
+def call_name(node: ast.AST) -> str:
+    """Get the dotted name of a call's function (e.g. "os.path.join").
+
+    Args:
+        node: Call node (or any expression)
+
+    Returns:
+        Dotted name, or "" if the callee is not a plain name/attribute chain
+        (for method calls on other expressions, only the attribute chain is
+        kept, e.g. "db.query(...).filter" gives ".filter")
+    """
+    func = node.func if isinstance(node, ast.Call) else node
+    parts = []
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if isinstance(func, ast.Name):
+        parts.append(func.id)
+    elif parts:
+        parts.append("")
+    return ".".join(reversed(parts))
+
+
+def is_str_constant(node: Optional[ast.AST]) -> bool:
+    """Check whether a node is a string literal."""
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
@@ -130,26 +130,18 @@ class GitIntegration:
         if not staged_files:
             return [], False
 
-        reports = []
-        should_block = False
-
-        for file_path in staged_files:
-            full_path = self.repo_path / file_path
-            if not full_path.exists():
-                continue
-
-            try:
-                report = self.reviewer.review_file(str(full_path))
-                reports.append(report)
+        # Reviewed concurrently; reports are returned in staged order
+        order = {str(self.repo_path / file_path): i for i, file_path in enumerate(staged_files)}
+        reports = list(self.reviewer.iter_reviews(path for path in order if Path(path).exists()))
+        reports.sort(key=lambda report: order[report.file_path])
 
-                # Check if we should block
-                if self.block_on_critical and report.metrics.get("critical", 0) > 0:
-                    should_block = True
-                if self.block_on_high and report.metrics.get("high", 0) > 0:
-                    should_block = True
-
-            except Exception as e:
-                print(f"Error reviewing {file_path}: {e}", file=sys.stderr)
+        should_block = False
+        for report in reports:
+            # Check if we should block
+            if self.block_on_critical and report.metrics.get("critical", 0) > 0:
+                should_block = True
+            if self.block_on_high and report.metrics.get("high", 0) > 0:
+                should_block = True
 
         return reports, should_block
 
@@ -3,9 +3,11 @@
 All specialized perspectives inherit from this base class.
 """
 
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
+from coffee_maker.code_reviewer.analysis import Analysis
 from coffee_maker.code_reviewer.models import ReviewIssue
 
 
@@ -19,8 +21,18 @@ class BasePerspective(ABC):
         - analyze(): Synchronous analysis
         - analyze_async(): Asynchronous analysis
         - get_summary(): Get perspective summary
+
+    Static checks are rules registered for the perspective's ``rule_group``
+    (see coffee_maker.code_reviewer.analysis); every perspective reads them
+    from the same single-pass analysis of a file.
     """
 
+    rule_group: str = ""
+
+    # Pure-Python analysis holds the GIL, so batches of CPU-bound perspectives
+    # are reviewed in worker processes; I/O- or LLM-backed perspectives set False
+    cpu_bound: bool = True
+
     def __init__(self, model_name: str = "", perspective_name: str = ""):
         """Initialize the perspective.
 
@@ -56,6 +68,24 @@ class BasePerspective(ABC):
             List of issues found during analysis
         """
 
+    def analyze_batch(self, files: Sequence[Tuple[str, str]]) -> List[Tuple[List[ReviewIssue], str]]:
+        """Analyze several files in one pass.
+
+        The default analyzes each file in turn. LLM-backed perspectives can
+        override this to review a group of small files in a single request.
+
+        Args:
+            files: (code_content, file_path) pairs
+
+        Returns:
+            (issues, summary) for each file, in order
+        """
+        results = []
+        for code_content, file_path in files:
+            issues = self.analyze(code_content, file_path)
+            results.append((issues, self.get_summary()))
+        return results
+
     def get_summary(self) -> str:
         """Get summary of last analysis.
 
@@ -64,6 +94,20 @@ class BasePerspective(ABC):
         """
         return self.last_analysis_summary
 
+    def _rule_issues(self, analysis: Analysis) -> List[ReviewIssue]:
+        """Get this perspective's issues from a file analysis.
+
+        Args:
+            analysis: Shared analysis of the file
+
+        Returns:
+            Copies of the issues found by this perspective's rules
+        """
+        return [
+            dataclasses.replace(issue, perspective=self.perspective_name)
+            for issue in analysis.issues.get(self.rule_group, [])
+        ]
+
     def _create_issue(
         self,
         severity: str,
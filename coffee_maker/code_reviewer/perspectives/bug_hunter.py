@@ -9,12 +9,97 @@ This perspective focuses on:
 - Exception handling issues
 """
 
-import re
-from typing import List
-
+import ast
+from typing import Iterator, List
+
+from coffee_maker.code_reviewer.analysis import (
+    AnalysisContext,
+    analyze_source,
+    call_name,
+    is_str_constant,
+    register_rule,
+)
 from coffee_maker.code_reviewer.perspectives.base_perspective import BasePerspective
 from coffee_maker.code_reviewer.models import ReviewIssue
 
+RULE_GROUP = "bug_hunter"
+
+# Calls returning numbers, which cannot be concatenated to strings
+_NUMBER_CALLS = {"int", "float", "len", "sum", "abs", "round"}
+
+
+@register_rule(RULE_GROUP, ast.ExceptHandler)
+def check_bare_except(node: ast.ExceptHandler, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag ``except:`` clauses."""
+    if node.type is None:
+        yield ctx.issue(
+            node,
+            severity="medium",
+            category="bug",
+            title="Bare except clause",
+            description="Bare except catches all exceptions including system exits and keyboard interrupts",
+            suggestion="Specify exception type: except Exception: or except ValueError:",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Assign, ast.AnnAssign)
+def check_resource_leak(node: ast.stmt, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag files opened into a variable instead of a with statement."""
+    if isinstance(node.value, ast.Call) and call_name(node.value) in ("open", "io.open", "codecs.open"):
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="bug",
+            title="Potential resource leak",
+            description="File opened without context manager may not be properly closed",
+            suggestion="Use: with open(...) as f: to ensure file is properly closed",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Attribute, ast.Subscript)
+def check_null_dereference(node: ast.expr, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag ``.get(key)`` results used without a None check."""
+    value = node.value
+    if (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Attribute)
+        and value.func.attr == "get"
+        and len(value.args) == 1
+        and not value.keywords
+        and is_str_constant(value.args[0])
+        # "a.get(k).x if a.get(k) else y" and "a.get(k) and a.get(k).x" are guarded
+        and not any(isinstance(parent, (ast.IfExp, ast.BoolOp)) for parent in ctx.parents)
+    ):
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="bug",
+            title="Potential None dereference",
+            description="Calling .get() can return None, which is then dereferenced",
+            suggestion="Add None check or use .get() with default value",
+        )
+
+
+@register_rule(RULE_GROUP, ast.BinOp)
+def check_type_issues(node: ast.BinOp, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag string literals concatenated with numbers."""
+    if not isinstance(node.op, ast.Add):
+        return
+    for text, other in ((node.left, node.right), (node.right, node.left)):
+        number = (isinstance(other, ast.Constant) and type(other.value) in (int, float)) or (
+            isinstance(other, ast.Call) and call_name(other) in _NUMBER_CALLS
+        )
+        if (is_str_constant(text) or isinstance(text, ast.JoinedStr)) and number:
+            yield ctx.issue(
+                node,
+                severity="medium",
+                category="bug",
+                title="Potential type mismatch in concatenation",
+                description="Mixing strings and integers in concatenation may cause TypeError",
+                suggestion="Convert to string: str(value) before concatenation",
+            )
+            return
+
 
 class BugHunter(BasePerspective):
     """Identifies bugs and logical errors in code.
@@ -32,6 +117,8 @@ class BugHunter(BasePerspective):
         >>> print(f"Found {len(issues)} potential bugs")
     """
 
+    rule_group = RULE_GROUP
+
     def __init__(self, model_name: str = "gpt-4-turbo"):
         """Initialize Bug Hunter.
 
@@ -50,20 +137,26 @@ class BugHunter(BasePerspective):
         Returns:
             List of bug issues found
         """
-        issues = []
-
         # Mock analysis - In production, this would call GPT-4 API
-        # For now, we do pattern-based detection
-
-        # Check for common bug patterns
-        issues.extend(self._check_exception_handling(code_content))
-        issues.extend(self._check_resource_leaks(code_content))
-        issues.extend(self._check_null_dereference(code_content))
-        issues.extend(self._check_type_issues(code_content))
+        # For now, we run the rules registered above on the shared AST analysis
+        analysis = analyze_source(code_content, file_path)
+        issues = self._rule_issues(analysis)
+
+        if analysis.syntax_error is not None:
+            error = analysis.syntax_error
+            issues.append(
+                self._create_issue(
+                    severity="critical",
+                    category="bug",
+                    title="Syntax error",
+                    description=f"File does not parse: {error.msg}",
+                    line_number=error.lineno,
+                    code_snippet=(error.text or "").strip() or None,
+                    suggestion="Fix the syntax error; no other check can run on this file",
+                )
+            )
 
-        self.last_analysis_summary = (
-            f"Analyzed {len(code_content.splitlines())} lines, found {len(issues)} potential bugs"
-        )
+        self.last_analysis_summary = f"Analyzed {analysis.line_count} lines, found {len(issues)} potential bugs"
 
         return issues
 
@@ -80,125 +173,3 @@ class BugHunter(BasePerspective):
         # For async, we'd call the API asynchronously
         # For now, just delegate to sync version
         return self.analyze(code_content, file_path)
-
-    def _check_exception_handling(self, code: str) -> List[ReviewIssue]:
-        """Check for bare except clauses and missing exception handling.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of exception handling issues
-        """
-        issues = []
-
-        # Check for bare except
-        bare_except_pattern = r"^\s*except\s*:\s*$"
-        for i, line in enumerate(code.splitlines(), 1):
-            if re.search(bare_except_pattern, line):
-                issues.append(
-                    self._create_issue(
-                        severity="medium",
-                        category="bug",
-                        title="Bare except clause",
-                        description="Bare except catches all exceptions including system exits and keyboard interrupts",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Specify exception type: except Exception: or except ValueError:",
-                    )
-                )
-
-        return issues
-
-    def _check_resource_leaks(self, code: str) -> List[ReviewIssue]:
-        """Check for file opens without context managers.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of resource leak issues
-        """
-        issues = []
-
-        # Check for open() without "with"
-        # Look for: variable = open(...) not preceded by "with"
-        lines = code.splitlines()
-        for i, line in enumerate(lines, 1):
-            if "open(" in line and "with" not in line and "=" in line:
-                # Check if previous lines don't have "with" for this statement
-                if i == 1 or "with" not in lines[i - 2]:
-                    issues.append(
-                        self._create_issue(
-                            severity="high",
-                            category="bug",
-                            title="Potential resource leak",
-                            description="File opened without context manager may not be properly closed",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Use: with open(...) as f: to ensure file is properly closed",
-                        )
-                    )
-
-        return issues
-
-    def _check_null_dereference(self, code: str) -> List[ReviewIssue]:
-        """Check for potential None dereference.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of null dereference issues
-        """
-        issues = []
-
-        # Check for .get() followed by attribute access without None check
-        # This is a simplified check - real implementation would use AST
-        get_pattern = r'\.get\(["\'][\w]+["\']\)(\.|\[)'
-        for i, line in enumerate(code.splitlines(), 1):
-            if re.search(get_pattern, line) and "if" not in line and "or {}" not in line:
-                issues.append(
-                    self._create_issue(
-                        severity="high",
-                        category="bug",
-                        title="Potential None dereference",
-                        description="Calling .get() can return None, which is then dereferenced",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Add None check or use .get() with default value",
-                    )
-                )
-
-        return issues
-
-    def _check_type_issues(self, code: str) -> List[ReviewIssue]:
-        """Check for potential type-related issues.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of type-related issues
-        """
-        issues = []
-
-        # Check for string concatenation with non-strings
-        for i, line in enumerate(code.splitlines(), 1):
-            # Look for + operator with mixed types
-            if "+" in line and "str(" not in line:
-                # Simplified check - would need AST for accuracy
-                if '"' in line and "int(" in line:
-                    issues.append(
-                        self._create_issue(
-                            severity="medium",
-                            category="bug",
-                            title="Potential type mismatch in concatenation",
-                            description="Mixing strings and integers in concatenation may cause TypeError",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Convert to string: str(value) before concatenation",
-                        )
-                    )
-
-        return issues
@@ -9,12 +9,148 @@ This perspective focuses on:
 - I/O bottlenecks
 """
 
-import re
-from typing import List
-
+import ast
+from typing import Iterator, List
+
+from coffee_maker.code_reviewer.analysis import (
+    AnalysisContext,
+    analyze_source,
+    call_name,
+    is_str_constant,
+    register_rule,
+)
 from coffee_maker.code_reviewer.perspectives.base_perspective import BasePerspective
 from coffee_maker.code_reviewer.models import ReviewIssue
 
+RULE_GROUP = "performance_analyst"
+
+# Loop nesting depth reported as a complexity issue
+MAX_LOOP_DEPTH = 2
+
+# Methods running a database query (ORM or DB-API)
+_QUERY_METHODS = {"query", "filter", "filter_by", "execute", "executemany", "raw"}
+
+
+def _is_list(node: ast.AST) -> bool:
+    """Check whether an expression builds a new list."""
+    return isinstance(node, (ast.List, ast.ListComp)) or (isinstance(node, ast.Call) and call_name(node) == "list")
+
+
+def _is_text(node: ast.AST, ctx: AnalysisContext, follow: bool = True) -> bool:
+    """Check whether an expression is a string (literal, f-string, str() call, or a variable holding one)."""
+    if is_str_constant(node) or isinstance(node, ast.JoinedStr):
+        return True
+    if isinstance(node, ast.Call):
+        name = call_name(node)
+        return name in ("str", "repr") or (name in (".format", ".join") and is_str_constant(node.func.value))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mod)):
+        return _is_text(node.left, ctx, follow)
+    if follow and isinstance(node, ast.Name):
+        value = ctx.binding(node.id)
+        return value is not None and _is_text(value, ctx, follow=False)
+    return False
+
+
+@register_rule(RULE_GROUP, ast.For, ast.AsyncFor, ast.While)
+def check_nested_loops(node: ast.stmt, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag loops nested more than MAX_LOOP_DEPTH deep in one function."""
+    depth = ctx.loop_depth + 1
+    if depth > MAX_LOOP_DEPTH:
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="performance",
+            title="Deep loop nesting detected",
+            description=f"Loop nesting depth of {depth} may cause O(n^{depth}) complexity",
+            suggestion="Consider algorithmic optimization or caching to reduce complexity",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Assign, ast.AugAssign)
+def check_concatenation_in_loop(node: ast.stmt, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag strings built with += and lists rebuilt with x = x + [...] inside loops."""
+    if not ctx.loop_depth:
+        return
+
+    if isinstance(node, ast.AugAssign):
+        target, added = node.target, node.value
+        if not isinstance(node.op, ast.Add):
+            return
+    elif (
+        len(node.targets) == 1
+        and isinstance(node.value, ast.BinOp)
+        and isinstance(node.value.op, ast.Add)
+        and isinstance(node.value.left, ast.Name)
+        and isinstance(node.targets[0], ast.Name)
+        and node.value.left.id == node.targets[0].id
+    ):
+        target, added = node.targets[0], node.value.right
+        if _is_list(added):
+            # x = x + [...] copies the whole list on every iteration (x += [...] extends in place)
+            yield ctx.issue(
+                node,
+                severity="medium",
+                category="performance",
+                title="List concatenation in loop",
+                description="Using x = x + [...] to concatenate lists in a loop is O(n²). Each concatenation creates a new list",
+                suggestion="Use list.append(), list.extend() or a list comprehension instead",
+            )
+            return
+    else:
+        return
+
+    if _is_text(added, ctx) or (isinstance(target, ast.Name) and _is_text(target, ctx)):
+        yield ctx.issue(
+            node,
+            severity="medium",
+            category="performance",
+            title="String concatenation in loop",
+            description="String concatenation with += in loop is inefficient. Strings are immutable",
+            suggestion="Use list.append() and ''.join() at the end, or use io.StringIO",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Compare)
+def check_list_membership(node: ast.Compare, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag membership tests against lists."""
+    for op, comparator in zip(node.ops, node.comparators):
+        if isinstance(op, (ast.In, ast.NotIn)) and _is_list(comparator):
+            yield ctx.issue(
+                node,
+                severity="low",
+                category="performance",
+                title="List membership testing",
+                description="Membership testing in list is O(n). Use set for O(1) lookups",
+                suggestion="Use a set literal or a set built once: if item in {a, b}:",
+            )
+            return
+
+
+@register_rule(RULE_GROUP, ast.Call)
+def check_query_in_loop(node: ast.Call, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag database queries run on every iteration of a loop or comprehension (N+1)."""
+    if not ctx.loops or not isinstance(node.func, ast.Attribute) or node.func.attr not in _QUERY_METHODS:
+        return
+
+    # Report a query chain such as db.query(...).filter(...) once, at its first call
+    receiver = node.func.value
+    while isinstance(receiver, (ast.Call, ast.Attribute)):
+        if isinstance(receiver, ast.Call):
+            if isinstance(receiver.func, ast.Attribute) and receiver.func.attr in _QUERY_METHODS:
+                return
+            receiver = receiver.func
+        else:
+            receiver = receiver.value
+
+    yield ctx.issue(
+        node,
+        severity="critical",
+        category="performance",
+        title="Database query in loop (N+1 problem)",
+        description="Executing queries in a loop causes N+1 query problem. This can severely impact performance",
+        suggestion="Use eager loading, batch queries, or prefetch data before the loop",
+    )
+
 
 class PerformanceAnalyst(BasePerspective):
     """Analyzes code for performance issues and optimization opportunities.
@@ -32,6 +168,8 @@ class PerformanceAnalyst(BasePerspective):
         >>> perf_issues = [i for i in issues if i.category == "performance"]
     """
 
+    rule_group = RULE_GROUP
+
     def __init__(self, model_name: str = "gemini-pro"):
         """Initialize Performance Analyst.
 
@@ -50,17 +188,11 @@ class PerformanceAnalyst(BasePerspective):
         Returns:
             List of performance issues found
         """
-        issues = []
-
         # Mock analysis - In production, this would call Gemini API
-        issues.extend(self._check_nested_loops(code_content))
-        issues.extend(self._check_list_operations(code_content))
-        issues.extend(self._check_string_concatenation(code_content))
-        issues.extend(self._check_database_queries(code_content))
+        analysis = analyze_source(code_content, file_path)
+        issues = self._rule_issues(analysis)
 
-        self.last_analysis_summary = (
-            f"Analyzed {len(code_content.splitlines())} lines, found {len(issues)} performance concerns"
-        )
+        self.last_analysis_summary = f"Analyzed {analysis.line_count} lines, found {len(issues)} performance concerns"
 
         return issues
 
@@ -75,180 +207,3 @@ class PerformanceAnalyst(BasePerspective):
             List of performance issues found
         """
         return self.analyze(code_content, file_path)
-
-    def _check_nested_loops(self, code: str) -> List[ReviewIssue]:
-        """Check for nested loops that may cause O(n²) or worse complexity.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of nested loop issues
-        """
-        issues = []
-
-        lines = code.splitlines()
-        loop_depth = 0
-        loop_stack = []
-
-        for i, line in enumerate(lines, 1):
-            indent = len(line) - len(line.lstrip())
-
-            # Detect loop start
-            if re.search(r"^\s*for\s+", line) or re.search(r"^\s*while\s+", line):
-                loop_depth += 1
-                loop_stack.append((i, indent, line.strip()))
-
-                # Flag if nesting is deep
-                if loop_depth >= 3:
-                    issues.append(
-                        self._create_issue(
-                            severity="high",
-                            category="performance",
-                            title="Deep loop nesting detected",
-                            description=f"Loop nesting depth of {loop_depth} may cause O(n^{loop_depth}) complexity",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Consider algorithmic optimization or caching to reduce complexity",
-                        )
-                    )
-
-            # Detect when we exit a loop (indent decreases)
-            if loop_stack and indent <= loop_stack[-1][1] and line.strip():
-                loop_stack.pop()
-                loop_depth = max(0, loop_depth - 1)
-
-        return issues
-
-    def _check_list_operations(self, code: str) -> List[ReviewIssue]:
-        """Check for inefficient list operations.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of list operation issues
-        """
-        issues = []
-
-        # Check for list concatenation in loops
-        lines = code.splitlines()
-        in_loop = False
-
-        for i, line in enumerate(lines, 1):
-            if re.search(r"^\s*for\s+", line):
-                in_loop = True
-
-            # Check for += with lists in loop
-            if in_loop and "+=" in line and ("[" in line or "list" in line.lower()):
-                issues.append(
-                    self._create_issue(
-                        severity="medium",
-                        category="performance",
-                        title="List concatenation in loop",
-                        description="Using += to concatenate lists in a loop is O(n²). Each concatenation creates a new list",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Use list.append() or list comprehension instead",
-                    )
-                )
-
-            # Check for membership testing in list (should use set)
-            if "in [" in line or "not in [" in line:
-                issues.append(
-                    self._create_issue(
-                        severity="low",
-                        category="performance",
-                        title="List membership testing",
-                        description="Membership testing in list is O(n). Use set for O(1) lookups",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Convert to set: if item in set(items):",
-                    )
-                )
-
-            # Reset loop flag when we exit
-            if in_loop and line and not line[0].isspace():
-                in_loop = False
-
-        return issues
-
-    def _check_string_concatenation(self, code: str) -> List[ReviewIssue]:
-        """Check for inefficient string concatenation.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of string concatenation issues
-        """
-        issues = []
-
-        lines = code.splitlines()
-        in_loop = False
-
-        for i, line in enumerate(lines, 1):
-            if re.search(r"^\s*for\s+", line):
-                in_loop = True
-
-            # Check for string concatenation in loop
-            if in_loop and "+=" in line and ('"' in line or "'" in line):
-                issues.append(
-                    self._create_issue(
-                        severity="medium",
-                        category="performance",
-                        title="String concatenation in loop",
-                        description="String concatenation with += in loop is inefficient. Strings are immutable",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Use list.append() and ''.join() at the end, or use io.StringIO",
-                    )
-                )
-
-            if in_loop and line and not line[0].isspace():
-                in_loop = False
-
-        return issues
-
-    def _check_database_queries(self, code: str) -> List[ReviewIssue]:
-        """Check for N+1 query problems and missing eager loading.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of database query issues
-        """
-        issues = []
-
-        lines = code.splitlines()
-        in_loop = False
-
-        for i, line in enumerate(lines, 1):
-            if re.search(r"^\s*for\s+", line):
-                in_loop = True
-
-            # Check for database queries in loop
-            if in_loop and (
-                ".query(" in line
-                or ".filter(" in line
-                or ".get(" in line
-                or "SELECT" in line.upper()
-                or "execute(" in line
-            ):
-                issues.append(
-                    self._create_issue(
-                        severity="critical",
-                        category="performance",
-                        title="Database query in loop (N+1 problem)",
-                        description="Executing queries in a loop causes N+1 query problem. This can severely impact performance",
-                        line_number=i,
-                        code_snippet=line.strip(),
-                        suggestion="Use eager loading, batch queries, or prefetch data before the loop",
-                    )
-                )
-
-            if in_loop and line and not line[0].isspace():
-                in_loop = False
-
-        return issues
@@ -9,12 +9,205 @@ This perspective focuses on:
 - Command injection
 """
 
-import re
-from typing import List
-
+import ast
+from typing import Iterator, List, Optional
+
+from coffee_maker.code_reviewer.analysis import (
+    AnalysisContext,
+    analyze_source,
+    call_name,
+    is_str_constant,
+    register_rule,
+)
 from coffee_maker.code_reviewer.perspectives.base_perspective import BasePerspective
 from coffee_maker.code_reviewer.models import ReviewIssue
 
+RULE_GROUP = "security_auditor"
+
+_SQL_METHODS = {"execute", "executemany", "executescript"}
+
+# Objects whose attributes carry user input (request.args, form.get(...), ...)
+_USER_INPUT_OBJECTS = {"request", "args", "form", "data", "params"}
+
+# Endings of secret variable names, most specific first. Names of settings about a
+# secret (TOKEN_ENV_VAR = "GITHUB_TOKEN", TOKENS_ONLY = "...") do not end with one.
+_SECRET_NAMES = [
+    ("aws_secret_access_key", "Hardcoded AWS secret"),
+    ("private_key", "Hardcoded private key"),
+    ("secret_key", "Hardcoded secret"),
+    ("api_key", "Hardcoded API key"),
+    ("password", "Hardcoded password"),
+    ("secret", "Hardcoded secret"),
+    ("token", "Hardcoded token"),
+]
+
+_RANDOM_FUNCTIONS = {"random.random", "random.randint", "random.choice", "random.choices", "random.randrange"}
+_SECURITY_CONTEXTS = ["token", "password", "secret", "key", "salt", "nonce", "session"]
+
+_PATH_FUNCTIONS = {"open", "Path", "pathlib.Path", "os.path.join"}
+_PATH_SANITIZERS = {"realpath", "abspath", "normpath", "resolve", "secure_filename"}
+
+
+def _dynamic_sql(node: ast.AST, ctx: AnalysisContext, follow: bool = True) -> Optional[str]:
+    """Describe how a query string is built from values, or None if it is a constant."""
+    if isinstance(node, ast.JoinedStr) and any(isinstance(value, ast.FormattedValue) for value in node.values):
+        return "F-string in SQL query"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mod) and is_str_constant(node.left):
+        return "String formatting in SQL"
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return "String concatenation in SQL"
+    if isinstance(node, ast.Call) and call_name(node) == ".format" and is_str_constant(node.func.value):
+        return ".format() in SQL query"
+    if follow and isinstance(node, ast.Name):
+        value = ctx.binding(node.id)
+        return _dynamic_sql(value, ctx, follow=False) if value is not None else None
+    return None
+
+
+def _uses_user_input(call: ast.Call) -> bool:
+    """Check whether a call's arguments read user input."""
+    for argument in [*call.args, *(keyword.value for keyword in call.keywords)]:
+        for node in ast.walk(argument):
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                if node.value.id in _USER_INPUT_OBJECTS:
+                    return True
+            elif isinstance(node, ast.Call) and call_name(node) == "input":
+                return True
+    return False
+
+
+def _has_keyword(call: ast.Call, name: str) -> bool:
+    """Check whether a call passes name=True."""
+    return any(
+        keyword.arg == name and isinstance(keyword.value, ast.Constant) and keyword.value.value is True
+        for keyword in call.keywords
+    )
+
+
+@register_rule(RULE_GROUP, ast.Call)
+def check_sql_injection(node: ast.Call, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag queries built by string interpolation, passed directly or through a variable."""
+    if not node.args or not isinstance(node.func, ast.Attribute) or node.func.attr not in _SQL_METHODS:
+        return
+
+    description = _dynamic_sql(node.args[0], ctx)
+    if description:
+        yield ctx.issue(
+            node,
+            severity="critical",
+            category="security",
+            title="SQL Injection vulnerability",
+            description=f"{description} - Direct string interpolation can lead to SQL injection",
+            suggestion="Use parameterized queries: execute(query, (param1, param2))",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Call)
+def check_command_injection(node: ast.Call, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag shell command execution, critical when user input reaches it."""
+    name = call_name(node)
+    runs_shell = name in ("os.system", "os.popen") or (name.startswith("subprocess.") and _has_keyword(node, "shell"))
+    if not runs_shell:
+        return
+
+    if _uses_user_input(node):
+        yield ctx.issue(
+            node,
+            severity="critical",
+            category="security",
+            title="Command Injection vulnerability",
+            description="Executing shell commands with user input can lead to command injection",
+            suggestion="Use subprocess with list arguments and shell=False, or sanitize input",
+        )
+    else:
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="security",
+            title="Shell execution enabled",
+            description="shell=True allows shell injection if input is not properly sanitized",
+            suggestion="Use shell=False and pass command as list",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Assign, ast.AnnAssign, ast.keyword)
+def check_hardcoded_secrets(node: ast.AST, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag string literals assigned to (or passed as) secret-named variables."""
+    if isinstance(node, ast.keyword):
+        names, value, located = [node.arg or ""], node.value, ctx.parents[-1]
+    else:
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        names = [target.id if isinstance(target, ast.Name) else getattr(target, "attr", "") for target in targets]
+        value, located = node.value, node
+    if not is_str_constant(value) or not value.value:
+        return
+
+    for name in names:
+        lowered = name.lower()
+        description = next((text for secret, text in _SECRET_NAMES if lowered.endswith(secret)), None)
+        if description:
+            yield ctx.issue(
+                located,
+                severity="critical",
+                category="security",
+                title="Hardcoded secret detected",
+                description=f"{description} - Secrets should never be hardcoded in source code",
+                suggestion="Use environment variables, secret management services, or config files",
+                code_snippet=ctx.snippet(located)[:50] + "...",  # Truncate to avoid exposing secret
+            )
+            return
+
+
+@register_rule(RULE_GROUP, ast.Call)
+def check_insecure_random(node: ast.Call, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag the random module used to produce tokens, passwords, keys, ..."""
+    if call_name(node) not in _RANDOM_FUNCTIONS:
+        return
+
+    # What the value is used for: the assigned names, the keyword or the enclosing function
+    context = [function.name for function in ctx.functions if hasattr(function, "name")]
+    for parent in reversed(ctx.parents):
+        if isinstance(parent, ast.keyword) and parent.arg:
+            context.append(parent.arg)
+        elif isinstance(parent, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = parent.targets if isinstance(parent, ast.Assign) else [parent.target]
+            context.extend(ast.unparse(target) for target in targets)
+        if isinstance(parent, ast.stmt):
+            break
+
+    text = " ".join(context).lower()
+    if any(word in text for word in _SECURITY_CONTEXTS):
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="security",
+            title="Insecure random number generation",
+            description="random module is not cryptographically secure and should not be used for security purposes",
+            suggestion="Use secrets module: secrets.token_bytes(), secrets.token_hex(), or secrets.choice()",
+        )
+
+
+@register_rule(RULE_GROUP, ast.Call)
+def check_path_traversal(node: ast.Call, ctx: AnalysisContext) -> Iterator[ReviewIssue]:
+    """Flag files opened from unsanitized user input."""
+    if call_name(node) not in _PATH_FUNCTIONS or not _uses_user_input(node):
+        return
+
+    sanitized = any(
+        isinstance(sub, ast.Call) and call_name(sub).rsplit(".", 1)[-1] in _PATH_SANITIZERS
+        for argument in node.args
+        for sub in ast.walk(argument)
+    )
+    if not sanitized:
+        yield ctx.issue(
+            node,
+            severity="high",
+            category="security",
+            title="Path traversal vulnerability",
+            description="File operations with unsanitized user input can lead to path traversal attacks",
+            suggestion="Validate and sanitize file paths, use os.path.realpath() to resolve paths",
+        )
+
 
 class SecurityAuditor(BasePerspective):
     """Audits code for security vulnerabilities and weaknesses.
@@ -32,6 +225,8 @@ class SecurityAuditor(BasePerspective):
         >>> critical_sec_issues = [i for i in issues if i.severity == "critical"]
     """
 
+    rule_group = RULE_GROUP
+
     def __init__(self, model_name: str = "security-specialized"):
         """Initialize Security Auditor.
 
@@ -50,18 +245,11 @@ class SecurityAuditor(BasePerspective):
         Returns:
             List of security issues found
         """
-        issues = []
-
         # Mock analysis - In production, this would use specialized security tools
-        issues.extend(self._check_sql_injection(code_content))
-        issues.extend(self._check_command_injection(code_content))
-        issues.extend(self._check_hardcoded_secrets(code_content))
-        issues.extend(self._check_insecure_random(code_content))
-        issues.extend(self._check_path_traversal(code_content))
-
-        self.last_analysis_summary = (
-            f"Analyzed {len(code_content.splitlines())} lines, found {len(issues)} security concerns"
-        )
+        analysis = analyze_source(code_content, file_path)
+        issues = self._rule_issues(analysis)
+
+        self.last_analysis_summary = f"Analyzed {analysis.line_count} lines, found {len(issues)} security concerns"
 
         return issues
 
@@ -76,206 +264,3 @@ class SecurityAuditor(BasePerspective):
             List of security issues found
         """
         return self.analyze(code_content, file_path)
-
-    def _check_sql_injection(self, code: str) -> List[ReviewIssue]:
-        """Check for SQL injection vulnerabilities.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of SQL injection issues
-        """
-        issues = []
-
-        # Check for string formatting in SQL queries
-        sql_patterns = [
-            (r'execute\(["\'].*%s.*["\'].*%', "String formatting in SQL"),
-            (r'execute\(f["\'].*\{.*\}.*["\']', "F-string in SQL query"),
-            (r'execute\(["\'].*\+.*["\']', "String concatenation in SQL"),
-            (r"cursor\.execute\(.*\.format\(", ".format() in SQL query"),
-        ]
-
-        for i, line in enumerate(code.splitlines(), 1):
-            for pattern, description in sql_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(
-                        self._create_issue(
-                            severity="critical",
-                            category="security",
-                            title="SQL Injection vulnerability",
-                            description=f"{description} - Direct string interpolation can lead to SQL injection",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Use parameterized queries: execute(query, (param1, param2))",
-                        )
-                    )
-
-        return issues
-
-    def _check_command_injection(self, code: str) -> List[ReviewIssue]:
-        """Check for command injection vulnerabilities.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of command injection issues
-        """
-        issues = []
-
-        # Check for shell=True or string-based subprocess calls
-        for i, line in enumerate(code.splitlines(), 1):
-            if "subprocess" in line or "os.system" in line or "os.popen" in line:
-                if "shell=True" in line or "os.system(" in line or "os.popen(" in line:
-                    # Check if user input is involved
-                    if any(
-                        keyword in line
-                        for keyword in [
-                            "input(",
-                            "request.",
-                            "args.",
-                            "form.",
-                            "data.",
-                            "params.",
-                        ]
-                    ):
-                        issues.append(
-                            self._create_issue(
-                                severity="critical",
-                                category="security",
-                                title="Command Injection vulnerability",
-                                description="Executing shell commands with user input can lead to command injection",
-                                line_number=i,
-                                code_snippet=line.strip(),
-                                suggestion="Use subprocess with list arguments and shell=False, or sanitize input",
-                            )
-                        )
-                    elif "shell=True" in line:
-                        issues.append(
-                            self._create_issue(
-                                severity="high",
-                                category="security",
-                                title="Shell execution enabled",
-                                description="shell=True allows shell injection if input is not properly sanitized",
-                                line_number=i,
-                                code_snippet=line.strip(),
-                                suggestion="Use shell=False and pass command as list",
-                            )
-                        )
-
-        return issues
-
-    def _check_hardcoded_secrets(self, code: str) -> List[ReviewIssue]:
-        """Check for hardcoded passwords, API keys, and secrets.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of hardcoded secret issues
-        """
-        issues = []
-
-        # Patterns for common secrets
-        secret_patterns = [
-            (r'password\s*=\s*["\'][^"\']+["\']', "Hardcoded password"),
-            (r'api_key\s*=\s*["\'][^"\']+["\']', "Hardcoded API key"),
-            (r'secret\s*=\s*["\'][^"\']+["\']', "Hardcoded secret"),
-            (r'token\s*=\s*["\'][^"\']+["\']', "Hardcoded token"),
-            (r'aws_secret_access_key\s*=\s*["\']', "Hardcoded AWS secret"),
-            (r'private_key\s*=\s*["\']', "Hardcoded private key"),
-        ]
-
-        for i, line in enumerate(code.splitlines(), 1):
-            # Skip comments and empty values
-            if line.strip().startswith("#") or '""' in line or "''" in line:
-                continue
-
-            for pattern, description in secret_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(
-                        self._create_issue(
-                            severity="critical",
-                            category="security",
-                            title="Hardcoded secret detected",
-                            description=f"{description} - Secrets should never be hardcoded in source code",
-                            line_number=i,
-                            code_snippet=line.strip()[:50] + "...",  # Truncate to avoid exposing secret
-                            suggestion="Use environment variables, secret management services, or config files",
-                        )
-                    )
-
-        return issues
-
-    def _check_insecure_random(self, code: str) -> List[ReviewIssue]:
-        """Check for insecure random number generation.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of insecure random issues
-        """
-        issues = []
-
-        # Check for random.random() used in security contexts
-        security_contexts = ["token", "password", "secret", "key", "salt", "nonce", "session"]
-
-        lines = code.splitlines()
-        for i, line in enumerate(lines, 1):
-            if "random.random()" in line or "random.randint(" in line or "random.choice(" in line:
-                # Check surrounding context
-                context = " ".join(lines[max(0, i - 3) : min(len(lines), i + 2)])
-
-                if any(ctx in context.lower() for ctx in security_contexts):
-                    issues.append(
-                        self._create_issue(
-                            severity="high",
-                            category="security",
-                            title="Insecure random number generation",
-                            description="random module is not cryptographically secure and should not be used for security purposes",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Use secrets module: secrets.token_bytes(), secrets.token_hex(), or secrets.choice()",
-                        )
-                    )
-
-        return issues
-
-    def _check_path_traversal(self, code: str) -> List[ReviewIssue]:
-        """Check for path traversal vulnerabilities.
-
-        Args:
-            code: Code to analyze
-
-        Returns:
-            List of path traversal issues
-        """
-        issues = []
-
-        # Check for file operations with user input
-        file_operations = ["open(", "Path(", "os.path.join(", "pathlib.Path("]
-        user_input_indicators = ["request.", "args.", "form.", "data.", "params.", "input("]
-
-        for i, line in enumerate(code.splitlines(), 1):
-            # Check if line has file operation
-            has_file_op = any(op in line for op in file_operations)
-            has_user_input = any(ui in line for ui in user_input_indicators)
-
-            if has_file_op and has_user_input:
-                # Check if there's path validation
-                if "realpath" not in line and "abspath" not in line and "normpath" not in line:
-                    issues.append(
-                        self._create_issue(
-                            severity="high",
-                            category="security",
-                            title="Path traversal vulnerability",
-                            description="File operations with unsanitized user input can lead to path traversal attacks",
-                            line_number=i,
-                            code_snippet=line.strip(),
-                            suggestion="Validate and sanitize file paths, use os.path.realpath() to resolve paths",
-                        )
-                    )
-
-        return issues
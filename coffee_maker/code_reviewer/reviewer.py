@@ -2,14 +2,24 @@
 
 This module coordinates multiple specialized code review agents to provide
 comprehensive code analysis from different perspectives.
+
+Many files are reviewed with ``iter_reviews``: small files are grouped into
+batches that each perspective analyzes in one pass, batches run in a bounded
+worker pool, files whose content was already reviewed are not analyzed again,
+and reports are yielded as soon as their batch finishes.
 """
 
 import asyncio
+import copy
+import dataclasses
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from coffee_maker.code_reviewer.models import ReviewReport
+from coffee_maker.code_reviewer.models import ReviewIssue, ReviewReport
 from coffee_maker.code_reviewer.perspectives import (
     ArchitectCritic,
     BasePerspective,
@@ -18,6 +28,42 @@ from coffee_maker.code_reviewer.perspectives import (
     SecurityAuditor,
 )
 
+# Small files are grouped into batches of up to this many lines
+DEFAULT_BATCH_LINES = 400
+
+# Issues and per-perspective summaries found in one file's content
+FileResult = Tuple[List[ReviewIssue], Dict[str, str]]
+
+
+def _analyze_batch(perspectives: Dict[str, BasePerspective], files: Sequence[Tuple[str, str]]) -> List[FileResult]:
+    """Run every perspective over a batch of files (executed in a pool worker).
+
+    Args:
+        perspectives: Perspectives by name
+        files: (code_content, file_path) pairs
+
+    Returns:
+        (issues, summaries by perspective) for each file, in order
+    """
+    results: List[FileResult] = [([], {}) for _ in files]
+    for name, perspective in perspectives.items():
+        # Each batch gets its own copy: perspectives keep per-analysis state
+        perspective = copy.copy(perspective)
+        try:
+            outcomes = perspective.analyze_batch(files)
+        except Exception as e:
+            # Log error but continue with other perspectives
+            print(f"Error in {name}: {e}")
+            continue
+
+        for (issues, summaries), (found, summary) in zip(results, outcomes):
+            for issue in found:
+                issue.perspective = name
+            issues.extend(found)
+            summaries[name] = summary
+
+    return results
+
 
 class MultiModelCodeReviewer:
     """Orchestrates multi-perspective code review using different LLMs.
@@ -63,6 +109,9 @@ class MultiModelCodeReviewer:
         if "security_auditor" in self.enabled_perspectives:
             self.perspectives["security_auditor"] = SecurityAuditor()
 
+        # Results of reviewed file contents, by content hash
+        self._reviewed: Dict[str, FileResult] = {}
+
     def review_file(self, file_path: str) -> ReviewReport:
         """Review a single file with all enabled perspectives.
 
@@ -169,15 +218,135 @@ class MultiModelCodeReviewer:
         except Exception as e:
             print(f"Error in {name}: {e}")
 
-    def review_directory(self, directory_path: str, file_pattern: str = "*.py") -> List[ReviewReport]:
+    def iter_reviews(
+        self,
+        file_paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        batch_lines: int = DEFAULT_BATCH_LINES,
+        use_processes: Optional[bool] = None,
+    ) -> Iterator[ReviewReport]:
+        """Review many files concurrently, yielding reports as they finish.
+
+        Files are grouped into batches of up to batch_lines lines (a larger
+        file forms its own batch) and each perspective analyzes a batch in one
+        pass. Files whose content was already reviewed by this reviewer, or
+        that duplicate another file of the run, are not analyzed again.
+
+        Args:
+            file_paths: Paths of files to review
+            max_workers: Maximum concurrent batches (default: CPU count)
+            batch_lines: Line budget of a batch of small files
+            use_processes: Run batches in worker processes (perspectives must be
+                picklable) or threads. Default: processes when there are several
+                batches and every perspective is cpu_bound, threads otherwise
+
+        Yields:
+            One review report per readable file, in completion order
+
+        Example:
+            >>> reviewer = MultiModelCodeReviewer()
+            >>> for report in reviewer.iter_reviews(["app.py", "models.py"]):
+            ...     print(report.summary)
+        """
+        pending: Dict[str, List[str]] = {}  # content hash -> paths waiting for it
+        batches: List[List[Tuple[str, str, str]]] = []
+        batch: List[Tuple[str, str, str]] = []
+        batch_size = 0
+
+        for file_path in file_paths:
+            try:
+                code_content = Path(file_path).read_text()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Error reviewing {file_path}: {e}")
+                continue
+
+            digest = hashlib.sha256(code_content.encode("utf-8")).hexdigest()
+            if digest in self._reviewed:
+                yield self._build_report(file_path, self._reviewed[digest])
+                continue
+            if digest in pending:
+                pending[digest].append(file_path)
+                continue
+            pending[digest] = [file_path]
+
+            lines = code_content.count("\n") + 1
+            if batch and batch_size + lines > batch_lines:
+                batches.append(batch)
+                batch, batch_size = [], 0
+            batch.append((digest, code_content, file_path))
+            batch_size += lines
+
+        if batch:
+            batches.append(batch)
+        if not batches:
+            return
+
+        if use_processes is None:
+            use_processes = len(batches) > 1 and all(p.cpu_bound for p in self.perspectives.values())
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        executor = executor_class(max_workers=min(max_workers or os.cpu_count() or 1, len(batches)))
+        try:
+            futures = {
+                executor.submit(
+                    _analyze_batch, self.perspectives, [(content, path) for _, content, path in batch]
+                ): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"Error reviewing {', '.join(path for _, _, path in batch)}: {e}")
+                    continue
+
+                for (digest, _, _), result in zip(batch, results):
+                    self._reviewed[digest] = result
+                    for file_path in pending[digest]:
+                        yield self._build_report(file_path, result)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _build_report(self, file_path: str, result: FileResult) -> ReviewReport:
+        """Build a file's report from the review of its content.
+
+        Args:
+            file_path: Reviewed file
+            result: Issues and perspective summaries of its content
+
+        Returns:
+            Complete review report
+        """
+        issues, summaries = result
+        report = ReviewReport(
+            file_path=file_path,
+            timestamp=datetime.now(),
+            issues=[dataclasses.replace(issue) for issue in issues],
+            perspective_reports=dict(summaries),
+        )
+        report.calculate_metrics()
+        report.summary = self._generate_summary(report)
+        return report
+
+    def review_directory(
+        self,
+        directory_path: str,
+        file_pattern: str = "*.py",
+        max_workers: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+    ) -> List[ReviewReport]:
         """Review all files in a directory matching pattern.
 
+        Files are reviewed concurrently (see iter_reviews).
+
         Args:
             directory_path: Path to directory to review
             file_pattern: File pattern to match (default: *.py)
+            max_workers: Maximum concurrent batches (default: CPU count)
+            use_processes: Worker processes or threads (default: see iter_reviews)
 
         Returns:
-            List of review reports, one per file
+            List of review reports, one per file, in directory walk order
 
         Example:
             >>> reviewer = MultiModelCodeReviewer()
@@ -188,16 +357,13 @@ class MultiModelCodeReviewer:
         if not directory.exists():
             raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-        reports = []
-        for file_path in directory.rglob(file_pattern):
-            if file_path.is_file():
-                try:
-                    report = self.review_file(str(file_path))
-                    reports.append(report)
-                except Exception as e:
-                    print(f"Error reviewing {file_path}: {e}")
+        file_paths = [str(file_path) for file_path in directory.rglob(file_pattern) if file_path.is_file()]
+        reports = {
+            report.file_path: report
+            for report in self.iter_reviews(file_paths, max_workers=max_workers, use_processes=use_processes)
+        }
 
-        return reports
+        return [reports[file_path] for file_path in file_paths if file_path in reports]
 
     def _generate_summary(self, report: ReviewReport) -> str:
         """Generate executive summary from report.
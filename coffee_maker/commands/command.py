@@ -21,7 +21,7 @@ Example:
     >>> result = cmd.execute(db, {"priority_id": "PRIORITY-1"})
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from coffee_maker.database.domain_wrapper import DomainWrapper
 from coffee_maker.utils.logging import get_logger
@@ -52,8 +52,9 @@ class Command:
         files_read: Optional[List[str]] = None,
         required_skills: Optional[List[str]] = None,
         required_tools: Optional[List[str]] = None,
-        content: str = "",
+        content: Optional[str] = "",
         source_file: str = "",
+        content_loader: Optional[Callable[[], str]] = None,
     ):
         """Initialize command.
 
@@ -67,8 +68,9 @@ class Command:
             files_read: Files this command reads
             required_skills: Skills required for execution
             required_tools: Tools required (git, gh, pytest, etc.)
-            content: Markdown content from command file
+            content: Markdown content from command file (None to load it with content_loader)
             source_file: Path to source markdown file
+            content_loader: Callable returning the content, called on first access
         """
         self.name = name
         self.agent = agent
@@ -79,9 +81,21 @@ class Command:
         self.files_read = files_read or []
         self.required_skills = required_skills or []
         self.required_tools = required_tools or []
-        self.content = content
+        self._content = content
+        self._content_loader = content_loader
         self.source_file = source_file
 
+    @property
+    def content(self) -> str:
+        """Markdown content of the command, loaded on first access if deferred."""
+        if self._content is None:
+            self._content = self._content_loader() if self._content_loader else ""
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
     def execute(
         self,
         db: DomainWrapper,
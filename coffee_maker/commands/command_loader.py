@@ -8,6 +8,13 @@ The CommandLoader handles:
 - Loading required skills
 - Executing commands with parameters
 
+Parsed frontmatter is kept in a compiled manifest per commands directory
+(``~/.coffee_maker/command_manifests``): one JSON file with every command's
+permissions, skills and the byte range of its body. A file is re-parsed only
+when its mtime or size changed and its SHA-256 no longer matches, so building
+a loader usually costs one ``stat`` per command file and no YAML parsing.
+Command bodies are read from their offset on first access of ``content``.
+
 Example:
     >>> loader = CommandLoader(AgentType.ARCHITECT)
     >>> result = loader.execute("create_spec", {"priority_id": "PRIORITY-25"})
@@ -31,10 +38,12 @@ Command Format:
     ```
 """
 
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import frontmatter
+from typing import Any, Dict, List, Optional, Tuple
 
 from coffee_maker.autonomous.agent_registry import AgentType
 from coffee_maker.commands.command import Command
@@ -43,6 +52,31 @@ from coffee_maker.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+MANIFEST_VERSION = 2
+DEFAULT_MANIFEST_DIR = Path.home() / ".coffee_maker" / "command_manifests"
+
+# Manifests already loaded or compiled by this process, by resolved commands directory
+_manifests: Dict[str, Dict[str, Dict[str, Any]]] = {}
+_manifests_lock = threading.Lock()
+
+
+def _parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Parse frontmatter, importing the YAML stack only when a file is compiled."""
+    import frontmatter
+
+    return frontmatter.parse(text)
+
+
+def _read_body(path: Path, entry: Dict[str, Any]) -> str:
+    """Read a command body from its manifest offset (re-parsing if the file changed)."""
+    data = path.read_bytes()
+    if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+        return _parse_frontmatter(data.decode("utf-8"))[1]
+    if "body" in entry:
+        return entry["body"]
+    start = entry["body_offset"]
+    return data[start : start + entry["body_length"]].decode("utf-8")
+
 
 class CommandLoader:
     """Loads and executes commands for an agent from markdown files.
@@ -75,6 +109,7 @@ class CommandLoader:
         self,
         agent_type: AgentType,
         commands_dir: Optional[Path] = None,
+        manifest_dir: Optional[Path] = DEFAULT_MANIFEST_DIR,
     ):
         """Initialize command loader.
 
@@ -82,6 +117,7 @@ class CommandLoader:
             agent_type: Type of agent
             commands_dir: Directory containing command files
                          (default: .claude/commands/agents/{agent})
+            manifest_dir: Directory of compiled manifests (None disables persistence)
         """
         self.agent_type = agent_type
         self.agent_name = agent_type.value
@@ -91,6 +127,7 @@ class CommandLoader:
             commands_dir = Path(f".claude/commands/agents/{self.agent_name}")
 
         self.commands_dir = commands_dir
+        self.manifest_dir = manifest_dir
         self.commands: Dict[str, Command] = {}
 
         # Load all commands for this agent
@@ -100,73 +137,149 @@ class CommandLoader:
             logger.warning(f"Commands directory not found: {self.commands_dir}")
 
     def _load_commands(self) -> None:
-        """Load all command markdown files for this agent."""
+        """Load all command markdown files for this agent from the compiled manifest."""
         try:
-            command_files = list(self.commands_dir.glob("*.md"))
+            command_files = sorted(self.commands_dir.glob("*.md"))
             logger.debug(f"Found {len(command_files)} command files in {self.commands_dir}")
 
+            key = str(self.commands_dir.resolve())
+            with _manifests_lock:
+                manifest = _manifests.get(key)
+            if manifest is None:
+                manifest = self._load_manifest(key)
+
+            entries: Dict[str, Dict[str, Any]] = {}
             for cmd_file in command_files:
                 try:
-                    command = self._parse_command(cmd_file)
+                    entry = manifest.get(cmd_file.name)
+                    stat = cmd_file.stat()
+                    if entry is None or (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+                        entry = self._compile_entry(cmd_file, stat, entry)
+                    entries[cmd_file.name] = entry
+                    command = self._command_from_entry(cmd_file, entry)
                     self.commands[command.action] = command
                     logger.debug(f"Loaded command: {command.name}")
                 except Exception as e:
                     logger.error(f"Failed to load command {cmd_file}: {e}")
 
+            if entries != manifest:
+                self._save_manifest(key, entries)
+            with _manifests_lock:
+                _manifests[key] = entries
+
             logger.info(f"Loaded {len(self.commands)} commands for {self.agent_name}")
         except Exception as e:
             logger.error(f"Error loading commands from {self.commands_dir}: {e}")
 
-    def _parse_command(self, path: Path) -> Command:
-        """Parse command from markdown file.
+    def _compile_entry(
+        self, path: Path, stat: os.stat_result, previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Compile the manifest entry of a command file.
 
         Args:
             path: Path to command markdown file
+            stat: Result of ``path.stat()`` taken before reading
+            previous: Existing entry, reused if the content hash is unchanged
 
         Returns:
-            Command object
-
-        Raises:
-            ValueError: If command metadata is invalid
+            Manifest entry: file signature, Command arguments and body byte range (or body)
         """
-        with open(path, encoding="utf-8") as f:
-            post = frontmatter.load(f)
+        data = path.read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+        if previous is not None and previous["sha256"] == sha256:
+            return {**previous, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
 
-        metadata = post.metadata
+        text = data.decode("utf-8")
+        metadata, content = _parse_frontmatter(text)
 
-        # Extract and validate required metadata
-        command_name = metadata.get("command", f"unknown.{path.stem}")
-        agent = metadata.get("agent", self.agent_name)
-        action = metadata.get("action", path.stem)
-
-        # Extract table permissions
         tables_config = metadata.get("tables", {})
-        tables_write = tables_config.get("write", [])
-        tables_read = tables_config.get("read", [])
-
-        # Extract file permissions
         files_config = metadata.get("files", {})
-        files_write = files_config.get("write", [])
-        files_read = files_config.get("read", [])
 
-        # Extract skill and tool requirements
-        required_skills = metadata.get("required_skills", [])
-        required_tools = metadata.get("required_tools", [])
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "command": {
+                "name": metadata.get("command", f"unknown.{path.stem}"),
+                "agent": metadata.get("agent"),
+                "action": metadata.get("action", path.stem),
+                "tables_write": tables_config.get("write", []),
+                "tables_read": tables_config.get("read", []),
+                "files_write": files_config.get("write", []),
+                "files_read": files_config.get("read", []),
+                "required_skills": metadata.get("required_skills", []),
+                "required_tools": metadata.get("required_tools", []),
+            },
+        }
+
+        # The parsed body is usually the stripped tail of the file and is read from there on
+        # demand; when the parser rewrote it (e.g. CRLF line endings), the body is stored as is
+        stripped = text.rstrip()
+        if stripped.endswith(content):
+            body_start = len(stripped) - len(content)
+            entry["body_offset"] = len(text[:body_start].encode("utf-8"))
+            entry["body_length"] = len(content.encode("utf-8"))
+        else:
+            entry["body"] = content
+        return entry
 
+    def _command_from_entry(self, path: Path, entry: Dict[str, Any]) -> Command:
+        """Build a Command whose content is read on first access."""
+        arguments = dict(entry["command"])
+        arguments["agent"] = arguments["agent"] or self.agent_name
         return Command(
-            name=command_name,
-            agent=agent,
-            action=action,
-            tables_write=tables_write,
-            tables_read=tables_read,
-            files_write=files_write,
-            files_read=files_read,
-            required_skills=required_skills,
-            required_tools=required_tools,
-            content=post.content,
+            **arguments,
+            content=None,
             source_file=str(path),
+            content_loader=lambda: _read_body(path, entry),
         )
 
+    def _parse_command(self, path: Path) -> Command:
+        """Parse command from markdown file.
+
+        Args:
+            path: Path to command markdown file
+
+        Returns:
+            Command object
+
+        Raises:
+            ValueError: If command metadata is invalid
+        """
+        return self._command_from_entry(path, self._compile_entry(path, path.stat()))
+
+    def _manifest_file(self, key: str) -> Path:
+        """Get the manifest file of a resolved commands directory."""
+        return self.manifest_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def _load_manifest(self, key: str) -> Dict[str, Dict[str, Any]]:
+        """Load the persisted manifest of a commands directory (empty if missing or stale)."""
+        if self.manifest_dir is None:
+            return {}
+        try:
+            cached = json.loads(self._manifest_file(key).read_text())
+            if cached.get("version") != MANIFEST_VERSION or cached.get("commands_dir") != key:
+                return {}
+            return cached["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_manifest(self, key: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Persist a manifest atomically (failures only disable persistence)."""
+        if self.manifest_dir is None:
+            return
+
+        manifest_file = self._manifest_file(key)
+        payload = {"version": MANIFEST_VERSION, "commands_dir": key, "entries": entries}
+        try:
+            self.manifest_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = manifest_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(payload, ensure_ascii=False))
+            os.replace(temp_file, manifest_file)
+            logger.debug(f"Saved command manifest for {self.commands_dir} to {manifest_file}")
+        except OSError as e:
+            logger.debug(f"Could not persist command manifest to {manifest_file}: {e}")
+
     def execute(self, action: str, params: Dict[str, Any]) -> Any:
         """Execute a command with parameters.
 
@@ -6,6 +6,11 @@ implementations in parallel during the migration phase, comparing results to
 ensure consistency and safety. When the command system is fully validated,
 legacy mode can be safely disabled.
 
+Shadow mode runs the migration without doubling latency: the legacy result
+is returned as soon as it is ready, while the command implementation runs for
+a sample of calls on a background executor and is compared off the hot path.
+Comparisons and latencies are kept in bounded ring buffers.
+
 Example:
     wrapper = ParallelOperationWrapper()
     result = wrapper.execute_with_validation(
@@ -13,18 +18,30 @@ Example:
         action="claim_priority",
         params={"priority_id": 10}
     )
+
+    # Production: compare 10% of calls in the background
+    wrapper = ParallelOperationWrapper(shadow=True, sample_rate=0.1)
+    result = wrapper.execute_with_validation(...)  # legacy result, no extra latency
+    wrapper.get_statistics()["latency_ms"]["command"]["p95"]
 """
 
 import logging
+import random
+import threading
 import time
 import json
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
 from datetime import datetime
 
 from coffee_maker.commands.feature_flags import FeatureFlags
 
 logger = logging.getLogger(__name__)
 
+# Comparisons and latency samples kept per wrapper (oldest dropped first)
+DEFAULT_HISTORY_SIZE = 1000
+
 
 class OperationResult:
     """
@@ -80,14 +97,51 @@ class ParallelOperationWrapper:
 
     This allows for safe, gradual rollout with confidence that the new
     command system produces equivalent results to the legacy system.
+
+    In shadow mode, step 2 runs for ``sample_rate`` of the calls on a
+    background executor and the legacy result is always returned at once.
+    Shadow runs that would queue beyond ``max_pending_shadows`` are skipped
+    rather than building a backlog.
     """
 
-    def __init__(self):
-        """Initialize parallel operation wrapper."""
+    def __init__(
+        self,
+        shadow: bool = False,
+        sample_rate: float = 1.0,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        max_workers: int = 2,
+        max_pending_shadows: int = 100,
+    ):
+        """Initialize parallel operation wrapper.
+
+        Args:
+            shadow: Run the command implementation in the background and
+                return the legacy result immediately
+            sample_rate: Fraction of calls (0.0-1.0) that run the command
+                implementation in shadow mode
+            history_size: Comparisons and latency samples kept for statistics
+            max_workers: Background threads for shadow runs
+            max_pending_shadows: Shadow runs allowed to wait for a thread
+        """
         self.flags = FeatureFlags()
-        self.comparison_log = []
+        self.shadow = shadow
+        self.sample_rate = sample_rate
+        self.max_workers = max_workers
+        self.max_pending_shadows = max_pending_shadows
+        self.comparison_log: Deque[Dict[str, Any]] = deque(maxlen=history_size)
         self.mismatch_count = 0
         self.operation_count = 0
+        self._latencies: Dict[str, Deque[float]] = {
+            "legacy": deque(maxlen=history_size),
+            "command": deque(maxlen=history_size),
+        }
+        self._comparisons = 0
+        self._matches = 0
+        self._performance_ratio_sum = 0.0
+        self._shadow_skipped = 0
+        self._pending_shadows = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def execute_with_validation(
         self,
@@ -109,39 +163,127 @@ class ParallelOperationWrapper:
 
         Returns:
             OperationResult with appropriate implementation's result
+            (always the legacy result in shadow mode)
         """
-        self.operation_count += 1
+        with self._lock:
+            self.operation_count += 1
 
         # Always execute legacy (baseline)
         legacy_result = self._execute_with_timing(legacy_fn, params)
+        self._record_latency("legacy", legacy_result)
 
         # Execute command implementation if enabled
         command_enabled = self.flags.is_enabled(agent, action)
-        command_result = None
+        if not (command_enabled and command_fn):
+            # Command not enabled or not provided - return legacy result
+            return legacy_result
+
+        if self.shadow:
+            self._submit_shadow(agent, action, params, legacy_result, command_fn)
+            return legacy_result
+
+        command_result = self._execute_with_timing(command_fn, params)
+        self._record_latency("command", command_result)
+
+        # Compare results
+        if not self._compare(agent, action, params, legacy_result, command_result):
+            # Return legacy result on mismatch (safe fallback)
+            return legacy_result
 
-        if command_enabled and command_fn:
-            command_result = self._execute_with_timing(command_fn, params)
+        # Both succeeded and match - return command result
+        return command_result
 
-        # Compare results if both were executed
-        if command_enabled and command_result:
-            matches = self._results_match(legacy_result, command_result)
-            self._log_comparison(agent, action, params, legacy_result, command_result, matches)
+    def _submit_shadow(
+        self,
+        agent: str,
+        action: str,
+        params: Dict[str, Any],
+        legacy_result: OperationResult,
+        command_fn: Callable,
+    ) -> None:
+        """Run the command implementation in the background for a sample of calls."""
+        if random.random() >= self.sample_rate:
+            return
+
+        with self._lock:
+            if self._pending_shadows >= self.max_pending_shadows:
+                self._shadow_skipped += 1
+                return
+            self._pending_shadows += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="shadow")
+            executor = self._executor
+
+        def run_shadow():
+            try:
+                command_result = self._execute_with_timing(command_fn, params)
+                self._record_latency("command", command_result)
+                self._compare(agent, action, params, legacy_result, command_result)
+            except Exception as e:
+                logger.error(f"Shadow comparison failed for {agent}.{action}: {e}")
+            finally:
+                with self._lock:
+                    self._pending_shadows -= 1
+
+        executor.submit(run_shadow)
+
+    def _compare(
+        self,
+        agent: str,
+        action: str,
+        params: Dict[str, Any],
+        legacy_result: OperationResult,
+        command_result: OperationResult,
+    ) -> bool:
+        """Compare, log and count one legacy/command result pair.
 
-            if not matches:
+        Returns:
+            True if results match
+        """
+        matches = self._results_match(legacy_result, command_result)
+        self._log_comparison(agent, action, params, legacy_result, command_result, matches)
+
+        if not matches:
+            with self._lock:
                 self.mismatch_count += 1
-                logger.warning(
-                    f"Result mismatch for {agent}.{action}: "
-                    f"legacy={legacy_result.success}, "
-                    f"command={command_result.success}"
-                )
-                # Return legacy result on mismatch (safe fallback)
-                return legacy_result
+            logger.warning(
+                f"Result mismatch for {agent}.{action}: "
+                f"legacy={legacy_result.success}, "
+                f"command={command_result.success}"
+            )
+        return matches
+
+    def _record_latency(self, implementation: str, result: OperationResult) -> None:
+        """Add a duration sample to an implementation's latency ring buffer."""
+        with self._lock:
+            self._latencies[implementation].append(result.duration_ms)
+
+    def wait_for_shadows(self, timeout: float = 30.0) -> bool:
+        """
+        Wait until background shadow runs have finished.
 
-            # Both succeeded and match - return command result
-            return command_result
+        Args:
+            timeout: Maximum seconds to wait
 
-        # Command not enabled or not provided - return legacy result
-        return legacy_result
+        Returns:
+            True if no shadow run is pending
+        """
+        deadline = time.monotonic() + timeout
+        while self._pending_shadows and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self._pending_shadows == 0
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the shadow executor.
+
+        Args:
+            wait: Wait for running shadow comparisons to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait)
 
     @staticmethod
     def _execute_with_timing(fn: Optional[Callable], params: Dict[str, Any]) -> OperationResult:
@@ -158,13 +300,13 @@ class ParallelOperationWrapper:
         if fn is None:
             return OperationResult(False, error="No callable provided")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = fn(**params)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             return OperationResult(True, data=result, duration_ms=duration_ms)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             return OperationResult(
                 False,
                 error=str(e),
@@ -235,7 +377,11 @@ class ParallelOperationWrapper:
                 command_result.duration_ms / legacy_result.duration_ms if legacy_result.duration_ms > 0 else 0
             ),
         }
-        self.comparison_log.append(log_entry)
+        with self._lock:
+            self.comparison_log.append(log_entry)
+            self._comparisons += 1
+            self._matches += 1 if match else 0
+            self._performance_ratio_sum += log_entry["performance_ratio"]
 
         if not match:
             logger.warning(
@@ -247,33 +393,48 @@ class ParallelOperationWrapper:
         """
         Get migration statistics.
 
+        Counts cover every comparison since the last reset; latency
+        percentiles cover the last ``history_size`` runs of each implementation.
+
         Returns:
-            Dictionary with operation counts, mismatch rates, etc.
+            Dictionary with operation counts, mismatch rates, shadow counts
+            and latency percentiles (p50/p95/p99 in ms) per implementation
         """
-        match_count = sum(1 for log in self.comparison_log if log["match"])
-        mismatch_count = len(self.comparison_log) - match_count
-
-        avg_performance_ratio = (
-            sum(log["performance_ratio"] for log in self.comparison_log) / len(self.comparison_log)
-            if self.comparison_log
-            else 0
-        )
+        with self._lock:
+            comparisons = self._comparisons
+            matches = self._matches
+            ratio_sum = self._performance_ratio_sum
+            latencies = {name: sorted(samples) for name, samples in self._latencies.items()}
+            shadow_skipped = self._shadow_skipped
+            pending = self._pending_shadows
 
         return {
             "total_operations": self.operation_count,
-            "parallel_operations": len(self.comparison_log),
-            "matches": match_count,
-            "mismatches": mismatch_count,
-            "match_rate": (match_count / len(self.comparison_log) * 100 if self.comparison_log else 0),
-            "avg_command_performance_ratio": avg_performance_ratio,
+            "parallel_operations": comparisons,
+            "matches": matches,
+            "mismatches": comparisons - matches,
+            "match_rate": (matches / comparisons * 100 if comparisons else 0),
+            "avg_command_performance_ratio": ratio_sum / comparisons if comparisons else 0,
+            "shadow": self.shadow,
+            "sample_rate": self.sample_rate,
+            "shadow_pending": pending,
+            "shadow_skipped": shadow_skipped,
+            "latency_ms": {name: _latency_summary(samples) for name, samples in latencies.items()},
             "enabled_agents": list(self.flags.get_enabled_agents()),
         }
 
     def reset_statistics(self) -> None:
         """Reset comparison log and statistics."""
-        self.comparison_log = []
-        self.mismatch_count = 0
-        self.operation_count = 0
+        with self._lock:
+            self.comparison_log.clear()
+            for samples in self._latencies.values():
+                samples.clear()
+            self.mismatch_count = 0
+            self.operation_count = 0
+            self._comparisons = 0
+            self._matches = 0
+            self._performance_ratio_sum = 0.0
+            self._shadow_skipped = 0
         logger.info("Reset parallel operation statistics")
 
     def export_comparison_log(self, filepath: str) -> None:
@@ -287,7 +448,7 @@ class ParallelOperationWrapper:
             json.dump(
                 {
                     "statistics": self.get_statistics(),
-                    "comparison_log": self.comparison_log,
+                    "comparison_log": list(self.comparison_log),
                 },
                 f,
                 indent=2,
@@ -295,6 +456,32 @@ class ParallelOperationWrapper:
         logger.info(f"Exported comparison log to {filepath}")
 
 
+def _latency_summary(sorted_samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize sorted latency samples with nearest-rank percentiles.
+
+    Args:
+        sorted_samples: Durations in milliseconds, ascending
+
+    Returns:
+        Dictionary with count, p50, p95, p99 and max (zeros if no samples)
+    """
+    if not sorted_samples:
+        return {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def percentile(q: float) -> float:
+        rank = max(1, -(-len(sorted_samples) * q // 100))  # ceil(n * q / 100)
+        return sorted_samples[int(rank) - 1]
+
+    return {
+        "count": len(sorted_samples),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": sorted_samples[-1],
+    }
+
+
 def _data_matches(data1: Any, data2: Any) -> bool:
     """
     Check if two data structures match.
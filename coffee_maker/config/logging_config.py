@@ -1,17 +1,71 @@
 """Logging configuration for Coffee Maker Agent.
 
 Provides centralized logging setup with consistent formatting.
+
+Two setups are available:
+
+- ``get_logger`` / ``setup_file_logging``: synchronous handlers on the calling
+  thread (simple scripts, migrations).
+- ``setup_async_logging``: the pipeline for long-running agents. Every logger
+  propagates to a single ``QueueHandler`` on the root logger; one background
+  ``QueueListener`` thread formats and writes records to the console and to a
+  log file rotated by size and age. Per-module level gates (set as logger
+  levels) drop records before they are created, and sampling drops them
+  before they are queued, so a log call on a hot path costs at most a record
+  and a queue put. The file can be written as JSON lines that
+  dashboards tail and parse without regexes.
+
+Example:
+    >>> from pathlib import Path
+    >>> from coffee_maker.config.logging_config import setup_async_logging
+    >>>
+    >>> setup_async_logging(
+    ...     log_dir=Path("logs"),
+    ...     name="code_developer",
+    ...     json_lines=True,
+    ...     module_levels={"coffee_maker.autonomous.message_queue": "WARNING"},
+    ...     sample_rates={"coffee_maker.autonomous.claude_cli_interface": 0.1},
+    ... )
+
+Environment:
+    LOG_LEVEL: Root level (default INFO)
+    LOG_FORMAT: "json" for JSON-lines log files
+    LOG_MODULE_LEVELS: Per-module levels, e.g. "coffee_maker.cli=WARNING,coffee_maker.autonomous=DEBUG"
+    LOG_SAMPLE_RATES: Per-module sampling of records below WARNING, e.g. "coffee_maker.autonomous.daemon=0.1"
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Mapping, Optional, Union
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_setup_lock = threading.Lock()
+# Loggers given their own console handler by get_logger before the pipeline started
+_standalone_handlers: Dict[str, logging.Handler] = {}
 
 
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """Get a configured logger instance.
 
+    When the asynchronous pipeline is active (``setup_async_logging``), the
+    logger only gets its level and propagates to the pipeline. Otherwise it
+    gets its own stdout handler, which a later ``setup_async_logging`` call
+    removes so the logger joins the pipeline.
+
     Args:
         name: Logger name (typically __name__)
         level: Optional logging level (default: INFO)
@@ -26,24 +80,30 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
         level = logging.INFO
     logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    with _setup_lock:
+        # Remove existing handlers to avoid duplicates
+        logger.handlers.clear()
+        _standalone_handlers.pop(name, None)
+
+        if _listener is not None:
+            logger.propagate = True
+            return logger
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
 
     # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
     console_handler.setFormatter(formatter)
 
     # Add handler to logger
     logger.addHandler(console_handler)
 
-    # Prevent propagation to root logger
-    logger.propagate = False
+    # Prevent propagation to root logger (until setup_async_logging routes it to the queue)
+    with _setup_lock:
+        logger.propagate = False
+        _standalone_handlers[name] = console_handler
 
     return logger
 
@@ -51,6 +111,9 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
 def setup_file_logging(log_dir: Path, name: str = "coffee_maker") -> None:
     """Set up file logging in addition to console logging.
 
+    When the asynchronous pipeline is active, the file is written by its
+    background listener instead of the logging thread.
+
     Args:
         log_dir: Directory to store log files
         name: Base name for log files
@@ -58,18 +121,312 @@ def setup_file_logging(log_dir: Path, name: str = "coffee_maker") -> None:
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / f"{name}.log"
 
-    # Get root logger
-    root_logger = logging.getLogger()
-
     # Create file handler
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
 
     # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
     file_handler.setFormatter(formatter)
 
+    with _setup_lock:
+        if _listener is not None:
+            _listener.handlers = _listener.handlers + (file_handler,)
+            return
+
     # Add handler to root logger
-    root_logger.addHandler(file_handler)
+    logging.getLogger().addHandler(file_handler)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line.
+
+    Keys: ts (ISO timestamp), level, logger, msg, pid, thread, and exc when the
+    record carries an exception.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line."""
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "pid": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ModuleGate(logging.Filter):
+    """Per-module level gates and sampling.
+
+    Rules match a logger and its children (``"coffee_maker.cli"`` matches
+    ``"coffee_maker.cli.chat_interface"``); the longest matching prefix wins,
+    and loggers without a rule use the default level.
+    Sampling keeps a fraction of records below WARNING; warnings and errors are
+    never sampled out. Decisions are cached per logger name.
+
+    Example:
+        >>> gate = ModuleGate(levels={"coffee_maker.cli": "WARNING"}, sample_rates={"coffee_maker.autonomous": 0.1})
+        >>> handler.addFilter(gate)
+    """
+
+    def __init__(
+        self,
+        levels: Optional[Mapping[str, Union[int, str]]] = None,
+        sample_rates: Optional[Mapping[str, float]] = None,
+        default_level: int = logging.NOTSET,
+    ):
+        """Initialize the gate.
+
+        Args:
+            levels: Minimum level per module prefix
+            sample_rates: Fraction (0.0-1.0) of records below WARNING to keep per module prefix
+            default_level: Minimum level of loggers without a level rule
+        """
+        super().__init__()
+        self.levels = {name: _to_level(level) for name, level in (levels or {}).items()}
+        self.default_level = default_level
+        self.sample_rates = dict(sample_rates or {})
+        self._rules: Dict[str, tuple] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record passes its module's gate."""
+        rule = self._rules.get(record.name)
+        if rule is None:
+            rule = self._rules[record.name] = (
+                self._match(self.levels, record.name, self.default_level),
+                self._match(self.sample_rates, record.name, 1.0),
+            )
+        min_level, rate = rule
+        if record.levelno < min_level:
+            return False
+        return rate >= 1.0 or record.levelno >= logging.WARNING or random.random() < rate
+
+    @staticmethod
+    def _match(rules: Mapping, name: str, default):
+        """Get the rule of the longest prefix matching a logger name."""
+        while name:
+            if name in rules:
+                return rules[name]
+            name = name.rpartition(".")[0]
+        return rules.get("", default)
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that rolls over by size or by age.
+
+    Backups are numbered like ``RotatingFileHandler`` (``name.log.1`` is the
+    newest), whichever limit is reached first. With an age limit, the start
+    time of the current file is kept in a hidden ``.name.log.start`` file next
+    to it, so restarts do not reset the age (st_ctime changes on every write).
+    """
+
+    def __init__(self, filename: Union[str, Path], max_bytes: int, backup_count: int, rollover_seconds: float):
+        """Initialize the handler.
+
+        Args:
+            filename: Log file path
+            max_bytes: Roll over when the file would exceed this size (0: no size limit)
+            backup_count: Number of rotated files to keep
+            rollover_seconds: Roll over when the file is older than this (0: no age limit)
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.rollover_seconds = rollover_seconds
+        directory, name = os.path.split(self.baseFilename)
+        self.start_file = os.path.join(directory, f".{name}.start")
+        self._rollover_at = self._next_rollover() if rollover_seconds else 0.0
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Roll over on size (checked by the base class) or age."""
+        if self.rollover_seconds and time.time() >= self._rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        """Roll over and restart the age limit."""
+        super().doRollover()
+        if self.rollover_seconds:
+            started = time.time()
+            self._write_start(started)
+            self._rollover_at = started + self.rollover_seconds
+
+    def _next_rollover(self) -> float:
+        """Rollover time of the current file, based on when it was started."""
+        started = self._read_start()
+        if started is None:
+            started = time.time()
+            self._write_start(started)
+        return started + self.rollover_seconds
+
+    def _read_start(self) -> Optional[float]:
+        """Start time of the current file (None: the file is new or its start is unknown)."""
+        try:
+            with open(self.start_file, encoding="utf-8") as f:
+                return float(f.read())
+        except (OSError, ValueError):
+            pass
+        try:
+            stat = os.stat(self.baseFilename)
+        except OSError:
+            return None
+        # Files from before the start file: creation time where the platform records it
+        return getattr(stat, "st_birthtime", None) if stat.st_size else None
+
+    def _write_start(self, started: float) -> None:
+        """Record the start time of the current file."""
+        try:
+            with open(self.start_file, "w", encoding="utf-8") as f:
+                f.write(repr(started))
+        except OSError:
+            pass  # the age limit then restarts with the next process
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as they are.
+
+    The standard handler formats the message on the logging thread; the queue
+    here is in-process, so formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged."""
+        return record
+
+
+def setup_async_logging(
+    log_dir: Optional[Path] = None,
+    name: str = "coffee_maker",
+    level: Union[int, str, None] = None,
+    json_lines: Optional[bool] = None,
+    console: bool = True,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    rollover_seconds: float = 24 * 3600,
+    module_levels: Optional[Mapping[str, Union[int, str]]] = None,
+    sample_rates: Optional[Mapping[str, float]] = None,
+) -> logging.handlers.QueueListener:
+    """Route all logging through one queue and a background writer thread.
+
+    Replaces the root logger's handlers with a single queue handler. Calling it
+    again replaces the previous pipeline (its queue is flushed first).
+
+    Args:
+        log_dir: Directory for the log file (None: console only)
+        name: Base name of the log file
+        level: Root level (default: LOG_LEVEL environment variable, else INFO)
+        json_lines: Write the log file as JSON lines (default: LOG_FORMAT=json)
+        console: Also write to stdout (human-readable format)
+        max_bytes: Rotate the log file at this size
+        backup_count: Number of rotated log files to keep
+        rollover_seconds: Rotate the log file at this age
+        module_levels: Minimum level per module prefix (merged over LOG_MODULE_LEVELS)
+        sample_rates: Fraction of sub-WARNING records to keep per module prefix (merged over LOG_SAMPLE_RATES)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _queue_handler
+
+    level = _to_level(level or os.getenv("LOG_LEVEL", "INFO"))
+    if json_lines is None:
+        json_lines = os.getenv("LOG_FORMAT", "").lower() == "json"
+    levels = {**_parse_env_rules("LOG_MODULE_LEVELS", _to_level), **(module_levels or {})}
+    levels = {module: _to_level(module_level) for module, module_level in levels.items()}
+    rates = {**_parse_env_rules("LOG_SAMPLE_RATES", float), **(sample_rates or {})}
+
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT))
+        handlers.append(console_handler)
+    if log_dir is not None:
+        log_dir = Path(log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        suffix = "jsonl" if json_lines else "log"
+        file_handler = SizeAndTimeRotatingFileHandler(
+            log_dir / f"{name}.{suffix}", max_bytes, backup_count, rollover_seconds
+        )
+        file_handler.setFormatter(
+            JsonLinesFormatter() if json_lines else logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
+        )
+        handlers.append(file_handler)
+
+    queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+    if levels or rates:
+        queue_handler.addFilter(ModuleGate(levels, rates, default_level=level))
+    listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+
+    with _setup_lock:
+        root = logging.getLogger()
+        previous = _listener
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        # Loggers configured by get_logger before now write to stdout themselves
+        for logger_name, standalone_handler in _standalone_handlers.items():
+            standalone_logger = logging.getLogger(logger_name)
+            standalone_logger.removeHandler(standalone_handler)
+            standalone_logger.propagate = True
+        _standalone_handlers.clear()
+        # Logger levels drop gated records before a LogRecord is even created
+        for module, module_level in levels.items():
+            logging.getLogger(module).setLevel(module_level)
+        _listener, _queue_handler = listener, queue_handler
+        listener.start()
+
+    if previous is not None:
+        _stop_listener(previous)
+    return listener
+
+
+def shutdown_async_logging() -> None:
+    """Flush the queue and stop the background writer (registered at exit)."""
+    global _listener, _queue_handler
+
+    with _setup_lock:
+        listener, handler = _listener, _queue_handler
+        _listener = _queue_handler = None
+        if handler is not None:
+            logging.getLogger().removeHandler(handler)
+    if listener is not None:
+        _stop_listener(listener)
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a listener after it wrote its queued records, and close its handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _to_level(level: Union[int, str]) -> int:
+    """Convert a level name or number to a level number."""
+    if isinstance(level, int):
+        return level
+    number = logging.getLevelName(str(level).strip().upper())
+    if not isinstance(number, int):
+        raise ValueError(f"Unknown logging level: {level}")
+    return number
+
+
+def _parse_env_rules(variable: str, convert) -> Dict[str, object]:
+    """Parse "module=value,module=value" from an environment variable."""
+    rules = {}
+    for item in os.getenv(variable, "").split(","):
+        module, sep, value = item.partition("=")
+        if sep:
+            try:
+                rules[module.strip()] = convert(value.strip())
+            except ValueError:
+                logging.getLogger(__name__).warning(f"Ignoring invalid {variable} entry: {item}")
+    return rules
+
+
+atexit.register(shutdown_async_logging)
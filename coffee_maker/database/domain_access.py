@@ -192,13 +192,14 @@ class DomainDatabase:
         """
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, list(data.values()))
-            self.conn.commit()
-            record_id = cursor.lastrowid
+            # Record and audit row commit together
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.execute(query, list(data.values()))
+                record_id = cursor.lastrowid
 
-            # Log to audit trail
-            self._audit_log("WRITE", table, str(record_id), 1)
+                # Log to audit trail
+                self._audit_log("WRITE", table, str(record_id), 1)
 
             logger.debug(f"{self.agent_name} wrote to {table} (ID: {record_id})")
             return record_id
@@ -251,7 +252,8 @@ class DomainDatabase:
             results = [dict(row) for row in rows]
 
             # Log to audit trail
-            self._audit_log("READ", table, None, len(results))
+            with self.conn:
+                self._audit_log("READ", table, None, len(results))
 
             logger.debug(f"{self.agent_name} read {len(results)} records from {table}")
             return results
@@ -297,13 +299,14 @@ class DomainDatabase:
         params = list(data.values()) + list(conditions.values())
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
-            affected_rows = cursor.rowcount
+            # Changes and audit row commit together
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                affected_rows = cursor.rowcount
 
-            # Log to audit trail
-            self._audit_log("UPDATE", table, None, affected_rows)
+                # Log to audit trail
+                self._audit_log("UPDATE", table, None, affected_rows)
 
             logger.debug(f"{self.agent_name} updated {affected_rows} rows in {table}")
             return affected_rows
@@ -337,13 +340,14 @@ class DomainDatabase:
         params = list(conditions.values())
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
-            affected_rows = cursor.rowcount
+            # Changes and audit row commit together
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                affected_rows = cursor.rowcount
 
-            # Log to audit trail
-            self._audit_log("DELETE", table, None, affected_rows)
+                # Log to audit trail
+                self._audit_log("DELETE", table, None, affected_rows)
 
             logger.debug(f"{self.agent_name} deleted {affected_rows} rows from {table}")
             return affected_rows
@@ -440,6 +444,9 @@ class DomainDatabase:
     ):
         """Log an operation to the audit trail.
 
+        The row is added to the caller's transaction, which commits it together
+        with the audited change.
+
         Args:
             operation: Type of operation (READ, WRITE, UPDATE, DELETE)
             table: Name of the affected table
@@ -465,7 +472,6 @@ class DomainDatabase:
                     details,
                 ),
             )
-            self.conn.commit()
         except sqlite3.Error as e:
             # Don't fail the main operation if audit logging fails
             logger.warning(f"Failed to log audit trail: {e}")
@@ -8,14 +8,20 @@ Features:
     - Audit trail logging for all operations
     - Inter-agent notifications
     - Transparent wrapping of existing database classes
+
+Every write commits together with its ``system_audit`` row: generic tables
+insert both in one transaction, and roadmap items (written through
+RoadmapDatabase) are mirrored from ``roadmap_audit`` by a trigger. Batches
+from ``write_many``/``update_many`` share a single transaction.
 """
 
 import json
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from coffee_maker.autonomous.roadmap_database import RoadmapDatabase
 from coffee_maker.utils.logging import get_logger
@@ -114,6 +120,38 @@ READ_PERMISSIONS = {
 }
 
 
+_AUDIT_TABLE = """
+    CREATE TABLE IF NOT EXISTS system_audit (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT NOT NULL,
+        item_id TEXT NOT NULL,
+        action TEXT NOT NULL,
+        field_changed TEXT,
+        old_value TEXT,
+        new_value TEXT,
+        changed_by TEXT NOT NULL,
+        changed_at TEXT NOT NULL
+    )
+"""
+
+# RoadmapDatabase commits each roadmap change with its roadmap_audit row; this
+# copies that row into system_audit inside the same transaction.
+_ROADMAP_AUDIT_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS trg_roadmap_audit_system_audit
+    AFTER INSERT ON roadmap_audit
+    BEGIN
+        INSERT INTO system_audit (
+            table_name, item_id, action, field_changed,
+            old_value, new_value, changed_by, changed_at
+        ) VALUES (
+            'roadmap_priority', NEW.item_id,
+            CASE WHEN NEW.action IN ('create', 'delete') THEN NEW.action ELSE 'update' END,
+            NEW.field_changed, NEW.old_value, NEW.new_value, NEW.changed_by, NEW.changed_at
+        );
+    END
+"""
+
+
 class DomainWrapper:
     """Wrapper that enforces domain-based access control over existing database classes.
 
@@ -123,6 +161,7 @@ class DomainWrapper:
     Example:
         >>> db = DomainWrapper(AgentType.ARCHITECT)
         >>> db.write("specs_specification", {"id": "SPEC-101", "title": "..."})
+        >>> db.write_many("specs_task", [{"id": "TASK-101-1"}, {"id": "TASK-101-2"}])
         >>> items = db.read("roadmap_priority", {"status": "📝 Planned"})
         >>> db.send_notification("code_developer", {"type": "spec_ready", "spec_id": "SPEC-101"})
     """
@@ -144,6 +183,8 @@ class DomainWrapper:
         # Get our permissions
         self.read_tables = READ_PERMISSIONS.get(agent_type, [])
 
+        self._init_audit()
+
         logger.info(f"DomainWrapper initialized for {self.agent_name}")
 
     def can_write(self, table: str) -> bool:
@@ -180,35 +221,44 @@ class DomainWrapper:
         # Check specific permission
         return table in self.read_tables
 
-    def _audit_log(
-        self,
-        action: str,
-        table: str,
-        item_id: str,
-        details: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Log operation to audit trail.
-
-        Args:
-            action: Action performed ('create', 'update', 'delete', 'read')
-            table: Table affected
-            item_id: ID of item affected
-            details: Additional details (field_changed, old_value, new_value)
-        """
-        if details is None:
-            details = {}
+    def _init_audit(self) -> None:
+        """Create the audit table and the roadmap audit trigger if missing."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute(_AUDIT_TABLE)
+                conn.execute(_ROADMAP_AUDIT_TRIGGER)
+        finally:
+            conn.close()
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run data changes and their audit rows in one transaction (one commit)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with conn:
+                yield conn.cursor()
+        finally:
+            conn.close()
 
-            cursor.execute(
-                """
-                INSERT INTO system_audit (
-                    table_name, item_id, action, field_changed,
-                    old_value, new_value, changed_by, changed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+    def _audit(self, cursor: sqlite3.Cursor, entries: Sequence[Tuple[str, str, str, Dict[str, Any]]]) -> None:
+        """Add audit rows to the current transaction.
+
+        Args:
+            cursor: Cursor of the transaction making the changes
+            entries: (action, table, item_id, details) per change, where action is
+                'create', 'update' or 'delete' and details may hold field_changed,
+                old_value and new_value
+        """
+        now = datetime.now().isoformat()
+        cursor.executemany(
+            """
+            INSERT INTO system_audit (
+                table_name, item_id, action, field_changed,
+                old_value, new_value, changed_by, changed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
                 (
                     table,
                     item_id,
@@ -217,16 +267,13 @@ class DomainWrapper:
                     details.get("old_value"),
                     details.get("new_value"),
                     self.agent_name,
-                    datetime.now().isoformat(),
-                ),
-            )
-
-            conn.commit()
-            conn.close()
-
+                    now,
+                )
+                for action, table, item_id, details in entries
+            ],
+        )
+        for action, table, item_id, _ in entries:
             logger.debug(f"Audit logged: {self.agent_name} {action} on {table}:{item_id}")
-        except Exception as e:
-            logger.error(f"Failed to audit log operation: {e}")
 
     def write(self, table: str, data: Dict[str, Any]) -> Any:
         """Write to a table with permission check and audit logging.
@@ -238,6 +285,24 @@ class DomainWrapper:
         Returns:
             Result from underlying database
 
+        Raises:
+            PermissionError: If agent lacks write permission
+        """
+        return self.write_many(table, [data])[0]
+
+    def write_many(self, table: str, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Write several records, with their audit rows, in one transaction.
+
+        roadmap_priority rows are inserted through RoadmapDatabase in the same
+        transaction, so a failing row leaves none of the batch written.
+
+        Args:
+            table: Table name
+            rows: Records to write
+
+        Returns:
+            Result from underlying database for each record (row id for generic tables)
+
         Raises:
             PermissionError: If agent lacks write permission
         """
@@ -248,72 +313,62 @@ class DomainWrapper:
             )
 
         # Add agent tracking and timestamp
-        data["updated_by"] = self.agent_name
-        if "updated_at" not in data:
-            data["updated_at"] = datetime.now().isoformat()
-        item_id = data.get("id", "unknown")
+        now = datetime.now().isoformat()
+        for data in rows:
+            data["updated_by"] = self.agent_name
+            if "updated_at" not in data:
+                data["updated_at"] = now
 
         # Use the appropriate method based on table
         try:
             if table == "roadmap_priority":
-                # Special handling for roadmap items
+                # Special handling for roadmap items (audited by the roadmap_audit trigger)
                 if self.agent_type != AgentType.PROJECT_MANAGER:
                     raise PermissionError("Only project_manager can write to roadmap_priority")
 
-                result = self.db.create_item(
-                    item_id=item_id,
-                    item_type=data.get("item_type", "priority"),
-                    number=data["number"],
-                    title=data["title"],
-                    status=data.get("status", "📝 Planned"),
-                    content=data.get("content", ""),
-                    estimated_hours=data.get("estimated_hours"),
-                    dependencies=data.get("dependencies"),
-                    priority_order=data.get("priority_order"),
-                )
-
-                # Audit log
-                self._audit_log(
-                    action="create",
-                    table=table,
-                    item_id=item_id,
-                    details={
-                        "field_changed": "all",
-                        "new_value": json.dumps(data)[:200],
-                    },
+                with self._transaction() as cursor:
+                    for data in rows:
+                        self.db._insert_item(
+                            cursor,
+                            item_id=data.get("id", "unknown"),
+                            item_type=data.get("item_type", "priority"),
+                            number=data["number"],
+                            title=data["title"],
+                            status=data.get("status", "📝 Planned"),
+                            content=data.get("content", ""),
+                            estimated_hours=data.get("estimated_hours"),
+                            dependencies=data.get("dependencies"),
+                            priority_order=data.get("priority_order"),
+                        )
+                return [True] * len(rows)
+
+            # Generic write for other tables using direct SQL
+            results = []
+            with self._transaction() as cursor:
+                for data in rows:
+                    columns = list(data.keys())
+                    placeholders = ["?" for _ in columns]
+                    query = f"""
+                        INSERT INTO {table} ({', '.join(columns)})
+                        VALUES ({', '.join(placeholders)})
+                    """
+                    cursor.execute(query, list(data.values()))
+                    results.append(cursor.lastrowid)
+
+                self._audit(
+                    cursor,
+                    [
+                        (
+                            "create",
+                            table,
+                            data.get("id", "unknown"),
+                            {"field_changed": "all", "new_value": json.dumps(data, default=str)[:200]},
+                        )
+                        for data in rows
+                    ],
                 )
 
-                return result
-
-            else:
-                # Generic write for other tables using direct SQL
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
-                columns = list(data.keys())
-                placeholders = ["?" for _ in columns]
-                query = f"""
-                    INSERT INTO {table} ({', '.join(columns)})
-                    VALUES ({', '.join(placeholders)})
-                """
-
-                cursor.execute(query, list(data.values()))
-                conn.commit()
-                result = cursor.lastrowid
-                conn.close()
-
-                # Audit log
-                self._audit_log(
-                    action="create",
-                    table=table,
-                    item_id=item_id,
-                    details={
-                        "field_changed": "all",
-                        "new_value": json.dumps(data)[:200],
-                    },
-                )
-
-                return result
+            return results
 
         except PermissionError:
             raise
@@ -385,6 +440,24 @@ class DomainWrapper:
         Returns:
             Number of affected rows
 
+        Raises:
+            PermissionError: If agent lacks write permission
+        """
+        return self.update_many(table, [(data, conditions)])
+
+    def update_many(self, table: str, changes: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> int:
+        """Apply several updates, with their audit rows, in one transaction.
+
+        roadmap_priority status changes go through RoadmapDatabase in the same
+        transaction as the other updates of the batch.
+
+        Args:
+            table: Table name
+            changes: (fields to update, WHERE conditions) pairs
+
+        Returns:
+            Total number of affected rows
+
         Raises:
             PermissionError: If agent lacks write permission
         """
@@ -394,69 +467,58 @@ class DomainWrapper:
                 f"This table is owned by {TABLE_OWNERSHIP.get(table, 'unknown')}"
             )
 
-        # Add tracking
-        data["updated_by"] = self.agent_name
-        item_id = conditions.get("id", "unknown")
+        affected = 0
 
         try:
-            # Special handling for roadmap_priority
-            if table == "roadmap_priority" and "status" in data:
-                if self.agent_type != AgentType.PROJECT_MANAGER:
-                    raise PermissionError("Only project_manager can update roadmap status")
-
-                if item_id != "unknown":
-                    result = self.db.update_status(
-                        item_id=item_id,
-                        new_status=data["status"],
-                        updated_by=self.agent_name,
-                    )
-
-                    # Audit log
-                    self._audit_log(
-                        action="update",
-                        table=table,
-                        item_id=item_id,
-                        details={
-                            "field_changed": "status",
-                            "new_value": data["status"],
-                        },
-                    )
-
-                    return 1 if result else 0
-
-            # Generic update
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            set_clauses = [f"{k} = ?" for k in data.keys()]
-            where_clauses = [f"{k} = ?" for k in conditions.keys()]
-
-            query = f"""
-                UPDATE {table}
-                SET {', '.join(set_clauses)}
-                WHERE {' AND '.join(where_clauses)}
-            """
-
-            params = list(data.values()) + list(conditions.values())
-            cursor.execute(query, params)
-            conn.commit()
-            rowcount = cursor.rowcount
-            conn.close()
-
-            # Audit log
-            if rowcount > 0:
-                self._audit_log(
-                    action="update",
-                    table=table,
-                    item_id=item_id,
-                    details={
-                        "field_changed": ", ".join(data.keys()),
-                        "new_value": json.dumps(data)[:200],
-                    },
-                )
-
-            return rowcount
+            with self._transaction() as cursor:
+                audits = []
+                for data, conditions in changes:
+                    # Add tracking
+                    data["updated_by"] = self.agent_name
+                    item_id = conditions.get("id", "unknown")
+
+                    # Special handling for roadmap_priority (audited by the roadmap_audit trigger)
+                    if table == "roadmap_priority" and "status" in data:
+                        if self.agent_type != AgentType.PROJECT_MANAGER:
+                            raise PermissionError("Only project_manager can update roadmap status")
+
+                        if item_id != "unknown":
+                            old_status = self.db._set_status(cursor, item_id, data["status"], self.agent_name)
+                            affected += 0 if old_status is None else 1
+                            continue
+
+                    # Generic update
+                    set_clauses = [f"{k} = ?" for k in data.keys()]
+                    where_clauses = [f"{k} = ?" for k in conditions.keys()]
+
+                    query = f"""
+                        UPDATE {table}
+                        SET {', '.join(set_clauses)}
+                        WHERE {' AND '.join(where_clauses)}
+                    """
+
+                    cursor.execute(query, list(data.values()) + list(conditions.values()))
+                    affected += cursor.rowcount
+
+                    if cursor.rowcount > 0:
+                        audits.append(
+                            (
+                                "update",
+                                table,
+                                item_id,
+                                {
+                                    "field_changed": ", ".join(data.keys()),
+                                    "new_value": json.dumps(data, default=str)[:200],
+                                },
+                            )
+                        )
+
+                self._audit(cursor, audits)
+
+            return affected
 
+        except PermissionError:
+            raise
         except Exception as e:
             logger.error(f"Error updating {table}: {e}")
             raise
@@ -78,33 +78,37 @@ print(budget.get_budget_status())
 Full API documentation available at: https://bobain.github.io/MonolithicCoffeeMakerAgent/
 """
 
-from typing import List
-
-from coffee_maker.langfuse_observe.auto_picker_llm_refactored import (
-    AutoPickerLLMRefactored,
-    create_auto_picker_llm_refactored,
-)
-from coffee_maker.langfuse_observe.builder import LLMBuilder, SmartLLM
-from coffee_maker.langfuse_observe.scheduled_llm import ScheduledLLM
-from coffee_maker.langfuse_observe.cost_calculator import CostCalculator
-from coffee_maker.langfuse_observe.cost_budget import (
-    CostBudgetEnforcer,
-    create_budget_enforcer,
-)
-from coffee_maker.langfuse_observe.http_pool import (
-    get_http_client,
-    get_async_http_client,
-)
-
-__all__: List[str] = [
-    "AutoPickerLLMRefactored",
-    "create_auto_picker_llm_refactored",
-    "LLMBuilder",
-    "SmartLLM",
-    "ScheduledLLM",
-    "CostCalculator",
-    "CostBudgetEnforcer",
-    "create_budget_enforcer",
-    "get_http_client",
-    "get_async_http_client",
-]
+import importlib
+from typing import Any, Dict, List
+
+# Public names are resolved on first access (PEP 562) so that importing a light
+# submodule such as ``coffee_maker.langfuse_observe.retry`` does not pull in
+# langchain, langfuse and tiktoken through the package __init__.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "AutoPickerLLMRefactored": "coffee_maker.langfuse_observe.auto_picker_llm_refactored",
+    "create_auto_picker_llm_refactored": "coffee_maker.langfuse_observe.auto_picker_llm_refactored",
+    "LLMBuilder": "coffee_maker.langfuse_observe.builder",
+    "SmartLLM": "coffee_maker.langfuse_observe.builder",
+    "ScheduledLLM": "coffee_maker.langfuse_observe.scheduled_llm",
+    "CostCalculator": "coffee_maker.langfuse_observe.cost_calculator",
+    "CostBudgetEnforcer": "coffee_maker.langfuse_observe.cost_budget",
+    "create_budget_enforcer": "coffee_maker.langfuse_observe.cost_budget",
+    "get_http_client": "coffee_maker.langfuse_observe.http_pool",
+    "get_async_http_client": "coffee_maker.langfuse_observe.http_pool",
+}
+
+__all__: List[str] = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -46,6 +46,8 @@ class LangfuseExporter:
     - Converting Langfuse data to dataclass models
     - Storing traces, generations, and spans in local database
     - Incremental sync to avoid re-exporting data
+    - Hourly/daily usage rollups, kept current by the triggers that
+      init_database installs on the generations table
 
     Attributes:
         config: Export configuration
@@ -17,6 +17,9 @@ This schema is optimized for:
 - **Span**: Intermediate steps/operations within traces
 - **PerformanceMetric**: Pre-aggregated performance metrics
 - **RateLimitCounter**: Multi-process safe rate limit tracking
+- **Usage rollups**: Hourly and daily per-model/per-agent aggregates of generations,
+  maintained incrementally by triggers so dashboards never scan raw rows
+  (usage_rollup_members records what each generation contributes)
 
 ## Database Support
 
@@ -152,6 +155,204 @@ CREATE INDEX IF NOT EXISTS idx_rate_limit_model ON rate_limit_counters(model);
 CREATE INDEX IF NOT EXISTS idx_rate_limit_window ON rate_limit_counters(window_start, window_end);
 """
 
+# Usage rollups: one row per (bucket, model, agent). Dashboards aggregate these
+# instead of raw generations, so query cost depends on the time range only.
+# model is stored as '' when NULL (primary key columns cannot be NULL).
+CREATE_USAGE_ROLLUP_TABLES = """
+CREATE TABLE IF NOT EXISTS usage_rollup_hourly (
+    bucket_start TEXT NOT NULL,  -- 'YYYY-MM-DD HH:00:00'
+    model TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    request_count INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0.0,
+    latency_sum_ms REAL NOT NULL DEFAULT 0.0,
+    latency_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket_start, model, agent_name)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS usage_rollup_daily (
+    bucket_start TEXT NOT NULL,  -- 'YYYY-MM-DD'
+    model TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    request_count INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0.0,
+    latency_sum_ms REAL NOT NULL DEFAULT 0.0,
+    latency_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket_start, model, agent_name)
+) WITHOUT ROWID;
+
+-- Covering indexes for per-model and per-agent lookups within a time range
+CREATE INDEX IF NOT EXISTS idx_rollup_hourly_model ON usage_rollup_hourly(
+    model, bucket_start, request_count, total_cost, total_tokens, input_tokens, output_tokens,
+    latency_sum_ms, latency_count
+);
+CREATE INDEX IF NOT EXISTS idx_rollup_hourly_agent ON usage_rollup_hourly(
+    agent_name, bucket_start, request_count, total_cost, total_tokens, latency_sum_ms, latency_count
+);
+CREATE INDEX IF NOT EXISTS idx_rollup_daily_model ON usage_rollup_daily(
+    model, bucket_start, request_count, total_cost, total_tokens, input_tokens, output_tokens,
+    latency_sum_ms, latency_count
+);
+CREATE INDEX IF NOT EXISTS idx_rollup_daily_agent ON usage_rollup_daily(
+    agent_name, bucket_start, request_count, total_cost, total_tokens, latency_sum_ms, latency_count
+);
+
+-- What each generation currently contributes to the rollups, keyed on the
+-- generation id and its trace id. Triggers subtract this row before adding
+-- the new values, and re-attribute it when its trace is renamed.
+CREATE TABLE IF NOT EXISTS usage_rollup_members (
+    generation_id TEXT PRIMARY KEY,
+    trace_id TEXT,
+    hour_bucket TEXT NOT NULL,
+    day_bucket TEXT NOT NULL,
+    model TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    total_tokens INTEGER NOT NULL,
+    total_cost REAL NOT NULL,
+    latency_ms REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rollup_members_trace ON usage_rollup_members(trace_id);
+"""
+
+ROLLUP_BUCKETS = {
+    "usage_rollup_hourly": "hour_bucket",
+    "usage_rollup_daily": "day_bucket",
+}
+
+ROLLUP_TRIGGERS = (
+    "trg_generations_rollup_replace",  # pre-ledger schema
+    "trg_generations_rollup_insert",
+    "trg_generations_rollup_update",
+    "trg_generations_rollup_delete",
+    "trg_traces_rollup_insert",
+    "trg_traces_rollup_update",
+    "trg_traces_rollup_delete",
+)
+
+
+def _member_insert_sql(row: str, source: str = "") -> str:
+    """Build an INSERT recording the rollup contribution of generation rows.
+
+    Args:
+        row: Generation row alias ("NEW" or a table alias)
+        source: Optional "FROM ..." clause when row is a table alias
+    """
+    return f"""
+        INSERT INTO usage_rollup_members (generation_id, trace_id, hour_bucket, day_bucket, model, agent_name,
+                                          input_tokens, output_tokens, total_tokens, total_cost, latency_ms)
+        SELECT {row}.id,
+               {row}.trace_id,
+               strftime('%Y-%m-%d %H:00:00', {row}.created_at),
+               DATE({row}.created_at),
+               COALESCE({row}.model, ''),
+               COALESCE((SELECT name FROM traces WHERE id = {row}.trace_id), 'Unknown'),
+               COALESCE({row}.input_tokens, 0),
+               COALESCE({row}.output_tokens, 0),
+               COALESCE({row}.total_tokens, 0),
+               COALESCE({row}.total_cost, 0.0),
+               {row}.latency_ms
+        {source} WHERE 1;"""
+
+
+def _rollup_adjust_sql(table: str, sign: int, where: str, agent: str = "m.agent_name") -> str:
+    """Build an UPSERT adding (sign=1) or removing (sign=-1) member rows from a rollup.
+
+    Args:
+        table: Rollup table name
+        sign: +1 to add the members, -1 to subtract them
+        where: Condition selecting members (alias m)
+        agent: Agent name to attribute the members to
+    """
+    return f"""
+        INSERT INTO {table} (bucket_start, model, agent_name, request_count, input_tokens, output_tokens,
+                             total_tokens, total_cost, latency_sum_ms, latency_count)
+        SELECT m.{ROLLUP_BUCKETS[table]},
+               m.model,
+               {agent},
+               {sign} * COUNT(*),
+               {sign} * SUM(m.input_tokens),
+               {sign} * SUM(m.output_tokens),
+               {sign} * SUM(m.total_tokens),
+               {sign} * SUM(m.total_cost),
+               {sign} * COALESCE(SUM(m.latency_ms), 0.0),
+               {sign} * COUNT(m.latency_ms)
+        FROM usage_rollup_members m
+        WHERE {where}
+        GROUP BY 1, 2, 3
+        ON CONFLICT(bucket_start, model, agent_name) DO UPDATE SET
+            request_count = request_count + excluded.request_count,
+            input_tokens = input_tokens + excluded.input_tokens,
+            output_tokens = output_tokens + excluded.output_tokens,
+            total_tokens = total_tokens + excluded.total_tokens,
+            total_cost = total_cost + excluded.total_cost,
+            latency_sum_ms = latency_sum_ms + excluded.latency_sum_ms,
+            latency_count = latency_count + excluded.latency_count;"""
+
+
+def _build_rollup_triggers() -> str:
+    """Build AFTER triggers keeping rollups in sync with generations and traces.
+
+    Every change to a generation subtracts its recorded member row and adds
+    the new one, so the rollups move by the difference whatever the statement:
+    INSERT OR REPLACE (whose implicit delete fires no trigger), UPSERT (fires
+    the UPDATE trigger), or INSERT OR IGNORE (fires nothing). Inserting,
+    renaming or deleting a trace moves its generations to the new agent name.
+    """
+    tables = list(ROLLUP_BUCKETS)
+
+    def forget(generation_id: str) -> str:
+        where = f"m.generation_id = {generation_id}"
+        subtract = " ".join(_rollup_adjust_sql(t, -1, where) for t in tables)
+        return f"{subtract} DELETE FROM usage_rollup_members WHERE generation_id = {generation_id};"
+
+    added = _member_insert_sql("NEW") + " ".join(_rollup_adjust_sql(t, 1, "m.generation_id = NEW.id") for t in tables)
+
+    def reattribute(trace_id: str, agent: str) -> str:
+        where = f"m.trace_id = {trace_id} AND m.agent_name != {agent}"
+        moved = " ".join(_rollup_adjust_sql(t, -1, where) + _rollup_adjust_sql(t, 1, where, agent) for t in tables)
+        moved_members = f"trace_id = {trace_id} AND agent_name != {agent}"
+        return f"{moved} UPDATE usage_rollup_members SET agent_name = {agent} WHERE {moved_members};"
+
+    return f"""
+CREATE TRIGGER IF NOT EXISTS trg_generations_rollup_insert AFTER INSERT ON generations
+BEGIN {forget("NEW.id")} {added}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_generations_rollup_update AFTER UPDATE OF
+    id, trace_id, model, input_tokens, output_tokens, total_tokens, total_cost, latency_ms, created_at
+ON generations
+BEGIN {forget("OLD.id")} {added}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_generations_rollup_delete AFTER DELETE ON generations
+BEGIN {forget("OLD.id")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_traces_rollup_insert AFTER INSERT ON traces
+BEGIN {reattribute("NEW.id", "COALESCE(NEW.name, 'Unknown')")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_traces_rollup_update AFTER UPDATE OF id, name ON traces
+BEGIN {reattribute("OLD.id", "'Unknown'")} {reattribute("NEW.id", "COALESCE(NEW.name, 'Unknown')")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_traces_rollup_delete AFTER DELETE ON traces
+BEGIN {reattribute("OLD.id", "'Unknown'")}
+END;
+"""
+
+
+CREATE_USAGE_ROLLUP_TRIGGERS = _build_rollup_triggers()
+
 
 # Dataclass Models
 
@@ -360,11 +561,51 @@ def init_database(db_path: str) -> sqlite3.Connection:
     conn.executescript(CREATE_SPANS_TABLE)
     conn.executescript(CREATE_PERFORMANCE_METRICS_TABLE)
     conn.executescript(CREATE_RATE_LIMIT_COUNTERS_TABLE)
+    ensure_usage_rollups(conn)
 
     conn.commit()
     return conn
 
 
+def ensure_usage_rollups(conn: sqlite3.Connection) -> None:
+    """Create usage rollup tables and triggers, backfilling them on first creation.
+
+    Safe to call on every startup: existing rollups are left untouched.
+    Databases from before the member table get their triggers replaced and
+    their rollups rebuilt.
+
+    Args:
+        conn: Database connection (generations and traces tables must exist)
+    """
+    existing = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+        "AND name IN ('usage_rollup_hourly', 'usage_rollup_daily', 'usage_rollup_members')"
+    ).fetchone()[0]
+
+    if existing < 3:
+        conn.executescript("".join(f"DROP TRIGGER IF EXISTS {name};" for name in ROLLUP_TRIGGERS))
+    conn.executescript(CREATE_USAGE_ROLLUP_TABLES)
+    conn.executescript(CREATE_USAGE_ROLLUP_TRIGGERS)
+
+    if existing < 3:
+        rebuild_usage_rollups(conn)
+    conn.commit()
+
+
+def rebuild_usage_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute usage rollups from raw generations (e.g. after bulk imports).
+
+    Args:
+        conn: Database connection
+    """
+    conn.execute("DELETE FROM usage_rollup_members")
+    conn.execute(_member_insert_sql("g", "FROM generations g"))
+    for table in ROLLUP_BUCKETS:
+        conn.execute(f"DELETE FROM {table}")
+        conn.execute(_rollup_adjust_sql(table, 1, "1"))
+    conn.commit()
+
+
 # Helper Functions for Database Operations
 
 
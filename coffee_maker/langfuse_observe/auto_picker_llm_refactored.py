@@ -17,6 +17,7 @@ from coffee_maker.langfuse_observe.response_parser import (
 from coffee_maker.langfuse_observe.strategies.context import ContextStrategy, create_context_strategy
 from coffee_maker.langfuse_observe.strategies.fallback import FallbackStrategy, SequentialFallback
 from coffee_maker.langfuse_observe.strategies.metrics import MetricsStrategy, NoOpMetrics
+from coffee_maker.utils.token_service import get_token_service
 
 logger = logging.getLogger(__name__)
 
@@ -424,8 +425,7 @@ class AutoPickerLLMRefactored(BaseLLM):
         else:
             text = str(input_data)
 
-        # Rough estimation: 4 characters per token
-        return max(1, len(text) // 4)
+        return max(1, get_token_service().count(text, model=model_name))
 
     def _check_context_length(
         self, estimated_tokens: int, model_name: str, enable_fallback: bool = True
@@ -17,8 +17,6 @@ import logging
 import time
 from typing import Any, Callable, Optional, Tuple, Type
 
-from langfuse import observe
-
 logger = logging.getLogger(__name__)
 
 
@@ -102,7 +100,32 @@ class RetryConfig:
         return True
 
 
-@observe(capture_input=False, capture_output=False)
+def _observe(**observe_kwargs: Any) -> Callable:
+    """Apply ``langfuse.observe`` on first call.
+
+    Importing langfuse costs about a second, and this module is imported by the
+    CLI notification path. Deferring the decorator keeps ``--help`` and status
+    commands from paying for it.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        observed: Optional[Callable] = None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal observed
+            if observed is None:
+                from langfuse import observe
+
+                observed = observe(**observe_kwargs)(func)
+            return observed(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@_observe(capture_input=False, capture_output=False)
 def _log_retry_attempt(
     function_name: str,
     attempt: int,
@@ -135,7 +158,7 @@ def _log_retry_attempt(
     # The observe decorator handles the Langfuse integration
 
 
-@observe(capture_input=False, capture_output=False)
+@_observe(capture_input=False, capture_output=False)
 def _log_retry_exhausted(
     function_name: str,
     total_attempts: int,
@@ -162,7 +185,7 @@ def _log_retry_exhausted(
     # Langfuse will automatically capture this as a span
 
 
-@observe(capture_input=False, capture_output=False)
+@_observe(capture_input=False, capture_output=False)
 def _log_retry_success(
     function_name: str,
     attempt: int,
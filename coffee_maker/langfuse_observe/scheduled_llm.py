@@ -13,6 +13,7 @@ from langchain_core.outputs import LLMResult
 from pydantic import ConfigDict
 
 from coffee_maker.langfuse_observe.strategies.scheduling import SchedulingStrategy
+from coffee_maker.utils.token_service import get_token_service
 
 logger = logging.getLogger(__name__)
 
@@ -194,9 +195,7 @@ class ScheduledLLM(BaseLLM):
         Returns:
             Estimated token count
         """
-        # Rough estimation: 4 characters per token
-        total_chars = sum(len(prompt) for prompt in prompts)
-        return total_chars // 4
+        return sum(get_token_service().count_batch(prompts, model=self.model_name))
 
     def _extract_token_usage(self, result: LLMResult, estimated_tokens: int) -> int:
         """Extract actual token usage from LLM result.
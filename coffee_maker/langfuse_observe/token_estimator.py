@@ -3,7 +3,7 @@
 import logging
 from typing import Any
 
-import tiktoken
+from coffee_maker.utils.token_service import get_token_service
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 def estimate_tokens(input_data: Any, model_name: str = "gpt-4") -> int:
     """Estimate token count for input data.
 
+    Uses the shared token counting service (cached encoders and counts).
+
     Args:
         input_data: Input to estimate (dict, str, or list)
         model_name: Model name for tokenizer selection
@@ -18,13 +20,6 @@ def estimate_tokens(input_data: Any, model_name: str = "gpt-4") -> int:
     Returns:
         Estimated token count
     """
-    try:
-        # Try to get encoding for the specific model
-        encoding = tiktoken.encoding_for_model(model_name)
-    except KeyError:
-        # Fallback to cl100k_base (used by gpt-4, gpt-3.5-turbo)
-        encoding = tiktoken.get_encoding("cl100k_base")
-
     # Convert input_data to string
     if isinstance(input_data, dict):
         # For dict inputs (common in LangChain)
@@ -35,10 +30,4 @@ def estimate_tokens(input_data: Any, model_name: str = "gpt-4") -> int:
     else:
         text = str(input_data)
 
-    # Estimate tokens
-    try:
-        return len(encoding.encode(text))
-    except Exception as e:
-        logger.warning(f"Token estimation failed: {e}, using fallback")
-        # Fallback: ~4 characters per token
-        return len(text) // 4
+    return get_token_service().count(text, model=model_name)
@@ -143,15 +143,17 @@ def get_running_agents() -> List[Dict]:
 
 
 def get_agent_status_from_files() -> Dict[str, Dict]:
-    """Read agent status from status files.
+    """Read agent status from the status registry and status files.
 
-    Returns all status files, categorized by whether the process is still running.
+    Agents with a row in the host-wide status registry are read from one
+    snapshot of it; status files are only parsed for agents without a row
+    (e.g. written by older versions). Statuses are categorized by whether
+    the process is still running.
 
     Returns:
         Dictionary with 'active' and 'recent_issues' keys containing agent statuses
     """
-    from datetime import datetime, timedelta
-    import os
+    from coffee_maker.autonomous.agent_status_registry import get_agent_status_registry, pid_alive
 
     status_dir = Path("data/agent_status")
     active_agents = {}
@@ -160,34 +162,36 @@ def get_agent_status_from_files() -> Dict[str, Dict]:
     if not status_dir.exists():
         return {"active": active_agents, "recent_issues": recent_issues}
 
+    def categorize(agent_type: str, status: Dict, alive: bool) -> None:
+        if alive:
+            active_agents[agent_type] = status
+            return
+        # Process doesn't exist - show errors/crashes from last 24 hours
+        try:
+            heartbeat_time = datetime.fromisoformat(status.get("last_heartbeat") or "")
+            if datetime.now() - heartbeat_time < timedelta(hours=24):
+                recent_issues[agent_type] = status
+        except ValueError:
+            pass
+
+    try:
+        snapshot = get_agent_status_registry(status_dir).snapshot()
+    except Exception:
+        snapshot = {}
+    for agent_type, status in snapshot.items():
+        categorize(agent_type, status, status["alive"])
+
     for status_file in status_dir.glob("*.json"):
         try:
             status = json.loads(status_file.read_text())
             agent_type = status.get("agent_type", status_file.stem)
+            if agent_type in snapshot:
+                continue
 
-            # Check if PID is still running
+            # No PID - might be old format, skip
             pid = status.get("pid")
             if pid:
-                try:
-                    os.kill(pid, 0)  # Signal 0 checks if process exists
-                    # Process exists - this is an active agent
-                    active_agents[agent_type] = status
-                except (OSError, ProcessLookupError):
-                    # Process doesn't exist - check if it's a recent issue
-                    last_heartbeat = status.get("last_heartbeat")
-                    if last_heartbeat:
-                        try:
-                            heartbeat_time = datetime.fromisoformat(last_heartbeat)
-                            age = datetime.now() - heartbeat_time
-
-                            # Show errors/crashes from last 24 hours
-                            if age < timedelta(hours=24):
-                                recent_issues[agent_type] = status
-                        except Exception:
-                            pass
-            else:
-                # No PID - might be old format, skip
-                pass
+                categorize(agent_type, status, pid_alive(pid))
 
         except Exception:
             continue
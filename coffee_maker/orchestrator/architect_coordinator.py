@@ -275,6 +275,7 @@ architect merge-worktree-branches --merge {branch} --us-number {us_number}
             priority="high",
             sound=False,  # CFR-009: Silent for background agent (orchestrator)
             agent_id="orchestrator",
+            wait=False,
         )
 
         logger.info(f"📬 Notified architect to merge {branch} (US-{us_number})")
@@ -149,6 +149,7 @@ class ContinuousWorkLoop:
             priority="normal",
             sound=False,  # CFR-009: Background agent, no sound
             agent_id="orchestrator",
+            wait=False,
         )
 
         try:
@@ -382,6 +383,7 @@ class ContinuousWorkLoop:
             priority="normal",
             sound=False,  # CFR-009
             agent_id="orchestrator",
+            wait=False,
         )
 
         # Track that we sent the notification
@@ -858,6 +860,7 @@ class ContinuousWorkLoop:
                     priority="high",
                     sound=False,  # CFR-009
                     agent_id="orchestrator",
+                    wait=False,
                 )
 
         if completed_tasks:
@@ -930,6 +933,7 @@ class ContinuousWorkLoop:
             priority="high" if bug["priority"] == "Critical" else "normal",
             sound=False,  # CFR-009
             agent_id="orchestrator",
+            wait=False,
         )
 
         # Spawn code_developer for bug fix
@@ -1182,6 +1186,7 @@ class ContinuousWorkLoop:
                 priority="critical",
                 sound=False,  # CFR-009
                 agent_id="orchestrator",
+                wait=False,
             )
 
     def _handle_shutdown(self, signum, frame):
@@ -1209,6 +1214,7 @@ class ContinuousWorkLoop:
             priority="normal",
             sound=False,  # CFR-009
             agent_id="orchestrator",
+            wait=False,
         )
 
         logger.info("✅ Graceful shutdown complete")
@@ -1431,6 +1437,7 @@ class ContinuousWorkLoop:
                         priority="high",
                         sound=False,  # CFR-009: Silent for background agent
                         agent_id="orchestrator",
+                        wait=False,
                     )
 
                     bugs_created += 1
@@ -20,12 +20,21 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
+from coffee_maker.autonomous.roadmap_index import RoadmapHeading, RoadmapIndex
 from coffee_maker.autonomous.roadmap_parser import RoadmapParser
 
 logger = logging.getLogger(__name__)
 
+# Pattern to match User Stories: ### 🎯 [US-XXX] Title
+US_HEADER_PATTERN = re.compile(r"### 🎯 \[(US-\d+)\] (.+?)(?:\n|$)")
+
+
+def _is_story_boundary(heading: RoadmapHeading) -> bool:
+    """Check if a heading ends a user story section (any ## or ### heading)."""
+    return heading.text.startswith("##")
+
 
 @dataclass
 class StoryCompletion:
@@ -136,6 +145,20 @@ class StatusReportGenerator:
 
         logger.info(f"StatusReportGenerator initialized for {roadmap_path}")
 
+    def _iter_story_sections(self) -> Iterator[Tuple[str, str, str]]:
+        """Iterate over User Story sections using the shared roadmap index.
+
+        Yields:
+            Tuples of (story_id, title, section_content) in roadmap order
+        """
+        index = RoadmapIndex.for_path(self.roadmap_path)
+        ends = index.section_ends(_is_story_boundary, key="status_report")
+
+        for heading in index.headings:
+            match = US_HEADER_PATTERN.search(heading.text)
+            if match:
+                yield match.group(1), match.group(2).strip(), index.section_text(heading, ends[heading.index])
+
     def get_recent_completions(self, days: int = 14) -> List[StoryCompletion]:
         """Get list of recently completed stories/priorities.
 
@@ -157,24 +180,7 @@ class StatusReportGenerator:
         cutoff_date = datetime.now() - timedelta(days=days)
         completions = []
 
-        # Read full roadmap content
-        content = self.roadmap_path.read_text()
-
-        # Pattern to match User Stories: ### 🎯 [US-XXX] Title
-        us_pattern = r"### 🎯 \[(US-\d+)\] (.+?)(?:\n|$)"
-        us_matches = re.finditer(us_pattern, content)
-
-        for match in us_matches:
-            story_id = match.group(1)
-            title = match.group(2).strip()
-
-            # Extract story section
-            section_start = match.start()
-            # Find next section (either ### or ##)
-            next_section = re.search(r"\n##", content[section_start + 1 :])
-            section_end = section_start + next_section.start() if next_section else len(content)
-            section_content = content[section_start:section_end]
-
+        for story_id, title, section_content in self._iter_story_sections():
             # Check if story is complete
             if not self._is_complete(section_content):
                 continue
@@ -282,26 +288,10 @@ class StatusReportGenerator:
         """
         upcoming = []
 
-        # Read full roadmap content
-        content = self.roadmap_path.read_text()
-
-        # Pattern to match User Stories: ### 🎯 [US-XXX] Title
-        us_pattern = r"### 🎯 \[(US-\d+)\] (.+?)(?:\n|$)"
-        us_matches = re.finditer(us_pattern, content)
-
-        for match in us_matches:
+        for story_id, title, section_content in self._iter_story_sections():
             if len(upcoming) >= limit:
                 break
 
-            story_id = match.group(1)
-            title = match.group(2).strip()
-
-            # Extract story section
-            section_start = match.start()
-            next_section = re.search(r"\n##", content[section_start + 1 :])
-            section_end = section_start + next_section.start() if next_section else len(content)
-            section_content = content[section_start:section_end]
-
             # Check if story is complete (skip if complete)
             if self._is_complete(section_content):
                 continue
@@ -952,23 +942,7 @@ class StatusReportGenerator:
         """
         in_progress = []
 
-        # Read full roadmap content
-        content = self.roadmap_path.read_text()
-
-        # Pattern to match User Stories: ### 🎯 [US-XXX] Title
-        us_pattern = r"### 🎯 \[(US-\d+)\] (.+?)(?:\n|$)"
-        us_matches = re.finditer(us_pattern, content)
-
-        for match in us_matches:
-            story_id = match.group(1)
-            title = match.group(2).strip()
-
-            # Extract story section
-            section_start = match.start()
-            next_section = re.search(r"\n##", content[section_start + 1 :])
-            section_end = section_start + next_section.start() if next_section else len(content)
-            section_content = content[section_start:section_end]
-
+        for story_id, title, section_content in self._iter_story_sections():
             # Check if in progress (not complete, has started or progress indicators)
             if self._is_in_progress(section_content):
                 story_info = {
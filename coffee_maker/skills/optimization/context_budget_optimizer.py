@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from coffee_maker.utils.token_service import get_token_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,20 +34,13 @@ class TokenCounter:
     """Accurate token counting using tiktoken.
 
     This class provides reliable token counting for context budget calculations.
-    Falls back to approximation if tiktoken is not available.
+    Counting is delegated to the shared token counting service (cached encoder
+    and counts), which falls back to approximation if tiktoken is not available.
     """
 
     def __init__(self):
-        """Initialize token counter with tiktoken encoding."""
-        try:
-            import tiktoken
-
-            self.encoding = tiktoken.get_encoding("cl100k_base")  # GPT-3.5/4 encoding
-            self.has_tiktoken = True
-        except ImportError:
-            logger.warning("tiktoken not available, using approximate counting")
-            self.encoding = None
-            self.has_tiktoken = False
+        """Initialize token counter with the shared token counting service."""
+        self.service = get_token_service()
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text.
@@ -56,11 +51,7 @@ class TokenCounter:
         Returns:
             Number of tokens
         """
-        if self.has_tiktoken and self.encoding:
-            return len(self.encoding.encode(text))
-        else:
-            # Rough approximation: 1 token ≈ 4 characters
-            return len(text) // 4
+        return self.service.count(text)
 
     def count_file_tokens(self, file_path: str) -> Tuple[int, int]:
         """Count tokens in file.
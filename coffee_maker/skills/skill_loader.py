@@ -21,6 +21,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from coffee_maker.utils.token_service import get_token_service
+
 
 @dataclass
 class SkillStep:
@@ -254,7 +256,8 @@ class StartupSkillLoader:
         """
         Estimate token count for text.
 
-        Rule of thumb: ~4 characters per token
+        Uses the token service's approximate mode (~4 characters per token):
+        startup only needs a rough context budget.
 
         Args:
             text: Text to estimate
@@ -262,7 +265,7 @@ class StartupSkillLoader:
         Returns:
             Estimated token count
         """
-        return len(text) // 4
+        return get_token_service().count(text, approximate=True)
 
     def _execute_health_checks(self, agent_name: str, step: SkillStep) -> None:
         """
@@ -8,11 +8,16 @@ This module provides automated dependency evaluation with comprehensive analysis
 - Version analysis (recency, breaking changes, deprecation)
 - Impact assessment (bundle size, install time, sub-dependencies)
 
+All components share one PackageMetadataProvider, so each package's PyPI metadata
+and Poetry tree are fetched once per analysis (and cached on disk between runs).
+`analyze_pyproject()` audits every dependency of a pyproject.toml in one pass.
+
 Time savings: 40-60 min manual analysis → 2-3 min automated (93-95% reduction)
 """
 
 import logging
 import time
+import tomllib
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from datetime import datetime
@@ -40,6 +45,7 @@ from coffee_maker.utils.dependency_impact_assessor import ImpactAssessor
 from coffee_maker.utils.dependency_license_checker import LicenseChecker
 from coffee_maker.utils.dependency_security_scanner import SecurityScanner
 from coffee_maker.utils.dependency_version_analyzer import VersionAnalyzer
+from coffee_maker.utils.package_metadata import DEFAULT_CACHE_DIR, PackageMetadataProvider
 
 logger = logging.getLogger(__name__)
 
@@ -154,23 +160,30 @@ class DependencyAnalyzer:
     Time savings: 40-60 min → 2-3 min (93-95% reduction)
     """
 
-    def __init__(self, project_root: Path, langfuse_client: Optional[Any] = None):
+    def __init__(
+        self,
+        project_root: Path,
+        langfuse_client: Optional[Any] = None,
+        metadata_provider: Optional[PackageMetadataProvider] = None,
+    ):
         """
         Initialize analyzer with project context.
 
         Args:
             project_root: Path to project root (contains pyproject.toml)
             langfuse_client: Optional Langfuse client for observability
+            metadata_provider: Shared metadata provider (default: disk-cached in ~/.coffee_maker/cache/pypi)
         """
         self.project_root = project_root
         self.langfuse = langfuse_client
+        self.metadata_provider = metadata_provider or PackageMetadataProvider(cache_dir=DEFAULT_CACHE_DIR)
 
-        # Initialize sub-components
-        self.conflict_analyzer = ConflictAnalyzer(project_root)
+        # Initialize sub-components (all share the same metadata provider)
+        self.conflict_analyzer = ConflictAnalyzer(project_root, self.metadata_provider)
         self.security_scanner = SecurityScanner()
-        self.license_checker = LicenseChecker()
-        self.version_analyzer = VersionAnalyzer()
-        self.impact_assessor = ImpactAssessor(project_root)
+        self.license_checker = LicenseChecker(self.metadata_provider)
+        self.version_analyzer = VersionAnalyzer(self.metadata_provider)
+        self.impact_assessor = ImpactAssessor(project_root, self.metadata_provider)
 
         logger.info(f"DependencyAnalyzer initialized for project: {project_root}")
 
@@ -257,6 +270,101 @@ class DependencyAnalyzer:
             logger.error(f"Analysis failed for {package_name}: {str(e)}")
             raise AnalysisError(f"Analysis failed: {str(e)}")
 
+    def analyze_pyproject(
+        self,
+        pyproject_path: Optional[Path] = None,
+        include_groups: bool = False,
+        max_workers: int = 4,
+    ) -> Dict[str, AnalysisReport]:
+        """
+        Analyze every dependency declared in a pyproject.toml in one pass.
+
+        Metadata for all packages is prefetched concurrently through the shared
+        provider, so each package is fetched from PyPI once no matter how many
+        components inspect it.
+
+        Args:
+            pyproject_path: Path to pyproject.toml (default: project_root/pyproject.toml)
+            include_groups: Also analyze Poetry dependency groups (dev, ...)
+            max_workers: Maximum packages analyzed concurrently
+
+        Returns:
+            Dict mapping package name to AnalysisReport (failed packages are omitted)
+        """
+        start_time = time.time()
+        pyproject_path = pyproject_path or Path(self.project_root) / "pyproject.toml"
+        dependencies = self._read_pyproject_dependencies(pyproject_path, include_groups)
+
+        logger.info(f"Starting batch analysis of {len(dependencies)} dependencies from {pyproject_path}")
+
+        # Prefetch metadata once per package (coalesced with the per-component lookups)
+        self.metadata_provider.get_many(dependencies.keys())
+
+        reports: Dict[str, AnalysisReport] = {}
+        if not dependencies:
+            return reports
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(dependencies))) as executor:
+            futures = {
+                name: executor.submit(self.analyze_dependency, name, constraint)
+                for name, constraint in dependencies.items()
+            }
+            for name, future in futures.items():
+                try:
+                    reports[name] = future.result()
+                except AnalysisError as e:
+                    logger.error(f"Batch analysis failed for {name}: {str(e)}")
+
+        logger.info(
+            f"Batch analysis complete: {len(reports)}/{len(dependencies)} packages in "
+            f"{time.time() - start_time:.2f}s (metadata stats: {self.metadata_provider.stats})"
+        )
+
+        return reports
+
+    def _read_pyproject_dependencies(self, pyproject_path: Path, include_groups: bool) -> Dict[str, Optional[str]]:
+        """
+        Read dependency names and version constraints from pyproject.toml.
+
+        Supports Poetry tables ([tool.poetry.dependencies], [tool.poetry.group.*])
+        and PEP 621 ([project] dependencies).
+
+        Args:
+            pyproject_path: Path to pyproject.toml
+            include_groups: Include Poetry dependency groups
+
+        Returns:
+            Dict mapping package name to version constraint (None = any)
+        """
+        with open(pyproject_path, "rb") as f:
+            pyproject = tomllib.load(f)
+
+        dependencies: Dict[str, Optional[str]] = {}
+
+        poetry = pyproject.get("tool", {}).get("poetry", {})
+        tables = [poetry.get("dependencies", {})]
+        if include_groups:
+            tables.extend(group.get("dependencies", {}) for group in poetry.get("group", {}).values())
+
+        for table in tables:
+            for name, spec in table.items():
+                if name.lower() == "python":
+                    continue
+                constraint = spec.get("version") if isinstance(spec, dict) else spec
+                dependencies[name] = None if constraint in (None, "*") else constraint
+
+        from packaging.requirements import InvalidRequirement, Requirement
+
+        for requirement_string in pyproject.get("project", {}).get("dependencies", []):
+            try:
+                requirement = Requirement(requirement_string)
+            except InvalidRequirement:
+                logger.warning(f"Skipping invalid requirement: {requirement_string}")
+                continue
+            dependencies[requirement.name] = str(requirement.specifier) or None
+
+        return dependencies
+
     def _generate_recommendation(
         self, security: SecurityReport, license: LicenseInfo, conflicts: ConflictInfo
     ) -> Recommendation:
@@ -10,6 +10,8 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from coffee_maker.utils.package_metadata import PackageMetadataProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,14 +23,16 @@ class ConflictAnalyzer:
     parses poetry.lock to identify circular dependencies.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, metadata_provider: Optional[PackageMetadataProvider] = None):
         """
         Initialize with project root containing pyproject.toml.
 
         Args:
             project_root: Path to project root directory
+            metadata_provider: Shared metadata provider (default: private in-memory provider)
         """
         self.project_root = project_root
+        self.metadata_provider = metadata_provider or PackageMetadataProvider()
         self.pyproject_path = project_root / "pyproject.toml"
         self.lock_path = project_root / "poetry.lock"
 
@@ -107,17 +111,8 @@ class ConflictAnalyzer:
                 version_clean = version.strip('"').strip("'")
                 package_spec = f"{package_name}{version_clean}"
 
-            # Run poetry add --dry-run
-            cmd = ["poetry", "add", package_spec, "--dry-run"]
-            logger.debug(f"Running: {' '.join(cmd)}")
-
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            # Run poetry add --dry-run (memoized per pyproject.toml/poetry.lock content)
+            result = self.metadata_provider.poetry_add_dry_run(package_spec, self.project_root)
 
             # Parse output for conflict messages
             conflicts = []
@@ -180,15 +175,9 @@ class ConflictAnalyzer:
 
         logger.debug(f"Circular dependency detection for {package_name} (simplified)")
 
-        # Try to get dependency tree
+        # Try to get dependency tree (memoized per poetry.lock version)
         try:
-            result = subprocess.run(
-                ["poetry", "show", package_name, "--tree"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = self.metadata_provider.poetry_show_tree(package_name, self.project_root)
 
             if result.returncode == 0:
                 # Parse tree and look for repeated packages
@@ -222,14 +211,8 @@ class ConflictAnalyzer:
             Tuple of (tree_depth, total_sub_dependencies)
         """
         try:
-            # Try to get dependency tree
-            result = subprocess.run(
-                ["poetry", "show", package_name, "--tree"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            # Try to get dependency tree (memoized per poetry.lock version)
+            result = self.metadata_provider.poetry_show_tree(package_name, self.project_root)
 
             if result.returncode == 0:
                 tree_output = result.stdout
@@ -5,11 +5,10 @@ Assesses the impact of adding a dependency (installation time, bundle size, sub-
 """
 
 import logging
-import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import requests
+from coffee_maker.utils.package_metadata import PackageMetadataProvider
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +20,17 @@ class ImpactAssessor:
     Estimates installation time, bundle size, and sub-dependencies.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, metadata_provider: Optional[PackageMetadataProvider] = None):
         """
         Initialize assessor with project root.
 
         Args:
             project_root: Path to project root directory
+            metadata_provider: Shared metadata provider (default: private in-memory provider)
         """
         self.project_root = project_root
-        self.pypi_base_url = "https://pypi.org/pypi"
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "MonolithicCoffeeMakerAgent/1.0"})
+        self.metadata_provider = metadata_provider or PackageMetadataProvider()
+        self.session = self.metadata_provider.session
         logger.debug(f"ImpactAssessor initialized for {project_root}")
 
     def assess_impact(self, package_name: str, version: Optional[str] = None) -> "ImpactAssessment":  # noqa: F821
@@ -100,33 +99,29 @@ class ImpactAssessor:
             Estimated bundle size in MB
         """
         try:
-            # Fetch PyPI metadata
-            url = f"{self.pypi_base_url}/{package_name}/json"
-            response = self.session.get(url, timeout=10)
+            # Fetch PyPI metadata (shared with license/version checks)
+            metadata = self.metadata_provider.get_metadata(package_name)
 
-            if response.status_code == 200:
-                metadata = response.json()
+            # Get latest version info
+            info = metadata.get("info", {})
+            latest_version = info.get("version", "")
 
-                # Get latest version info
-                info = metadata.get("info", {})
-                latest_version = info.get("version", "")
+            # Get release files for latest version
+            releases = metadata.get("releases", {})
+            version_files = releases.get(latest_version, [])
 
-                # Get release files for latest version
-                releases = metadata.get("releases", {})
-                version_files = releases.get(latest_version, [])
+            if version_files:
+                # Find wheel file (preferred) or source distribution
+                wheel_files = [f for f in version_files if f.get("packagetype") == "bdist_wheel"]
+                sdist_files = [f for f in version_files if f.get("packagetype") == "sdist"]
 
-                if version_files:
-                    # Find wheel file (preferred) or source distribution
-                    wheel_files = [f for f in version_files if f.get("packagetype") == "bdist_wheel"]
-                    sdist_files = [f for f in version_files if f.get("packagetype") == "sdist"]
+                target_file = wheel_files[0] if wheel_files else (sdist_files[0] if sdist_files else None)
 
-                    target_file = wheel_files[0] if wheel_files else (sdist_files[0] if sdist_files else None)
-
-                    if target_file:
-                        size_bytes = target_file.get("size", 0)
-                        size_mb = size_bytes / (1024 * 1024)
-                        logger.debug(f"Bundle size for {package_name}: {size_mb:.2f}MB")
-                        return round(size_mb, 2)
+                if target_file:
+                    size_bytes = target_file.get("size", 0)
+                    size_mb = size_bytes / (1024 * 1024)
+                    logger.debug(f"Bundle size for {package_name}: {size_mb:.2f}MB")
+                    return round(size_mb, 2)
 
         except Exception as e:
             logger.debug(f"Could not estimate bundle size for {package_name}: {str(e)}")
@@ -138,7 +133,7 @@ class ImpactAssessor:
         """
         Count sub-dependencies and return list.
 
-        Uses `poetry show --tree` (simulated with --dry-run).
+        Uses `poetry show --tree` via the shared metadata provider.
 
         Args:
             package_name: Package name
@@ -150,14 +145,8 @@ class ImpactAssessor:
         sub_deps = []
 
         try:
-            # Try to get dependency tree
-            result = subprocess.run(
-                ["poetry", "show", package_name, "--tree"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            # Try to get dependency tree (memoized per poetry.lock version)
+            result = self.metadata_provider.poetry_show_tree(package_name, self.project_root)
 
             if result.returncode == 0:
                 tree_output = result.stdout
@@ -230,47 +219,43 @@ class ImpactAssessor:
         }
 
         try:
-            # Fetch PyPI metadata
-            url = f"{self.pypi_base_url}/{package_name}/json"
-            response = self.session.get(url, timeout=10)
-
-            if response.status_code == 200:
-                metadata = response.json()
-                info = metadata.get("info", {})
-
-                # Check classifiers for OS-specific info
-                classifiers = info.get("classifiers", [])
-
-                # Look for OS-specific classifiers
-                # "Operating System :: POSIX :: Linux"
-                # "Operating System :: MacOS"
-                # "Operating System :: Microsoft :: Windows"
-
-                has_os_restrictions = False
-                supports_linux = False
-                supports_macos = False
-                supports_windows = False
-
-                for classifier in classifiers:
-                    if "Operating System ::" in classifier:
-                        has_os_restrictions = True
-                        if "Linux" in classifier or "POSIX" in classifier:
-                            supports_linux = True
-                        if "MacOS" in classifier or "Mac OS" in classifier:
-                            supports_macos = True
-                        if "Windows" in classifier or "Microsoft" in classifier:
-                            supports_windows = True
-
-                # If OS restrictions found, update compatibility
-                if has_os_restrictions:
-                    platform_compat["linux"] = supports_linux
-                    platform_compat["macos"] = supports_macos
-                    platform_compat["windows"] = supports_windows
-
-                    logger.debug(
-                        f"Platform compatibility for {package_name}: "
-                        f"linux={supports_linux}, macos={supports_macos}, windows={supports_windows}"
-                    )
+            # Fetch PyPI metadata (shared with license/version checks)
+            metadata = self.metadata_provider.get_metadata(package_name)
+            info = metadata.get("info", {})
+
+            # Check classifiers for OS-specific info
+            classifiers = info.get("classifiers", [])
+
+            # Look for OS-specific classifiers
+            # "Operating System :: POSIX :: Linux"
+            # "Operating System :: MacOS"
+            # "Operating System :: Microsoft :: Windows"
+
+            has_os_restrictions = False
+            supports_linux = False
+            supports_macos = False
+            supports_windows = False
+
+            for classifier in classifiers:
+                if "Operating System ::" in classifier:
+                    has_os_restrictions = True
+                    if "Linux" in classifier or "POSIX" in classifier:
+                        supports_linux = True
+                    if "MacOS" in classifier or "Mac OS" in classifier:
+                        supports_macos = True
+                    if "Windows" in classifier or "Microsoft" in classifier:
+                        supports_windows = True
+
+            # If OS restrictions found, update compatibility
+            if has_os_restrictions:
+                platform_compat["linux"] = supports_linux
+                platform_compat["macos"] = supports_macos
+                platform_compat["windows"] = supports_windows
+
+                logger.debug(
+                    f"Platform compatibility for {package_name}: "
+                    f"linux={supports_linux}, macos={supports_macos}, windows={supports_windows}"
+                )
 
         except Exception as e:
             logger.debug(f"Could not check platform compatibility for {package_name}: {str(e)}")
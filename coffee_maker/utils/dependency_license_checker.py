@@ -5,10 +5,12 @@ Checks license compatibility with project license (Apache 2.0) using PyPI API.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import requests
 
+from coffee_maker.utils.package_metadata import PackageMetadataProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,11 +66,15 @@ class LicenseChecker:
         "rdkit": ["openbabel", "deepchem"],
     }
 
-    def __init__(self):
-        """Initialize checker with PyPI API client."""
-        self.pypi_base_url = "https://pypi.org/pypi"
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "MonolithicCoffeeMakerAgent/1.0"})
+    def __init__(self, metadata_provider: Optional[PackageMetadataProvider] = None):
+        """
+        Initialize checker with PyPI metadata provider.
+
+        Args:
+            metadata_provider: Shared metadata provider (default: private in-memory provider)
+        """
+        self.metadata_provider = metadata_provider or PackageMetadataProvider()
+        self.session = self.metadata_provider.session
         logger.debug("LicenseChecker initialized")
 
     def check_license(self, package_name: str) -> "LicenseInfo":  # noqa: F821
@@ -159,18 +165,7 @@ class LicenseChecker:
             PackageNotFoundError: If package doesn't exist
         """
         try:
-            url = f"{self.pypi_base_url}/{package_name}/json"
-            logger.debug(f"Fetching PyPI metadata: {url}")
-
-            response = self.session.get(url, timeout=10)
-
-            if response.status_code == 404:
-                from coffee_maker.utils.dependency_analyzer import PackageNotFoundError
-
-                raise PackageNotFoundError(f"Package '{package_name}' not found on PyPI")
-
-            response.raise_for_status()
-            return response.json()
+            return self.metadata_provider.get_metadata(package_name)
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch PyPI metadata for {package_name}: {str(e)}")
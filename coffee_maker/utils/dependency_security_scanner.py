@@ -19,6 +19,9 @@ class SecurityScanner:
     Uses pip-audit and safety to check CVE databases.
     """
 
+    # Tool availability is checked once per process, not per scanner instance
+    _tools_checked = False
+
     def __init__(self):
         """Initialize scanner (check tool availability)."""
         self._ensure_tools_installed()
@@ -243,7 +246,11 @@ class SecurityScanner:
         )
 
     def _ensure_tools_installed(self):
-        """Check if pip-audit and safety are installed, warn if not."""
+        """Check if pip-audit and safety are installed, warn if not (once per process)."""
+        if SecurityScanner._tools_checked:
+            return
+        SecurityScanner._tools_checked = True
+
         # Check pip-audit
         try:
             result = subprocess.run(
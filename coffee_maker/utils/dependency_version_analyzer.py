@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 import requests
 from packaging.version import Version, InvalidVersion
 
+from coffee_maker.utils.package_metadata import PackageMetadataProvider
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,11 +24,15 @@ class VersionAnalyzer:
     Uses PyPI JSON API to check latest versions and release notes.
     """
 
-    def __init__(self):
-        """Initialize analyzer with PyPI API client."""
-        self.pypi_base_url = "https://pypi.org/pypi"
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "MonolithicCoffeeMakerAgent/1.0"})
+    def __init__(self, metadata_provider: Optional[PackageMetadataProvider] = None):
+        """
+        Initialize analyzer with PyPI metadata provider.
+
+        Args:
+            metadata_provider: Shared metadata provider (default: private in-memory provider)
+        """
+        self.metadata_provider = metadata_provider or PackageMetadataProvider()
+        self.session = self.metadata_provider.session
         logger.debug("VersionAnalyzer initialized")
 
     def analyze_version(
@@ -119,18 +125,7 @@ class VersionAnalyzer:
             PackageNotFoundError: If package doesn't exist
         """
         try:
-            url = f"{self.pypi_base_url}/{package_name}/json"
-            logger.debug(f"Fetching PyPI metadata: {url}")
-
-            response = self.session.get(url, timeout=10)
-
-            if response.status_code == 404:
-                from coffee_maker.utils.dependency_analyzer import PackageNotFoundError
-
-                raise PackageNotFoundError(f"Package '{package_name}' not found on PyPI")
-
-            response.raise_for_status()
-            return response.json()
+            return self.metadata_provider.get_metadata(package_name)
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch PyPI metadata for {package_name}: {str(e)}")
@@ -0,0 +1,365 @@
+"""
+Shared package metadata provider for dependency analysis.
+
+LicenseChecker, VersionAnalyzer and ImpactAssessor all need the same PyPI JSON
+document, and ImpactAssessor/ConflictAnalyzer all need the same
+`poetry show <package> --tree` output. This module fetches each of them once and
+shares the result:
+
+- Request coalescing: concurrent callers asking for the same package wait on a
+  single in-flight request instead of issuing their own.
+- On-disk cache: PyPI responses are stored with their ETag and revalidated with
+  `If-None-Match` once the TTL expires (a 304 just refreshes the timestamp).
+- Offline mode: metadata is served from the disk cache (ignoring TTL) or from a
+  local fixture index (`<package>.json` files), never from the network.
+- Poetry memoization: `poetry show --tree` and `poetry add --dry-run` results
+  are keyed on the command and the content of pyproject.toml and poetry.lock.
+
+Usage:
+    provider = PackageMetadataProvider(cache_dir=DEFAULT_CACHE_DIR)
+    metadata = provider.get_metadata("pytest-timeout")
+    batch = provider.get_many(["requests", "pyyaml"])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_ENV_VAR = "COFFEE_MAKER_PYPI_OFFLINE"
+FIXTURES_ENV_VAR = "COFFEE_MAKER_PYPI_FIXTURES"
+
+# Per-user disk cache, outside any repository working tree
+DEFAULT_CACHE_DIR = Path.home() / ".coffee_maker" / "cache" / "pypi"
+
+
+def normalize_package_name(package_name: str) -> str:
+    """Normalize a package name per PEP 503 ("Foo_Bar" → "foo-bar")."""
+    return re.sub(r"[-_.]+", "-", package_name).lower().strip()
+
+
+class PackageMetadataProvider:
+    """
+    Fetches and caches PyPI metadata and Poetry dependency trees.
+
+    One provider is meant to be shared by all dependency analysis components
+    of a DependencyAnalyzer, so each package is fetched at most once per TTL.
+
+    Example:
+        >>> provider = PackageMetadataProvider(offline=True, fixture_dir=Path("tests/fixtures/pypi"))
+        >>> provider.get_metadata("pytest-timeout")["info"]["license"]
+        'MIT'
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: int = 3600,
+        offline: Optional[bool] = None,
+        fixture_dir: Optional[Path] = None,
+        timeout: int = 10,
+    ):
+        """Initialize PackageMetadataProvider.
+
+        Args:
+            cache_dir: Directory for on-disk cache (default: None = memory only)
+            ttl: Time-to-live in seconds before revalidating with PyPI (default: 1 hour)
+            offline: Never hit the network (default: COFFEE_MAKER_PYPI_OFFLINE env var)
+            fixture_dir: Directory of `<package>.json` fixtures used in offline mode
+                (default: COFFEE_MAKER_PYPI_FIXTURES env var)
+            timeout: HTTP timeout in seconds
+        """
+        self.pypi_base_url = "https://pypi.org/pypi"
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "MonolithicCoffeeMakerAgent/1.0"})
+
+        self.cache_dir = cache_dir
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        if offline is None:
+            offline = os.environ.get(OFFLINE_ENV_VAR, "").lower() in ("1", "true", "yes")
+        self.offline = offline
+        if fixture_dir is None and os.environ.get(FIXTURES_ENV_VAR):
+            fixture_dir = Path(os.environ[FIXTURES_ENV_VAR])
+        self.fixture_dir = fixture_dir
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._poetry_cache: Dict[Tuple[Tuple[str, ...], str, str], subprocess.CompletedProcess] = {}
+
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "fetches": 0, "revalidated": 0, "coalesced": 0}
+
+        logger.debug(f"PackageMetadataProvider initialized (cache_dir={cache_dir}, offline={self.offline})")
+
+    # ==================== PyPI metadata ====================
+
+    def get_metadata(self, package_name: str) -> Dict[str, Any]:
+        """
+        Get PyPI JSON metadata for a package.
+
+        Args:
+            package_name: Package name (any PEP 503 spelling)
+
+        Returns:
+            Dict with PyPI metadata ("info", "releases", ...)
+
+        Raises:
+            PackageNotFoundError: If package doesn't exist on PyPI
+            requests.RequestException: If the network request fails (or offline without fixture)
+        """
+        key = normalize_package_name(package_name)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and (self.offline or self._is_fresh(entry)):
+                self.stats["memory_hits"] += 1
+                return entry["data"]
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self.stats["coalesced"] += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            entry = self._load(key, package_name, entry)
+            with self._lock:
+                self._memory[key] = entry
+            future.set_result(entry["data"])
+            return entry["data"]
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get_many(self, package_names: Iterable[str], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata for many packages concurrently.
+
+        Packages that fail to resolve are logged and omitted from the result.
+
+        Args:
+            package_names: Package names to fetch
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Dict mapping each requested name to its metadata
+        """
+        names = list(dict.fromkeys(package_names))
+        results: Dict[str, Dict[str, Any]] = {}
+        if not names:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            futures = {name: executor.submit(self.get_metadata, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not fetch metadata for {name}: {str(e)}")
+
+        return results
+
+    def clear(self) -> None:
+        """Clear the in-memory caches (disk cache is kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._tree_cache.clear()
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check if a cache entry is within its TTL."""
+        return time.time() - entry.get("fetched_at", 0) <= self.ttl
+
+    def _load(self, key: str, package_name: str, entry: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Resolve a cache entry from disk, fixtures or PyPI (in that order)."""
+        if entry is None:
+            entry = self._read_disk_entry(key)
+            if entry is not None and (self.offline or self._is_fresh(entry)):
+                self.stats["disk_hits"] += 1
+                return entry
+
+        if self.offline:
+            if entry is not None:
+                return entry
+            fixture = self._read_fixture(key, package_name)
+            if fixture is not None:
+                return {"etag": None, "fetched_at": time.time(), "data": fixture}
+            raise requests.ConnectionError(f"Offline mode: no cached metadata or fixture for '{package_name}'")
+
+        return self._fetch(key, package_name, entry)
+
+    def _fetch(self, key: str, package_name: str, stale: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch from PyPI, revalidating a stale entry with its ETag when possible."""
+        url = f"{self.pypi_base_url}/{package_name}/json"
+        headers = {}
+        if stale is not None and stale.get("etag"):
+            headers["If-None-Match"] = stale["etag"]
+
+        logger.debug(f"Fetching PyPI metadata: {url}")
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+
+        if response.status_code == 304 and stale is not None:
+            self.stats["revalidated"] += 1
+            entry = {"etag": stale.get("etag"), "fetched_at": time.time(), "data": stale["data"]}
+            self._write_disk_entry(key, entry)
+            return entry
+
+        if response.status_code == 404:
+            from coffee_maker.utils.dependency_analyzer import PackageNotFoundError
+
+            raise PackageNotFoundError(f"Package '{package_name}' not found on PyPI")
+
+        response.raise_for_status()
+        self.stats["fetches"] += 1
+
+        etag = response.headers.get("ETag") if response.headers is not None else None
+        entry = {
+            "etag": etag if isinstance(etag, str) else None,
+            "fetched_at": time.time(),
+            "data": response.json(),
+        }
+        self._write_disk_entry(key, entry)
+        return entry
+
+    def _cache_file(self, key: str) -> Optional[Path]:
+        """Get on-disk cache file path (None if disk cache disabled)."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.json"
+
+    def _read_disk_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a cache entry from disk."""
+        cache_file = self._cache_file(key)
+        if cache_file is None or not cache_file.exists():
+            return None
+
+        try:
+            entry = json.loads(cache_file.read_text())
+            if "data" not in entry:
+                raise ValueError("missing data")
+            return entry
+        except (json.JSONDecodeError, OSError, ValueError) as e:
+            logger.warning(f"Failed to load metadata cache for {key}: {e}")
+            cache_file.unlink(missing_ok=True)
+            return None
+
+    def _write_disk_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Write a cache entry to disk atomically."""
+        cache_file = self._cache_file(key)
+        if cache_file is None:
+            return
+
+        try:
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_file.write_text(json.dumps(entry))
+            os.replace(tmp_file, cache_file)
+        except (TypeError, OSError) as e:
+            logger.warning(f"Failed to cache metadata for {key}: {e}")
+
+    def _read_fixture(self, key: str, package_name: str) -> Optional[Dict[str, Any]]:
+        """Read metadata from the offline fixture index."""
+        if self.fixture_dir is None:
+            return None
+
+        for candidate in (key, package_name):
+            fixture_file = self.fixture_dir / f"{candidate}.json"
+            if fixture_file.exists():
+                try:
+                    return json.loads(fixture_file.read_text())
+                except (json.JSONDecodeError, OSError) as e:
+                    logger.warning(f"Invalid metadata fixture {fixture_file}: {e}")
+                    return None
+        return None
+
+    # ==================== Poetry commands ====================
+
+    def poetry_show_tree(self, package_name: str, project_root: Path, timeout: int = 30) -> subprocess.CompletedProcess:
+        """
+        Run `poetry show <package> --tree`, memoized on the project's dependency files.
+
+        Args:
+            package_name: Package name
+            project_root: Project root containing pyproject.toml / poetry.lock
+            timeout: Subprocess timeout in seconds
+
+        Returns:
+            CompletedProcess (stdout/stderr as text)
+
+        Raises:
+            Same exceptions as subprocess.run (not cached)
+        """
+        return self._run_poetry(["show", package_name, "--tree"], project_root, timeout)
+
+    def poetry_add_dry_run(
+        self, package_spec: str, project_root: Path, timeout: int = 60
+    ) -> subprocess.CompletedProcess:
+        """
+        Run `poetry add <package_spec> --dry-run`, memoized on the project's dependency files.
+
+        Args:
+            package_spec: Package name with optional version constraint
+            project_root: Project root containing pyproject.toml / poetry.lock
+            timeout: Subprocess timeout in seconds
+
+        Returns:
+            CompletedProcess (stdout/stderr as text)
+
+        Raises:
+            Same exceptions as subprocess.run (not cached)
+        """
+        return self._run_poetry(["add", package_spec, "--dry-run"], project_root, timeout)
+
+    def _run_poetry(self, args: List[str], project_root: Path, timeout: int) -> subprocess.CompletedProcess:
+        """Run a poetry command once per content of pyproject.toml and poetry.lock."""
+        key = (tuple(args), str(project_root), self._project_fingerprint(Path(project_root)))
+
+        with self._lock:
+            cached = self._poetry_cache.get(key)
+        if cached is not None:
+            return cached
+
+        logger.debug(f"Running: poetry {' '.join(args)}")
+        result = subprocess.run(
+            ["poetry", *args],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+        with self._lock:
+            self._poetry_cache[key] = result
+        return result
+
+    @staticmethod
+    def _project_fingerprint(project_root: Path) -> str:
+        """Hash the content of pyproject.toml and poetry.lock (missing files hash as empty)."""
+        digest = hashlib.sha256()
+        for name in ("pyproject.toml", "poetry.lock"):
+            try:
+                digest.update((project_root / name).read_bytes())
+            except OSError:
+                pass
+            digest.update(b"\0")
+        return digest.hexdigest()
@@ -0,0 +1,253 @@
+"""Compiled multi-pattern matching for keyword and regex vocabularies.
+
+Classifiers across the CLI (request classification, intent detection,
+metadata extraction, error categorization) check a text against a vocabulary
+of labelled keywords and regex patterns. Looping over the vocabulary scans the
+text once per term; ``PatternMatcher`` compiles the vocabulary once and finds
+every hit with one literal pass followed by targeted regex verification:
+
+- Keywords are case-insensitive substrings (same semantics as
+  ``keyword in text``), tested against the lowercased text once each.
+- Every regex pattern is reduced to a required literal factor: a set of
+  strings one of which occurs in any match (e.g. ``"want"``, ``"need"`` for
+  ``I (want|need) to``). Factors are tested in the same literal pass, and only
+  patterns whose factor occurred are verified with their own precompiled
+  regex. Patterns without a usable factor are always verified.
+
+Both passes stay per-term on purpose: CPython's ``re`` tries alternatives one
+by one at every position, so for vocabularies of this size a combined
+alternation (or trie regex) is slower than ``str`` substring tests and a few
+precompiled searches.
+
+Results are grouped by label, with labels and terms in vocabulary order, so
+"first matching label" keeps the priority order of the original dictionaries.
+
+Example:
+    >>> from coffee_maker.utils.pattern_matcher import PatternMatcher
+    >>>
+    >>> matcher = PatternMatcher(
+    ...     keywords={"feature": ["add", "dashboard"], "methodology": ["workflow"]},
+    ...     patterns={"feature": [r"new (feature|capability)"]},
+    ... )
+    >>> matcher.find("Add a new feature to the dashboard")
+    {'feature': ['add', 'dashboard', 'new (feature|capability)']}
+    >>> matcher.first("Change the workflow")
+    'methodology'
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Factors are read from the regex parse tree, which only the private parser
+# exposes. Without it (or if its format changes) the prefilter is disabled and
+# every pattern is verified with its regex.
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    try:  # Python < 3.11
+        import sre_constants
+        import sre_parse
+    except ImportError:
+        sre_constants = sre_parse = None
+
+# Term kinds in a vocabulary entry
+KEYWORD = "keyword"
+PATTERN = "pattern"
+
+# Shortest factor worth prefiltering on (single characters match almost any text)
+MIN_FACTOR_LENGTH = 2
+
+
+def _literal(items) -> Optional[str]:
+    """Get the string matched by a parsed sequence of literals (None if not literal)."""
+    chars = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            chars.append(chr(av))
+        elif op is not sre_constants.AT:  # anchors are zero-width
+            return None
+    return "".join(chars)
+
+
+def _alternatives(items) -> Optional[Tuple[str, ...]]:
+    """Get the strings a parsed group can match, if it is a (branch of) literal(s)."""
+    if len(items) == 1 and items[0][0] is sre_constants.BRANCH:
+        literals = [_literal(branch) for branch in items[0][1][1]]
+        return None if None in literals else tuple(literals)
+    literal = _literal(items)
+    return None if literal is None else (literal,)
+
+
+def _required_factor(pattern: str, flags: int) -> Optional[Tuple[str, ...]]:
+    """Find a set of ASCII strings one of which occurs in every match of pattern.
+
+    Only mandatory top-level items are considered: runs of literals and groups
+    that are literal alternations. The most selective candidate (longest
+    shortest alternative) is returned, lowercased for the keyword scan.
+
+    Args:
+        pattern: Regex source
+        flags: Regex flags
+
+    Returns:
+        Lowercased factor strings, or None if no usable factor exists (or the
+        regex parser is unavailable)
+    """
+    if sre_parse is None:
+        return None
+    try:
+        return _factor_of(list(sre_parse.parse(pattern, flags)))
+    except Exception:  # invalid pattern, or a parse tree format this code does not know
+        return None
+
+
+def _factor_of(items) -> Optional[Tuple[str, ...]]:
+    """Pick the most selective factor from the top-level items of a parsed pattern."""
+    candidates: List[Tuple[str, ...]] = []
+    run: List[str] = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op is sre_constants.AT:
+            continue
+        if run:
+            candidates.append(("".join(run),))
+            run = []
+        group = None
+        if op is sre_constants.SUBPATTERN:
+            group = _alternatives(av[-1])
+        elif op is sre_constants.BRANCH:
+            group = _alternatives([(op, av)])
+        if group is not None:
+            candidates.append(group)
+    if run:
+        candidates.append(("".join(run),))
+
+    usable = [
+        tuple(alternative.lower() for alternative in group)
+        for group in candidates
+        if all(len(alternative) >= MIN_FACTOR_LENGTH and alternative.isascii() for alternative in group)
+    ]
+    if not usable:
+        return None
+    return max(usable, key=lambda group: min(len(alternative) for alternative in group))
+
+
+class PatternMatcher:
+    """Labelled keyword and regex vocabulary compiled for prefiltered matching.
+
+    Terms are compiled on first use; the matcher is immutable afterwards and
+    safe to share between threads.
+
+    Attributes:
+        flags: Regex flags for patterns (keywords are always case-insensitive)
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[Mapping[Hashable, Iterable[str]]] = None,
+        patterns: Optional[Mapping[Hashable, Iterable[str]]] = None,
+        flags: int = re.IGNORECASE,
+    ):
+        """Initialize the matcher (nothing is compiled until the first match).
+
+        Args:
+            keywords: Label -> literal keywords
+            patterns: Label -> regex patterns
+            flags: Regex flags for patterns
+        """
+        self.flags = flags
+
+        # Vocabulary in order: label -> [(kind, term, key)], where key is the
+        # lowercased keyword or the pattern source
+        self._vocabulary: Dict[Hashable, List[Tuple[str, str, str]]] = {}
+        for kind, terms_by_label in ((KEYWORD, keywords or {}), (PATTERN, patterns or {})):
+            for label, terms in terms_by_label.items():
+                entries = self._vocabulary.setdefault(label, [])
+                entries.extend((kind, term, term.lower() if kind == KEYWORD else term) for term in terms)
+
+        self._literals: Tuple[str, ...] = ()
+        self._ignore_case = False
+        self._patterns: List[Tuple[str, re.Pattern, Optional[Tuple[str, ...]]]] = []
+        self._compiled = False
+
+    def _compile(self) -> None:
+        """Collect keywords and pattern factors for the literal pass, and compile each pattern."""
+        keywords = {key for entries in self._vocabulary.values() for kind, _, key in entries if kind == KEYWORD}
+        patterns = dict.fromkeys(
+            key for entries in self._vocabulary.values() for kind, _, key in entries if kind == PATTERN
+        )
+
+        self._patterns = [
+            (pattern, re.compile(pattern, self.flags), _required_factor(pattern, self.flags)) for pattern in patterns
+        ]
+        literals = keywords.union(*(factor for _, _, factor in self._patterns if factor))
+        self._literals = tuple(sorted(literals))
+        self._ignore_case = bool(self.flags & re.IGNORECASE)
+        self._compiled = True
+
+    def _scan(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Find the literals (lowercased keywords and factors) and patterns occurring in text."""
+        if not self._compiled:
+            self._compile()
+
+        lowered = text.lower()
+        literals = {literal for literal in self._literals if literal in lowered}
+
+        # Lowercasing non-ASCII text can change which strings a case-insensitive
+        # pattern matches (e.g. the long s), so factors are only trusted for ASCII
+        trust_factors = not self._ignore_case or text.isascii()
+        patterns = {
+            pattern
+            for pattern, regex, factor in self._patterns
+            if (not factor or not trust_factors or not literals.isdisjoint(factor)) and regex.search(text)
+        }
+        return literals, patterns
+
+    def find_terms(self, text: str) -> Dict[Hashable, List[Tuple[str, str]]]:
+        """Find all vocabulary terms occurring in text, with their kind.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Label -> matched (kind, term) pairs, where kind is "keyword" or
+            "pattern"; labels and terms are in vocabulary order
+        """
+        literals, patterns = self._scan(text)
+        if not literals and not patterns:
+            return {}
+
+        hits: Dict[Hashable, List[Tuple[str, str]]] = {}
+        for label, entries in self._vocabulary.items():
+            matched = [
+                (kind, term) for kind, term, key in entries if key in (literals if kind == KEYWORD else patterns)
+            ]
+            if matched:
+                hits[label] = matched
+        return hits
+
+    def find(self, text: str) -> Dict[Hashable, List[str]]:
+        """Find all vocabulary terms occurring in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Label -> matched terms (as given in the vocabulary), for labels with
+            at least one hit; labels and terms are in vocabulary order
+        """
+        return {label: [term for _, term in terms] for label, terms in self.find_terms(text).items()}
+
+    def first(self, text: str) -> Optional[Hashable]:
+        """Get the first label (in vocabulary order) with a hit in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Label, or None if no term occurs in text
+        """
+        return next(iter(self.find(text)), None)
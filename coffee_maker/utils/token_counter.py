@@ -1,7 +1,7 @@
 """Token counting utilities for context budget validation.
 
-This module provides accurate token counting using character-based estimation
-and runtime validation with actual API token usage.
+This module validates context budgets using the shared token counting service
+(coffee_maker.utils.token_service) and runtime validation with actual API token usage.
 
 References:
     - Anthropic token estimation: ~4 chars per token
@@ -13,6 +13,8 @@ import logging
 from dataclasses import dataclass
 from pathlib import Path
 
+from coffee_maker.utils.token_service import get_token_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,10 +41,10 @@ class TokenUsage:
 
 
 def estimate_tokens_from_text(text: str) -> int:
-    """Estimate token count from text using word-based heuristic.
+    """Count tokens in text with the shared token counting service.
 
-    Uses the rule of thumb: ~0.75 words per token (or ~1.33 tokens per word).
-    This is more accurate than character-based counting for English text.
+    Counts are exact (tiktoken cl100k_base, cached per text) and fall back to
+    ~4 characters per token when tiktoken is unavailable.
 
     Args:
         text: The text to estimate tokens for
@@ -51,25 +53,14 @@ def estimate_tokens_from_text(text: str) -> int:
         Estimated number of tokens
 
     Note:
-        This is an approximation. For exact counts, use Anthropic's API
-        token counting endpoint (when available).
+        cl100k_base is a close proxy for Claude tokenization. For exact counts,
+        use Anthropic's API token counting endpoint (when available).
 
     Examples:
         >>> estimate_tokens_from_text("Hello world")
-        3  # 2 words * 1.33 ≈ 3 tokens
-
-        >>> estimate_tokens_from_text("The quick brown fox jumps")
-        7  # 5 words * 1.33 ≈ 7 tokens
+        2
     """
-    # Count words (split on whitespace)
-    words = text.split()
-    word_count = len(words)
-
-    # Rule of thumb: ~1.33 tokens per word (or ~0.75 words per token)
-    # Rounded to nearest integer
-    estimated_tokens = int(word_count * 1.33 + 0.5)
-
-    return estimated_tokens
+    return get_token_service().count(text)
 
 
 def estimate_tokens_from_file(file_path: Path) -> int:
@@ -118,9 +109,9 @@ def validate_context_budget(
         ✅ 8,234 tokens (13.7% of 60,000)
           Command: 4,123 | README: 3,891 | Skills: 220
     """
-    command_tokens = estimate_tokens_from_text(command_text)
-    readme_tokens = estimate_tokens_from_text(agent_readme)
-    skills_tokens = estimate_tokens_from_text(auto_skills)
+    command_tokens, readme_tokens, skills_tokens = get_token_service().count_batch(
+        [command_text, agent_readme, auto_skills]
+    )
 
     total = command_tokens + readme_tokens + skills_tokens
     usage_percent = (total / max_tokens) * 100
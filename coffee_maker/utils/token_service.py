@@ -0,0 +1,281 @@
+"""Shared token counting service.
+
+One place to count tokens for rate-limit scheduling, context-length checks and
+context-budget validation:
+
+- Cached encoders: tiktoken encodings are loaded once per process and model.
+- Count cache: a bounded LRU maps a hash of (encoding, text) to its token count,
+  so the same prompts, READMEs and skill files are never re-encoded.
+- Batch API: ``count_batch`` encodes every uncached text in one threaded
+  ``encode_ordinary_batch`` call.
+- Approximate mode: ``len(text) // 4`` for hot paths that only need a rough
+  budget. Every exact count also records how far the approximation was from it,
+  so ``approximation_error()`` reports error bounds measured on real traffic.
+
+When tiktoken (or its encoding files) is unavailable, counts fall back to the
+approximation and ``stats["fallbacks"]`` is incremented.
+
+Usage:
+    from coffee_maker.utils.token_service import get_token_service
+
+    service = get_token_service()
+    tokens = service.count("Hello world", model="openai/gpt-4o-mini")
+    totals = service.count_batch(prompts, model="gpt-4")
+    rough = service.count(readme_text, approximate=True)
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_ENCODING = "cl100k_base"
+
+
+def approximate_token_count(text: str) -> int:
+    """Approximate token count (~4 characters per token)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ApproximationError:
+    """Measured error of the approximate mode against exact counts.
+
+    Percentages are relative to the exact count; ``max_under_pct`` is how far the
+    approximation undercounted at worst, ``max_over_pct`` how far it overcounted.
+    """
+
+    samples: int = 0
+    mean_abs_error_pct: float = 0.0
+    max_under_pct: float = 0.0
+    max_over_pct: float = 0.0
+
+
+class TokenCountingService:
+    """Counts tokens with cached encoders and a bounded LRU of results.
+
+    Thread-safe; meant to be shared process-wide through ``get_token_service()``.
+
+    Example:
+        >>> service = TokenCountingService(max_entries=1024)
+        >>> service.count_batch(["Hello", "world"], model="gpt-4")
+        [1, 1]
+    """
+
+    def __init__(self, max_entries: int = 4096, num_threads: int = 8):
+        """Initialize TokenCountingService.
+
+        Args:
+            max_entries: Maximum number of cached text counts
+            num_threads: Threads used by tiktoken for batch encoding
+        """
+        self.max_entries = max_entries
+        self.num_threads = num_threads
+
+        self._lock = threading.Lock()
+        self._counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self._encodings: Dict[str, "Future[Any]"] = {}
+        self._model_encodings: Dict[str, str] = {}
+
+        self._error_samples = 0
+        self._error_abs_sum = 0.0
+        self._error_max_under = 0.0
+        self._error_max_over = 0.0
+
+        self.stats = {"hits": 0, "misses": 0, "approximate": 0, "fallbacks": 0}
+
+    # ==================== Public API ====================
+
+    def count(self, text: str, model: str = "gpt-4", approximate: bool = False) -> int:
+        """Count tokens in a text.
+
+        Args:
+            text: Text to count
+            model: Model name (provider prefix such as "openai/" is ignored)
+            approximate: Use the fast ~4 chars/token approximation
+
+        Returns:
+            Token count
+        """
+        return self.count_batch([text], model=model, approximate=approximate)[0]
+
+    def count_batch(self, texts: Sequence[str], model: str = "gpt-4", approximate: bool = False) -> List[int]:
+        """Count tokens for many texts, encoding all cache misses in one call.
+
+        Args:
+            texts: Texts to count
+            model: Model name (provider prefix such as "openai/" is ignored)
+            approximate: Use the fast ~4 chars/token approximation
+
+        Returns:
+            Token counts, in the same order as ``texts``
+        """
+        if approximate:
+            with self._lock:
+                self.stats["approximate"] += len(texts)
+            return [approximate_token_count(text) for text in texts]
+
+        encoding_name, encoding = self._get_encoding(model)
+        if encoding is None:
+            with self._lock:
+                self.stats["fallbacks"] += len(texts)
+            return [approximate_token_count(text) for text in texts]
+
+        counts: List[Optional[int]] = [None] * len(texts)
+        missing: Dict[Tuple[str, bytes], List[int]] = {}
+
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = (encoding_name, self._digest(text))
+                cached = self._counts.get(key)
+                if cached is not None:
+                    self._counts.move_to_end(key)
+                    self.stats["hits"] += 1
+                    counts[i] = cached
+                else:
+                    missing.setdefault(key, []).append(i)
+            self.stats["misses"] += len(missing)
+
+        if missing:
+            keys = list(missing)
+            unique_texts = [texts[missing[key][0]] for key in keys]
+            encoded = self._encode(encoding, unique_texts)
+
+            with self._lock:
+                for key, text, tokens in zip(keys, unique_texts, encoded):
+                    for i in missing[key]:
+                        counts[i] = tokens
+                    self._store(key, tokens)
+                    self._record_error(text, tokens)
+
+        return counts
+
+    def approximation_error(self) -> ApproximationError:
+        """Get the approximation error measured on exact counts so far.
+
+        Returns:
+            ApproximationError with sample count and error bounds
+        """
+        with self._lock:
+            if not self._error_samples:
+                return ApproximationError()
+            return ApproximationError(
+                samples=self._error_samples,
+                mean_abs_error_pct=self._error_abs_sum / self._error_samples,
+                max_under_pct=self._error_max_under,
+                max_over_pct=self._error_max_over,
+            )
+
+    def clear(self) -> None:
+        """Clear cached counts (encoders are kept)."""
+        with self._lock:
+            self._counts.clear()
+
+    # ==================== Internals ====================
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        """Hash a text for the count cache."""
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _store(self, key: Tuple[str, bytes], tokens: int) -> None:
+        """Store a count, evicting least recently used entries (lock held)."""
+        self._counts[key] = tokens
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+
+    def _record_error(self, text: str, tokens: int) -> None:
+        """Record approximation error against an exact count (lock held)."""
+        if tokens <= 0:
+            return
+        error_pct = (approximate_token_count(text) - tokens) * 100.0 / tokens
+        self._error_samples += 1
+        self._error_abs_sum += abs(error_pct)
+        self._error_max_over = max(self._error_max_over, error_pct)
+        self._error_max_under = max(self._error_max_under, -error_pct)
+
+    def _encode(self, encoding: Any, texts: List[str]) -> List[int]:
+        """Encode texts (threaded batch when there are several)."""
+        if len(texts) == 1:
+            return [len(encoding.encode_ordinary(texts[0]))]
+        return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts, num_threads=self.num_threads)]
+
+    def _get_encoding(self, model: str) -> Tuple[str, Any]:
+        """Get (encoding name, encoding) for a model, loading it once.
+
+        The first caller for an encoding loads it outside the service lock
+        (tiktoken may download it); concurrent callers for the same encoding
+        wait on its future, and other encodings and cached counts are not blocked.
+        """
+        with self._lock:
+            encoding_name = self._model_encodings.get(model)
+        if encoding_name is None:
+            encoding_name = self._resolve_encoding_name(model)
+
+        with self._lock:
+            self._model_encodings[model] = encoding_name
+            future = self._encodings.get(encoding_name)
+            loader = future is None
+            if loader:
+                future = self._encodings[encoding_name] = Future()
+
+        if loader:
+            try:
+                future.set_result(self._load_encoding(encoding_name))
+            except BaseException as e:
+                with self._lock:
+                    del self._encodings[encoding_name]
+                future.set_exception(e)
+                raise
+        return encoding_name, future.result()
+
+    @staticmethod
+    def _resolve_encoding_name(model: str) -> str:
+        """Map a model name to its tiktoken encoding name."""
+        try:
+            import tiktoken
+        except ImportError:
+            return DEFAULT_ENCODING
+
+        bare_model = model.split("/", 1)[-1]
+        try:
+            return tiktoken.encoding_name_for_model(bare_model)
+        except KeyError:
+            # Non-OpenAI models (Claude, Gemini, ...) use cl100k_base as a proxy
+            return DEFAULT_ENCODING
+
+    @staticmethod
+    def _load_encoding(encoding_name: str) -> Optional[Any]:
+        """Load a tiktoken encoding (None if tiktoken or its files are unavailable)."""
+        try:
+            import tiktoken
+
+            return tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            logger.warning(f"Token encoding {encoding_name} unavailable, using approximate counts: {e}")
+            return None
+
+
+_service: Optional[TokenCountingService] = None
+_service_lock = threading.Lock()
+
+
+def get_token_service() -> TokenCountingService:
+    """Get the process-wide TokenCountingService.
+
+    Returns:
+        Shared TokenCountingService instance
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = TokenCountingService()
+    return _service
@@ -44,7 +44,7 @@ if __name__ == "__main__":
 
     # Export back to ROADMAP.md
     print(f"\n4. Exporting to {roadmap_path}...")
-    db.export_to_file(roadmap_path)
+    db.export_changes(roadmap_path)
     print("   ✅ Exported to ROADMAP.md")
 
     # Verify
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark request classification - per-term loops vs the compiled PatternMatcher.
+
+This script measures how many user inputs per second the indicator lookup
+of RequestClassifier handles, comparing the original per-keyword loop with
+uncompiled re.search calls against the shared PatternMatcher.
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from coffee_maker.cli.request_classifier import RequestClassifier
+
+SAMPLE_INPUTS = [
+    "I want to add email notifications to the dashboard so the team can see failures quickly",
+    "From now on, every PR must have tests and the developer should always follow the branching policy",
+    "What is the status of the current sprint? Please summarize the latest changes for me.",
+    "As a developer, I want to see a report of failed builds so that I can fix them faster",
+    "We should change our workflow to require code review approval before merging",
+    "Add a new API integration for Slack and always notify the team when deployment fails",
+    "hello",
+    "Can you show me the roadmap?",
+]
+
+
+def find_indicators_loop(text):
+    """Original indicator lookup: one substring test or re.search per term."""
+    lower = text.lower()
+    indicators = []
+    for keywords, patterns in (
+        (RequestClassifier.FEATURE_KEYWORDS, RequestClassifier.FEATURE_PATTERNS),
+        (RequestClassifier.METHODOLOGY_KEYWORDS, RequestClassifier.METHODOLOGY_PATTERNS),
+    ):
+        for keyword in keywords:
+            if keyword in lower:
+                indicators.append(f"keyword: {keyword}")
+        for pattern in patterns:
+            if re.search(pattern, lower, re.IGNORECASE):
+                indicators.append(f"pattern: {pattern}")
+    return indicators
+
+
+def benchmark(name, find, inputs):
+    """Run find over all inputs and print the throughput."""
+    print(f"\n{'='*80}")
+    print(f"Benchmarking {name} ({len(inputs)} inputs)")
+    print(f"{'='*80}")
+
+    start = time.perf_counter()
+    for text in inputs:
+        find(text)
+    total_time = time.perf_counter() - start
+
+    rate = len(inputs) / total_time
+    print(f"Total time: {total_time:.3f}s")
+    print(f"Throughput: {rate:,.0f} inputs/sec ({total_time / len(inputs) * 1e6:.1f}us per input)")
+    return rate
+
+
+def main():
+    """Run benchmarks and compare results."""
+    print("🏁 Request Classifier Performance Benchmark")
+    print("=" * 80)
+
+    inputs = SAMPLE_INPUTS * 2500
+    classifier = RequestClassifier()
+
+    loop_rate = benchmark("per-term loop", find_indicators_loop, inputs)
+    matcher_rate = benchmark("PatternMatcher", lambda text: classifier._find_indicators(text.lower()), inputs)
+    classify_rate = benchmark("RequestClassifier.classify (end to end)", classifier.classify, inputs)
+
+    print(f"\n{'='*80}")
+    print("PERFORMANCE COMPARISON")
+    print(f"{'='*80}")
+    print(f"\nPer-term loop:   {loop_rate:,.0f} inputs/sec")
+    print(f"PatternMatcher:  {matcher_rate:,.0f} inputs/sec")
+    print(f"Speedup: {matcher_rate / loop_rate:.1f}x")
+    print(f"\nEnd-to-end classify: {classify_rate:,.0f} inputs/sec")
+
+
+if __name__ == "__main__":
+    main()
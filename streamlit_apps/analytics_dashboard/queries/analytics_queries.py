@@ -6,6 +6,11 @@ from the Langfuse export database (SQLite or PostgreSQL).
 All query functions return pandas DataFrames and are cached using Streamlit's
 @st.cache_data decorator for optimal performance.
 
+Aggregate queries read the hourly/daily usage rollup tables maintained by
+triggers on the generations table (see models_sqlite.ensure_usage_rollups),
+so their cost depends on the selected time range, not on raw row volume.
+Date ranges are resolved to whole hours.
+
 Example:
     >>> import streamlit as st
     >>> stats = get_quick_stats("llm_metrics.db")
@@ -19,6 +24,54 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import streamlit as st
 
+from coffee_maker.langfuse_observe.analytics.models_sqlite import ensure_usage_rollups
+
+# Databases whose rollup tables/triggers have been verified in this process
+_ROLLUPS_READY: set = set()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection, creating and backfilling usage rollups on first use.
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        sqlite3.Connection
+    """
+    conn = sqlite3.connect(db_path)
+    if db_path not in _ROLLUPS_READY:
+        ensure_usage_rollups(conn)
+        _ROLLUPS_READY.add(db_path)
+    return conn
+
+
+def _rollup_source(
+    date_range: Optional[Tuple[datetime, datetime]] = None, hourly: bool = False
+) -> Tuple[str, str, List[str]]:
+    """Pick the rollup table and WHERE clause for a date range.
+
+    Bounded ranges use the hourly rollup (hour resolution); unbounded queries
+    use the daily rollup unless hourly buckets are required.
+
+    Args:
+        date_range: Optional (start_date, end_date) tuple
+        hourly: Force the hourly rollup (e.g. for hour-of-day patterns)
+
+    Returns:
+        Tuple of (table_name, where_clause, params)
+    """
+    if date_range:
+        start, end = date_range
+        return (
+            "usage_rollup_hourly",
+            "WHERE bucket_start BETWEEN ? AND ?",
+            [start.strftime("%Y-%m-%d %H:00:00"), end.strftime("%Y-%m-%d %H:%M:%S")],
+        )
+    if hourly:
+        return "usage_rollup_hourly", "", []
+    return "usage_rollup_daily", "", []
+
 
 @st.cache_data(ttl=300)
 def get_quick_stats(db_path: str, date_range: Optional[Tuple[datetime, datetime]] = None) -> Dict[str, float]:
@@ -36,21 +89,16 @@ def get_quick_stats(db_path: str, date_range: Optional[Tuple[datetime, datetime]
         >>> print(f"Total cost: ${stats['total_cost']:.2f}")
         Total cost: $42.50
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
             COALESCE(SUM(total_cost), 0) as total_cost,
             COALESCE(SUM(total_tokens), 0) as total_tokens,
-            COUNT(*) as total_requests,
-            COALESCE(AVG(latency_ms), 0) as avg_latency
-        FROM generations
+            COALESCE(SUM(request_count), 0) as total_requests,
+            COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_count), 0), 0) as avg_latency
+        FROM {table}
         {where_clause}
     """
 
@@ -131,24 +179,20 @@ def get_cost_by_model(db_path: str, date_range: Optional[Tuple[datetime, datetim
         >>> df = get_cost_by_model("llm_metrics.db")
         >>> print(df.sort_values("total_cost", ascending=False))
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
-            model,
+            NULLIF(model, '') as model,
             COALESCE(SUM(total_cost), 0) as total_cost,
-            COUNT(*) as request_count,
-            COALESCE(AVG(total_cost), 0) as avg_cost_per_request,
+            SUM(request_count) as request_count,
+            COALESCE(SUM(total_cost) / SUM(request_count), 0) as avg_cost_per_request,
             COALESCE(SUM(total_tokens), 0) as total_tokens
-        FROM generations
+        FROM {table}
         {where_clause}
         GROUP BY model
+        HAVING SUM(request_count) > 0
         ORDER BY total_cost DESC
     """
 
@@ -176,27 +220,21 @@ def get_daily_cost_trend(
         >>> df = get_daily_cost_trend("llm_metrics.db", days=7)
         >>> print(df.tail())
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
-    else:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        where_clause = "WHERE created_at >= ?"
-        params = [cutoff_date]
+    conn = _connect(db_path)
+    if not date_range:
+        date_range = (datetime.now() - timedelta(days=days), datetime.now())
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
-            DATE(created_at) as date,
+            DATE(bucket_start) as date,
             COALESCE(SUM(total_cost), 0) as total_cost,
-            COUNT(*) as request_count,
+            SUM(request_count) as request_count,
             COALESCE(SUM(total_tokens), 0) as total_tokens
-        FROM generations
+        FROM {table}
         {where_clause}
-        GROUP BY DATE(created_at)
+        GROUP BY DATE(bucket_start)
+        HAVING SUM(request_count) > 0
         ORDER BY date ASC
     """
 
@@ -227,29 +265,25 @@ def get_model_performance_comparison(
         >>> df = get_model_performance_comparison("llm_metrics.db")
         >>> print(df.sort_values("avg_latency_ms"))
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
-            model,
-            COALESCE(AVG(latency_ms), 0) as avg_latency_ms,
+            NULLIF(model, '') as model,
+            COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_count), 0), 0) as avg_latency_ms,
             COALESCE(SUM(total_cost), 0) as total_cost,
             COALESCE(SUM(total_tokens), 0) as total_tokens,
-            COUNT(*) as request_count,
-            COALESCE(AVG(total_cost), 0) as avg_cost_per_request,
+            SUM(request_count) as request_count,
+            COALESCE(SUM(total_cost) / SUM(request_count), 0) as avg_cost_per_request,
             CASE
                 WHEN SUM(total_tokens) > 0 THEN (SUM(total_cost) * 1000.0 / SUM(total_tokens))
                 ELSE 0
             END as cost_per_1k_tokens
-        FROM generations
+        FROM {table}
         {where_clause}
         GROUP BY model
+        HAVING SUM(request_count) > 0
         ORDER BY request_count DESC
     """
 
@@ -274,26 +308,21 @@ def get_agent_analysis(db_path: str, date_range: Optional[Tuple[datetime, dateti
         >>> df = get_agent_analysis("llm_metrics.db")
         >>> print(df.head())
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "AND g.created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range)
 
-    # Extract agent name from trace name or metadata
+    # Agent name is resolved from the trace name at ingest time
     query = f"""
         SELECT
-            COALESCE(t.name, 'Unknown') as agent_name,
-            COALESCE(SUM(g.total_cost), 0) as total_cost,
-            COUNT(g.id) as request_count,
-            COALESCE(SUM(g.total_tokens), 0) as total_tokens,
-            COALESCE(AVG(g.latency_ms), 0) as avg_latency_ms
-        FROM generations g
-        LEFT JOIN traces t ON g.trace_id = t.id
-        WHERE 1=1 {where_clause}
-        GROUP BY t.name
+            agent_name,
+            COALESCE(SUM(total_cost), 0) as total_cost,
+            SUM(request_count) as request_count,
+            COALESCE(SUM(total_tokens), 0) as total_tokens,
+            COALESCE(SUM(latency_sum_ms) / NULLIF(SUM(latency_count), 0), 0) as avg_latency_ms
+        FROM {table}
+        {where_clause}
+        GROUP BY agent_name
+        HAVING SUM(request_count) > 0
         ORDER BY total_cost DESC
     """
 
@@ -349,12 +378,12 @@ def get_available_models(db_path: str) -> List[str]:
         >>> print(models)
         ['openai/gpt-4o-mini', 'openai/gpt-4o', 'anthropic/claude-3-5-sonnet-20241022']
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
     query = """
         SELECT DISTINCT model
-        FROM generations
-        WHERE model IS NOT NULL
+        FROM usage_rollup_daily
+        WHERE model != '' AND request_count > 0
         ORDER BY model
     """
 
@@ -409,23 +438,19 @@ def get_hourly_usage_pattern(db_path: str, date_range: Optional[Tuple[datetime,
         >>> df = get_hourly_usage_pattern("llm_metrics.db")
         >>> # Use for heatmap showing usage by hour and day of week
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range, hourly=True)
 
     query = f"""
         SELECT
-            CAST(strftime('%H', created_at) AS INTEGER) as hour,
-            CAST(strftime('%w', created_at) AS INTEGER) as day_of_week,
-            COUNT(*) as request_count,
+            CAST(strftime('%H', bucket_start) AS INTEGER) as hour,
+            CAST(strftime('%w', bucket_start) AS INTEGER) as day_of_week,
+            SUM(request_count) as request_count,
             COALESCE(SUM(total_cost), 0) as total_cost
-        FROM generations
+        FROM {table}
         {where_clause}
         GROUP BY hour, day_of_week
+        HAVING SUM(request_count) > 0
         ORDER BY day_of_week, hour
     """
 
@@ -454,27 +479,21 @@ def get_cost_by_day_and_model(
         >>> # Pivot for stacked area chart
         >>> pivot = df.pivot(index='date', columns='model', values='total_cost')
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
-    else:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        where_clause = "WHERE created_at >= ?"
-        params = [cutoff_date]
+    conn = _connect(db_path)
+    if not date_range:
+        date_range = (datetime.now() - timedelta(days=days), datetime.now())
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
-            DATE(created_at) as date,
-            model,
+            DATE(bucket_start) as date,
+            NULLIF(model, '') as model,
             COALESCE(SUM(total_cost), 0) as total_cost,
-            COUNT(*) as request_count
-        FROM generations
+            SUM(request_count) as request_count
+        FROM {table}
         {where_clause}
-        GROUP BY DATE(created_at), model
+        GROUP BY DATE(bucket_start), model
+        HAVING SUM(request_count) > 0
         ORDER BY date ASC, model
     """
 
@@ -502,24 +521,20 @@ def get_token_usage_breakdown(db_path: str, date_range: Optional[Tuple[datetime,
         >>> df = get_token_usage_breakdown("llm_metrics.db")
         >>> # Use for stacked bar chart
     """
-    conn = sqlite3.connect(db_path)
-
-    where_clause = ""
-    params = []
-    if date_range:
-        where_clause = "WHERE created_at BETWEEN ? AND ?"
-        params = [date_range[0], date_range[1]]
+    conn = _connect(db_path)
+    table, where_clause, params = _rollup_source(date_range)
 
     query = f"""
         SELECT
-            model,
+            NULLIF(model, '') as model,
             COALESCE(SUM(input_tokens), 0) as input_tokens,
             COALESCE(SUM(output_tokens), 0) as output_tokens,
             COALESCE(SUM(total_tokens), 0) as total_tokens,
-            COUNT(*) as request_count
-        FROM generations
+            SUM(request_count) as request_count
+        FROM {table}
         {where_clause}
         GROUP BY model
+        HAVING SUM(request_count) > 0
         ORDER BY total_tokens DESC
     """
 
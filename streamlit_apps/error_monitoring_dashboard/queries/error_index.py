@@ -0,0 +1,195 @@
+"""Classified error index for the error monitoring dashboard.
+
+Error rows (a trace with a status message, or an ERROR/WARNING event, joined with
+its generations) are classified once when they enter the database and stored in
+the ``trace_errors`` table with indexed error_type, severity, category, model and
+timestamp columns. Dashboard queries filter, group and limit on that table in SQL
+instead of re-classifying every row on every page load.
+
+The index is maintained incrementally: rowid watermarks for traces, events and
+generations are kept in ``trace_errors_state``, and only traces touched by rows
+past the watermarks are (re)classified, vectorized over the whole batch with
+``ErrorClassifier.classify_series``.
+
+Example:
+    >>> conn = sqlite3.connect("llm_metrics.db")
+    >>> sync_error_index(conn)  # after ingesting new traces
+    42
+    >>> conn.execute("SELECT error_type, COUNT(*) FROM trace_errors GROUP BY error_type").fetchall()
+"""
+
+import logging
+import sqlite3
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from streamlit_apps.error_monitoring_dashboard.utils.error_classifier import ErrorClassifier
+
+logger = logging.getLogger(__name__)
+
+CREATE_ERROR_INDEX_TABLES = """
+CREATE TABLE IF NOT EXISTS trace_errors (
+    trace_rowid INTEGER NOT NULL,
+    event_rowid INTEGER NOT NULL DEFAULT 0,
+    generation_rowid INTEGER NOT NULL DEFAULT 0,
+    trace_id TEXT NOT NULL,
+    timestamp TEXT,
+    model TEXT,
+    combined_error TEXT,
+    error_type TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    category TEXT NOT NULL,
+    recommendation TEXT,
+    PRIMARY KEY (trace_rowid, event_rowid, generation_rowid)
+);
+
+CREATE INDEX IF NOT EXISTS idx_trace_errors_timestamp ON trace_errors(timestamp);
+CREATE INDEX IF NOT EXISTS idx_trace_errors_type ON trace_errors(error_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trace_errors_severity ON trace_errors(severity, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trace_errors_model ON trace_errors(model, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trace_errors_trace ON trace_errors(trace_id);
+
+CREATE TABLE IF NOT EXISTS trace_errors_state (
+    source TEXT PRIMARY KEY,
+    max_rowid INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Same error-row definition the dashboard has always used
+_ERROR_ROWS_SQL = """
+    SELECT
+        t.rowid AS trace_rowid,
+        COALESCE(e.rowid, 0) AS event_rowid,
+        COALESCE(g.rowid, 0) AS generation_rowid,
+        t.id AS trace_id,
+        t.timestamp,
+        g.model,
+        t.status_message,
+        e.message AS event_message
+    FROM traces t
+    LEFT JOIN events e ON t.id = e.trace_id
+    LEFT JOIN generations g ON t.id = g.trace_id
+    WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
+"""
+
+_SOURCES = ("traces", "events", "generations")
+
+_INDEX_COLUMNS = [
+    "trace_rowid",
+    "event_rowid",
+    "generation_rowid",
+    "trace_id",
+    "timestamp",
+    "model",
+    "combined_error",
+    "error_type",
+    "severity",
+    "category",
+    "recommendation",
+]
+
+
+def sync_error_index(
+    conn: sqlite3.Connection, trace_ids: Optional[Iterable[str]] = None, chunk_size: int = 50000
+) -> int:
+    """Classify error rows added since the last sync.
+
+    Call after ingesting traces/events/generations. Rows appended to any of the
+    three tables are picked up through rowid watermarks; traces updated in place
+    can be re-classified explicitly with ``trace_ids``.
+
+    Args:
+        conn: Connection to the dashboard database
+        trace_ids: Additional trace IDs to re-classify (e.g. updated in place)
+        chunk_size: Rows classified per batch
+
+    Returns:
+        Number of error rows (re)classified
+    """
+    conn.executescript(CREATE_ERROR_INDEX_TABLES)
+
+    watermarks = dict(conn.execute("SELECT source, max_rowid FROM trace_errors_state").fetchall())
+    current = {
+        source: conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {source}").fetchone()[0] for source in _SOURCES
+    }
+    extra_ids = list(dict.fromkeys(trace_ids or []))
+
+    if all(current[s] == watermarks.get(s, 0) for s in _SOURCES) and not extra_ids:
+        return 0
+
+    full_build = not any(watermarks.get(s, 0) for s in _SOURCES)
+
+    try:
+        if full_build:
+            conn.execute("DELETE FROM trace_errors")
+            query, params = _ERROR_ROWS_SQL, []
+        else:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _dirty_traces (id TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM _dirty_traces")
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO _dirty_traces (id)
+                SELECT id FROM traces WHERE rowid > ?
+                UNION SELECT trace_id FROM events WHERE rowid > ? AND trace_id IS NOT NULL
+                UNION SELECT trace_id FROM generations WHERE rowid > ? AND trace_id IS NOT NULL
+                """,
+                [watermarks.get(s, 0) for s in _SOURCES],
+            )
+            conn.executemany("INSERT OR IGNORE INTO _dirty_traces (id) VALUES (?)", [(i,) for i in extra_ids])
+            conn.execute("DELETE FROM trace_errors WHERE trace_id IN (SELECT id FROM _dirty_traces)")
+            query, params = _ERROR_ROWS_SQL + " AND t.id IN (SELECT id FROM _dirty_traces)", []
+
+        indexed = 0
+        for chunk in pd.read_sql_query(query, conn, params=params, chunksize=chunk_size):
+            indexed += _insert_classified(conn, chunk)
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO trace_errors_state (source, max_rowid) VALUES (?, ?)",
+            list(current.items()),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    logger.debug(f"Error index synced: {indexed} rows classified (full_build={full_build})")
+    return indexed
+
+
+def rebuild_error_index(conn: sqlite3.Connection) -> int:
+    """Drop and rebuild the error index from scratch.
+
+    Use after deleting traces or changing ErrorClassifier categories.
+
+    Args:
+        conn: Connection to the dashboard database
+
+    Returns:
+        Number of error rows classified
+    """
+    conn.executescript(
+        """
+        DROP TABLE IF EXISTS trace_errors;
+        DROP TABLE IF EXISTS trace_errors_state;
+        """
+    )
+    return sync_error_index(conn)
+
+
+def _insert_classified(conn: sqlite3.Connection, rows: pd.DataFrame) -> int:
+    """Classify a batch of error rows and write them to the index."""
+    if rows.empty:
+        return 0
+
+    rows = rows.copy()
+    rows["combined_error"] = rows["status_message"].fillna(rows["event_message"]).fillna("Unknown error")
+    rows = rows.join(ErrorClassifier.classify_series(rows["combined_error"]))
+
+    records = rows[_INDEX_COLUMNS].astype(object).where(rows[_INDEX_COLUMNS].notna(), None)
+    conn.executemany(
+        f"INSERT OR REPLACE INTO trace_errors ({', '.join(_INDEX_COLUMNS)}) "
+        f"VALUES ({', '.join('?' for _ in _INDEX_COLUMNS)})",
+        records.itertuples(index=False, name=None),
+    )
+    return len(rows)
@@ -4,6 +4,10 @@ This module provides query functions for retrieving error data from Langfuse tra
 stored in the SQLite database. All query functions return pandas DataFrames and are
 cached using Streamlit's @st.cache_data decorator for optimal performance.
 
+Error rows are classified once and stored in the indexed ``trace_errors`` table (see
+``error_index``), so error type, severity, model and date filters are all applied in
+SQL before ``LIMIT`` and aggregates are plain ``GROUP BY`` queries.
+
 Example:
     >>> import streamlit as st
     >>> errors = get_error_summary("llm_metrics.db")
@@ -17,9 +21,17 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import streamlit as st
 
+from streamlit_apps.error_monitoring_dashboard.queries.error_index import sync_error_index
 from streamlit_apps.error_monitoring_dashboard.utils.error_classifier import ErrorClassifier
 
 
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open the dashboard database and bring the error index up to date."""
+    conn = sqlite3.connect(db_path)
+    sync_error_index(conn)
+    return conn
+
+
 @st.cache_data(ttl=300)
 def get_error_summary(db_path: str, hours: int = 24) -> Dict[str, any]:
     """Get error summary statistics for the last N hours.
@@ -35,16 +47,16 @@ def get_error_summary(db_path: str, hours: int = 24) -> Dict[str, any]:
         >>> stats = get_error_summary("llm_metrics.db", hours=24)
         >>> print(f"Total errors: {stats['total_errors']}")
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
     cutoff_time = datetime.now() - timedelta(hours=hours)
 
     # Count errors
     error_query = """
-        SELECT COUNT(DISTINCT t.id) as error_count
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
-          AND t.timestamp >= ?
+        SELECT
+            COUNT(DISTINCT trace_id) as error_count,
+            COUNT(DISTINCT CASE WHEN severity = 'CRITICAL' THEN trace_id END) as critical_count
+        FROM trace_errors
+        WHERE timestamp >= ?
     """
 
     # Count total traces
@@ -62,9 +74,7 @@ def get_error_summary(db_path: str, hours: int = 24) -> Dict[str, any]:
     total_errors = int(error_df.iloc[0]["error_count"])
     total_traces = int(total_df.iloc[0]["total_count"])
     error_rate = total_errors / total_traces if total_traces > 0 else 0.0
-
-    # Estimate critical errors (would need severity classification in DB for accuracy)
-    critical_errors = int(total_errors * 0.15)  # Rough estimate
+    critical_errors = int(error_df.iloc[0]["critical_count"] or 0)
 
     return {
         "total_errors": total_errors,
@@ -98,43 +108,53 @@ def get_error_traces(
         >>> df = get_error_traces("llm_metrics.db", limit=50)
         >>> print(df.columns)
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
-    where_clauses = ["(e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)"]
+    where_clauses = []
     params = []
 
     if date_range:
-        where_clauses.append("t.timestamp BETWEEN ? AND ?")
+        where_clauses.append("x.timestamp BETWEEN ? AND ?")
         params.extend([date_range[0], date_range[1]])
 
-    if model:
-        where_clauses.append("g.model = ?")
+    if error_type and error_type != "All":
+        where_clauses.append("x.error_type = ?")
+        params.append(error_type)
+
+    if model and model != "All":
+        where_clauses.append("x.model = ?")
         params.append(model)
 
-    where_clause = " AND ".join(where_clauses)
+    where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
     query = f"""
         SELECT
-            t.id as trace_id,
+            x.trace_id,
             t.name as trace_name,
-            t.timestamp,
+            x.timestamp,
             t.metadata,
             t.status_message as error_message,
             e.level as event_level,
             e.message as event_message,
             e.body as event_body,
-            g.model,
+            x.model,
             g.model_parameters,
             g.prompt_tokens,
             g.completion_tokens,
             g.total_tokens,
             g.total_cost,
-            g.latency_ms
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        LEFT JOIN generations g ON t.id = g.trace_id
-        WHERE {where_clause}
-        ORDER BY t.timestamp DESC
+            g.latency_ms,
+            x.combined_error,
+            x.error_type,
+            x.severity,
+            x.category,
+            x.recommendation
+        FROM trace_errors x
+        JOIN traces t ON t.rowid = x.trace_rowid
+        LEFT JOIN events e ON e.rowid = x.event_rowid
+        LEFT JOIN generations g ON g.rowid = x.generation_rowid
+        {where_clause}
+        ORDER BY x.timestamp DESC
         LIMIT ?
     """
     params.append(limit)
@@ -145,28 +165,6 @@ def get_error_traces(
     # Convert timestamp to datetime
     df["timestamp"] = pd.to_datetime(df["timestamp"])
 
-    # Combine error messages
-    df["combined_error"] = df.apply(
-        lambda row: (
-            row["error_message"]
-            if pd.notna(row["error_message"])
-            else (row["event_message"] if pd.notna(row["event_message"]) else "Unknown error")
-        ),
-        axis=1,
-    )
-
-    # Classify errors
-    if not df.empty:
-        classifications = df["combined_error"].apply(ErrorClassifier.classify)
-        df["error_type"] = classifications.apply(lambda x: x["type"])
-        df["severity"] = classifications.apply(lambda x: x["severity"])
-        df["category"] = classifications.apply(lambda x: x["category"])
-        df["recommendation"] = classifications.apply(lambda x: x["recommendation"])
-
-        # Filter by error type if specified
-        if error_type and error_type != "All":
-            df = df[df["error_type"] == error_type]
-
     return df
 
 
@@ -188,27 +186,25 @@ def get_error_timeline(
         >>> df = get_error_timeline("llm_metrics.db", hours=48)
         >>> print(df.head())
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
     where_clause = ""
     params = []
     if date_range:
-        where_clause = "AND t.timestamp BETWEEN ? AND ?"
+        where_clause = "WHERE timestamp BETWEEN ? AND ?"
         params = [date_range[0], date_range[1]]
     else:
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        where_clause = "AND t.timestamp >= ?"
+        where_clause = "WHERE timestamp >= ?"
         params = [cutoff_time]
 
     query = f"""
         SELECT
-            strftime('%Y-%m-%d %H:00:00', t.timestamp) as hour,
-            COUNT(DISTINCT t.id) as error_count
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
-          {where_clause}
-        GROUP BY strftime('%Y-%m-%d %H:00:00', t.timestamp)
+            strftime('%Y-%m-%d %H:00:00', timestamp) as hour,
+            COUNT(DISTINCT trace_id) as error_count
+        FROM trace_errors
+        {where_clause}
+        GROUP BY strftime('%Y-%m-%d %H:00:00', timestamp)
         ORDER BY hour ASC
     """
 
@@ -236,33 +232,30 @@ def get_error_by_model(db_path: str, date_range: Optional[Tuple[datetime, dateti
         >>> df = get_error_by_model("llm_metrics.db")
         >>> print(df.sort_values("error_count", ascending=False))
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
     where_clause = ""
     params = []
     if date_range:
-        where_clause = "AND t.timestamp BETWEEN ? AND ?"
+        where_clause = "AND timestamp BETWEEN ? AND ?"
         params = [date_range[0], date_range[1]]
 
     query = f"""
         SELECT
-            COALESCE(g.model, 'Unknown') as model,
-            COUNT(DISTINCT t.id) as error_count,
-            COUNT(DISTINCT t.id) * 100.0 / (
+            COALESCE(model, 'Unknown') as model,
+            COUNT(DISTINCT trace_id) as error_count,
+            COUNT(DISTINCT trace_id) * 100.0 / (
                 SELECT COUNT(DISTINCT id)
                 FROM traces
-                WHERE 1=1 {where_clause.replace('t.timestamp', 'timestamp')}
+                WHERE 1=1 {where_clause}
             ) as error_percentage
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        LEFT JOIN generations g ON t.id = g.trace_id
-        WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
-          {where_clause}
-        GROUP BY g.model
+        FROM trace_errors
+        WHERE 1=1 {where_clause}
+        GROUP BY model
         ORDER BY error_count DESC
     """
 
-    df = pd.read_sql_query(query, conn, params=params)
+    df = pd.read_sql_query(query, conn, params=params * 2)
     conn.close()
 
     return df
@@ -286,15 +279,26 @@ def get_error_by_type(
         >>> df = get_error_by_type("llm_metrics.db", limit=5)
         >>> print(df)
     """
-    # Get all error traces
-    error_traces = get_error_traces(db_path, limit=1000, date_range=date_range)
+    conn = _connect(db_path)
 
-    if error_traces.empty:
-        return pd.DataFrame(columns=["error_type", "count", "severity"])
+    where_clause = ""
+    params = []
+    if date_range:
+        where_clause = "WHERE timestamp BETWEEN ? AND ?"
+        params = [date_range[0], date_range[1]]
+
+    query = f"""
+        SELECT error_type, severity, COUNT(*) as count
+        FROM trace_errors
+        {where_clause}
+        GROUP BY error_type, severity
+        ORDER BY count DESC
+        LIMIT ?
+    """
+    params.append(limit)
 
-    # Count by error type
-    error_counts = error_traces.groupby(["error_type", "severity"]).size().reset_index(name="count")
-    error_counts = error_counts.sort_values("count", ascending=False).head(limit)
+    error_counts = pd.read_sql_query(query, conn, params=params)
+    conn.close()
 
     return error_counts
 
@@ -316,14 +320,26 @@ def get_error_severity_distribution(
         >>> df = get_error_severity_distribution("llm_metrics.db")
         >>> print(df)
     """
-    # Get all error traces
-    error_traces = get_error_traces(db_path, limit=10000, date_range=date_range)
+    conn = _connect(db_path)
 
-    if error_traces.empty:
-        return pd.DataFrame(columns=["severity", "count"])
+    where_clause = ""
+    params = []
+    if date_range:
+        where_clause = "WHERE timestamp BETWEEN ? AND ?"
+        params = [date_range[0], date_range[1]]
 
-    # Count by severity
-    severity_counts = error_traces.groupby("severity").size().reset_index(name="count")
+    query = f"""
+        SELECT severity, COUNT(*) as count
+        FROM trace_errors
+        {where_clause}
+        GROUP BY severity
+    """
+
+    severity_counts = pd.read_sql_query(query, conn, params=params)
+    conn.close()
+
+    if severity_counts.empty:
+        return pd.DataFrame(columns=["severity", "count"])
 
     # Sort by severity order
     severity_counts["order"] = severity_counts["severity"].apply(ErrorClassifier.get_severity_order)
@@ -375,16 +391,13 @@ def get_available_models_with_errors(db_path: str) -> List[str]:
         >>> models = get_available_models_with_errors("llm_metrics.db")
         >>> print(models)
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
     query = """
-        SELECT DISTINCT g.model
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        LEFT JOIN generations g ON t.id = g.trace_id
-        WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
-          AND g.model IS NOT NULL
-        ORDER BY g.model
+        SELECT DISTINCT model
+        FROM trace_errors
+        WHERE model IS NOT NULL
+        ORDER BY model
     """
 
     df = pd.read_sql_query(query, conn)
@@ -408,23 +421,21 @@ def get_hourly_error_pattern(db_path: str, date_range: Optional[Tuple[datetime,
         >>> df = get_hourly_error_pattern("llm_metrics.db")
         >>> # Use for heatmap showing errors by hour and day of week
     """
-    conn = sqlite3.connect(db_path)
+    conn = _connect(db_path)
 
     where_clause = ""
     params = []
     if date_range:
-        where_clause = "AND t.timestamp BETWEEN ? AND ?"
+        where_clause = "WHERE timestamp BETWEEN ? AND ?"
         params = [date_range[0], date_range[1]]
 
     query = f"""
         SELECT
-            CAST(strftime('%H', t.timestamp) AS INTEGER) as hour,
-            CAST(strftime('%w', t.timestamp) AS INTEGER) as day_of_week,
-            COUNT(DISTINCT t.id) as error_count
-        FROM traces t
-        LEFT JOIN events e ON t.id = e.trace_id
-        WHERE (e.level IN ('ERROR', 'WARNING') OR t.status_message IS NOT NULL)
-          {where_clause}
+            CAST(strftime('%H', timestamp) AS INTEGER) as hour,
+            CAST(strftime('%w', timestamp) AS INTEGER) as day_of_week,
+            COUNT(DISTINCT trace_id) as error_count
+        FROM trace_errors
+        {where_clause}
         GROUP BY hour, day_of_week
         ORDER BY day_of_week, hour
     """
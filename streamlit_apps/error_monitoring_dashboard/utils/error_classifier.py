@@ -13,6 +13,11 @@ Example:
 from typing import Dict, List, Optional
 import re
 
+import numpy as np
+import pandas as pd
+
+from coffee_maker.utils.pattern_matcher import PatternMatcher
+
 
 class ErrorClassifier:
     """Categorizes errors from Langfuse traces.
@@ -90,6 +95,11 @@ class ErrorClassifier:
     # Severity order for sorting (highest to lowest)
     SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "UNKNOWN": 4}
 
+    # Type names and keywords of every category, compiled once (first type in ERROR_CATEGORIES order wins)
+    _MATCHER = PatternMatcher(
+        keywords={error_type: [error_type, *metadata["keywords"]] for error_type, metadata in ERROR_CATEGORIES.items()}
+    )
+
     @staticmethod
     def classify(error_message: str) -> Dict[str, str]:
         """Extract error type and severity from error message.
@@ -113,28 +123,16 @@ class ErrorClassifier:
                 "recommendation": "No error message provided",
             }
 
-        error_message_lower = error_message.lower()
-
-        # Check each error category
-        for error_type, metadata in ErrorClassifier.ERROR_CATEGORIES.items():
-            # Check if error type is in message
-            if error_type.lower() in error_message_lower:
-                return {
-                    "type": error_type,
-                    "severity": metadata["severity"],
-                    "category": metadata["category"],
-                    "recommendation": metadata["actionable"],
-                }
-
-            # Check keywords
-            for keyword in metadata["keywords"]:
-                if keyword.lower() in error_message_lower:
-                    return {
-                        "type": error_type,
-                        "severity": metadata["severity"],
-                        "category": metadata["category"],
-                        "recommendation": metadata["actionable"],
-                    }
+        # Check the error type names and keywords of all categories at once
+        error_type = ErrorClassifier._MATCHER.first(error_message)
+        if error_type is not None:
+            metadata = ErrorClassifier.ERROR_CATEGORIES[error_type]
+            return {
+                "type": error_type,
+                "severity": metadata["severity"],
+                "category": metadata["category"],
+                "recommendation": metadata["actionable"],
+            }
 
         # No match found
         return {
@@ -160,6 +158,54 @@ class ErrorClassifier:
         """
         return [ErrorClassifier.classify(msg) for msg in error_messages]
 
+    @staticmethod
+    def classify_series(error_messages: pd.Series) -> pd.DataFrame:
+        """Classify a whole column of error messages at once.
+
+        Vectorized equivalent of ``classify``: each error type is tested with one
+        ``str.contains`` pass over the column (type name and keywords combined into a
+        single pattern) and the first matching type wins, in ERROR_CATEGORIES order.
+
+        Args:
+            error_messages: Series of error messages (None/NaN allowed)
+
+        Returns:
+            DataFrame aligned with the input index, with columns
+            error_type, severity, category, recommendation
+
+        Example:
+            >>> df = ErrorClassifier.classify_series(pd.Series(["429 Too Many Requests", None]))
+            >>> list(df["error_type"])
+            ['RateLimitError', 'UnknownError']
+        """
+        lowered = error_messages.fillna("").astype(str).str.lower()
+        error_types = list(ErrorClassifier.ERROR_CATEGORIES)
+
+        conditions = []
+        for error_type, metadata in ErrorClassifier.ERROR_CATEGORIES.items():
+            terms = [error_type.lower()] + [keyword.lower() for keyword in metadata["keywords"]]
+            pattern = "|".join(re.escape(term) for term in terms)
+            conditions.append(lowered.str.contains(pattern, regex=True).to_numpy(dtype=bool))
+
+        types = pd.Series(np.select(conditions, error_types, default="UnknownError"), index=error_messages.index)
+        categories = ErrorClassifier.ERROR_CATEGORIES
+        result = pd.DataFrame(
+            {
+                "error_type": types,
+                "severity": types.map({t: m["severity"] for t, m in categories.items()}).fillna("MEDIUM"),
+                "category": types.map({t: m["category"] for t, m in categories.items()}).fillna("Other"),
+                "recommendation": types.map({t: m["actionable"] for t, m in categories.items()}).fillna(
+                    "Manual investigation required"
+                ),
+            }
+        )
+
+        empty = lowered == ""
+        result.loc[empty, "severity"] = "UNKNOWN"
+        result.loc[empty, "recommendation"] = "No error message provided"
+
+        return result
+
     @staticmethod
     def get_severity_order(severity: str) -> int:
         """Get numeric order for severity (for sorting).
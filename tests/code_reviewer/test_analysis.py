@@ -0,0 +1,103 @@
+"""Tests for the single-pass AST analysis shared by perspectives."""
+
+import ast
+
+from coffee_maker.code_reviewer import analysis
+from coffee_maker.code_reviewer.analysis import analyze_source, register_rule
+from coffee_maker.code_reviewer.perspectives import BugHunter, PerformanceAnalyst, SecurityAuditor
+from coffee_maker.code_reviewer.reviewer import MultiModelCodeReviewer
+
+
+class TestAnalyzeSource:
+    """Test suite for analyze_source and rule registration."""
+
+    def test_file_walked_once_for_all_perspectives(self, tmp_path, monkeypatch):
+        """Test the four perspectives share one parse of a file."""
+        parses = []
+        original = ast.parse
+        monkeypatch.setattr(
+            analysis.ast, "parse", lambda *args, **kwargs: parses.append(1) or original(*args, **kwargs)
+        )
+        path = tmp_path / "app.py"
+        path.write_text("def f():\n    try:\n        g()\n    except:\n        pass\n")
+
+        report = MultiModelCodeReviewer().review_file(str(path))
+
+        assert len(parses) == 1
+        assert [issue.title for issue in report.issues] == ["Bare except clause"]
+
+    def test_registered_rule_receives_scope_context(self, monkeypatch):
+        """Test rules get nodes of their types with enclosing function and loop context."""
+        monkeypatch.setattr(analysis, "_rules", list(analysis._rules))
+        monkeypatch.setattr(analysis, "_dispatch", None)
+        seen = []
+
+        @register_rule("test_group", ast.Call)
+        def record_calls(node, ctx):
+            seen.append((ast.unparse(node.func), [f.name for f in ctx.functions], ctx.loop_depth))
+            return []
+
+        analyze_source("def outer():\n    for x in xs():\n        def inner():\n            g()\n        h()\n", "t.py")
+        analyze_source.cache_clear()
+
+        assert seen == [("xs", ["outer"], 0), ("g", ["outer", "inner"], 0), ("h", ["outer"], 1)]
+
+    def test_syntax_error_reported_once(self):
+        """Test an unparsable file yields a single syntax error issue."""
+        issues = BugHunter().analyze("def broken(:\n    pass\n", "broken.py")
+
+        assert [(issue.title, issue.severity, issue.line_number) for issue in issues] == [
+            ("Syntax error", "critical", 1)
+        ]
+        assert SecurityAuditor().analyze("def broken(:\n", "broken.py") == []
+
+
+class TestScopeAwareRules:
+    """Test suite for rules relying on real scope instead of indentation."""
+
+    def test_loops_in_nested_function_not_nested(self):
+        """Test a loop inside a function defined in a loop starts a new nesting level."""
+        code = """
+for a in xs:
+    for b in ys:
+        def helper():
+            for c in zs:
+                pass
+        for d in ws:
+            pass
+"""
+        issues = PerformanceAnalyst().analyze(code, "t.py")
+
+        assert [(issue.title, issue.line_number) for issue in issues] == [("Deep loop nesting detected", 7)]
+
+    def test_query_in_loop_reported_once_per_chain(self):
+        """Test an ORM chain in a loop is one issue and a query over the iterable is none."""
+        code = """
+for user in db.query(User).all():
+    profile = db.query(Profile).filter(Profile.user_id == user.id).first()
+"""
+        issues = PerformanceAnalyst().analyze(code, "t.py")
+
+        assert [issue.line_number for issue in issues] == [3]
+
+    def test_sql_built_in_variable(self):
+        """Test a query string interpolated into a variable is traced to execute()."""
+        code = """
+def find(cursor, name):
+    query = "SELECT * FROM users WHERE name = '%s'" % name
+    cursor.execute(query)
+    query = "SELECT 1"
+    cursor.execute(query)
+"""
+        issues = SecurityAuditor().analyze(code, "t.py")
+
+        assert [(issue.line_number, issue.description.split(" - ")[0]) for issue in issues] == [
+            (4, "String formatting in SQL")
+        ]
+
+    def test_no_substring_false_positives(self):
+        """Test Popen is not a file open and setting names are not secrets."""
+        code = 'proc = subprocess.Popen(["ls"])\nTOKEN_ENV_VAR = "GITHUB_TOKEN"\nSECRET_KEY = "dev"\n'
+
+        assert BugHunter().analyze(code, "t.py") == []
+        assert [issue.line_number for issue in SecurityAuditor().analyze(code, "t.py")] == [3]
@@ -1,11 +1,14 @@
 """Tests for MultiModelCodeReviewer."""
 
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from coffee_maker.code_reviewer.models import ReviewReport
+from coffee_maker.code_reviewer.perspectives import BugHunter
 from coffee_maker.code_reviewer.reviewer import MultiModelCodeReviewer
 
 
@@ -227,3 +230,62 @@ except:
 
         finally:
             Path(temp_path).unlink()
+
+    def test_iter_reviews_batches_small_files(self, tmp_path, monkeypatch):
+        """Test small files share one perspective pass and large files get their own."""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+        (tmp_path / "big.py").write_text("z = 3\n" * 50)
+        reviewer = MultiModelCodeReviewer(enable_perspectives=["bug_hunter"])
+        batches = []
+        original = BugHunter.analyze_batch
+        monkeypatch.setattr(
+            BugHunter,
+            "analyze_batch",
+            lambda self, files: batches.append([Path(path).name for _, path in files]) or original(self, files),
+        )
+
+        reports = list(
+            reviewer.iter_reviews(
+                [str(tmp_path / name) for name in ("a.py", "b.py", "big.py")], batch_lines=10, use_processes=False
+            )
+        )
+
+        assert sorted(batches) == [["a.py", "b.py"], ["big.py"]]
+        assert sorted(Path(r.file_path).name for r in reports) == ["a.py", "b.py", "big.py"]
+        assert all(r.perspective_reports["bug_hunter"].startswith("Analyzed") for r in reports)
+
+    def test_iter_reviews_skips_reviewed_content(self, tmp_path, monkeypatch):
+        """Test duplicate and previously reviewed contents are analyzed once."""
+        code = "try:\n    run()\nexcept:\n    pass\n"
+        for name in ("one.py", "two.py", "three.py"):
+            (tmp_path / name).write_text(code)
+        reviewer = MultiModelCodeReviewer(enable_perspectives=["bug_hunter"])
+        analyzed = []
+        original = BugHunter.analyze
+        monkeypatch.setattr(
+            BugHunter, "analyze", lambda self, content, path: analyzed.append(path) or original(self, content, path)
+        )
+
+        first = reviewer.review_directory(str(tmp_path))
+        second = reviewer.review_directory(str(tmp_path))
+
+        assert len(analyzed) == 1
+        assert len(first) == len(second) == 3
+        assert all(r.get_issues_by_severity("medium")[0].title == "Bare except clause" for r in first + second)
+        assert {r.file_path for r in second} == {str(tmp_path / n) for n in ("one.py", "two.py", "three.py")}
+
+    def test_process_pool_reviews_builtin_perspectives(self, tmp_path):
+        """Test several batches of built-in perspectives are pickled to worker processes by default."""
+        code = "import pickle\ntry:\n    data = pickle.loads(blob)\nexcept:\n    pass\n"
+        for n in range(4):
+            (tmp_path / f"f{n}.py").write_text(code + f"VALUE = {n}\n")
+        reviewer = MultiModelCodeReviewer()
+
+        with patch("coffee_maker.code_reviewer.reviewer.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            reports = list(reviewer.iter_reviews(sorted(map(str, tmp_path.iterdir())), batch_lines=1))
+
+        pool.assert_called_once()
+        assert len(reports) == 4
+        assert all(r.get_issues_by_severity("medium") for r in reports)
+        assert all(set(r.perspective_reports) == set(reviewer.perspectives) for r in reports)
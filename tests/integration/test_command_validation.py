@@ -14,10 +14,14 @@ These tests run during migration to ensure safety and correctness.
 
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 from coffee_maker.commands.feature_flags import FeatureFlags
 from coffee_maker.commands.parallel_operation import (
+    OperationResult,
     ParallelOperationWrapper,
 )
 from coffee_maker.commands.rollback import RollbackManager
@@ -339,6 +343,66 @@ class TestParallelOperationValidation:
             assert result.data == "legacy"
 
 
+class TestShadowMode:
+    """Test sampled background comparison of the command implementation."""
+
+    def test_returns_legacy_without_waiting_for_shadow(self):
+        """Test the legacy result returns before the slow shadow run finishes."""
+        wrapper = ParallelOperationWrapper(shadow=True)
+        wrapper.flags.enable_command("test_agent", "test_action")
+        release = threading.Event()
+
+        def command_fn(x):
+            release.wait(5)
+            return x * 3
+
+        start = time.perf_counter()
+        result = wrapper.execute_with_validation(
+            agent="test_agent", action="test_action", params={"x": 5}, legacy_fn=lambda x: x * 2, command_fn=command_fn
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result.data == 10
+        assert elapsed < 1
+        assert wrapper.get_statistics()["shadow_pending"] == 1
+
+        release.set()
+        assert wrapper.wait_for_shadows()
+        stats = wrapper.get_statistics()
+        assert (stats["parallel_operations"], stats["mismatches"]) == (1, 1)
+        wrapper.shutdown()
+
+    def test_sampling_and_bounded_history(self):
+        """Test only sampled calls run the shadow and history stays bounded."""
+        wrapper = ParallelOperationWrapper(shadow=True, sample_rate=0.5, history_size=10)
+        wrapper.flags.enable_command("test_agent", "test_action")
+
+        with patch("coffee_maker.commands.parallel_operation.random.random", side_effect=[0.2, 0.7] * 20):
+            for i in range(40):
+                wrapper.execute_with_validation(
+                    agent="test_agent", action="test_action", params={"x": i}, legacy_fn=str, command_fn=str
+                )
+        wrapper.wait_for_shadows()
+        wrapper.shutdown()
+
+        stats = wrapper.get_statistics()
+        assert (stats["total_operations"], stats["parallel_operations"], stats["matches"]) == (40, 20, 20)
+        assert len(wrapper.comparison_log) == 10
+        assert stats["latency_ms"]["legacy"]["count"] == 10
+        assert stats["latency_ms"]["command"]["count"] == 10
+
+    def test_latency_percentiles(self):
+        """Test nearest-rank percentiles per implementation."""
+        wrapper = ParallelOperationWrapper()
+        for duration in range(1, 101):
+            wrapper._record_latency("legacy", OperationResult(True, duration_ms=float(duration)))
+
+        latency = wrapper.get_statistics()["latency_ms"]
+
+        assert latency["legacy"] == {"count": 100, "p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0}
+        assert latency["command"]["count"] == 0
+
+
 class TestWorkflowIntegration:
     """Test that command system integrates properly with workflows."""
 
@@ -0,0 +1,156 @@
+"""Unit tests for RoadmapDocument and the incremental RoadmapEditor."""
+
+import json
+
+import pytest
+
+from coffee_maker.autonomous.roadmap_index import RoadmapIndex
+from coffee_maker.cli.roadmap_document import PrefixTrie, RoadmapDocument
+from coffee_maker.cli.roadmap_editor import RoadmapEditor
+
+ROADMAP = """# Roadmap
+
+## 🎯 PRIORITIES
+
+### 🔴 **PRIORITY 1: Analytics** ⚡
+
+**Estimated Duration**: 1 week
+**Impact**: ⭐⭐⭐
+**Status**: ✅ Complete
+
+---
+
+### 🔴 **PRIORITY 3: Dashboard**
+
+**Estimated Duration**: 2 weeks
+**Impact**: ⭐⭐⭐⭐
+**Status**: 📝 Planned
+
+---
+
+### 🔴 **PRIORITY 32: Reports**
+
+**Status**: 📝 Planned
+
+---
+"""
+
+
+@pytest.fixture
+def roadmap_file(tmp_path):
+    path = tmp_path / "ROADMAP.md"
+    path.write_text(ROADMAP)
+    yield path
+    RoadmapIndex.invalidate()
+
+
+@pytest.fixture
+def document(roadmap_file, tmp_path):
+    return RoadmapDocument(roadmap_file, tmp_path / "backups", max_snapshots=2, snapshot_every=2)
+
+
+class TestPrefixTrie:
+    """Tests for PrefixTrie."""
+
+    def test_complete_in_key_order(self):
+        """Test completions are case-insensitive and sorted by key."""
+        trie = PrefixTrie()
+        for key in ["PRIORITY 32", "PRIORITY 3", "US-001", "PRIORITY 1"]:
+            trie.insert(key, key)
+
+        assert trie.complete("prio") == ["PRIORITY 1", "PRIORITY 3", "PRIORITY 32"]
+        assert trie.complete("PRIORITY 3", limit=1) == ["PRIORITY 3"]
+        assert trie.complete("us-") == ["US-001"]
+        assert trie.complete("x") == []
+
+
+class TestRoadmapDocument:
+    """Tests for spliced edits and incremental backups."""
+
+    def test_splice_writes_and_shares_index(self, document, roadmap_file):
+        """Test a splice updates the file and the shared index consistently."""
+        heading = document.index.get("PRIORITY 3")
+
+        document.splice(heading.start, heading.start, "## 📌 Note\n\n".encode("utf-8"), "Add note")
+
+        data = roadmap_file.read_bytes()
+        assert b"## \xf0\x9f\x93\x8c Note\n\n### " in data
+        assert RoadmapIndex.for_path(roadmap_file) is document.index
+        assert document.index.headings == RoadmapIndex.build(data).headings
+
+    def test_splice_rejects_invalid_range(self, document):
+        """Test out-of-range splices are rejected."""
+        with pytest.raises(ValueError):
+            document.splice(10, 5, b"x")
+
+    def test_journal_chains_and_rotation(self, document, tmp_path):
+        """Test edits are journaled on a snapshot, with a new chain every snapshot_every edits."""
+        for i in range(5):
+            document.splice(0, 0, f"<!-- {i} -->\n".encode("utf-8"), f"Edit {i}")
+
+        snapshots = sorted((tmp_path / "backups").glob("ROADMAP_*.md"))
+        assert len(snapshots) == 2  # max_snapshots
+        journal = snapshots[-1].with_suffix(".journal.jsonl")
+        entries = [json.loads(line) for line in journal.read_text().splitlines()]
+        assert [entry["description"] for entry in entries] == ["Edit 4"]
+        assert snapshots[-1].read_text().startswith("<!-- 3 -->\n")
+
+    def test_external_change_starts_new_chain(self, document, roadmap_file, tmp_path):
+        """Test a file changed outside the editor gets a fresh snapshot."""
+        document.splice(0, 0, b"<!-- a -->\n", "Edit a")
+        roadmap_file.write_text("# Changed\n")
+
+        document.splice(0, 0, b"<!-- b -->\n", "Edit b")
+
+        snapshots = sorted((tmp_path / "backups").glob("ROADMAP_*.md"))
+        assert snapshots[-1].read_text() == "# Changed\n"
+
+    def test_undo_reverts_last_edit(self, document, roadmap_file):
+        """Test undo applies the reverse patch of the last edit."""
+        status = document.index.get("PRIORITY 3")
+        offset = document.data.index(b"\xf0\x9f\x93\x9d Planned", status.start)
+        document.splice(offset, offset + len("📝 Planned".encode("utf-8")), "✅ Complete".encode("utf-8"))
+
+        assert document.undo() is True
+        assert roadmap_file.read_text() == ROADMAP
+        assert document.undo() is False
+
+
+class TestRoadmapEditorIncremental:
+    """Tests for RoadmapEditor edits on the in-memory document."""
+
+    @pytest.fixture
+    def editor(self, roadmap_file):
+        return RoadmapEditor(roadmap_file)
+
+    def test_add_priority_in_numeric_order(self, editor, roadmap_file):
+        """Test new priorities are spliced before the next higher priority."""
+        editor.add_priority("PRIORITY 2", "Pipelines", "1 week", "⭐⭐", deliverables=["Runner"])
+
+        content = roadmap_file.read_text()
+        assert content.index("PRIORITY 1:") < content.index("PRIORITY 2:") < content.index("PRIORITY 3:")
+        assert editor.get_priority_content("PRIORITY 2").count("- Runner") == 1
+
+    def test_add_priority_checks_heading_ids(self, editor):
+        """Test duplicates are detected by id, not by substring (PRIORITY 3 vs 32)."""
+        with pytest.raises(ValueError):
+            editor.add_priority("PRIORITY 32", "Duplicate", "1 week", "⭐")
+
+        assert editor.add_priority("PRIORITY 33", "Exports", "1 week", "⭐") is True
+
+    def test_update_priority_field(self, editor):
+        """Test a field is updated within the priority's own section."""
+        editor.update_priority("3", "status", "🔄 In Progress")
+
+        assert "**Status**: 🔄 In Progress" in editor.get_priority_content("PRIORITY 3")
+        assert "**Status**: 📝 Planned" in editor.get_priority_content("PRIORITY 32")
+
+    def test_list_and_complete_priorities(self, editor):
+        """Test listing and prefix completion of roadmap items."""
+        assert [p["name"] for p in editor.list_priorities()] == ["PRIORITY 1", "PRIORITY 3", "PRIORITY 32"]
+
+        completions = editor.complete_priorities("priority 3")
+
+        assert [p["name"] for p in completions] == ["PRIORITY 3", "PRIORITY 32"]
+        assert completions[0]["title"] == "Dashboard"
+        assert completions[0]["status"] == "📝 Planned"
@@ -154,7 +154,7 @@ class TestACEApi:
         assert isinstance(traces, list)
         assert len(traces) == 1
         assert traces[0]["trace_id"] == "trace_123"
-        api.trace_manager.list_traces.assert_called_once_with(agent="user_interpret")
+        api.trace_manager.list_traces.assert_called_once_with(agent="user_interpret", limit=100)
 
     @patch("coffee_maker.autonomous.ace.api.TraceManager")
     @patch("coffee_maker.autonomous.ace.api.EnvManager")
@@ -167,7 +167,7 @@ class TestACEApi:
 
         assert isinstance(traces, list)
         assert len(traces) == 1
-        api.trace_manager.get_traces_since.assert_called_once_with(hours=24, agent=None)
+        api.trace_manager.get_traces_since.assert_called_once_with(hours=24, agent=None, limit=100)
 
     @patch("coffee_maker.autonomous.ace.api.TraceManager")
     @patch("coffee_maker.autonomous.ace.api.EnvManager")
@@ -221,12 +221,26 @@ class TestACEApi:
     @patch("coffee_maker.autonomous.ace.api.TraceManager")
     @patch("coffee_maker.autonomous.ace.api.EnvManager")
     def test_get_metrics(self, mock_env_manager, mock_trace_manager, mock_config, sample_trace):
-        """Test getting metrics."""
-        # Create multiple traces
-        traces = [sample_trace] * 10
-
+        """Test getting metrics from per-day trace aggregates."""
         api = ACEApi(config=mock_config)
-        api.trace_manager.list_traces = Mock(return_value=traces)
+        api.trace_manager.summarize = Mock(
+            return_value=[
+                {
+                    "day": "2025-10-17",
+                    "agent": "user_interpret",
+                    "total": 4,
+                    "success_count": 4,
+                    "duration_seconds": 6.0,
+                },
+                {
+                    "day": "2025-10-18",
+                    "agent": "user_interpret",
+                    "total": 6,
+                    "success_count": 6,
+                    "duration_seconds": 9.0,
+                },
+            ]
+        )
 
         metrics = api.get_metrics(days=7)
 
@@ -236,6 +250,8 @@ class TestACEApi:
         assert metrics["success_rate"] == 100.0
         assert "agent_metrics" in metrics
         assert "user_interpret" in metrics["agent_metrics"]
+        assert metrics["agent_metrics"]["user_interpret"]["avg_duration_seconds"] == 1.5
+        assert metrics["traces_by_day"] == {"2025-10-17": 4, "2025-10-18": 6}
 
     @patch("coffee_maker.autonomous.ace.api.TraceManager")
     @patch("coffee_maker.autonomous.ace.api.EnvManager")
@@ -252,7 +268,7 @@ class TestACEApi:
         mock_config.delta_dir = delta_dir
 
         api = ACEApi(config=mock_config)
-        api.trace_manager.list_traces = Mock(return_value=[])
+        api.trace_manager.count_traces = Mock(return_value=0)
 
         status = api.get_reflection_status()
 
@@ -0,0 +1,148 @@
+"""Tests for the append-only ACE trace store."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from coffee_maker.autonomous.ace.models import Execution, ExecutionTrace
+from coffee_maker.autonomous.ace.trace_manager import TraceManager
+
+
+def make_trace(trace_id, agent, timestamp, status="success", duration=1.0):
+    """Create a trace with one execution."""
+    return ExecutionTrace(
+        trace_id=trace_id,
+        timestamp=timestamp,
+        agent_identity={"target_agent": agent},
+        user_query=f"Query for {trace_id}",
+        executions=[
+            Execution(
+                execution_id=f"{trace_id}_exec_0",
+                prompt="Prompt",
+                input_data={"query": "ünïcode"},
+                output="Output",
+                result_status=status,
+                duration_seconds=duration,
+            )
+        ],
+        context={"session_id": "session_1"},
+    )
+
+
+@pytest.fixture
+def now():
+    return datetime.now().replace(microsecond=0)
+
+
+@pytest.fixture
+def manager(tmp_path, now):
+    """Trace store with traces over three days and two agents."""
+    manager = TraceManager(tmp_path / "traces")
+    manager.append(make_trace("t1", "assistant", now - timedelta(days=2), duration=2.0))
+    manager.append(make_trace("t2", "code_developer", now - timedelta(days=1), status="failure", duration=4.0))
+    manager.append(make_trace("t3", "assistant", now - timedelta(hours=1), duration=6.0))
+    manager.append(make_trace("t4", "code_developer", now, duration=8.0))
+    return manager
+
+
+class TestTraceManager:
+    """Tests for TraceManager."""
+
+    def test_segments_partitioned_by_day_and_agent(self, manager, now):
+        """Test traces are appended to one segment per day and agent."""
+        partitions = {
+            (t.timestamp.strftime("%Y-%m-%d"), t.agent_identity["target_agent"]) for t in manager.list_traces()
+        }
+        segments = {(p.parent.name, p.stem) for p in manager.trace_dir.glob("*/*.jsonl")}
+
+        assert segments == partitions
+        assert (manager.trace_dir / now.strftime("%Y-%m-%d") / "code_developer.jsonl").read_text().count("\n") == 1
+
+    def test_list_traces_newest_first_with_filters(self, manager, now):
+        """Test time range, agent and limit are applied by the index."""
+        assert [t.trace_id for t in manager.list_traces()] == ["t4", "t3", "t2", "t1"]
+        assert [t.trace_id for t in manager.list_traces(agent="assistant")] == ["t3", "t1"]
+        assert [t.trace_id for t in manager.get_traces_since(hours=30)] == ["t4", "t3", "t2"]
+        assert [t.trace_id for t in manager.list_traces(limit=1)] == ["t4"]
+        assert [t.trace_id for t in manager.list_traces(date=(now - timedelta(days=2)).strftime("%Y-%m-%d"))] == ["t1"]
+
+    def test_read_trace_round_trips(self, manager, now):
+        """Test lookup by ID returns the stored trace."""
+        trace = manager.read_trace("t2")
+
+        assert (
+            trace.to_dict()
+            == make_trace("t2", "code_developer", now - timedelta(days=1), status="failure", duration=4.0).to_dict()
+        )
+        with pytest.raises(FileNotFoundError):
+            manager.read_trace("missing")
+
+    def test_duplicate_trace_rejected(self, manager, now):
+        """Test trace IDs are unique."""
+        with pytest.raises(ValueError):
+            manager.append(make_trace("t1", "assistant", now))
+
+    def test_concurrent_duplicates_stored_once(self, tmp_path, now):
+        """Test concurrent appends of one trace ID store exactly one copy."""
+        manager = TraceManager(tmp_path / "traces")
+        manager.count_traces()
+        errors = []
+
+        def append():
+            try:
+                TraceManager(manager.trace_dir).append(make_trace("dup", "assistant", now))
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=append) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 7
+        assert (manager.trace_dir / now.strftime("%Y-%m-%d") / "assistant.jsonl").read_text().count("\n") == 1
+        assert manager.read_trace("dup").trace_id == "dup"
+
+    def test_count_and_summarize_from_index(self, manager, now):
+        """Test aggregates are computed without reading segments."""
+        manager._read_records = None  # aggregates must not read traces
+
+        assert manager.count_traces() == 4
+        assert manager.count_traces(agent="code_developer", since=now - timedelta(days=1, minutes=1)) == 2
+
+        rows = manager.summarize(since=now - timedelta(days=3), agent="assistant")
+        assert sum(row["total"] for row in rows) == 2
+        assert sum(row["success_count"] for row in rows) == 2
+        assert sum(row["duration_seconds"] for row in rows) == pytest.approx(8.0)
+
+    def test_index_rebuilt_from_segments(self, manager):
+        """Test a lost index and unindexed appends are recovered from the segments."""
+        segment = next(manager.trace_dir.glob("*/assistant.jsonl"))
+        for path in manager.trace_dir.glob("index.db*"):
+            path.unlink()
+        with open(segment, "a") as f:
+            f.write('{"trace_id": "partial"')  # torn write, not a complete record
+
+        reopened = TraceManager(manager.trace_dir)
+
+        assert reopened.count_traces() == 4
+        assert reopened.read_trace("t3").agent_identity["target_agent"] == "assistant"
+
+    def test_pruned_segments_dropped_from_index(self, manager, now):
+        """Test deleting a day's directory removes its traces from the index."""
+        for segment in (manager.trace_dir / now.strftime("%Y-%m-%d")).glob("*.jsonl"):
+            segment.unlink()
+
+        reopened = TraceManager(manager.trace_dir)
+
+        assert "t4" not in [t.trace_id for t in reopened.list_traces()]
+
+    def test_missing_store_is_empty(self, tmp_path):
+        """Test queries on a store that does not exist yet do not create it."""
+        manager = TraceManager(tmp_path / "none")
+
+        assert manager.list_traces() == []
+        assert manager.count_traces() == 0
+        assert not (tmp_path / "none").exists()
@@ -0,0 +1,182 @@
+"""Unit tests for the host-wide agent status registry."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from coffee_maker.autonomous.agent_registry import AgentAlreadyRunningError, AgentRegistry, AgentType
+from coffee_maker.autonomous.agent_status_registry import AgentStatusRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return AgentStatusRegistry(tmp_path / "agent_status.db")
+
+
+@pytest.fixture
+def dead_pid():
+    """PID of a process that has exited."""
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class TestAgentStatusRegistry:
+    """Tests for AgentStatusRegistry."""
+
+    def test_heartbeats_upsert_and_count(self, registry):
+        """Test heartbeats update one row per agent and increment counters."""
+        registry.heartbeat("architect", state="idle")
+        registry.heartbeat("architect", state="working", current_task={"priority": "US-104"}, metrics={"specs": 2})
+        registry.heartbeat("architect", state="error", error="boom")
+        registry.heartbeat("code_developer", state="idle")
+
+        snapshot = registry.snapshot()
+
+        assert set(snapshot) == {"architect", "code_developer"}
+        architect = snapshot["architect"]
+        assert architect["state"] == "error"
+        assert architect["health"] == "unhealthy"
+        assert architect["current_task"] is None
+        assert architect["heartbeats"] == 3
+        assert architect["errors"] == 1
+        assert architect["pid"] == os.getpid()
+        assert architect["alive"] is True
+        assert registry.get("code_developer")["metrics"] == {}
+
+    def test_dead_pid_reported_not_alive(self, registry, dead_pid):
+        """Test liveness comes from the PID, not the last recorded state."""
+        registry.heartbeat("assistant", state="working", pid=dead_pid)
+
+        status = registry.get("assistant")
+
+        assert status["state"] == "working"
+        assert status["alive"] is False
+
+    def test_missing_database_is_empty(self, tmp_path):
+        """Test reads do not create the database."""
+        registry = AgentStatusRegistry(tmp_path / "none" / "agent_status.db")
+
+        assert registry.snapshot() == {}
+        assert registry.get("architect") is None
+        assert not (tmp_path / "none").exists()
+
+    def test_claim_held_by_live_process_refused(self, registry):
+        """Test a claim by another live process blocks this one."""
+        registry.claim("code_developer", pid=os.getppid())
+
+        with pytest.raises(AgentAlreadyRunningError) as exc_info:
+            registry.claim("code_developer")
+
+        assert exc_info.value.existing_pid == os.getppid()
+
+    def test_claim_left_by_dead_process_taken_over(self, registry, dead_pid):
+        """Test a crashed agent's claim does not block a restart."""
+        registry.claim("code_developer", pid=dead_pid)
+
+        registry.claim("code_developer")
+
+        assert registry.get("code_developer")["pid"] == os.getpid()
+        assert registry.get("code_developer")["claimed"] is True
+
+    def test_claim_visible_to_other_process(self, registry):
+        """Test a claim made in another process is enforced here."""
+        script = (
+            "import sys\n"
+            "from coffee_maker.autonomous.agent_status_registry import AgentStatusRegistry\n"
+            f"AgentStatusRegistry({str(registry.db_path)!r}).claim('assistant')\n"
+            "print('claimed', flush=True)\n"
+            "sys.stdin.read()\n"
+        )
+        process = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        try:
+            assert process.stdout.readline().strip() == b"claimed"
+            with pytest.raises(AgentAlreadyRunningError):
+                registry.claim("assistant")
+        finally:
+            process.stdin.close()
+            process.wait()
+
+        registry.claim("assistant")  # holder exited
+
+    def test_agent_registry_claims_host_wide(self, registry):
+        """Test AgentRegistry claims and releases the host-wide slot."""
+        AgentRegistry().reset()
+        try:
+            with AgentRegistry.register(AgentType.ARCHITECT, status_registry=registry):
+                assert registry.get("architect")["claimed"] is True
+            assert registry.get("architect")["claimed"] is False
+
+            registry.claim("architect", pid=os.getppid())
+            with pytest.raises(AgentAlreadyRunningError):
+                AgentRegistry().register_agent(AgentType.ARCHITECT, status_registry=registry)
+            assert not AgentRegistry().is_registered(AgentType.ARCHITECT)
+        finally:
+            AgentRegistry().reset()
+
+
+class TestBaseAgentHeartbeat:
+    """Tests for BaseAgent status writes."""
+
+    def test_status_mirrored_only_on_change(self, tmp_path):
+        """Test every heartbeat reaches the registry; the file changes only with state."""
+        from coffee_maker.autonomous.agents.architect_agent import ArchitectAgent
+
+        status_dir = tmp_path / "status"
+        agent = ArchitectAgent(status_dir=status_dir, message_dir=tmp_path / "messages")
+
+        agent._write_status()
+        os.utime(agent.status_file, ns=(0, 0))
+        agent._write_status()
+        assert agent.status_file.stat().st_mtime_ns == 0
+
+        agent.current_task = {"priority": "US-104"}
+        agent._write_status()
+
+        assert json.loads(agent.status_file.read_text())["state"] == "working"
+        status = agent.status_registry.get("architect")
+        assert status["heartbeats"] == 3
+        assert status["current_task"] == {"priority": "US-104"}
+
+        agent._write_status_stopped()
+        assert agent.status_registry.get("architect")["state"] == "stopped"
+        assert json.loads(agent.status_file.read_text())["health"] == "stopped"
+
+    def test_unchanged_status_refreshes_heartbeat(self, tmp_path, monkeypatch):
+        """Test an idle agent's status file does not keep a stale last_heartbeat."""
+        from coffee_maker.autonomous.agents.architect_agent import ArchitectAgent
+
+        agent = ArchitectAgent(status_dir=tmp_path / "status", message_dir=tmp_path / "messages")
+        agent._write_status()
+        first = json.loads(agent.status_file.read_text())["last_heartbeat"]
+
+        monkeypatch.setattr(ArchitectAgent, "STATUS_MIRROR_REFRESH_SECONDS", 0)
+        agent._write_status()
+
+        assert json.loads(agent.status_file.read_text())["last_heartbeat"] > first
+
+
+class TestAgentHeartbeatLines:
+    """Tests for the /agents heartbeat listing."""
+
+    def test_heartbeats_read_from_registry(self, tmp_path):
+        """Test the registry heartbeat wins over a stale status file."""
+        from coffee_maker.cli.commands.team import _agent_heartbeat_lines
+
+        (tmp_path / "architect_status.json").write_text(
+            json.dumps({"state": "idle", "last_heartbeat": "2000-01-01T00:00:00"})
+        )
+        (tmp_path / "assistant_status.json").write_text(
+            json.dumps({"state": "idle", "last_heartbeat": "2001-01-01T00:00:00"})
+        )
+        AgentStatusRegistry(tmp_path / "agent_status.db").heartbeat("architect", state="working")
+
+        lines = _agent_heartbeat_lines(tmp_path)
+
+        assert len(lines) == 2
+        assert lines[0].startswith("  architect: working (last: ")
+        assert "2000-01-01" not in lines[0]
+        assert lines[1] == "  assistant: idle (last: 2001-01-01T00:00:00)"
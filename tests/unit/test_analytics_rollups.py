@@ -0,0 +1,261 @@
+"""Tests for incrementally maintained usage rollups and the dashboard queries reading them."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from coffee_maker.langfuse_observe.analytics.models_sqlite import (
+    Generation,
+    Trace,
+    ensure_usage_rollups,
+    init_database,
+    insert_generation,
+    insert_trace,
+    rebuild_usage_rollups,
+)
+
+
+@pytest.fixture
+def metrics_db(tmp_path):
+    """Create a metrics database with two agents and two models."""
+    db_path = str(tmp_path / "metrics.db")
+    conn = init_database(db_path)
+    base = datetime(2025, 1, 6, 10, 0, 0)
+
+    insert_trace(conn, Trace(id="t1", name="code-developer", created_at=base))
+    insert_trace(conn, Trace(id="t2", name="architect", created_at=base))
+
+    for i in range(6):
+        insert_generation(
+            conn,
+            Generation(
+                id=f"g{i}",
+                trace_id="t1" if i % 2 == 0 else "t2",
+                model="openai/gpt-4o" if i < 4 else "anthropic/claude-3-5-sonnet",
+                input_tokens=100,
+                output_tokens=50,
+                total_tokens=150,
+                total_cost=0.01 * (i + 1),
+                latency_ms=1000.0 + i * 100,
+                created_at=base + timedelta(hours=i),
+            ),
+        )
+
+    yield db_path, conn
+    conn.close()
+
+
+def _raw_totals(conn):
+    return conn.execute(
+        "SELECT COUNT(*), SUM(total_cost), SUM(total_tokens), SUM(latency_ms) FROM generations"
+    ).fetchone()
+
+
+def _rollup_totals(conn, table):
+    return conn.execute(
+        f"SELECT SUM(request_count), SUM(total_cost), SUM(total_tokens), SUM(latency_sum_ms) FROM {table}"
+    ).fetchone()
+
+
+def _assert_rollups_match_rebuild(conn):
+    """Check trigger-maintained rollups equal a full rebuild (ignoring emptied rows)."""
+
+    def rows():
+        return {
+            table: conn.execute(
+                f"SELECT bucket_start, model, agent_name, request_count, total_tokens, ROUND(total_cost, 6), "
+                f"latency_count FROM {table} WHERE request_count != 0 ORDER BY 1, 2, 3"
+            ).fetchall()
+            for table in ("usage_rollup_hourly", "usage_rollup_daily")
+        }
+
+    incremental = rows()
+    rebuild_usage_rollups(conn)
+    assert incremental == rows()
+
+
+class TestUsageRollups:
+    """Tests for trigger-maintained rollup tables."""
+
+    def test_rollups_match_raw_after_inserts(self, metrics_db):
+        """Test hourly and daily rollups agree with raw generations."""
+        _, conn = metrics_db
+
+        raw = _raw_totals(conn)
+        for table in ("usage_rollup_hourly", "usage_rollup_daily"):
+            rollup = _rollup_totals(conn, table)
+            assert rollup[0] == raw[0]
+            assert rollup[1] == pytest.approx(raw[1])
+            assert rollup[2] == raw[2]
+            assert rollup[3] == pytest.approx(raw[3])
+
+    def test_replace_does_not_double_count(self, metrics_db):
+        """Test INSERT OR REPLACE of an existing generation moves its contribution."""
+        _, conn = metrics_db
+
+        insert_generation(
+            conn,
+            Generation(
+                id="g0",
+                trace_id="t1",
+                model="openai/gpt-4o",
+                total_tokens=1000,
+                total_cost=1.0,
+                created_at=datetime(2025, 1, 7, 9, 0, 0),
+            ),
+        )
+
+        raw = _raw_totals(conn)
+        rollup = _rollup_totals(conn, "usage_rollup_hourly")
+        assert rollup[0] == raw[0] == 6
+        assert rollup[1] == pytest.approx(raw[1])
+        assert rollup[2] == raw[2]
+
+    def test_delete_and_update_are_tracked(self, metrics_db):
+        """Test DELETE and UPDATE on generations keep rollups in sync."""
+        _, conn = metrics_db
+
+        conn.execute("DELETE FROM generations WHERE id = 'g1'")
+        conn.execute("UPDATE generations SET total_cost = 2.5 WHERE id = 'g2'")
+        conn.commit()
+
+        raw = _raw_totals(conn)
+        rollup = _rollup_totals(conn, "usage_rollup_daily")
+        assert rollup[0] == raw[0] == 5
+        assert rollup[1] == pytest.approx(raw[1])
+
+    def test_insert_or_ignore_existing_generation(self, metrics_db):
+        """Test an ignored insert leaves the rollups untouched."""
+        _, conn = metrics_db
+
+        conn.execute(
+            "INSERT OR IGNORE INTO generations (id, trace_id, model, total_tokens, total_cost, created_at) "
+            "VALUES ('g0', 't1', 'openai/gpt-4o', 999, 9.0, '2025-01-06 10:00:00')"
+        )
+        conn.commit()
+
+        assert _rollup_totals(conn, "usage_rollup_hourly")[0] == 6
+        _assert_rollups_match_rebuild(conn)
+
+    def test_upsert_existing_generation(self, metrics_db):
+        """Test an UPSERT moves the generation's contribution once."""
+        _, conn = metrics_db
+
+        conn.execute(
+            "INSERT INTO generations (id, trace_id, model, total_tokens, total_cost, created_at) "
+            "VALUES ('g0', 't1', 'openai/gpt-4o', 999, 9.0, '2025-01-07 10:00:00') "
+            "ON CONFLICT(id) DO UPDATE SET total_tokens = excluded.total_tokens, "
+            "total_cost = excluded.total_cost, created_at = excluded.created_at"
+        )
+        conn.commit()
+
+        raw = _raw_totals(conn)
+        assert _rollup_totals(conn, "usage_rollup_daily")[:3] == pytest.approx(raw[:3])
+        _assert_rollups_match_rebuild(conn)
+
+    def test_agent_reassignment_is_tracked(self, metrics_db):
+        """Test renamed, replaced, late and deleted traces move their generations."""
+        _, conn = metrics_db
+
+        conn.execute("UPDATE traces SET name = 'project-manager' WHERE id = 't1'")
+        insert_trace(conn, Trace(id="t2", name="assistant", created_at=datetime(2025, 1, 6)))
+        conn.execute("UPDATE generations SET trace_id = 't2' WHERE id = 'g0'")
+        insert_generation(
+            conn, Generation(id="g9", trace_id="t3", model="openai/gpt-4o", created_at=datetime(2025, 1, 6))
+        )
+        _assert_rollups_match_rebuild(conn)
+
+        insert_trace(conn, Trace(id="t3", name="ux-design-expert", created_at=datetime(2025, 1, 6)))
+        conn.execute("DELETE FROM traces WHERE id = 't1'")
+        conn.commit()
+
+        rows = dict(
+            conn.execute(
+                "SELECT agent_name, SUM(request_count) FROM usage_rollup_daily GROUP BY agent_name "
+                "HAVING SUM(request_count) != 0"
+            ).fetchall()
+        )
+        assert rows == {"Unknown": 2, "assistant": 4, "ux-design-expert": 1}
+        _assert_rollups_match_rebuild(conn)
+
+    def test_ensure_migrates_pre_member_triggers(self, metrics_db):
+        """Test databases with the old BEFORE INSERT trigger are migrated and rebuilt."""
+        _, conn = metrics_db
+        conn.executescript(
+            """
+            DROP TABLE usage_rollup_members;
+            CREATE TRIGGER trg_generations_rollup_replace BEFORE INSERT ON generations
+            BEGIN UPDATE usage_rollup_hourly SET request_count = request_count - 100; END;
+            """
+        )
+
+        ensure_usage_rollups(conn)
+        conn.execute("INSERT OR IGNORE INTO generations (id, created_at) VALUES ('g0', '2025-01-06 10:00:00')")
+
+        triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        assert "trg_generations_rollup_replace" not in triggers
+        assert _rollup_totals(conn, "usage_rollup_hourly")[0] == 6
+
+    def test_ensure_backfills_existing_database(self, metrics_db):
+        """Test rollups are backfilled when added to a database with history."""
+        _, conn = metrics_db
+        conn.executescript(
+            """
+            DROP TABLE usage_rollup_hourly;
+            DROP TABLE usage_rollup_daily;
+            """
+        )
+
+        ensure_usage_rollups(conn)
+
+        assert _rollup_totals(conn, "usage_rollup_hourly")[0] == 6
+
+    def test_rebuild_attributes_agents(self, metrics_db):
+        """Test rebuilt rollups attribute generations to trace names."""
+        _, conn = metrics_db
+
+        rebuild_usage_rollups(conn)
+
+        rows = dict(
+            conn.execute("SELECT agent_name, SUM(request_count) FROM usage_rollup_daily GROUP BY agent_name").fetchall()
+        )
+        assert rows == {"code-developer": 3, "architect": 3}
+
+
+class TestDashboardQueries:
+    """Tests for analytics dashboard queries served from rollups."""
+
+    def test_quick_stats_and_breakdowns(self, metrics_db):
+        """Test aggregate queries return the same numbers as raw aggregation."""
+        from streamlit_apps.analytics_dashboard.queries import analytics_queries as queries
+
+        db_path, conn = metrics_db
+        date_range = (datetime(2025, 1, 6, 0, 0, 0), datetime(2025, 1, 6, 23, 59, 59))
+
+        stats = queries.get_quick_stats(db_path, date_range)
+        raw = _raw_totals(conn)
+        assert stats["total_requests"] == raw[0]
+        assert stats["total_cost"] == pytest.approx(raw[1])
+        assert stats["avg_latency"] == pytest.approx(raw[3] / raw[0])
+
+        by_model = queries.get_cost_by_model(db_path, date_range).set_index("model")
+        assert by_model.loc["openai/gpt-4o", "request_count"] == 4
+        assert by_model.loc["anthropic/claude-3-5-sonnet", "total_cost"] == pytest.approx(0.11)
+
+        by_agent = queries.get_agent_analysis(db_path, date_range).set_index("agent_name")
+        assert by_agent.loc["code-developer", "request_count"] == 3
+
+        hourly = queries.get_hourly_usage_pattern(db_path, date_range)
+        assert hourly["request_count"].sum() == 6
+        assert sorted(hourly["hour"]) == [10, 11, 12, 13, 14, 15]
+
+    def test_time_range_filters_buckets(self, metrics_db):
+        """Test bounded ranges only include matching hourly buckets."""
+        from streamlit_apps.analytics_dashboard.queries import analytics_queries as queries
+
+        db_path, _ = metrics_db
+        date_range = (datetime(2025, 1, 6, 12, 30, 0), datetime(2025, 1, 6, 13, 15, 0))
+
+        stats = queries.get_quick_stats(db_path, date_range)
+
+        assert stats["total_requests"] == 2
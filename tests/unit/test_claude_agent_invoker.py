@@ -20,6 +20,9 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from coffee_maker.autonomous.ace import config as ace_config
+from coffee_maker.autonomous.ace.config import ACEConfig
+from coffee_maker.autonomous.ace.trace_manager import TraceManager
 from coffee_maker.claude_agent_invoker import (
     ClaudeAgentInvoker,
     ClaudeInvocationDB,
@@ -27,6 +30,18 @@ from coffee_maker.claude_agent_invoker import (
 )
 
 
+@pytest.fixture(autouse=True)
+def ace_trace_dir(tmp_path, monkeypatch):
+    """Record ACE traces of invocations under a temporary directory."""
+    trace_dir = tmp_path / "traces"
+    monkeypatch.setattr(
+        ace_config,
+        "get_default_config",
+        lambda: ACEConfig(trace_dir=trace_dir, delta_dir=tmp_path / "deltas", playbook_dir=tmp_path / "playbooks"),
+    )
+    return trace_dir
+
+
 class TestClaudeInvocationDB:
     """Test database persistence layer."""
 
@@ -207,6 +222,27 @@ class TestClaudeAgentInvoker:
         assert history[0]["agent_type"] == "architect"
         assert history[0]["status"] == "success"
 
+    def test_invocation_recorded_as_ace_trace(self, temp_db, mock_claude_cli, ace_trace_dir, tmp_path):
+        """Test completed invocations are appended to the ACE trace store."""
+        mock_claude_cli.return_value = Mock(
+            returncode=0, stdout=json.dumps({"result": "Done", "duration_ms": 1500}), stderr=""
+        )
+        claude = tmp_path / "claude"
+        claude.touch()
+        invoker = ClaudeAgentInvoker(claude_path=str(claude), db_path=temp_db)
+        invoker.invoke_agent("architect", "Create spec for OAuth2")
+        mock_claude_cli.return_value = Mock(returncode=1, stdout="", stderr="boom")
+        invoker.invoke_agent("architect", "Create spec for SSO")
+
+        traces = TraceManager(ace_trace_dir).list_traces(agent="architect")
+
+        assert [(t.user_query, t.executions[0].result_status) for t in traces] == [
+            ("Create spec for SSO", "error"),
+            ("Create spec for OAuth2", "success"),
+        ]
+        assert traces[1].executions[0].output == "Done"
+        assert traces[1].executions[0].duration_seconds == 1.5
+
     def test_invoke_agent_error(self, temp_db, mock_claude_cli):
         """Test agent invocation error handling."""
         # Mock error response
@@ -323,6 +359,101 @@ Do something with this priority.
             assert len(stream_messages) == 4
 
 
+def stream_event(text):
+    return json.dumps(
+        {
+            "type": "stream_event",
+            "event": {"type": "content_block_delta", "delta": {"type": "text_delta", "text": text}},
+        }
+    )
+
+
+class TestStreamText:
+    """Test incremental text streaming through stream-json."""
+
+    @pytest.fixture
+    def invoker(self, tmp_path):
+        """Invoker whose CLI path exists (the process itself is mocked)."""
+        claude = tmp_path / "claude"
+        claude.touch()
+        return ClaudeAgentInvoker(claude_path=str(claude), db_path=str(tmp_path / "invocations.db"))
+
+    def test_deltas_yielded_as_they_arrive(self, invoker):
+        """Test each text delta is yielded before the next line is read."""
+        read = []
+
+        def stdout():
+            for line in [
+                json.dumps({"type": "system", "subtype": "init", "session_id": "s-1"}),
+                stream_event("Hel"),
+                stream_event("lo"),
+                json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "Hello"}]}}),
+                json.dumps({"type": "result", "result": "Hello", "session_id": "s-1", "usage": {"output_tokens": 2}}),
+            ]:
+                read.append(line)
+                yield line + "\n"
+
+        mock_proc = MagicMock()
+        mock_proc.stdout = stdout()
+        mock_proc.wait.return_value = 0
+
+        with patch("subprocess.Popen", return_value=mock_proc) as popen:
+            stream = invoker.stream_text("Say hello", model="haiku")
+            assert next(stream) == "Hel"
+            assert len(read) == 2
+            assert list(stream) == ["lo"]
+
+        cmd = popen.call_args[0][0]
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert "--include-partial-messages" in cmd
+        history = invoker.get_history()
+        assert (history[0]["content"], history[0]["output_tokens"], history[0]["status"]) == ("Hello", 2, "success")
+
+    def test_complete_messages_without_partials(self, invoker):
+        """Test CLIs without partial messages stream whole assistant messages."""
+        mock_proc = MagicMock()
+        mock_proc.stdout = [
+            json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "Part one. "}]}}),
+            json.dumps({"type": "assistant", "message": {"content": [{"type": "tool_use", "name": "Read"}]}}),
+            json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": "Part two."}]}}),
+        ]
+        mock_proc.wait.return_value = 0
+
+        with patch("subprocess.Popen", return_value=mock_proc):
+            assert list(invoker.stream_text("Explain")) == ["Part one. ", "Part two."]
+
+    def test_error_result_raises(self, invoker):
+        """Test an error result is raised after streaming and recorded."""
+        mock_proc = MagicMock()
+        mock_proc.stdout = [json.dumps({"type": "result", "is_error": True, "result": "Credit balance too low"})]
+        mock_proc.wait.return_value = 1
+
+        with patch("subprocess.Popen", return_value=mock_proc):
+            with pytest.raises(RuntimeError, match="Credit balance too low"):
+                list(invoker.stream_text("Hi"))
+
+        assert invoker.get_history()[0]["error"] == "Credit balance too low"
+
+    def test_verbose_stderr_does_not_block(self, tmp_path):
+        """Test a CLI writing more than a pipe buffer to stderr still streams and reports it."""
+        claude = tmp_path / "claude"
+        claude.write_text(
+            "#!/usr/bin/env python3\n"
+            "import sys\n"
+            "sys.stderr.write('x' * 200000 + 'rate limited')\n"
+            "sys.stderr.flush()\n"
+            f"print({stream_event('Hi')!r})\n"
+            "sys.exit(1)\n"
+        )
+        claude.chmod(0o755)
+        invoker = ClaudeAgentInvoker(claude_path=str(claude), db_path=str(tmp_path / "invocations.db"))
+
+        stream = invoker.stream_text("Hi", timeout=30)
+        assert next(stream) == "Hi"
+        with pytest.raises(RuntimeError, match="rate limited$"):
+            next(stream)
+
+
 def test_get_invoker_singleton():
     """Test singleton pattern for get_invoker()."""
     invoker1 = get_invoker()
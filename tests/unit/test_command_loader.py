@@ -317,3 +317,66 @@ class TestCommandLoaderIntegration:
         list2 = loader.list_commands()
 
         assert list1 == list2
+
+
+class TestCommandManifest:
+    """Test the compiled command manifest."""
+
+    @pytest.fixture(autouse=True)
+    def clear_manifests(self, monkeypatch):
+        """Start each test without in-process manifests."""
+        monkeypatch.setattr("coffee_maker.commands.command_loader._manifests", {})
+
+    def test_manifest_reused_without_parsing(self, commands_dir, tmp_path, monkeypatch):
+        """Test a second process loads commands from the manifest without parsing frontmatter."""
+        CommandLoader(AgentType.ARCHITECT, commands_dir / "architect", manifest_dir=tmp_path)
+        monkeypatch.setattr("coffee_maker.commands.command_loader._manifests", {})
+
+        def fail(text):
+            raise AssertionError("frontmatter parsed")
+
+        monkeypatch.setattr("coffee_maker.commands.command_loader._parse_frontmatter", fail)
+        loader = CommandLoader(AgentType.ARCHITECT, commands_dir / "architect", manifest_dir=tmp_path)
+
+        cmd = loader.commands["create_spec"]
+        assert cmd.tables_write == ["specs_specification"]
+        assert cmd.required_skills == ["technical_specification_handling"]
+        assert cmd.content.startswith("# Command: architect.create_spec")
+        assert cmd.content.endswith("- priority_id: ID of the priority to create spec for")
+
+    def test_changed_file_recompiled(self, commands_dir, tmp_path):
+        """Test only files whose content changed are parsed again."""
+        arch_dir = commands_dir / "architect"
+        CommandLoader(AgentType.ARCHITECT, arch_dir, manifest_dir=tmp_path)
+        (arch_dir / "create_spec.md").write_text("---\naction: create_spec\nagent: architect\n---\n\nNew body é\n")
+        (arch_dir / "review.md").write_text("No frontmatter\n")
+
+        loader = CommandLoader(AgentType.ARCHITECT, arch_dir, manifest_dir=tmp_path)
+
+        assert loader.commands["create_spec"].tables_write == []
+        assert loader.commands["create_spec"].content == "New body é"
+        assert loader.commands["review"].name == "unknown.review"
+        assert loader.commands["review"].agent == "architect"
+        assert loader.commands["review"].content == "No frontmatter"
+
+    def test_content_loaded_lazily(self, commands_dir, tmp_path):
+        """Test command bodies are read on first access, re-parsing a file edited since loading."""
+        cmd_file = commands_dir / "architect" / "create_spec.md"
+        loader = CommandLoader(AgentType.ARCHITECT, commands_dir / "architect", manifest_dir=tmp_path)
+        cmd = loader.commands["create_spec"]
+        cmd_file.write_text("---\naction: create_spec\n---\nEdited\n")
+
+        assert cmd._content is None
+        assert cmd.content == "Edited"
+
+    def test_crlf_file_keeps_body(self, commands_dir, tmp_path, monkeypatch):
+        """Test a file with CRLF line endings keeps its body, also when loaded from the manifest."""
+        arch_dir = commands_dir / "architect"
+        (arch_dir / "create_spec.md").write_bytes(b"---\r\naction: create_spec\r\n---\r\n\r\n# Title\r\nBody\r\n")
+
+        loader = CommandLoader(AgentType.ARCHITECT, arch_dir, manifest_dir=tmp_path)
+        assert loader.commands["create_spec"].content == "# Title\nBody"
+
+        monkeypatch.setattr("coffee_maker.commands.command_loader._manifests", {})
+        loader = CommandLoader(AgentType.ARCHITECT, arch_dir, manifest_dir=tmp_path)
+        assert loader.commands["create_spec"].content == "# Title\nBody"
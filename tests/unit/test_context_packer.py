@@ -0,0 +1,109 @@
+"""Unit tests for the cached, token-budgeted ACE context packer."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from coffee_maker.autonomous.ace.context_packer import ContextFileCache, ContextPacker
+from coffee_maker.autonomous.roadmap_index import RoadmapIndex
+from coffee_maker.utils.token_service import TokenCountingService
+
+ROADMAP = "# Roadmap\n\n" + "".join(
+    f"## PRIORITY {n}: Item {n}\n\n**Status**: {status}\n\n" + f"Details of priority {n}. " * 40 + "\n\n"
+    for n, status in [(1, "✅ Complete"), (2, "📝 Planned"), (3, "🔄 In Progress"), (4, "📝 Planned")]
+)
+
+INSTRUCTIONS = "# Instructions\n\nIntro.\n\n## Rules\n\n" + "Rule text. " * 50 + "\n\n## More\n\nEnd.\n"
+
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / "ROADMAP.md").write_text(ROADMAP)
+    (tmp_path / "CLAUDE.md").write_text(INSTRUCTIONS)
+    (tmp_path / "SPEC.md").write_text("# Spec\n\nSpec body.\n")
+    yield {name: str(tmp_path / name) for name in ["ROADMAP.md", "CLAUDE.md", "SPEC.md"]}
+    RoadmapIndex.invalidate()
+
+
+@pytest.fixture
+def packer():
+    """Packer counting ~4 characters per token (no tokenizer files needed)."""
+    service = TokenCountingService()
+    with patch.object(TokenCountingService, "_load_encoding", return_value=None):
+        yield ContextPacker(cache=ContextFileCache(), token_service=service)
+
+
+class TestContextFileCache:
+    """Tests for ContextFileCache."""
+
+    def test_reread_only_when_changed(self, files):
+        """Test unchanged files are served from memory and changed ones re-read."""
+        cache = ContextFileCache()
+        path = files["CLAUDE.md"]
+
+        assert cache.read(Path(path)) == INSTRUCTIONS
+        assert cache.read(Path(path)) == INSTRUCTIONS
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+        with open(path, "a") as f:
+            f.write("Appended.\n")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+
+        assert cache.read(Path(path)).endswith("Appended.\n")
+        assert cache.stats["misses"] == 2
+
+    def test_sections_split_at_top_headings(self, files):
+        """Test sections split at level 1-2 headings and join back to the file."""
+        sections = ContextFileCache().sections(Path(files["CLAUDE.md"]))
+
+        assert [title for title, _ in sections] == ["# Instructions", "## Rules", "## More"]
+        assert "".join(text for _, text in sections) == INSTRUCTIONS
+
+
+class TestContextPacker:
+    """Tests for ContextPacker."""
+
+    def test_focus_then_open_items_within_budget(self, packer, files):
+        """Test focused items come first, then in-progress and planned items; complete items are skipped."""
+        packed = packer.pack([files["CLAUDE.md"], files["ROADMAP.md"]], token_budget=2000, focus=["PRIORITY 4"])
+
+        roadmap_parts = [label.rsplit("(", 1)[1].rstrip(")") for label in packed.included[1:]]
+        assert roadmap_parts == ["PRIORITY 4", "PRIORITY 3", "PRIORITY 2"]
+        assert packed.tokens <= 2000
+
+    def test_budget_limits_sections(self, packer, files):
+        """Test sections that do not fit are omitted instead of truncated."""
+        packed = packer.pack([files["ROADMAP.md"]], token_budget=450, focus=["PRIORITY 3"])
+
+        assert [label.split(" ")[-1] for label in packed.included] == ["3)"]
+        assert packed.omitted == 2
+        assert packed.tokens <= 450
+        assert "Details of priority 3." in packed.text
+
+    def test_stable_prefix_independent_of_focus(self, packer, files):
+        """Test the instruction-file prefix is byte-identical across focus and extra files."""
+        paths = [files["CLAUDE.md"], files["ROADMAP.md"]]
+
+        first = packer.pack(paths, token_budget=2000, focus=["PRIORITY 2"])
+        second = packer.pack(paths, token_budget=2000, focus=["PRIORITY 4"], extra_files=[files["SPEC.md"]])
+
+        prefix_length = first.text.index("--- " + files["ROADMAP.md"])
+        assert first.text[:prefix_length] == second.text[:prefix_length]
+        assert first.stable_tokens == second.stable_tokens
+        assert "Spec body." in second.text
+
+    def test_stable_files_keep_whole_sections(self, packer, files):
+        """Test instruction files over their budget share keep leading whole sections."""
+        packed = packer.pack([files["CLAUDE.md"]], token_budget=200)
+
+        assert "Intro." in packed.text
+        assert "Rule text." not in packed.text
+        assert "[2 sections omitted" in packed.text
+
+    def test_missing_file_reported(self, packer, tmp_path):
+        """Test a missing file yields an error placeholder."""
+        packed = packer.pack([str(tmp_path / "missing.md")], token_budget=1000)
+
+        assert "ERROR: Required context file not found" in packed.text
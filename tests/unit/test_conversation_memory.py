@@ -0,0 +1,117 @@
+"""Unit tests for token-budgeted conversation memory."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from coffee_maker.cli import ai_service
+from coffee_maker.cli.ai_service import AIService
+from coffee_maker.cli.conversation_memory import SUMMARY_HEADER, ConversationMemory
+
+
+def _history(count, size=5):
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i} " + "word " * size}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def memory(tmp_path):
+    return ConversationMemory(
+        budget_tokens=400, recent_messages=6, max_message_tokens=100, block_messages=4, store_dir=tmp_path
+    )
+
+
+class TestConversationMemory:
+    """Tests for ConversationMemory."""
+
+    def test_short_history_is_sent_verbatim(self, memory):
+        """Test a history within the budget is unchanged."""
+        history = _history(4)
+
+        assert memory.build(history) == history
+
+    def test_older_messages_are_summarized(self, memory):
+        """Test only the recent window stays verbatim and older messages become a summary."""
+        history = _history(20)
+
+        messages = memory.build(history)
+
+        assert messages[1:] == history[15:]
+        summary, first_recent = messages[0]["content"].split("\n\n")
+        assert messages[0]["role"] == "user"
+        assert summary.startswith(SUMMARY_HEADER + "\n- user: message 0 ")
+        assert "message 13" in summary and "message 14" not in summary
+        assert first_recent == history[14]["content"]
+
+    def test_block_summaries_are_cached(self, memory):
+        """Test completed blocks are summarized once as the conversation grows."""
+        summarizer = Mock(side_effect=lambda block: f"{len(block)} messages")
+        memory.summarizer = summarizer
+        history = _history(30)
+
+        memory.build(history[:20])
+        memory.build(history[:21])
+        memory.build(history)
+
+        assert [len(call.args[0]) for call in summarizer.call_args_list] == [4, 4, 4, 2, 3, 4, 4, 4]
+
+    def test_large_messages_are_stored_by_reference(self, memory):
+        """Test a large output is replaced by a stub and can be loaded back."""
+        log = "\n".join(f"line {i}: ERROR something failed" for i in range(200))
+
+        content = memory.build([{"role": "user", "content": log}])[0]["content"]
+
+        ref = content.split("ref ", 1)[1].split(" ", 1)[0]
+        assert content.startswith(f"[Large output stored as ref {ref}")
+        assert "200 lines" in content and "line 0:" in content and "line 199:" in content
+        assert len(content) < len(log) // 4
+        assert memory.load_reference(ref) == log
+
+    def test_oldest_summaries_dropped_over_budget(self, memory):
+        """Test the summary keeps the newest blocks when all of them do not fit."""
+        memory.budget_tokens = 250
+        history = _history(60, size=10)
+
+        summary = memory.build(history)[0]["content"]
+
+        assert "older messages omitted" in summary
+        assert "message 0 " not in summary and "message 50 " in summary
+
+
+class TestAIServiceSystemPrompt:
+    """Tests for the memoized AIService system prompt."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(ai_service.ConfigManager, "get_anthropic_api_key", lambda: "test-key")
+        monkeypatch.setattr(ai_service, "Anthropic", MagicMock())
+        monkeypatch.setattr(ai_service, "CLASSIFIER_AVAILABLE", False)
+        monkeypatch.setattr(ai_service, "UPDATER_AVAILABLE", False)
+        load_prompt = Mock(side_effect=lambda name, variables: f"Roadmap: {variables['TOTAL_PRIORITIES']} priorities")
+        monkeypatch.setattr(ai_service, "load_prompt", load_prompt)
+        return AIService()
+
+    def test_prompt_rebuilt_only_on_roadmap_change(self, service):
+        """Test the prompt is reused until the roadmap version changes."""
+        context = {"roadmap_summary": {"total": 2, "priorities": [], "version": "a"}}
+
+        first = service._build_system_prompt(context)
+        assert service._build_system_prompt(context) is first
+        assert ai_service.load_prompt.call_count == 1
+
+        changed = {"roadmap_summary": {"total": 3, "priorities": [], "version": "b"}}
+        assert service._build_system_prompt(changed) == "Roadmap: 3 priorities"
+        assert ai_service.load_prompt.call_count == 2
+
+    def test_stream_sends_cacheable_system_block(self, service):
+        """Test the streamed request marks the system prompt for prompt caching."""
+        stream = service.client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = ["Hi"]
+
+        chunks = list(service.process_request_stream("Hello", {"roadmap_summary": {"total": 1}}, []))
+
+        assert chunks == ["Hi"]
+        system = service.client.messages.stream.call_args.kwargs["system"]
+        assert system == [{"type": "text", "text": "Roadmap: 1 priorities", "cache_control": {"type": "ephemeral"}}]
@@ -0,0 +1,95 @@
+"""Unit tests for the documentation retrieval index."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from coffee_maker.cli.assistant_bridge import AssistantBridge
+from coffee_maker.cli.doc_index import DocumentationIndex, chunk_markdown
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "docs" / "roadmap").mkdir(parents=True)
+    (root / ".claude" / "agents").mkdir(parents=True)
+    (root / "docs" / "roadmap" / "ROADMAP.md").write_text(
+        "# Roadmap\n\n## US-062: Email notifications\n\nSend an email when a task completes.\n\n"
+        "## US-063: Slack bot\n\nPost daily standups to Slack.\n"
+    )
+    (root / "docs" / "GIT.md").write_text("# Git workflow\n\nRebase feature branches before opening a pull request.\n")
+    (root / ".claude" / "agents" / "architect.md").write_text("# Architect\n\nWrites technical specs.\n")
+    os.symlink("roadmap/ROADMAP.md", root / "docs" / "ROADMAP.md")
+    return root
+
+
+@pytest.fixture
+def index(project, tmp_path):
+    return DocumentationIndex(root=project, index_dir=tmp_path / "index", max_age=3600)
+
+
+class TestChunkMarkdown:
+    """Tests for chunk_markdown."""
+
+    def test_chunks_follow_headings_and_size(self):
+        """Test sections become chunks with heading trails, and long sections are split."""
+        text = "# Guide\n\nIntro\n\n## Setup\n\n```\n# not a heading\n```\n" + "word\n" * 10 + "### Details\nx\n"
+
+        chunks = chunk_markdown(text, max_chars=30)
+
+        assert [(line, heading) for line, heading, _ in chunks] == [
+            (1, "Guide"),
+            (5, "Guide > Setup"),
+            (9, "Guide > Setup"),
+            (15, "Guide > Setup"),
+            (20, "Guide > Setup > Details"),
+        ]
+        assert "# not a heading" in chunks[1][2]
+        assert all(len(content) <= 30 for _, _, content in chunks)
+
+
+class TestDocumentationIndex:
+    """Tests for DocumentationIndex."""
+
+    def test_search_ranks_relevant_chunks(self, index):
+        """Test the best matching chunk comes first, with its location, and symlinked copies are skipped."""
+        chunks = index.search("How are emails sent when tasks complete?", top_k=2)
+
+        assert [(c.path, c.line, c.heading) for c in chunks] == [
+            ("docs/roadmap/ROADMAP.md", 3, "Roadmap > US-062: Email notifications")
+        ]
+        assert index.search("architect specs")[0].path == ".claude/agents/architect.md"
+        assert index.search("???") == []
+
+    def test_update_is_incremental(self, index, project):
+        """Test only changed, new and deleted files are re-indexed."""
+        assert index.update() == {"added": 3, "updated": 0, "removed": 0, "unchanged": 0}
+
+        (project / "docs" / "GIT.md").write_text("# Git workflow\n\nSquash commits before merging.\n")
+        (project / "docs" / "NEW.md").write_text("# Deployment\n\nDeploy with Cloud Run.\n")
+        (project / ".claude" / "agents" / "architect.md").unlink()
+
+        assert index.update() == {"added": 1, "updated": 1, "removed": 1, "unchanged": 1}
+        assert [c.path for c in index.search("squash")] == ["docs/GIT.md"]
+        assert index.search("rebase") == []
+        assert index.search("architect") == []
+        assert [c.path for c in index.search("cloud run")] == ["docs/NEW.md"]
+
+
+class TestAssistantBridgeRetrieval:
+    """Tests for AssistantBridge documentation retrieval."""
+
+    def test_invoke_sends_top_chunks(self, index, monkeypatch):
+        """Test the agent receives the retrieved chunks instead of whole documents."""
+        monkeypatch.setattr(AssistantBridge, "_initialize_agent", lambda self: None)
+        bridge = AssistantBridge(doc_index=index, top_k=1)
+        bridge.agent = Mock()
+        bridge.agent.invoke.return_value = {"output": "Via email."}
+
+        result = bridge.invoke("How do email notifications work?")
+
+        assert result["answer"] == "Via email."
+        documentation = bridge.agent.invoke.call_args[0][0]["documentation"]
+        assert documentation.startswith("[docs/roadmap/ROADMAP.md:3] Roadmap > US-062: Email notifications\n")
+        assert "Slack" not in documentation
@@ -253,6 +253,81 @@ class TestAuditLogging:
             pytest.fail("Audit timestamp not in ISO format")
 
 
+class TestBatchWrites:
+    """Test transactional batch writes and updates."""
+
+    def test_write_many_one_transaction(self, temp_db):
+        """Test a batch is written with its audit rows, or not at all."""
+        db = DomainWrapper(AgentType.ARCHITECT, str(temp_db))
+
+        ids = db.write_many("specs_specification", [{"id": f"SPEC-{n}", "title": f"Spec {n}"} for n in range(3)])
+        with pytest.raises(sqlite3.IntegrityError):
+            db.write_many("specs_specification", [{"id": "SPEC-9", "title": "New"}, {"id": "SPEC-0", "title": "Dup"}])
+
+        assert len(ids) == 3
+        assert [row["id"] for row in db.read("specs_specification")] == ["SPEC-0", "SPEC-1", "SPEC-2"]
+        audits = db.read("system_audit", {"table_name": "specs_specification"})
+        assert [(a["item_id"], a["action"]) for a in audits] == [(f"SPEC-{n}", "create") for n in range(3)]
+
+    def test_update_many(self, temp_db):
+        """Test updates are applied together and only changed rows are audited."""
+        db = DomainWrapper(AgentType.ARCHITECT, str(temp_db))
+        db.write_many("specs_specification", [{"id": "SPEC-1", "title": "A"}, {"id": "SPEC-2", "title": "B"}])
+
+        affected = db.update_many(
+            "specs_specification",
+            [
+                ({"title": "A2"}, {"id": "SPEC-1"}),
+                ({"title": "B2"}, {"id": "SPEC-2"}),
+                ({"title": "C2"}, {"id": "SPEC-3"}),
+            ],
+        )
+
+        assert affected == 2
+        assert [row["title"] for row in db.read("specs_specification")] == ["A2", "B2"]
+        audits = db.read("system_audit", {"action": "update"})
+        assert [(a["item_id"], a["field_changed"]) for a in audits] == [
+            ("SPEC-1", "title, updated_by"),
+            ("SPEC-2", "title, updated_by"),
+        ]
+
+    def test_roadmap_changes_audited_by_trigger(self, temp_db):
+        """Test roadmap writes get exactly one system_audit row each, from the roadmap_audit trigger."""
+        db = DomainWrapper(AgentType.PROJECT_MANAGER, str(temp_db))
+
+        db.write("roadmap_priority", {"id": "PRIORITY-1", "number": "1", "title": "Test"})
+        db.update("roadmap_priority", {"status": "✅ Complete"}, {"id": "PRIORITY-1"})
+
+        audits = db.read("system_audit", {"item_id": "PRIORITY-1"})
+        assert [(a["action"], a["old_value"], a["new_value"], a["changed_by"]) for a in audits] == [
+            ("create", None, None, "project_manager"),
+            ("update", "📝 Planned", "✅ Complete", "project_manager"),
+        ]
+
+    def test_roadmap_batches_are_atomic(self, temp_db):
+        """Test roadmap rows share the batch transaction: a failing row rolls back the others."""
+        db = DomainWrapper(AgentType.PROJECT_MANAGER, str(temp_db))
+        db.write("roadmap_priority", {"id": "PRIORITY-1", "number": "1", "title": "One"})
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.write_many(
+                "roadmap_priority",
+                [
+                    {"id": "PRIORITY-2", "number": "2", "title": "Two"},
+                    {"id": "PRIORITY-1", "number": "1", "title": "Dup"},
+                ],
+            )
+        with pytest.raises(sqlite3.OperationalError):
+            db.update_many(
+                "roadmap_priority",
+                [({"status": "✅ Complete"}, {"id": "PRIORITY-1"}), ({"no_such_column": "x"}, {"id": "PRIORITY-1"})],
+            )
+
+        assert [(row["id"], row["status"]) for row in db.read("roadmap_priority")] == [("PRIORITY-1", "📝 Planned")]
+        audits = db.read("system_audit", {"table_name": "roadmap_priority"})
+        assert [(a["item_id"], a["action"]) for a in audits] == [("PRIORITY-1", "create")]
+
+
 class TestNotifications:
     """Test inter-agent notification system."""
 
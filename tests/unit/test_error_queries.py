@@ -0,0 +1,175 @@
+"""Tests for the classified error index and the error dashboard queries reading it."""
+
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from streamlit_apps.error_monitoring_dashboard.queries.error_index import rebuild_error_index, sync_error_index
+from streamlit_apps.error_monitoring_dashboard.utils.error_classifier import ErrorClassifier
+
+SCHEMA = """
+CREATE TABLE traces (id TEXT PRIMARY KEY, name TEXT, timestamp TEXT, metadata TEXT, status_message TEXT,
+                     input TEXT, output TEXT);
+CREATE TABLE events (id TEXT PRIMARY KEY, trace_id TEXT, timestamp TEXT, level TEXT, message TEXT, body TEXT);
+CREATE TABLE generations (id TEXT PRIMARY KEY, trace_id TEXT, model TEXT, model_parameters TEXT,
+                          prompt_tokens INTEGER, completion_tokens INTEGER, total_tokens INTEGER,
+                          total_cost REAL, latency_ms REAL, created_at TEXT);
+"""
+
+
+def _add_trace(conn, trace_id, timestamp, status_message=None, model="gpt-4", event=None):
+    conn.execute(
+        "INSERT INTO traces (id, name, timestamp, status_message) VALUES (?, 'agent', ?, ?)",
+        (trace_id, timestamp, status_message),
+    )
+    conn.execute(
+        "INSERT INTO generations (id, trace_id, model, total_tokens) VALUES (?, ?, ?, 10)",
+        (f"g-{trace_id}", trace_id, model),
+    )
+    if event:
+        conn.execute(
+            "INSERT INTO events (id, trace_id, timestamp, level, message) VALUES (?, ?, ?, ?, ?)",
+            (f"e-{trace_id}", trace_id, timestamp, event[0], event[1]),
+        )
+    conn.commit()
+
+
+@pytest.fixture
+def error_db(tmp_path):
+    """Create a dashboard database with a mix of error and healthy traces."""
+    db_path = str(tmp_path / "llm_metrics.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+
+    for i in range(30):
+        _add_trace(conn, f"rate-{i}", f"2025-01-06 10:{i:02d}:00", status_message="Rate limit exceeded (429)")
+    _add_trace(conn, "auth", "2025-01-06 11:00:00", model="claude-3", event=("ERROR", "Invalid API key"))
+    _add_trace(conn, "ok", "2025-01-06 11:05:00", event=("INFO", "all good"))
+
+    yield db_path, conn
+    conn.close()
+
+
+class TestClassifySeries:
+    """Tests for the vectorized classifier."""
+
+    def test_matches_scalar_classifier(self):
+        """Test classify_series agrees with classify row by row."""
+        messages = pd.Series(
+            [
+                "RateLimitError: slow down",
+                "Request timed out",
+                "connection error: timeout",
+                "HTTP 503 service unavailable",
+                "something odd",
+                "",
+                None,
+            ]
+        )
+
+        result = ErrorClassifier.classify_series(messages)
+
+        for i, message in enumerate(messages):
+            expected = ErrorClassifier.classify(message)
+            assert result.loc[i, "error_type"] == expected["type"]
+            assert result.loc[i, "severity"] == expected["severity"]
+            assert result.loc[i, "category"] == expected["category"]
+            assert result.loc[i, "recommendation"] == expected["recommendation"]
+
+
+class TestErrorIndex:
+    """Tests for the incrementally maintained trace_errors table."""
+
+    def test_initial_sync_classifies_error_rows(self, error_db):
+        """Test only error rows are indexed, with their classification."""
+        _, conn = error_db
+
+        assert sync_error_index(conn) == 31
+        rows = dict(conn.execute("SELECT error_type, COUNT(*) FROM trace_errors GROUP BY error_type").fetchall())
+        assert rows == {"RateLimitError": 30, "AuthenticationError": 1}
+
+    def test_sync_is_incremental(self, error_db):
+        """Test a second sync only classifies newly ingested traces."""
+        _, conn = error_db
+        sync_error_index(conn)
+
+        assert sync_error_index(conn) == 0
+
+        _add_trace(conn, "late", "2025-01-06 12:00:00", status_message="context length exceeded")
+        assert sync_error_index(conn) == 1
+
+        conn.execute(
+            "INSERT INTO events (id, trace_id, timestamp, level, message) "
+            "VALUES ('e-ok2', 'ok', '2025-01-06 11:06:00', 'WARNING', 'request timed out')"
+        )
+        conn.commit()
+        assert sync_error_index(conn) == 1
+        assert conn.execute("SELECT error_type FROM trace_errors WHERE trace_id = 'ok'").fetchone() == ("TimeoutError",)
+
+    def test_explicit_trace_ids_are_reclassified(self, error_db):
+        """Test traces updated in place can be re-classified on demand."""
+        _, conn = error_db
+        sync_error_index(conn)
+
+        conn.execute("UPDATE traces SET status_message = 'model not found' WHERE id = 'rate-0'")
+        conn.commit()
+        sync_error_index(conn, trace_ids=["rate-0"])
+
+        assert conn.execute("SELECT error_type FROM trace_errors WHERE trace_id = 'rate-0'").fetchone() == (
+            "ModelNotFoundError",
+        )
+
+    def test_rebuild(self, error_db):
+        """Test rebuilding drops stale rows for deleted traces."""
+        _, conn = error_db
+        sync_error_index(conn)
+        conn.execute("DELETE FROM traces WHERE id = 'auth'")
+        conn.commit()
+
+        assert rebuild_error_index(conn) == 30
+
+
+class TestErrorQueries:
+    """Tests for dashboard queries served from the error index."""
+
+    def test_error_type_filter_applied_before_limit(self, error_db):
+        """Test filtered pages are not starved by the LIMIT."""
+        from streamlit_apps.error_monitoring_dashboard.queries import error_queries as queries
+
+        db_path, _ = error_db
+
+        df = queries.get_error_traces(db_path, limit=10, error_type="AuthenticationError")
+
+        assert len(df) == 1
+        assert df.iloc[0]["trace_id"] == "auth"
+        assert df.iloc[0]["model"] == "claude-3"
+        assert df.iloc[0]["combined_error"] == "Invalid API key"
+        assert df.iloc[0]["severity"] == "CRITICAL"
+
+    def test_model_and_date_filters(self, error_db):
+        """Test model and date range are filtered in SQL."""
+        from streamlit_apps.error_monitoring_dashboard.queries import error_queries as queries
+
+        db_path, _ = error_db
+        date_range = (datetime(2025, 1, 6, 10, 10, 0), datetime(2025, 1, 6, 10, 19, 59))
+
+        df = queries.get_error_traces(db_path, limit=100, date_range=date_range, model="gpt-4")
+
+        assert len(df) == 10
+        assert set(df["error_type"]) == {"RateLimitError"}
+
+    def test_aggregates(self, error_db):
+        """Test type and severity breakdowns cover all rows, not a sample."""
+        from streamlit_apps.error_monitoring_dashboard.queries import error_queries as queries
+
+        db_path, _ = error_db
+
+        by_type = queries.get_error_by_type(db_path, limit=5).set_index("error_type")
+        assert by_type.loc["RateLimitError", "count"] == 30
+
+        severity = queries.get_error_severity_distribution(db_path)
+        assert list(severity["severity"]) == ["CRITICAL", "HIGH"]
+
+        assert queries.get_available_models_with_errors(db_path) == ["All", "claude-3", "gpt-4"]
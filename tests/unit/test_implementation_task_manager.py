@@ -15,8 +15,10 @@ Related: PRIORITY 31, CFR-000
 """
 
 import json
+import random
 import sqlite3
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -926,3 +928,137 @@ class TestTaskGroupDependencies:
         assert len(available_works) == 2
         task_groups = {work["task_group_id"] for work in available_works}
         assert task_groups == {"GROUP-20", "GROUP-35"}
+
+
+class TestReadyQueue:
+    """Test the trigger-maintained ready queue (group in-degree counts)."""
+
+    @staticmethod
+    def insert_tasks(db_path, tasks, dependencies=()):
+        """Insert (task_id, group, order, status) tasks and (group, depends_on) hard dependencies."""
+        conn = sqlite3.connect(db_path)
+        for task_id, group, order, status in tasks:
+            conn.execute(
+                """
+                INSERT INTO specs_task
+                (task_id, priority_number, task_group_id, priority_order,
+                 spec_id, scope_description, assigned_files, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, '[]', ?, ?)
+            """,
+                # One priority per group (priority_order is unique within a priority)
+                (
+                    task_id,
+                    int.from_bytes(group.encode(), "big"),
+                    group,
+                    order,
+                    f"SPEC-{group}",
+                    task_id,
+                    status,
+                    "2025",
+                ),
+            )
+        for group, depends_on in dependencies:
+            conn.execute(
+                """
+                INSERT INTO specs_task_dependency
+                (task_group_id, depends_on_group_id, dependency_type, created_at, created_by)
+                VALUES (?, ?, 'hard', '2025-10-24', 'architect')
+            """,
+                (group, depends_on),
+            )
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def set_status(db_path, task_id, status):
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE specs_task SET status = ? WHERE task_id = ?", (status, task_id))
+        conn.commit()
+        conn.close()
+
+    def test_ready_set_follows_completions(self, temp_db):
+        """Test only group heads with completed prerequisites are ready, and completions unblock."""
+        self.insert_tasks(
+            temp_db,
+            [("A-1", "A", 1, "pending"), ("A-2", "A", 2, "pending"), ("B-1", "B", 1, "pending")],
+            dependencies=[("B", "A")],
+        )
+        manager = ImplementationTaskManager(temp_db)
+
+        assert [t["task_id"] for t in manager.query_ready_works()] == ["A-1"]
+
+        self.set_status(temp_db, "A-1", "completed")
+        assert [t["task_id"] for t in manager.query_ready_works()] == ["A-2"]
+
+        self.set_status(temp_db, "A-2", "completed")
+        assert [t["task_id"] for t in manager.query_ready_works()] == ["B-1"]
+
+        self.set_status(temp_db, "A-2", "pending")  # reopened prerequisite blocks again
+        assert [t["task_id"] for t in manager.query_ready_works()] == ["A-2"]
+
+    def test_claim_next_work_drains_ready_set(self, temp_db):
+        """Test claim_next_work claims ready tasks only, and nothing twice."""
+        self.insert_tasks(
+            temp_db,
+            [("A-1", "A", 1, "pending"), ("B-1", "B", 1, "pending"), ("C-1", "C", 1, "pending")],
+            dependencies=[("C", "A")],
+        )
+        first = ImplementationTaskManager(temp_db).claim_next_work()
+        second = ImplementationTaskManager(temp_db).claim_next_work()
+        third = ImplementationTaskManager(temp_db).claim_next_work()
+
+        assert [first["task_id"], second["task_id"]] == ["A-1", "B-1"]
+        assert first["status"] == "in_progress"
+        assert third is None
+
+    def test_claim_work_rejects_blocked_group(self, temp_db):
+        """Test claiming a task by id also requires its group's dependencies to be completed."""
+        self.insert_tasks(temp_db, [("A-1", "A", 1, "pending"), ("B-1", "B", 1, "pending")], dependencies=[("B", "A")])
+
+        assert ImplementationTaskManager(temp_db).claim_work("B-1") is False
+
+    def test_parallel_claims_are_disjoint(self, temp_db):
+        """Test concurrent instances never claim the same task."""
+        self.insert_tasks(temp_db, [(f"G{n}-1", f"G{n:02d}", 1, "pending") for n in range(20)])
+        claimed = []
+
+        def worker():
+            while True:
+                task = ImplementationTaskManager(temp_db).claim_next_work()
+                if task is None:
+                    return
+                claimed.append(task["task_id"])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claimed) == sorted(f"G{n}-1" for n in range(20))
+
+    def test_state_matches_full_evaluation(self, temp_db):
+        """Test incrementally maintained readiness equals evaluating the whole graph."""
+        rng = random.Random(7)
+        groups = [f"G{n:02d}" for n in range(12)]
+        tasks = [(f"{g}-{o}", g, o, "pending") for g in groups for o in range(1, rng.randint(1, 4) + 1)]
+        dependencies = {(groups[i], groups[j]) for i in range(12) for j in range(i) if rng.random() < 0.2}
+        self.insert_tasks(temp_db, tasks[: len(tasks) // 2], sorted(dependencies))
+        manager = ImplementationTaskManager(temp_db)
+        manager.query_ready_works()  # state built from existing rows
+        self.insert_tasks(temp_db, tasks[len(tasks) // 2 :])  # then maintained by triggers
+
+        status = {task_id: "pending" for task_id, _, _, _ in tasks}
+        for task_id in rng.sample(sorted(status), len(status)):
+            status[task_id] = rng.choice(["completed", "completed", "in_progress"])
+            self.set_status(temp_db, task_id, status[task_id])
+
+            open_groups = {g for t, g, _, _ in tasks if status[t] != "completed"}
+            expected = set()
+            for t, g, o, _ in tasks:
+                head = min((o2 for t2, g2, o2, _ in tasks if g2 == g and status[t2] != "completed"), default=None)
+                blocked = any(dep in open_groups for grp, dep in dependencies if grp == g)
+                if status[t] == "pending" and o == head and not blocked:
+                    expected.add(t)
+
+            assert {t["task_id"] for t in manager.query_ready_works(limit=1000)} == expected
@@ -0,0 +1,174 @@
+"""Unit tests for the asynchronous logging pipeline."""
+
+import json
+import logging
+import os
+import time
+import threading
+
+import pytest
+
+from coffee_maker.config.logging_config import (
+    ModuleGate,
+    SizeAndTimeRotatingFileHandler,
+    get_logger,
+    setup_async_logging,
+    shutdown_async_logging,
+)
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger after installing a pipeline."""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    shutdown_async_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def make_record(name, level=logging.INFO):
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+class TestAsyncLogging:
+    """Tests for setup_async_logging."""
+
+    def test_json_lines_written_by_background_thread(self, root_logger, tmp_path):
+        """Test records are written as JSON lines by the listener thread."""
+        setup_async_logging(log_dir=tmp_path, name="agent", json_lines=True, console=False)
+        written_by = []
+        original_emit = SizeAndTimeRotatingFileHandler.emit
+
+        def emit(handler, record):
+            written_by.append(threading.current_thread())
+            original_emit(handler, record)
+
+        SizeAndTimeRotatingFileHandler.emit = emit
+        try:
+            logging.getLogger("coffee_maker.test").info("Héllo 🚀")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("coffee_maker.test").exception("Failed")
+            shutdown_async_logging()
+        finally:
+            SizeAndTimeRotatingFileHandler.emit = original_emit
+
+        lines = [json.loads(line) for line in (tmp_path / "agent.jsonl").read_text().splitlines()]
+        assert [(line["logger"], line["level"], line["msg"]) for line in lines] == [
+            ("coffee_maker.test", "INFO", "Héllo 🚀"),
+            ("coffee_maker.test", "ERROR", "Failed"),
+        ]
+        assert "ValueError: boom" in lines[1]["exc"]
+        assert threading.current_thread() not in written_by
+
+    def test_module_levels_gate_before_queueing(self, root_logger, tmp_path):
+        """Test per-module levels apply to children, and other modules keep the root level."""
+        setup_async_logging(
+            log_dir=tmp_path,
+            name="agent",
+            level="INFO",
+            json_lines=True,
+            console=False,
+            module_levels={"coffee_maker.noisy": "WARNING", "coffee_maker.traced": "DEBUG"},
+        )
+        logging.getLogger("coffee_maker.noisy.db").info("dropped")
+        logging.getLogger("coffee_maker.noisy.db").warning("kept warning")
+        logging.getLogger("coffee_maker.traced").debug("kept debug")
+        logging.getLogger("coffee_maker.other").debug("dropped debug")
+        shutdown_async_logging()
+
+        messages = [json.loads(line)["msg"] for line in (tmp_path / "agent.jsonl").read_text().splitlines()]
+        assert messages == ["kept warning", "kept debug"]
+
+    def test_get_logger_propagates_to_pipeline(self, root_logger, tmp_path):
+        """Test get_logger does not attach its own handler while the pipeline runs."""
+        setup_async_logging(log_dir=tmp_path, name="agent", console=False)
+
+        logger = get_logger("coffee_maker.test.get_logger")
+
+        assert logger.handlers == []
+        assert logger.propagate
+
+    def test_get_logger_before_setup_joins_pipeline(self, root_logger, tmp_path, capsys):
+        """Test loggers configured before the pipeline starts are rerouted to it."""
+        logger = get_logger("coffee_maker.test.early")
+        assert logger.handlers and not logger.propagate
+
+        setup_async_logging(log_dir=tmp_path, name="agent", console=False)
+        logger.info("early logger message")
+        shutdown_async_logging()
+
+        assert logger.handlers == []
+        assert "early logger message" in (tmp_path / "agent.log").read_text()
+        assert "early logger message" not in capsys.readouterr().out
+
+
+class TestModuleGate:
+    """Tests for ModuleGate."""
+
+    def test_sampling_spares_warnings(self, monkeypatch):
+        """Test sampling drops a fraction of info records but no warnings."""
+        gate = ModuleGate(sample_rates={"coffee_maker.hot": 0.25})
+        values = iter([0.1, 0.5, 0.9, 0.2])
+        monkeypatch.setattr("coffee_maker.config.logging_config.random.random", lambda: next(values))
+
+        kept = [gate.filter(make_record("coffee_maker.hot.loop")) for _ in range(4)]
+
+        assert kept == [True, False, False, True]
+        assert gate.filter(make_record("coffee_maker.hot.loop", logging.WARNING))
+        assert gate.filter(make_record("coffee_maker.cold"))
+
+
+class TestSizeAndTimeRotatingFileHandler:
+    """Tests for rotation."""
+
+    def test_rotates_on_size(self, tmp_path):
+        """Test the file rolls over when it would exceed max_bytes."""
+        handler = SizeAndTimeRotatingFileHandler(tmp_path / "a.log", max_bytes=20, backup_count=2, rollover_seconds=0)
+        for _ in range(5):
+            handler.emit(make_record("x"))
+        handler.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.log", "a.log.1", "a.log.2"]
+
+    def test_rotates_on_age(self, tmp_path):
+        """Test the file rolls over once it is older than rollover_seconds."""
+        handler = SizeAndTimeRotatingFileHandler(tmp_path / "a.log", max_bytes=0, backup_count=2, rollover_seconds=60)
+        handler.emit(make_record("x"))
+        handler._rollover_at = 0  # file is past its age limit
+        handler.emit(make_record("x"))
+        handler.close()
+
+        assert (tmp_path / "a.log.1").read_text() == "message\n"
+        assert os.path.getsize(tmp_path / "a.log") == len("message\n")
+
+    def test_age_survives_reopen(self, tmp_path):
+        """Test a reopened file keeps its recorded start time, however recently it was written."""
+        handler = SizeAndTimeRotatingFileHandler(tmp_path / "a.log", max_bytes=0, backup_count=2, rollover_seconds=60)
+        handler.emit(make_record("x"))
+        handler.close()
+        (tmp_path / ".a.log.start").write_text(repr(time.time() - 120))
+
+        handler = SizeAndTimeRotatingFileHandler(tmp_path / "a.log", max_bytes=0, backup_count=2, rollover_seconds=60)
+        handler.emit(make_record("x"))
+        handler.close()
+
+        assert (tmp_path / "a.log.1").read_text() == "message\n"
+        assert float((tmp_path / ".a.log.start").read_text()) > time.time() - 60
+
+    def test_fresh_reopen_does_not_rotate(self, tmp_path):
+        """Test reopening a file within its age limit appends to it."""
+        for _ in range(2):
+            handler = SizeAndTimeRotatingFileHandler(
+                tmp_path / "a.log", max_bytes=0, backup_count=2, rollover_seconds=60
+            )
+            handler.emit(make_record("x"))
+            handler.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".a.log.start", "a.log"]
@@ -1,7 +1,11 @@
 """Unit tests for notification database."""
 
+import sqlite3
 import tempfile
+import threading
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +17,7 @@ from coffee_maker.cli.notifications import (
     NOTIF_STATUS_PENDING,
     NOTIF_STATUS_READ,
     NOTIF_STATUS_RESPONDED,
+    NOTIF_TYPE_INFO,
     NOTIF_TYPE_QUESTION,
     NotificationDB,
 )
@@ -245,3 +250,140 @@ class TestNotificationDB:
         assert pending[0]["id"] == id1
         assert pending[1]["id"] == id2
         assert pending[2]["id"] == id3
+
+
+_ROW = {
+    "type": NOTIF_TYPE_INFO,
+    "priority": NOTIF_PRIORITY_NORMAL,
+    "message": "m",
+    "context": None,
+    "status": NOTIF_STATUS_PENDING,
+    "created_at": "2025-01-01T00:00:00",
+}
+
+
+class TestNotificationWriter:
+    """Test batched, deduplicated and non-blocking notification writes."""
+
+    def test_duplicates_merged_within_window(self, temp_db):
+        """Test identical pending notifications are merged into one row."""
+        db = NotificationDB(temp_db)
+
+        ids = [db.create_notification(type=NOTIF_TYPE_INFO, title="Tick", message="Same") for _ in range(3)]
+        db.create_notification(type=NOTIF_TYPE_INFO, title="Tick", message="Different")
+
+        pending = db.get_pending_notifications()
+        assert len(set(ids)) == 1
+        assert [(n["message"], n["occurrences"]) for n in pending] == [("Same", 3), ("Different", 1)]
+
+        db.mark_as_read(ids[0])
+        assert db.create_notification(type=NOTIF_TYPE_INFO, title="Tick", message="Same") != ids[0]
+
+    def test_no_wait_does_not_block_on_locked_database(self, temp_db):
+        """Test wait=False returns while the database is locked and the write lands later."""
+        db = NotificationDB(temp_db)
+        blocker = sqlite3.connect(temp_db, isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        start = time.monotonic()
+        for n in range(50):
+            assert db.create_notification(type=NOTIF_TYPE_INFO, title=f"Event {n}", message="m", wait=False) is None
+        assert time.monotonic() - start < 0.5
+
+        blocker.execute("COMMIT")
+        blocker.close()
+        assert len(db.get_pending_notifications()) == 50
+
+    def test_constraint_violation_fails_only_its_row(self, temp_db):
+        """Test a rejected row does not roll back its batch or stop the writer."""
+        db = NotificationDB(temp_db)
+        blocker = sqlite3.connect(temp_db, isolation_level=None)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        with patch("coffee_maker.cli.notifications.DB_TIMEOUT", 5):
+            before = db._writer.submit(dict(_ROW, title="Before"))
+            bad = db._writer.submit(dict(_ROW, title=None))
+            after = db._writer.submit(dict(_ROW, title="After"))
+            blocker.execute("COMMIT")
+            blocker.close()
+
+            with pytest.raises(sqlite3.IntegrityError):
+                bad.result(5)
+            assert before.result(5) and after.result(5)
+
+        assert db.create_notification(type=NOTIF_TYPE_INFO, title="Later", message="m")
+        assert [n["title"] for n in db.get_pending_notifications()] == ["Before", "After", "Later"]
+
+    def test_writer_restarts_after_crash(self, temp_db):
+        """Test the next notification starts a new writer if the previous one died."""
+        db = NotificationDB(temp_db)
+
+        with patch("coffee_maker.cli.notifications.sqlite3.connect", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                db._writer.submit(dict(_ROW, title="Lost")).result(5)
+
+        assert db.create_notification(type=NOTIF_TYPE_INFO, title="Kept", message="m")
+
+    def test_sound_played_off_caller_thread(self, temp_db):
+        """Test notification sounds never run in the thread creating the notification."""
+        db = NotificationDB(temp_db)
+        played = threading.Event()
+        threads = []
+
+        def play(priority):
+            threads.append(threading.current_thread())
+            played.set()
+            return True
+
+        with patch("coffee_maker.cli.notifications.play_notification_sound", side_effect=play):
+            db.create_notification(
+                type=NOTIF_TYPE_QUESTION, title="Ask", message="?", sound=True, agent_id="user_listener"
+            )
+            assert played.wait(5)
+
+        assert threads[0] is not threading.current_thread()
+
+
+class TestNotificationSubscription:
+    """Test push delivery of new notifications."""
+
+    def test_delivers_new_notifications_from_any_connection(self, temp_db):
+        """Test subscribers receive new rows of their type, including other processes' writes."""
+        db = NotificationDB(temp_db)
+        db.create_notification(type=NOTIF_TYPE_QUESTION, title="Old", message="before subscribing")
+        received = []
+        done = threading.Event()
+
+        def on_notification(notif):
+            received.append(notif["title"])
+            if len(received) == 2:
+                done.set()
+
+        subscription = db.subscribe(on_notification, type=NOTIF_TYPE_QUESTION, poll_interval=0.01)
+        try:
+            db.create_notification(type=NOTIF_TYPE_INFO, title="Info", message="filtered out")
+            db.create_notification(type=NOTIF_TYPE_QUESTION, title="Mine", message="this process")
+            other = sqlite3.connect(temp_db)
+            other.execute(
+                "INSERT INTO notifications (type, title, message, created_at, updated_at) "
+                "VALUES ('question', 'Other', 'other process', '2025-01-01', '2025-01-01')"
+            )
+            other.commit()
+            other.close()
+
+            assert done.wait(5)
+        finally:
+            subscription.close()
+
+        assert received == ["Mine", "Other"]
+
+    def test_wait_for_response_wakes_on_response(self, temp_db):
+        """Test wait_for_response returns the response committed by another connection."""
+        db = NotificationDB(temp_db)
+        notif_id = db.create_notification(type=NOTIF_TYPE_QUESTION, title="Approve?", message="?")
+
+        timer = threading.Timer(0.1, NotificationDB(temp_db).respond_to_notification, (notif_id, "approve"))
+        timer.start()
+
+        assert db.wait_for_response(notif_id, timeout=5, poll_interval=0.01) == "approve"
+        assert db.wait_for_response(notif_id + 1, timeout=5) is None
@@ -0,0 +1,203 @@
+"""
+Unit tests for the shared PackageMetadataProvider.
+
+Covers:
+- One PyPI fetch per package shared across license/version/impact components
+- Request coalescing for concurrent lookups
+- On-disk cache with ETag/TTL revalidation
+- Offline mode backed by a fixture index
+- Poetry tree memoization
+- Batch analysis of a pyproject.toml
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from coffee_maker.utils.dependency_analyzer import DependencyAnalyzer
+from coffee_maker.utils.dependency_impact_assessor import ImpactAssessor
+from coffee_maker.utils.dependency_license_checker import LicenseChecker
+from coffee_maker.utils.dependency_version_analyzer import VersionAnalyzer
+from coffee_maker.utils.package_metadata import PackageMetadataProvider, normalize_package_name
+
+
+@pytest.fixture
+def sample_pypi_metadata():
+    """Sample PyPI metadata for testing."""
+    return {
+        "info": {"name": "pytest-timeout", "version": "2.2.0", "license": "MIT", "classifiers": []},
+        "releases": {"2.2.0": [{"packagetype": "bdist_wheel", "size": 12345, "upload_time": "2023-01-15T10:30:00"}]},
+    }
+
+
+def _ok_response(metadata, etag='"abc"'):
+    return Mock(status_code=200, json=lambda: metadata, headers={"ETag": etag})
+
+
+class TestPackageMetadataProvider:
+    """Tests for PackageMetadataProvider."""
+
+    def test_normalize_package_name(self):
+        """Test PEP 503 normalization."""
+        assert normalize_package_name("Foo_Bar.baz") == "foo-bar-baz"
+
+    def test_components_share_single_fetch(self, tmp_path, sample_pypi_metadata):
+        """Test license, version and impact checks fetch metadata once."""
+        provider = PackageMetadataProvider()
+
+        with patch.object(provider.session, "get") as mock_get, patch("subprocess.run") as mock_run:
+            mock_get.return_value = _ok_response(sample_pypi_metadata)
+            mock_run.return_value = Mock(returncode=1, stdout="", stderr="")
+
+            LicenseChecker(provider).check_license("pytest-timeout")
+            VersionAnalyzer(provider).analyze_version("pytest_timeout")
+            ImpactAssessor(tmp_path, provider).assess_impact("Pytest-Timeout")
+
+            assert mock_get.call_count == 1
+            assert provider.stats["fetches"] == 1
+
+    def test_concurrent_requests_are_coalesced(self, sample_pypi_metadata):
+        """Test concurrent lookups for the same package share one request."""
+        provider = PackageMetadataProvider()
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            release.wait(timeout=5)
+            return _ok_response(sample_pypi_metadata)
+
+        with patch.object(provider.session, "get", side_effect=slow_get) as mock_get:
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(provider.get_metadata("pytest-timeout")))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+            assert mock_get.call_count == 1
+            assert len(results) == 5
+            assert all(result == sample_pypi_metadata for result in results)
+
+    def test_disk_cache_reused_across_providers(self, tmp_path, sample_pypi_metadata):
+        """Test a fresh disk entry is served without hitting the network."""
+        first = PackageMetadataProvider(cache_dir=tmp_path)
+        with patch.object(first.session, "get", return_value=_ok_response(sample_pypi_metadata)):
+            first.get_metadata("pytest-timeout")
+
+        second = PackageMetadataProvider(cache_dir=tmp_path)
+        with patch.object(second.session, "get") as mock_get:
+            assert second.get_metadata("pytest-timeout") == sample_pypi_metadata
+            mock_get.assert_not_called()
+            assert second.stats["disk_hits"] == 1
+
+    def test_stale_entry_revalidated_with_etag(self, tmp_path, sample_pypi_metadata):
+        """Test expired entries send If-None-Match and reuse data on 304."""
+        provider = PackageMetadataProvider(cache_dir=tmp_path, ttl=0)
+        with patch.object(provider.session, "get", return_value=_ok_response(sample_pypi_metadata)):
+            provider.get_metadata("pytest-timeout")
+
+        time.sleep(0.01)
+        with patch.object(provider.session, "get") as mock_get:
+            mock_get.return_value = Mock(status_code=304, headers={})
+
+            assert provider.get_metadata("pytest-timeout") == sample_pypi_metadata
+            assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+            assert provider.stats["revalidated"] == 1
+
+    def test_offline_mode_uses_fixture_index(self, tmp_path, sample_pypi_metadata):
+        """Test offline mode serves fixtures and never hits the network."""
+        (tmp_path / "pytest-timeout.json").write_text(json.dumps(sample_pypi_metadata))
+        provider = PackageMetadataProvider(offline=True, fixture_dir=tmp_path)
+
+        with patch.object(provider.session, "get") as mock_get:
+            assert provider.get_metadata("pytest_timeout") == sample_pypi_metadata
+            with pytest.raises(requests.ConnectionError):
+                provider.get_metadata("missing-package")
+            mock_get.assert_not_called()
+
+    def test_poetry_tree_memoized(self, tmp_path):
+        """Test poetry show --tree runs once per package and lock version."""
+        provider = PackageMetadataProvider()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="pytest 7.0.0", stderr="")
+
+            provider.poetry_show_tree("pytest", tmp_path)
+            provider.poetry_show_tree("pytest", tmp_path)
+
+            assert mock_run.call_count == 1
+
+    def test_poetry_dry_run_memoized_on_lock_content(self, tmp_path):
+        """Test poetry add --dry-run reruns only when the dependency files change."""
+        provider = PackageMetadataProvider()
+        (tmp_path / "poetry.lock").write_text("# lock v1")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+            provider.poetry_add_dry_run("pytest>=8.0", tmp_path)
+            provider.poetry_add_dry_run("pytest>=8.0", tmp_path)
+            assert mock_run.call_count == 1
+
+            (tmp_path / "poetry.lock").write_text("# lock v2")
+            provider.poetry_add_dry_run("pytest>=8.0", tmp_path)
+            provider.poetry_add_dry_run("requests", tmp_path)
+            assert mock_run.call_count == 3
+            assert mock_run.call_args.args[0] == ["poetry", "add", "requests", "--dry-run"]
+
+
+class TestBatchAnalysis:
+    """Tests for DependencyAnalyzer.analyze_pyproject."""
+
+    def test_analyze_pyproject_fetches_each_package_once(self, tmp_path, sample_pypi_metadata):
+        """Test batch analysis performs one metadata fetch per dependency."""
+        (tmp_path / "pyproject.toml").write_text(
+            """
+[tool.poetry.dependencies]
+python = "^3.11"
+requests = "^2.31"
+pyyaml = {version = "^6.0", extras = []}
+rich = "*"
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8.0"
+"""
+        )
+        provider = PackageMetadataProvider(cache_dir=tmp_path / ".cache")
+        analyzer = DependencyAnalyzer(tmp_path, metadata_provider=provider)
+
+        with patch.object(provider.session, "get") as mock_get, patch("subprocess.run") as mock_run:
+            mock_get.return_value = _ok_response(sample_pypi_metadata)
+            mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+            reports = analyzer.analyze_pyproject()
+
+            assert set(reports) == {"requests", "pyyaml", "rich"}
+            assert reports["requests"].requested_version == "^2.31"
+            assert reports["rich"].requested_version is None
+            assert mock_get.call_count == 3
+
+    def test_analyze_pyproject_includes_groups(self, tmp_path):
+        """Test dependency groups are read when requested."""
+        (tmp_path / "pyproject.toml").write_text(
+            """
+[tool.poetry.dependencies]
+python = "^3.11"
+
+[tool.poetry.group.dev.dependencies]
+pytest = "^8.0"
+"""
+        )
+        analyzer = DependencyAnalyzer(tmp_path, metadata_provider=PackageMetadataProvider())
+
+        dependencies = analyzer._read_pyproject_dependencies(tmp_path / "pyproject.toml", include_groups=True)
+
+        assert dependencies == {"pytest": "^8.0"}
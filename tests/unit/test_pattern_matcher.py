@@ -0,0 +1,68 @@
+"""Unit tests for the compiled keyword and regex PatternMatcher."""
+
+import re
+
+from coffee_maker.utils import pattern_matcher
+from coffee_maker.utils.pattern_matcher import PatternMatcher, _required_factor
+
+
+class TestPatternMatcher:
+    """Tests for PatternMatcher."""
+
+    def test_all_hits_in_vocabulary_order(self):
+        """Test overlapping keywords and patterns are all reported, grouped by label in vocabulary order."""
+        matcher = PatternMatcher(
+            keywords={"b": ["test", "testing strategy", "tests"], "a": ["git"]},
+            patterns={"a": [r"\bpull (request|req)s?\b"], "c": [r"\d+ days"]},
+        )
+
+        hits = matcher.find_terms("Our Testing Strategy for Git pull requests")
+
+        assert hits == {
+            "b": [("keyword", "test"), ("keyword", "testing strategy")],
+            "a": [("keyword", "git"), ("pattern", r"\bpull (request|req)s?\b")],
+        }
+        assert matcher.first("3 days of tests") == "b"
+        assert matcher.find("nothing here") == {}
+
+    def test_patterns_without_literal_factor_always_verified(self):
+        """Test patterns with no required literal are still searched."""
+        matcher = PatternMatcher(patterns={"number": [r"\d{3,}"], "word": [r"(?:fo|ba)\w*"]})
+
+        assert matcher.find("ticket 4021 for bar") == {"number": [r"\d{3,}"], "word": [r"(?:fo|ba)\w*"]}
+
+    def test_non_ascii_text_skips_prefilter(self):
+        """Test case-insensitive matches that lowercasing would hide are still found."""
+        matcher = PatternMatcher(patterns={"status": ["status"]})
+
+        assert matcher.first("ſtatus") == "status"
+        assert PatternMatcher(patterns={"status": ["Status"]}, flags=0).first("status") is None
+
+
+class TestRequiredFactor:
+    """Tests for _required_factor."""
+
+    def test_most_selective_factor(self):
+        """Test the longest mandatory literal alternation is chosen, lowercased."""
+        assert _required_factor(r"\b(I|we) (want|need|would like) to\b", re.IGNORECASE) == (
+            "want",
+            "need",
+            "would like",
+        )
+        assert _required_factor(r"(a|bc)?XYZ", 0) == ("xyz",)
+        assert _required_factor(r"foo|barbaz", 0) == ("foo", "barbaz")
+        assert _required_factor(r"\w+\s\d", 0) is None
+
+    def test_without_regex_parser_every_pattern_is_verified(self, monkeypatch):
+        """Test the prefilter is disabled when the private parser is missing or unusable."""
+        parser = pattern_matcher.sre_parse
+        monkeypatch.setattr(pattern_matcher, "sre_parse", None)
+        assert _required_factor(r"new (feature|capability)", re.IGNORECASE) is None
+
+        matcher = PatternMatcher(keywords={"a": ["add"]}, patterns={"b": [r"new (feature|capability)"]})
+        assert matcher.find("Add a New Capability") == {"a": ["add"], "b": ["new (feature|capability)"]}
+        assert matcher.find("nothing new") == {}
+
+        monkeypatch.setattr(pattern_matcher, "sre_constants", object())
+        monkeypatch.setattr(pattern_matcher, "sre_parse", parser)
+        assert _required_factor(r"new (feature|capability)", re.IGNORECASE) is None
@@ -0,0 +1,108 @@
+"""Unit tests for the shared, hot-reloaded provider configuration."""
+
+import os
+import time
+
+import pytest
+
+from coffee_maker.ai_providers import provider_config
+from coffee_maker.ai_providers.provider_config import ProviderConfig, SharedProviderConfig, get_shared_config
+
+CONFIG = """
+default_provider: claude
+providers:
+  claude:
+    enabled: true
+    model: claude-sonnet-4
+    api_key_env: ANTHROPIC_API_KEY
+  openai:
+    enabled: {openai_enabled}
+    model: gpt-4o
+    api_key_env: OPENAI_API_KEY
+fallback:
+  retry_attempts: {retries}
+  fallback_order: [claude, openai]
+"""
+
+
+def _write(path, openai_enabled="false", retries=3, text=None, mtime_offset=0):
+    path.write_text(text if text is not None else CONFIG.format(openai_enabled=openai_enabled, retries=retries))
+    # Distinct mtime even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "ai_providers.yaml"
+    _write(path)
+    return path
+
+
+@pytest.fixture
+def shared(config_file, monkeypatch):
+    shared = SharedProviderConfig(config_file)
+    monkeypatch.setattr(provider_config, "_shared_config", shared)
+    return shared
+
+
+class TestSharedProviderConfig:
+    """Tests for SharedProviderConfig."""
+
+    def test_file_read_once_until_changed(self, shared, config_file, monkeypatch):
+        """Test the snapshot is shared and the file is only reloaded after a change."""
+        loads = []
+        original = ProviderConfig._load_config
+        monkeypatch.setattr(ProviderConfig, "_load_config", lambda self: loads.append(1) or original(self))
+        before = shared.current
+
+        assert get_shared_config().current is before
+        assert shared.refresh() is False
+        assert loads == []
+
+        _write(config_file, openai_enabled="true", mtime_offset=5)
+        assert shared.refresh() is True
+        assert shared.current.get_enabled_providers() == ["claude", "openai"]
+        assert before.get_enabled_providers() == ["claude"]
+        assert loads == [1]
+
+    def test_invalid_file_keeps_previous_snapshot(self, shared, config_file):
+        """Test a broken edit is ignored until the file is fixed."""
+        before = shared.current
+
+        _write(config_file, text="providers: [", mtime_offset=5)
+        assert shared.refresh() is False
+        assert shared.current is before
+
+        _write(config_file, retries=5, mtime_offset=10)
+        assert shared.refresh() is True
+        assert shared.current.fallback_config.retry_attempts == 5
+
+    def test_watcher_picks_up_changes(self, config_file):
+        """Test the background watcher installs a new snapshot without any caller involvement."""
+        shared = SharedProviderConfig(config_file, poll_interval=0.01)
+        shared.start()
+        try:
+            _write(config_file, retries=7, mtime_offset=5)
+            for _ in range(500):
+                if shared.current.fallback_config.retry_attempts == 7:
+                    break
+                time.sleep(0.01)
+        finally:
+            shared.stop()
+
+        assert shared.current.fallback_config.retry_attempts == 7
+
+    def test_fallback_strategy_follows_reloads(self, shared, config_file):
+        """Test a strategy without an explicit config sees the reloaded fallback settings."""
+        pytest.importorskip("google.generativeai")
+        from coffee_maker.ai_providers.fallback_strategy import FallbackStrategy
+
+        strategy = FallbackStrategy()
+        assert strategy.retry_attempts == 3
+
+        _write(config_file, retries=1, mtime_offset=5)
+        shared.refresh()
+
+        assert strategy.retry_attempts == 1
+        assert strategy.config is shared.current
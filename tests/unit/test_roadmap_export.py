@@ -0,0 +1,111 @@
+"""Unit tests for incremental ROADMAP.md export from RoadmapDatabase."""
+
+import os
+import sqlite3
+
+import pytest
+
+from coffee_maker.autonomous.roadmap_database import RoadmapDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = RoadmapDatabase(tmp_path / "roadmap.db", agent_name="project_manager")
+    for n in range(1, 6):
+        db.create_item(f"US-{n:03d}", "user_story", f"{n:03d}", f"Story {n}", content=f"## US-{n:03d}: Story {n}\n")
+    db.create_item("PRIORITY-9", "priority", "9", "Generated heading")
+    return db
+
+
+@pytest.fixture
+def roadmap(tmp_path):
+    return tmp_path / "docs" / "ROADMAP.md"
+
+
+def set_content(db, item_id, content, updated_at="2999-01-01T00:00:00"):
+    conn = sqlite3.connect(db.db_path)
+    conn.execute("UPDATE roadmap_priority SET content = ?, updated_at = ? WHERE id = ?", (content, updated_at, item_id))
+    conn.commit()
+    conn.close()
+
+
+class TestExportChanges:
+    """Tests for export_changes."""
+
+    def test_first_export_is_full(self, db, roadmap):
+        """Test the first export writes every section and reports them as added."""
+        sections = db.export_changes(roadmap)
+
+        assert [s["change"] for s in sections] == ["added"] * 6
+        assert roadmap.read_text().endswith("### PRIORITY 9: Generated heading 📝 Planned\n")
+        assert db.export_changes(roadmap) == []
+
+    def test_patch_matches_full_export(self, db, roadmap, tmp_path):
+        """Test patched files are byte-identical to a full export of the same data."""
+        db.export_to_file(roadmap)
+        db.update_status("US-002", "✅ Complete", "project_manager")
+        set_content(db, "US-004", "## US-004: Story 4 rewritten\n\nMore text.\n")
+        db.create_item("US-010", "user_story", "010", "New", content="## US-010: New\n")
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("UPDATE roadmap_priority SET priority_order = 0 WHERE id = 'PRIORITY-9'")
+        conn.commit()
+        conn.close()
+
+        sections = db.export_changes(roadmap)
+
+        assert [(s["item_id"], s["change"]) for s in sections] == [
+            ("US-002", "updated"),
+            ("US-004", "updated"),
+            ("US-010", "added"),
+            ("PRIORITY-9", "moved"),
+        ]
+        status_change = sections[0]["audit"]
+        assert [(a["action"], a["old_value"], a["new_value"]) for a in status_change] == [
+            ("update_status", "📝 Planned", "✅ Complete")
+        ]
+
+        db.export_to_file(tmp_path / "full.md")
+        assert roadmap.read_text() == (tmp_path / "full.md").read_text()
+        assert roadmap.read_text().index("PRIORITY 9") < roadmap.read_text().index("US-001")
+
+    def test_direct_update_without_updated_at_is_exported(self, db, roadmap):
+        """Test title/status/content changes that leave updated_at alone still reach the file."""
+        db.export_changes(roadmap)
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("UPDATE roadmap_priority SET title = 'Renamed', status = '✅ Complete' WHERE id = 'PRIORITY-9'")
+        conn.execute("UPDATE roadmap_priority SET priority_order = priority_order WHERE id = 'US-001'")
+        conn.commit()
+        conn.close()
+
+        sections = db.export_changes(roadmap)
+
+        assert [(s["item_id"], s["change"]) for s in sections] == [("PRIORITY-9", "updated")]
+        assert roadmap.read_text().endswith("### PRIORITY 9: Renamed ✅ Complete\n")
+
+    def test_outside_edit_triggers_full_rewrite(self, db, roadmap, tmp_path):
+        """Test a file changed since the last export is rewritten instead of patched."""
+        db.export_changes(roadmap)
+        roadmap.write_text(roadmap.read_text() + "manual edit\n")
+        os.utime(roadmap, ns=(0, 0))
+        set_content(db, "US-001", "## US-001: Changed\n")
+
+        assert [s["item_id"] for s in db.export_changes(roadmap)] == ["US-001"]
+
+        db.export_to_file(tmp_path / "full.md")
+        assert roadmap.read_text() == (tmp_path / "full.md").read_text()
+
+
+class TestGetChangedSections:
+    """Tests for get_changed_sections."""
+
+    def test_only_items_changed_since(self, db):
+        """Test only sections updated after the timestamp are returned, with their audit trail."""
+        since = "2500-01-01T00:00:00"
+        set_content(db, "US-003", "## US-003: Changed\n")
+
+        sections = db.get_changed_sections(since)
+
+        assert [(s["item_id"], s["change"], s["markdown"]) for s in sections] == [
+            ("US-003", "updated", "## US-003: Changed\n")
+        ]
+        assert sections[0]["audit"] == []
@@ -0,0 +1,198 @@
+"""Unit tests for the shared ROADMAP section index."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from coffee_maker.autonomous.roadmap_index import RoadmapIndex
+from coffee_maker.autonomous.roadmap_parser import RoadmapParser
+
+ROADMAP = (
+    """# Roadmap
+
+Intro text.
+
+## US-110: Orchestrator Database Tracing 📝 Planned
+
+**Status**: 🔄 In Progress
+
+Details for US-110.
+
+```markdown
+## US-999: Example inside a code block
+```
+
+### 🔴 **PRIORITY 1: Analytics & Observability** ⚡ FOUNDATION
+
+**Status**: ✅ Complete
+
+#### Deliverables
+- Dashboards
+
+### PRIORITY 2.5: Follow-up ✅
+
+## Appendix
+
+"""
+    + "Filler line.\n" * 15
+    + """
+### 🎯 [US-001] View roadmap
+
+**Status**: 📝 Backlog
+"""
+)
+
+
+@pytest.fixture
+def roadmap_file(tmp_path):
+    path = tmp_path / "ROADMAP.md"
+    path.write_text(ROADMAP)
+    yield path
+    RoadmapIndex.invalidate()
+
+
+class TestRoadmapIndexBuild:
+    """Tests for the one-pass index build."""
+
+    def test_items_ids_and_status(self):
+        """Test item headings are indexed with id, title and status."""
+        index = RoadmapIndex.build(ROADMAP)
+
+        items = {h.item_id: h for h in index.items()}
+
+        assert list(items) == ["US-110", "PRIORITY 1", "PRIORITY 2.5", "US-001"]
+        assert items["US-110"].title == "Orchestrator Database Tracing"
+        assert items["US-110"].status == "🔄 In Progress"
+        assert items["PRIORITY 1"].title == "Analytics & Observability"
+        assert items["PRIORITY 1"].status == "✅ Complete"
+        assert items["PRIORITY 2.5"].status is None
+        assert items["US-001"].status == "📝 Backlog"
+
+    def test_code_blocks_are_flagged(self):
+        """Test headings inside fenced code blocks are not items."""
+        index = RoadmapIndex.build(ROADMAP)
+
+        fenced = [h for h in index.headings if h.in_code_block]
+
+        assert [h.text for h in fenced] == ["## US-999: Example inside a code block"]
+        assert index.get("US-999") is None
+
+    def test_section_ends_at_same_or_higher_level(self):
+        """Test default section ends follow heading levels."""
+        index = RoadmapIndex.build(ROADMAP)
+
+        priority = index.get("PRIORITY 1")
+        section = index.section_text(priority)
+
+        assert section.startswith("### 🔴 **PRIORITY 1")
+        assert "#### Deliverables\n- Dashboards" in section
+        assert "PRIORITY 2.5" not in section
+        assert section.endswith("- Dashboards\n")
+
+        us_110 = index.section_text(index.get("US-110"))
+        assert "PRIORITY 2.5" in us_110
+        assert "Appendix" not in us_110
+
+    def test_custom_section_ends(self):
+        """Test consumers can resolve ends under their own boundary rule."""
+        index = RoadmapIndex.build(ROADMAP)
+
+        ends = index.section_ends(lambda h: h.level == 2 and not h.in_code_block, key="level2")
+        us_110 = index.get("US-110")
+
+        assert index.section_text(us_110, ends[us_110.index]).endswith("### PRIORITY 2.5: Follow-up ✅\n")
+        assert index.section_ends(lambda h: False, key="level2") is ends
+
+    def test_get_normalizes_ids(self):
+        """Test lookups accept bare numbers and any case."""
+        index = RoadmapIndex.build(ROADMAP)
+
+        assert index.get("2.5").item_id == "PRIORITY 2.5"
+        assert index.get("priority 1").item_id == "PRIORITY 1"
+        assert index.get("us-001").item_id == "US-001"
+
+    def test_byte_offsets_with_multibyte_text(self):
+        """Test offsets are byte offsets into the UTF-8 content."""
+        index = RoadmapIndex.build(ROADMAP)
+        data = ROADMAP.encode("utf-8")
+
+        for heading in index.headings:
+            assert data[heading.start :].decode("utf-8").startswith(heading.text)
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ("Intro text.", "Intro.\n\n## US-120: Inserted\n\n**Status**: ✅ Done"),
+            ("**Status**: ✅ Complete", "**Status**: 🔄 In Progress"),
+            ("### PRIORITY 2.5: Follow-up ✅\n", ""),
+            ("Details for US-110.", "```\n## US-121: Opens a code block"),
+        ],
+    )
+    def test_splice_matches_full_build(self, old, new):
+        """Test an incremental splice indexes exactly like a full rebuild."""
+        index = RoadmapIndex.build(ROADMAP)
+        start = index.data.index(old.encode("utf-8"))
+
+        spliced = index.splice(start, start + len(old.encode("utf-8")), new.encode("utf-8"))
+        rebuilt = RoadmapIndex.build(ROADMAP.replace(old, new, 1))
+
+        assert spliced.data == rebuilt.data
+        assert spliced.headings == rebuilt.headings
+        assert spliced.fences == rebuilt.fences
+
+
+class TestRoadmapIndexCache:
+    """Tests for validation and persistence."""
+
+    def test_reused_while_file_unchanged(self, roadmap_file, tmp_path):
+        """Test the in-process index is reused without re-reading the file."""
+        first = RoadmapIndex.for_path(roadmap_file, cache_dir=tmp_path / "cache")
+
+        with patch.object(RoadmapIndex, "build", side_effect=AssertionError("rebuilt")):
+            assert RoadmapIndex.for_path(roadmap_file, cache_dir=tmp_path / "cache") is first
+
+    def test_persisted_index_used_by_new_process(self, roadmap_file, tmp_path):
+        """Test a fresh process loads the persisted index instead of re-parsing."""
+        cache_dir = tmp_path / "cache"
+        first = RoadmapIndex.for_path(roadmap_file, cache_dir=cache_dir)
+        RoadmapIndex.invalidate()
+
+        with patch.object(RoadmapIndex, "build", side_effect=AssertionError("rebuilt")):
+            loaded = RoadmapIndex.for_path(roadmap_file, cache_dir=cache_dir)
+
+        assert loaded.headings == first.headings
+
+    def test_touched_file_validated_by_hash(self, roadmap_file, tmp_path):
+        """Test an mtime change with identical content does not rebuild."""
+        first = RoadmapIndex.for_path(roadmap_file, cache_dir=None)
+        stat = roadmap_file.stat()
+        os.utime(roadmap_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(RoadmapIndex, "build", side_effect=AssertionError("rebuilt")):
+            touched = RoadmapIndex.for_path(roadmap_file, cache_dir=None)
+
+        assert touched.headings is first.headings
+
+    def test_changed_file_rebuilt(self, roadmap_file, tmp_path):
+        """Test edited content produces a new index."""
+        RoadmapIndex.for_path(roadmap_file, cache_dir=tmp_path / "cache")
+        roadmap_file.write_text(ROADMAP + "\n## US-200: New story\n")
+
+        index = RoadmapIndex.for_path(roadmap_file, cache_dir=tmp_path / "cache")
+
+        assert index.get("US-200") is not None
+
+
+class TestRoadmapParserOnIndex:
+    """Tests for RoadmapParser reading the shared index."""
+
+    def test_priorities_from_index(self, roadmap_file):
+        """Test parser output keeps its shape and section boundaries."""
+        priorities = RoadmapParser(str(roadmap_file)).get_priorities()
+
+        assert [p["name"] for p in priorities] == ["US-110", "PRIORITY 1", "PRIORITY 2.5"]
+        assert priorities[0]["status"] == "🔄 In Progress"
+        assert priorities[0]["section_start"] == 4
+        assert "Details for US-110." in priorities[0]["content"]
+        assert priorities[2]["status"] == "complete"
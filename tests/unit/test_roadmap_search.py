@@ -0,0 +1,131 @@
+"""Unit tests for RoadmapDatabase full-text search and reusable component lookups."""
+
+import sqlite3
+
+import pytest
+
+from coffee_maker.autonomous.roadmap_database import RoadmapDatabase
+
+
+def plan(*components, complete=True):
+    return {
+        "tech_specs_complete": complete,
+        "architecture_summary": {"overview": "Overview"},
+        "reusable_components": [
+            {"name": name, "location": f"SPEC {name}", "use_cases": use_cases} for name, use_cases in components
+        ],
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "roadmap.db"
+
+
+@pytest.fixture
+def architect(db_path):
+    pm = RoadmapDatabase(db_path, agent_name="project_manager")
+    for n, title in enumerate(["Authentication", "Email system", "Unplanned", "Notes"], start=1):
+        pm.create_item(f"PRIORITY-{n}", "priority", str(n), title, content=f"{title} details")
+
+    architect = RoadmapDatabase(db_path, agent_name="architect")
+    architect.update_plan_and_summary(
+        "PRIORITY-1", plan(("JWT token generator", ["API auth"]), ("Password hasher", ["Login"]))
+    )
+    architect.update_plan_and_summary(
+        "PRIORITY-2", plan(("Email validator", ["Signup"]), ("JWT refresh", ["Sessions", "email links"]))
+    )
+    architect.update_plan_and_summary("PRIORITY-3", plan(("JWT parser", ["API auth"]), complete=False))
+    architect.update_plan_and_summary("PRIORITY-4", "not json {")
+    return architect
+
+
+class TestFindReusableComponents:
+    """Tests for find_reusable_components."""
+
+    def test_all_components_of_complete_items(self, architect):
+        """Test items without completed specs or valid plans are skipped."""
+        components = architect.find_reusable_components()
+
+        assert [(c["source_item_id"], c["component_name"]) for c in components] == [
+            ("PRIORITY-1", "JWT token generator"),
+            ("PRIORITY-1", "Password hasher"),
+            ("PRIORITY-2", "Email validator"),
+            ("PRIORITY-2", "JWT refresh"),
+        ]
+        assert components[0] == {
+            "component_name": "JWT token generator",
+            "source_item_id": "PRIORITY-1",
+            "source_item_title": "Authentication",
+            "location": "SPEC JWT token generator",
+            "use_cases": ["API auth"],
+            "architecture_overview": "Overview",
+        }
+
+    def test_search_terms_ranked(self, architect):
+        """Test only matching components are returned, best matching item first."""
+        components = architect.find_reusable_components(["email", "jwt"])
+
+        assert [c["component_name"] for c in components] == ["Email validator", "JWT refresh", "JWT token generator"]
+        assert architect.find_reusable_components(["hash"]) == architect.find_reusable_components(["Hasher"])
+        assert architect.find_reusable_components(["kafka"]) == []
+
+    def test_terms_match_inside_words(self, architect):
+        """Test terms match anywhere in component names and use cases, like a substring check."""
+        architect.update_plan_and_summary("PRIORITY-3", plan(("OAuthHandler", ["SSO"])))
+
+        assert [c["component_name"] for c in architect.find_reusable_components(["mail"])] == [
+            "Email validator",
+            "JWT refresh",
+        ]
+        assert [c["component_name"] for c in architect.find_reusable_components(["auth"])] == [
+            "OAuthHandler",
+            "JWT token generator",
+        ]
+        assert [c["component_name"] for c in architect.find_reusable_components(["wt"])] == [
+            "JWT token generator",
+            "JWT refresh",
+        ]
+
+    def test_index_follows_plan_updates(self, architect):
+        """Test triggers re-index a plan when it changes."""
+        architect.update_plan_and_summary("PRIORITY-1", plan(("Rate limiter", ["API"])))
+
+        assert [c["component_name"] for c in architect.find_reusable_components(["jwt"])] == ["JWT refresh"]
+        assert [c["source_item_id"] for c in architect.find_reusable_components(["rate"])] == ["PRIORITY-1"]
+
+    def test_lookup_uses_json_index(self, architect, db_path):
+        """Test the completed-specs filter is served by the JSON expression index."""
+        conn = sqlite3.connect(db_path)
+        plan_rows = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM roadmap_priority WHERE json_extract("
+            "CASE WHEN json_valid(plan_and_summary) THEN plan_and_summary END, '$.tech_specs_complete') = 1"
+        ).fetchall()
+        conn.close()
+
+        assert "idx_items_tech_specs_complete" in " ".join(row[-1] for row in plan_rows)
+
+
+class TestSearch:
+    """Tests for search."""
+
+    def test_items_and_specs_searchable(self, architect, db_path):
+        """Test a specs table created after the index is backfilled and kept in sync."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE specs_specification (id TEXT PRIMARY KEY, title TEXT, content TEXT)")
+        conn.execute("INSERT INTO specs_specification VALUES ('SPEC-001', 'Auth spec', 'Token rotation')")
+        conn.commit()
+        conn.close()
+
+        db = RoadmapDatabase(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute("INSERT INTO specs_specification VALUES ('SPEC-002', 'Mail spec', 'Bounce handling')")
+        conn.execute("DELETE FROM roadmap_priority WHERE id = 'PRIORITY-2'")
+        conn.commit()
+        conn.close()
+
+        assert sorted(r["id"] for r in db.search("token")) == ["PRIORITY-1", "SPEC-001"]
+        assert [r["id"] for r in db.search("TOKEN rotation", kind="spec")] == ["SPEC-001"]
+        assert [r["id"] for r in db.search("bounce")] == ["SPEC-002"]
+        assert db.search("email") == []
+        assert "[Authentication]" in db.search("authentication")[0]["snippet"]
@@ -0,0 +1,83 @@
+"""Cold-start import budgets for the console entry points.
+
+Each entry point from pyproject.toml is imported in a fresh interpreter with
+``python -X importtime``. The test fails when the cumulative import time goes over
+the entry point's budget, or when a heavy AI/observability stack (langchain,
+langfuse, tiktoken, provider SDKs) is imported just to show ``--help``.
+
+Budgets are for a loaded developer machine (parallel test workers); set
+STARTUP_BUDGET_SCALE (e.g. 2.0) on slower CI runners.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# entry point -> (module, attribute, budget in milliseconds)
+ENTRY_POINTS = {
+    "project-manager": ("coffee_maker.cli.roadmap_cli", "main", 2000),
+    "code-developer": ("coffee_maker.autonomous.daemon_cli", "main", 2000),
+    "architect": ("coffee_maker.cli.architect_cli", "architect", 2000),
+    "orchestrator": ("coffee_maker.cli.orchestrator_cli", "main", 2000),
+}
+
+BUDGET_SCALE = float(os.environ.get("STARTUP_BUDGET_SCALE", "1.0"))
+
+# Top-level packages that must only be imported once a command actually needs them
+HEAVY_PACKAGES = {"langchain", "langchain_core", "langfuse", "tiktoken", "anthropic", "openai"}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _profile_import(module: str, attribute: str):
+    """Import an entry point in a fresh interpreter and parse -X importtime output.
+
+    Returns:
+        Tuple of (cumulative microseconds for the module, set of imported module names)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"from {module} import {attribute}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0 and "ModuleNotFoundError" in result.stderr:
+        pytest.skip(f"{module} cannot be imported here: {result.stderr.strip().splitlines()[-1]}")
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(match.group(2))
+
+    return cumulative_us, imported
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("entry_point", sorted(ENTRY_POINTS))
+def test_entry_point_cold_start_within_budget(entry_point):
+    """Test each entry point imports within its budget and without the AI stack."""
+    module, attribute, budget_ms = ENTRY_POINTS[entry_point]
+    budget_ms *= BUDGET_SCALE
+
+    # Best of two runs smooths out filesystem cache misses on the first one
+    runs = [_profile_import(module, attribute) for _ in range(2)]
+    cumulative_us = min(us for us, _ in runs)
+    imported = runs[0][1]
+
+    heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY_PACKAGES and "." not in name)
+    assert not heavy, f"{entry_point} imports {heavy} at startup"
+    assert cumulative_us / 1000 <= budget_ms, f"{entry_point} cold start {cumulative_us / 1000:.0f}ms > {budget_ms}ms"
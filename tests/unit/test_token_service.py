@@ -0,0 +1,134 @@
+"""Unit tests for the shared TokenCountingService."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from coffee_maker.utils.token_service import TokenCountingService, approximate_token_count
+
+
+class FakeEncoding:
+    """Whitespace tokenizer standing in for a tiktoken encoding."""
+
+    def __init__(self):
+        self.single_calls = 0
+        self.batch_calls = []
+
+    def encode_ordinary(self, text):
+        self.single_calls += 1
+        return text.split()
+
+    def encode_ordinary_batch(self, texts, num_threads=8):
+        self.batch_calls.append(list(texts))
+        return [text.split() for text in texts]
+
+
+@pytest.fixture
+def encoding():
+    return FakeEncoding()
+
+
+@pytest.fixture
+def service(encoding):
+    """Service whose encoder loads are served by FakeEncoding."""
+    service = TokenCountingService(max_entries=3)
+    with patch.object(TokenCountingService, "_load_encoding", return_value=encoding) as mock_load:
+        service.mock_load = mock_load
+        yield service
+
+
+class TestTokenCountingService:
+    """Tests for TokenCountingService."""
+
+    def test_counts_are_cached(self, service, encoding):
+        """Test the same text is encoded once."""
+        assert service.count("one two three") == 3
+        assert service.count("one two three") == 3
+
+        assert encoding.single_calls == 1
+        assert service.stats["hits"] == 1
+
+    def test_encoder_loaded_once_per_encoding(self, service):
+        """Test encoders are cached across models sharing an encoding."""
+        service.count("a", model="openai/gpt-4")
+        service.count("b", model="gpt-4")
+        service.count("c", model="anthropic/claude-3-5-sonnet")
+
+        assert service.mock_load.call_count == 1
+
+    def test_batch_encodes_only_misses_in_one_call(self, service, encoding):
+        """Test count_batch sends uncached, de-duplicated texts in one batch."""
+        service.count("cached text")
+
+        counts = service.count_batch(["cached text", "a b", "c d e", "a b"])
+
+        assert counts == [2, 2, 3, 2]
+        assert encoding.batch_calls == [["a b", "c d e"]]
+
+    def test_lru_is_bounded(self, service, encoding):
+        """Test least recently used counts are evicted past max_entries."""
+        service.count_batch(["a", "b", "c"])
+        service.count("a")
+        service.count("d")
+
+        service.count("b")
+
+        assert encoding.single_calls == 2  # "d", then "b" again after eviction
+        assert len(service._counts) == 3
+
+    def test_approximate_mode(self, service, encoding):
+        """Test approximate mode never touches the encoder."""
+        assert service.count("x" * 400, approximate=True) == 100
+        assert service.mock_load.call_count == 0
+        assert encoding.single_calls == 0
+
+    def test_approximation_error_measured_on_exact_counts(self, service):
+        """Test exact counts record approximation error bounds."""
+        service.count("abcd efgh")  # exact 2, approx 2
+        service.count("ab cd ef gh")  # exact 4, approx 2 (undercount 50%)
+
+        error = service.approximation_error()
+
+        assert error.samples == 2
+        assert error.max_under_pct == pytest.approx(50.0)
+        assert error.max_over_pct == pytest.approx(0.0)
+        assert error.mean_abs_error_pct == pytest.approx(25.0)
+
+    def test_falls_back_when_encoder_unavailable(self):
+        """Test counts fall back to the approximation without tiktoken files."""
+        service = TokenCountingService()
+        with patch.object(TokenCountingService, "_load_encoding", return_value=None):
+            assert service.count("x" * 40) == approximate_token_count("x" * 40)
+
+        assert service.stats["fallbacks"] == 1
+
+    def test_encoder_load_does_not_block_other_counts(self, encoding):
+        """Test a slow encoder load holds neither the service nor other encodings."""
+        service = TokenCountingService()
+        loading = threading.Event()
+        release = threading.Event()
+
+        def load(encoding_name):
+            if encoding_name == "o200k_base":
+                loading.set()
+                release.wait(5)
+            return encoding
+
+        with patch.object(TokenCountingService, "_load_encoding", side_effect=load) as mock_load:
+            results = []
+            slow = [
+                threading.Thread(target=lambda: results.append(service.count("a b", model="gpt-4o"))) for _ in range(2)
+            ]
+            for thread in slow:
+                thread.start()
+            assert loading.wait(5)
+
+            assert service.count("one two three", model="gpt-4") == 3
+
+            release.set()
+            for thread in slow:
+                thread.join(5)
+
+        assert results == [2, 2]
+        assert mock_load.call_count == 2